@@ -33,6 +33,7 @@ from etools.applications.action_points.serializers import (
     ActionPointListSerializer,
     ActionPointSerializer,
 )
+from etools.applications.core.mixins import StreamingExportMixin
 from etools.applications.permissions2.conditions import ObjectStatusCondition
 from etools.applications.permissions2.metadata import PermissionBasedMetadata
 from etools.applications.permissions2.views import PermittedFSMActionMixin, PermittedSerializerMixin
@@ -51,6 +52,7 @@ class ActionPointViewSet(
         MultiSerializerViewSetMixin,
         PermittedSerializerMixin,
         ExportMixin,
+        StreamingExportMixin,
         mixins.ListModelMixin,
         mixins.CreateModelMixin,
         mixins.RetrieveModelMixin,
@@ -123,16 +125,14 @@ class ActionPointViewSet(
 
         action_points = self.get_list_export_qs()
 
-        serializer = ActionPointExportSerializer(
+        return self.stream_export(
             action_points.prefetch_related('comments'),
-            context={"request": request},
-            many=True,
+            ActionPointExportSerializer(context={"request": request}),
+            headers={
+                'Content-Disposition': 'attachment;filename=action_points_{}.csv'.format(timezone.now().date())
+            },
         )
 
-        return Response(serializer.data, headers={
-            'Content-Disposition': 'attachment;filename=action_points_{}.csv'.format(timezone.now().date())
-        })
-
     @action(detail=False, methods=['get'], url_path='export/xlsx', renderer_classes=(ExportOpenXMLRenderer,))
     def list_xlsx_export(self, request, *args, **kwargs):
         self.serializer_class = ActionPointExportSerializer
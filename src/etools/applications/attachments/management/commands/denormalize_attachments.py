@@ -1,9 +1,28 @@
-from django.core.management.base import BaseCommand
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
 
 from unicef_attachments.models import Attachment
 from unicef_attachments.utils import get_attachment_flat_model, get_denormalize_func
 
-from etools.libraries.tenant_support.utils import run_on_all_tenants
+from etools.libraries.tenant_support.utils import TenantExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def denormalize_attachments(all_attachments=False):
+    attachment_qs = Attachment.objects
+
+    if not all_attachments:
+        attachment_qs = attachment_qs.exclude(
+            pk__in=get_attachment_flat_model().objects.values_list(
+                "attachment_id",
+                flat=True
+            )
+        )
+
+    for attachment in attachment_qs.all():
+        get_denormalize_func()(attachment)
 
 
 class Command(BaseCommand):
@@ -15,21 +34,21 @@ class Command(BaseCommand):
             dest="all",
             help="Process all attachments"
         )
-
-    def run(self):
-        attachment_qs = Attachment.objects
-
-        if not self.all_flag:
-            attachment_qs = attachment_qs.exclude(
-                pk__in=get_attachment_flat_model().objects.values_list(
-                    "attachment_id",
-                    flat=True
-                )
-            )
-
-        for attachment in attachment_qs.all():
-            get_denormalize_func()(attachment)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=0,
+            help="Process the countries in parallel with this many processes"
+        )
 
     def handle(self, *args, **options):
-        self.all_flag = options["all"]
-        run_on_all_tenants(self.run)
+        if options["workers"]:
+            executor = TenantExecutor(TenantExecutor.PROCESSES, max_workers=options["workers"])
+        else:
+            executor = TenantExecutor()
+        results = executor.run(denormalize_attachments, all_attachments=options["all"])
+        failed = [result for result in results if result.exception]
+        for result in failed:
+            logger.error("Denormalizing attachments failed for {}\n{}".format(result.schema_name, result.traceback))
+        if failed:
+            raise CommandError("Failed for {}".format(", ".join(result.schema_name for result in failed)))
@@ -1,5 +1,7 @@
 from django.core.management import call_command
+from django.core.management.base import CommandError
 
+from mock import patch
 from unicef_attachments.models import Attachment
 from unicef_attachments.utils import get_attachment_flat_model
 
@@ -30,6 +32,15 @@ class TestDenormalizeAttachmentCommand(BaseTenantTestCase):
 
         self.assertTrue(flat_qs.exists())
 
+    @patch("etools.applications.attachments.management.commands.denormalize_attachments.get_denormalize_func")
+    def test_run_failed(self, mock_denormalize_func):
+        AttachmentFactory(file="sample1.pdf")
+        get_attachment_flat_model().objects.all().delete()
+        mock_denormalize_func.return_value.side_effect = ValueError()
+
+        with self.assertRaises(CommandError):
+            call_command("denormalize_attachments")
+
 
 class TestRemovePDPCADocTypeCommand(BaseTenantTestCase):
     def test_run(self):
@@ -32,6 +32,7 @@ from etools.applications.audit.transitions.serializers import EngagementCancelSe
 from etools.applications.audit.utils import generate_final_report
 from etools.applications.core.urlresolvers import build_frontend_url
 from etools.applications.environment.notifications import send_notification_with_template
+from etools.applications.hact.tracker import mark_partners_dirty
 from etools.applications.partners.models import PartnerOrganization, PartnerStaffMember
 from etools.applications.reports.models import Office, Section
 from etools.libraries.djangolib.models import GroupWrapper, InheritedModelMixin
@@ -274,6 +275,7 @@ class Engagement(InheritedModelMixin, TimeStampedModel, models.Model):
                 permission=has_action_permission(action='submit'))
     def submit(self):
         self.date_of_report_submit = timezone.now()
+        mark_partners_dirty([self.partner_id])
 
         self._notify_focal_points('audit/engagement/reported_by_auditor')
 
@@ -283,12 +285,14 @@ class Engagement(InheritedModelMixin, TimeStampedModel, models.Model):
     def cancel(self, cancel_comment):
         self.date_of_cancel = timezone.now()
         self.cancel_comment = cancel_comment
+        mark_partners_dirty([self.partner_id])
 
     @transition(status, source=STATUSES.report_submitted, target=STATUSES.final,
                 permission=has_action_permission(action='finalize'))
     def finalize(self):
         self.date_of_final_report = timezone.now().date()
         self.generate_final_report()
+        mark_partners_dirty([self.partner_id])
 
     def get_object_url(self, **kwargs):
         return build_frontend_url('ap', 'engagements', self.id, 'overview', **kwargs)
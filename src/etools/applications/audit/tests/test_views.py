@@ -13,7 +13,9 @@ from unicef_attachments.models import Attachment
 
 from etools.applications.action_points.tests.factories import ActionPointCategoryFactory, ActionPointFactory
 from etools.applications.attachments.tests.factories import AttachmentFactory, AttachmentFileTypeFactory
+from etools.applications.audit.exports import EngagementCSVRenderer
 from etools.applications.audit.models import Auditor, Engagement, Risk, SpotCheck
+from etools.applications.audit.serializers.engagement import EngagementExportSerializer
 from etools.applications.audit.tests.base import AuditTestCaseMixin, EngagementTransitionsTestCaseMixin
 from etools.applications.audit.tests.factories import (
     AuditFactory,
@@ -32,9 +34,11 @@ from etools.applications.audit.tests.factories import (
 )
 from etools.applications.audit.tests.test_transitions import MATransitionsTestCaseMixin
 from etools.applications.core.tests.cases import BaseTenantTestCase
+from etools.applications.core.tests.mixins import GroupQueriesMixin
 from etools.applications.partners.models import PartnerType
 from etools.applications.reports.tests.factories import SectionFactory
 from etools.applications.users.tests.factories import OfficeFactory
+from etools.libraries.djangolib.tests.utils import TestExportMixin
 
 
 class BaseTestCategoryRisksViewSet(EngagementTransitionsTestCaseMixin):
@@ -262,7 +266,9 @@ class TestAuditRisksViewSet(BaseTestCategoryRisksViewSet, BaseTenantTestCase):
         )
 
 
-class TestEngagementsListViewSet(EngagementTransitionsTestCaseMixin, BaseTenantTestCase):
+class TestEngagementsListViewSet(
+    GroupQueriesMixin, TestExportMixin, EngagementTransitionsTestCaseMixin, BaseTenantTestCase,
+):
     engagement_factory = MicroAssessmentFactory
 
     @classmethod
@@ -298,6 +304,9 @@ class TestEngagementsListViewSet(EngagementTransitionsTestCaseMixin, BaseTenantT
     def test_non_engagement_staff_list(self):
         self._test_list(self.non_engagement_auditor, [])
 
+    def test_groups_loaded_once(self):
+        self.assertGroupsLoadedOnce(self._test_list, self.auditor, [self.engagement])
+
     def test_unknown_user_list(self):
         self._test_list(self.usual_user, expected_status=status.HTTP_403_FORBIDDEN)
 
@@ -418,6 +427,11 @@ class TestEngagementsListViewSet(EngagementTransitionsTestCaseMixin, BaseTenantT
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('text/csv', response['Content-Type'])
+        # as the serialized list was rendered before the export was streamed
+        engagements = Engagement.objects.filter(agreement__auditor_firm__unicef_users_allowed=False)
+        self.assertCSVExport(b''.join(response.streaming_content), EngagementCSVRenderer().render(
+            EngagementExportSerializer(engagements, many=True).data,
+        ), ordered=False)
 
     def test_staff_spot_checks_csv_view(self):
         StaffSpotCheckFactory()
@@ -430,6 +444,7 @@ class TestEngagementsListViewSet(EngagementTransitionsTestCaseMixin, BaseTenantT
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('text/csv', response['Content-Type'])
+        self.assertTrue(b''.join(response.streaming_content))
 
     def test_search_by_id(self):
         self._test_list(self.auditor, [self.engagement], filter_params={'search': self.engagement.pk})
@@ -93,6 +93,7 @@ from etools.applications.audit.serializers.export import (
     SpotCheckDetailCSVSerializer,
     SpotCheckPDFSerializer,
 )
+from etools.applications.core.mixins import StreamingExportMixin
 from etools.applications.partners.models import PartnerOrganization
 from etools.applications.partners.serializers.partner_organization_v2 import MinimalPartnerOrganizationListSerializer
 from etools.applications.permissions2.conditions import ObjectStatusCondition
@@ -164,12 +165,12 @@ class AuditorFirmViewSet(
     def get_queryset(self):
         queryset = super().get_queryset()
 
-        user_groups = self.request.user.groups.all()
+        user_groups = self.request.user.group_names
 
-        if UNICEFUser.as_group() in user_groups or UNICEFAuditFocalPoint.as_group() in user_groups:
+        if UNICEFUser.name in user_groups or UNICEFAuditFocalPoint.name in user_groups:
             # no need to filter queryset
             pass
-        elif Auditor.as_group() in user_groups:
+        elif Auditor.name in user_groups:
             queryset = queryset.filter(staff_members__user=self.request.user)
         else:
             queryset = queryset.none()
@@ -179,7 +180,7 @@ class AuditorFirmViewSet(
     def get_permission_context(self):
         context = super().get_permission_context()
 
-        if Auditor.as_group() in self.request.user.groups.all() and \
+        if Auditor.name in self.request.user.group_names and \
            hasattr(self.request.user, 'purchase_order_auditorstaffmember'):
             context += [
                 AuditStaffMemberCondition(self.request.user.purchase_order_auditorstaffmember.auditor_firm,
@@ -266,6 +267,7 @@ class EngagementPartnerView(generics.ListAPIView):
 
 class EngagementViewSet(
     BaseAuditViewSet,
+    StreamingExportMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     viewsets.GenericViewSet
@@ -332,12 +334,12 @@ class EngagementViewSet(
     def get_queryset(self):
         queryset = super().get_queryset()
 
-        user_groups = self.request.user.groups.all()
+        user_groups = self.request.user.group_names
 
-        if UNICEFUser.as_group() in user_groups or UNICEFAuditFocalPoint.as_group() in user_groups:
+        if UNICEFUser.name in user_groups or UNICEFAuditFocalPoint.name in user_groups:
             # no need to filter queryset
             pass
-        elif Auditor.as_group() in user_groups:
+        elif Auditor.name in user_groups:
             queryset = queryset.filter(staff_members__user=self.request.user)
         else:
             queryset = queryset.none()
@@ -354,7 +356,7 @@ class EngagementViewSet(
     def get_permission_context(self):
         context = super().get_permission_context()
 
-        if Auditor.as_group() in self.request.user.groups.all() and \
+        if Auditor.name in self.request.user.group_names and \
            hasattr(self.request.user, 'purchase_order_auditorstaffmember'):
             context += [
                 AuditStaffMemberCondition(self.request.user.purchase_order_auditorstaffmember.auditor_firm,
@@ -415,9 +417,8 @@ class EngagementViewSet(
     @action(detail=False, methods=['get'], url_path='csv', renderer_classes=[EngagementCSVRenderer])
     def export_list_csv(self, request, *args, **kwargs):
         engagements = self.filter_queryset(self.get_queryset())
-        serializer = EngagementExportSerializer(engagements, many=True)
 
-        return Response(serializer.data, headers={
+        return self.stream_export(engagements, EngagementExportSerializer(), headers={
             'Content-Disposition': 'attachment;filename={}_{}.csv'.format(self.export_filename, timezone.now().date())
         })
 
@@ -577,7 +578,7 @@ class AuditorStaffMembersViewSet(
     def get_permission_context(self):
         context = super().get_permission_context()
 
-        if Auditor.as_group() in self.request.user.groups.all():
+        if Auditor.name in self.request.user.group_names:
             context += [
                 AuditStaffMemberCondition(self.get_parent_object(), self.request.user),
             ]
@@ -8,3 +8,6 @@ class AppConfig(BaseAppConfig):
     def ready(self):
         from . import checks  # noqa isort: skip
         from etools.config.celery import app  # noqa
+        from etools.libraries.tenant_support.content_types import install_schema_content_type_cache
+
+        install_schema_content_type_cache()
@@ -1,7 +1,6 @@
 import logging
 
 from django.conf import settings
-from django.contrib.contenttypes.models import ContentType
 from django.db import connection
 from django.http.response import HttpResponseRedirect
 from django.template.response import SimpleTemplateResponse
@@ -11,7 +10,8 @@ from django.utils.deprecation import MiddlewareMixin
 from django_tenants.middleware import TenantMainMiddleware
 from django_tenants.utils import get_public_schema_name
 
-from etools.libraries.tenant_support.utils import set_country
+from etools.applications.core.query_budget import get_default_query_budget, get_query_budget, QueryRecorder
+from etools.libraries.tenant_support.utils import get_user_country, set_country
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +45,28 @@ class QueryCountDebugMiddleware(MiddlewareMixin):
     pass
 
 
+class QueryBudgetMiddleware(QueryCountDebugMiddleware):
+    """
+    Check the queries of every request against the budget declared on its view with core.query_budget.query_budget,
+    or QUERY_BUDGET_MAX_QUERIES and QUERY_BUDGET_MAX_DUPLICATES, and log the violations with the fingerprints
+    (normalized sql and call sites) of the repeated queries.
+    """
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            response = super().__call__(request)
+
+        budget = getattr(request, 'query_budget', None) or get_default_query_budget()
+        violations = recorder.get_violations(budget)
+        if violations:
+            logger.warning('Query budget exceeded by %s %s:\n%s', request.method, request.path, '\n'.join(violations))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.query_budget = get_query_budget(view_func)
+
+
 class EToolsTenantMiddleware(TenantMainMiddleware):
     """
     Sets request.tenant based on the users's country (Tenant) and sets the DB connection to use that tenant.
@@ -76,11 +98,12 @@ class EToolsTenantMiddleware(TenantMainMiddleware):
             else:
                 return HttpResponseRedirect(settings.LOGIN_URL)
 
-        if request.user.is_superuser and not request.user.profile.country:
+        country = get_user_country(request.user)
+        if request.user.is_superuser and not country:
             return None
 
         if not request.user.is_superuser and (
-                not request.user.profile.country or request.user.profile.country.business_area_code in settings.INACTIVE_BUSINESS_AREAS):
+                not country or country.business_area_code in settings.INACTIVE_BUSINESS_AREAS):
             return HttpResponseRedirect("/workspace_inactive/")
 
         try:
@@ -89,14 +112,9 @@ class EToolsTenantMiddleware(TenantMainMiddleware):
             logger.info('No country found for user {}'.format(request.user))
             return SimpleTemplateResponse('no_country_found.html', {'user': request.user})
 
-        # Content type can no longer be cached as public and tenant schemas
-        # have different models. If someone wants to change this, the cache
-        # needs to be separated between public and shared schemas. If this
-        # cache isn't cleared, this can cause permission problems. For example,
-        # on public, a particular model has id 14, but on the tenants it has
-        # the id 15. if 14 is cached instead of 15, the permissions for the
-        # wrong model will be fetched.
-        ContentType.objects.clear_cache()
+        # Public and tenant schemas can have different content type ids, for example a model has id 14 on
+        # public and 15 on the tenants. The ContentType cache is kept per schema by SchemaContentTypeCache
+        # (installed when the core app is ready), so it does not need to be cleared on every request.
 
         # Do we have a public-specific urlconf?
         if hasattr(settings, 'PUBLIC_SCHEMA_URLCONF') and request.tenant.schema_name == get_public_schema_name():
@@ -0,0 +1,27 @@
+# Generated by Django 3.2.6 on 2026-10-18 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_auto_20190424_1448'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportPartition',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('report', models.CharField(max_length=50, verbose_name='Report')),
+                ('job_id', models.CharField(max_length=32, verbose_name='Job')),
+                ('schema_name', models.CharField(max_length=63, verbose_name='Schema Name')),
+                ('rows', models.JSONField(default=list, verbose_name='Rows')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Created')),
+            ],
+            options={
+                'unique_together': {('report', 'job_id', 'schema_name')},
+            },
+        ),
+    ]
@@ -1,7 +1,11 @@
 from django.db import connection
+from django.db.models import prefetch_related_objects
+from django.http import StreamingHttpResponse
 
 from rest_framework import serializers
 
+from etools.applications.core.renderers import stream_csv
+
 
 class ExportModelMixin:
     def set_labels(self, serializer_fields, model):
@@ -32,6 +36,66 @@ class ExportModelMixin:
         return context
 
 
+class StreamingExportMixin:
+    """
+    Stream the CSV exports instead of rendering them at once: the queryset is read in chunks,
+    prefetched chunk by chunk, and every object is serialized and rendered as a line when it is sent.
+    """
+    export_chunk_size = 500
+
+    def iterate_queryset(self, queryset):
+        """Objects of the queryset with its prefetches, which iterator() would ignore, done per chunk"""
+        queryset = queryset.all()
+        lookups = queryset._prefetch_related_lookups
+
+        chunk = []
+        for obj in queryset.prefetch_related(None).iterator(chunk_size=self.export_chunk_size):
+            chunk.append(obj)
+            if len(chunk) == self.export_chunk_size:
+                prefetch_related_objects(chunk, *lookups)
+                yield from chunk
+                chunk = []
+
+        prefetch_related_objects(chunk, *lookups)
+        yield from chunk
+
+    def stream_export(self, queryset, serializer=None, headers=None):
+        """
+        Response streaming the objects of the queryset serialized by serializer, the serializer of the view
+        by default, with the accepted renderer, as the response of the serialized list would render them.
+        """
+        renderer = self.request.accepted_renderer
+        if serializer is None:
+            serializer = self.get_serializer()
+
+        def get_rows():
+            for obj in self.iterate_queryset(queryset):
+                yield serializer.to_representation(obj)
+
+        response = StreamingHttpResponse(
+            stream_csv(renderer, get_rows, self.get_renderer_context()),
+            content_type='{}; charset={}'.format(renderer.media_type, renderer.charset),
+        )
+        for name, value in (headers or {}).items():
+            response[name] = value
+        return response
+
+
+class StreamingListExportMixin(StreamingExportMixin):
+    """Stream the list when it is requested as CSV without pagination"""
+    streamed_export_formats = ('csv', 'csv_flat')
+
+    def is_streamed_export(self):
+        if getattr(self.request.accepted_renderer, 'format', None) not in self.streamed_export_formats:
+            return False
+        return self.paginator is None or self.paginator.get_page_size(self.request) is None
+
+    def list(self, request, *args, **kwargs):
+        if not self.is_streamed_export():
+            return super().list(request, *args, **kwargs)
+        return self.stream_export(self.filter_queryset(self.get_queryset()))
+
+
 class ExportSerializerMixin:
     country = serializers.SerializerMethodField()
 
@@ -1,3 +1,6 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
 from django_tenants.models import DomainMixin
 
 
@@ -6,3 +9,21 @@ class Domain(DomainMixin):
 
     def __str__(self):
         return f'{self.domain} [{self.tenant.schema_name}]'
+
+
+class ReportPartition(models.Model):
+    """
+    Rows of one tenant for a job building a report in the background, see management.reports.ReportStore.
+    The partitions are shared, so that the rows of all the tenants are read without switching schemas.
+    """
+    report = models.CharField(verbose_name=_('Report'), max_length=50)
+    job_id = models.CharField(verbose_name=_('Job'), max_length=32)
+    schema_name = models.CharField(verbose_name=_('Schema Name'), max_length=63)
+    rows = models.JSONField(verbose_name=_('Rows'), default=list)
+    created = models.DateTimeField(verbose_name=_('Created'), auto_now_add=True)
+
+    class Meta:
+        unique_together = ('report', 'job_id', 'schema_name')
+
+    def __str__(self):
+        return f'{self.report} {self.job_id} [{self.schema_name}]'
@@ -70,6 +70,10 @@ def process_permissions(permission_dict):
     return result
 
 
+# the matrices only change along with the code, so each process keeps them after the first load
+permission_matrices = {}
+
+
 def import_permissions(model_name):
     permission_file_map = {
         'Intervention': settings.PACKAGE_ROOT + '/applications/partners/permission_matrix/intervention_permissions.csv',
@@ -85,6 +89,9 @@ def import_permissions(model_name):
             result = process_permissions(sheet)
         return result
 
+    if model_name in permission_matrices:
+        return permission_matrices[model_name]
+
     cache_key = "public-{}-permissions".format(model_name.lower())
     response = cache.get(cache_key, None)
 
@@ -92,10 +99,11 @@ def import_permissions(model_name):
         response = process_file()
         cache.set(cache_key, response)
 
+    permission_matrices[model_name] = response
     return response
 
 
 class IsUNICEFUser(IsAuthenticated):
 
     def has_permission(self, request, view):
-        return super().has_permission(request, view) and request.user.groups.filter(name='UNICEF User').exists()
+        return super().has_permission(request, view) and 'UNICEF User' in request.user.group_names
@@ -0,0 +1,121 @@
+import os
+import re
+import sys
+from collections import namedtuple
+
+from django.conf import settings
+from django.urls import get_resolver, URLResolver
+
+import etools
+
+ETOOLS_ROOT = os.path.dirname(etools.__file__)
+
+QueryBudget = namedtuple('QueryBudget', ['max_queries', 'max_duplicates'])
+QueryFingerprint = namedtuple('QueryFingerprint', ['sql', 'count', 'call_sites'])
+
+# literals and parameters are replaced, so that the queries of an N+1 pattern share the same fingerprint
+SQL_NORMALIZATIONS = [
+    (re.compile(r"'(?:[^']|'')*'"), '?'),
+    (re.compile(r'\b\d+(\.\d+)?\b'), '?'),
+    (re.compile(r'%s'), '?'),
+    (re.compile(r'\(\s*\?(\s*,\s*\?)*\s*\)'), '(...)'),
+]
+
+
+def query_budget(max_queries=None, max_duplicates=None):
+    """
+    Declare the query budget of a view class or function: the maximum number of queries of a request and
+    the maximum number of times a query may repeat with different parameters.
+
+    @query_budget(max_queries=15, max_duplicates=2)
+    class InterventionListAPIView(ListAPIView):
+    """
+    def decorator(view):
+        view.query_budget = QueryBudget(max_queries, max_duplicates)
+        return view
+    return decorator
+
+
+def get_query_budget(view_func):
+    """Budget declared on the view, the view class of DRF and Django views included"""
+    view = getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None) or view_func
+    return getattr(view, 'query_budget', None)
+
+
+def get_default_query_budget():
+    return QueryBudget(settings.QUERY_BUDGET_MAX_QUERIES, settings.QUERY_BUDGET_MAX_DUPLICATES)
+
+
+def get_budgeted_views(resolver=None, namespace=''):
+    """Yield (url name, budget) of all the registered url patterns whose view declares a budget"""
+    resolver = resolver or get_resolver()
+    for pattern in resolver.url_patterns:
+        if isinstance(pattern, URLResolver):
+            yield from get_budgeted_views(
+                pattern, '{}{}:'.format(namespace, pattern.namespace) if pattern.namespace else namespace,
+            )
+        elif pattern.name:
+            budget = get_query_budget(pattern.callback)
+            if budget:
+                yield namespace + pattern.name, budget
+
+
+def normalize_sql(sql):
+    for pattern, replacement in SQL_NORMALIZATIONS:
+        sql = pattern.sub(replacement, sql)
+    return sql
+
+
+def get_call_site():
+    """Innermost eTools frame which is not part of this module, as path:line in function"""
+    frame = sys._getframe(1)
+    while frame:
+        filename = frame.f_code.co_filename
+        if filename.startswith(ETOOLS_ROOT) and filename != __file__:
+            return '{}:{} in {}'.format(os.path.relpath(filename, ETOOLS_ROOT), frame.f_lineno, frame.f_code.co_name)
+        frame = frame.f_back
+    return None
+
+
+class QueryRecorder:
+    """
+    Database execute wrapper recording the fingerprint and the call site of every query, it works without
+    DEBUG as it doesn't rely on connection.queries
+
+    with connection.execute_wrapper(recorder):
+        ...
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append((normalize_sql(sql), get_call_site()))
+        return execute(sql, params, many, context)
+
+    def get_fingerprints(self):
+        """Fingerprints of the recorded queries, the most repeated first"""
+        fingerprints = {}
+        for sql, call_site in self.queries:
+            count, call_sites = fingerprints.get(sql, (0, []))
+            if call_site and call_site not in call_sites:
+                call_sites.append(call_site)
+            fingerprints[sql] = (count + 1, call_sites)
+        return sorted(
+            [QueryFingerprint(sql, count, call_sites) for sql, (count, call_sites) in fingerprints.items()],
+            key=lambda fingerprint: -fingerprint.count,
+        )
+
+    def get_violations(self, budget):
+        """Descriptions of the limits of budget exceeded by the recorded queries"""
+        violations = []
+        if budget.max_queries is not None and len(self.queries) > budget.max_queries:
+            violations.append('{} queries, the budget is {}'.format(len(self.queries), budget.max_queries))
+        if budget.max_duplicates is not None:
+            for fingerprint in self.get_fingerprints():
+                if fingerprint.count > budget.max_duplicates:
+                    violations.append('{} times, the budget is {}: {}\n    at {}'.format(
+                        fingerprint.count, budget.max_duplicates, fingerprint.sql,
+                        ', '.join(fingerprint.call_sites) or 'unknown',
+                    ))
+        return violations
@@ -1,3 +1,5 @@
+import csv
+
 from rest_framework_csv import renderers as r
 
 
@@ -29,3 +31,36 @@ class ListSeperatorCSVRenderMixin:
 
     def clean_list(self, list_item):
         return self.separator.join(list_item)
+
+
+class Echo:
+    """File-like object returning what is written, so that csv.writer returns the lines instead of buffering them"""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(renderer, get_rows, renderer_context=None):
+    """
+    Render the rows returned by get_rows with the CSV renderer line by line, the same lines the renderer
+    would render for their list. The renderers without header take the keys of all the rows as header,
+    so the rows are iterated twice for them, without being kept.
+    """
+    renderer_context = renderer_context or {}
+    header = renderer_context.get('header', renderer.header)
+    labels = renderer_context.get('labels', renderer.labels)
+    writer_opts = renderer_context.get('writer_opts', renderer.writer_opts or {})
+
+    if not header:
+        header_fields = None
+        for item in renderer.flatten_data(get_rows()):
+            header_fields = header_fields or set()
+            header_fields.update(item.keys())
+        if header_fields is None:
+            # no rows, no header
+            return
+        header = sorted(header_fields)
+
+    csv_writer = csv.writer(Echo(), **writer_opts)
+    for row in renderer.tablize(get_rows(), header=header, labels=labels):
+        yield csv_writer.writerow(row)
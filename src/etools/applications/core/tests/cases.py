@@ -122,6 +122,9 @@ class BaseTenantTestCase(TenantTestCase):
             request.tenant = user.profile.country
 
         user = user or self.user
+        # the user is loaded again by each request outside of tests, so are its groups
+        if hasattr(user, 'clear_group_names'):
+            user.clear_group_names()
         force_authenticate(request, user=user)
 
         if "view" in kwargs:
@@ -1,5 +1,11 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
 from django.urls import NoReverseMatch, reverse
 
+from rest_framework import status
+
+from etools.applications.core.query_budget import get_budgeted_views, QueryRecorder
+
 
 def _delimit_namespace(namespace):
     """Add delimiter (':') to namespace if necessary"""
@@ -86,3 +92,53 @@ class WorkspaceRequiredAPITestMixIn:
         return super().forced_auth_req(
             method, url, user=user, data=data, request_format=request_format, **kwargs
         )
+
+
+class QueryBudgetMixin:
+    """Mixin for BaseTenantTestCase. Provides assertions on the query budgets declared with query_budget"""
+
+    def assertQueryBudget(self, budget, func, *args, **kwargs):
+        """Call func and assert that its queries fit in budget, return the result of func"""
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            result = func(*args, **kwargs)
+        violations = recorder.get_violations(budget)
+        if violations:
+            self.fail('Query budget exceeded:\n{}'.format('\n'.join(violations)))
+        return result
+
+    def assertViewQueryBudgets(self, user, url_kwargs=None):
+        """Get all the registered views which declare a query budget as user and assert their budgets.
+
+        url_kwargs maps the url names to the kwargs of their url, the views whose url needs kwargs
+        which are not given are skipped. The data the views return is the data of the test case, the views must
+        be allowed to user so that the budgets are asserted on that data.
+        """
+        url_kwargs = url_kwargs or {}
+        # the profile is loaded by forced_auth_req, outside of the budget of the views
+        getattr(user, 'profile', None)
+        for name, budget in get_budgeted_views():
+            try:
+                url = reverse(name, kwargs=url_kwargs.get(name))
+            except NoReverseMatch:
+                continue
+            with self.subTest(url=url):
+                response = self.assertQueryBudget(budget, self.forced_auth_req, 'get', url, user=user)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class GroupQueriesMixin:
+    """Mixin for BaseTenantTestCase. Provides assertions on the group membership lookups of a request"""
+
+    def assertGroupsLoadedOnce(self, func, *args, **kwargs):
+        """Call func, a request made with forced_auth_req usually, and assert that the queries involving
+        the groups of the users are at most one, return the result of func
+        """
+        table = '"{}"'.format(get_user_model().groups.through._meta.db_table)
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            result = func(*args, **kwargs)
+        queries = ['{}\n    at {}'.format(sql, call_site) for sql, call_site in recorder.queries if table in sql]
+        if len(queries) > 1:
+            self.fail('Groups loaded {} times:\n{}'.format(len(queries), '\n'.join(queries)))
+        return result
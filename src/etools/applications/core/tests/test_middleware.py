@@ -1,7 +1,9 @@
 from unittest import skip
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
 from django.test import override_settings, RequestFactory, TestCase
 from django.urls import reverse
 
@@ -52,6 +54,7 @@ class EToolsTenantMiddlewareTest(TestCase):
     def test_user_without_country_redirects_to_inactive_workspace(self):
         "If user has no country, middleware redirects them to inactive workspace."
         self.request.user.profile.country = None
+        self.request.user.profile.save()
         response = EToolsTenantMiddleware().process_request(self.request)
         self.assertRedirects(response, self.inactive_workspace_url, fetch_redirect_response=False)
 
@@ -62,6 +65,24 @@ class EToolsTenantMiddlewareTest(TestCase):
         self.request.user = superuser
         self.assertEquals(EToolsTenantMiddleware().process_request(self.request), None)
 
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_user_country_cached(self):
+        "The country of the user is resolved without queries once cached, until the profile is saved."
+        cache.clear()
+        self.assertEqual(EToolsTenantMiddleware().process_request(self.request), None)
+        self.assertEqual(self.request.tenant, self.profile.country)
+
+        self.request.user = get_user_model().objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(EToolsTenantMiddleware().process_request(self.request), None)
+        self.assertEqual(self.request.tenant, self.profile.country)
+
+        self.request.user.profile.country = None
+        self.request.user.profile.save()
+        self.request.user = get_user_model().objects.get(pk=self.user.pk)
+        response = EToolsTenantMiddleware().process_request(self.request)
+        self.assertRedirects(response, self.inactive_workspace_url, fetch_redirect_response=False)
+
     @skip('unused')
     @override_settings(INACTIVE_BUSINESS_AREAS=['ZZZ'])
     def test_user_with_inactive_country_redirects_to_inactive_workspace(self):
@@ -0,0 +1,50 @@
+from django.contrib.auth import get_user_model
+
+from rest_framework_csv.renderers import CSVRenderer
+
+from etools.applications.core.mixins import StreamingExportMixin
+from etools.applications.core.renderers import CSVFlatRenderer, stream_csv
+from etools.applications.core.tests.cases import BaseTenantTestCase
+from etools.applications.users.tests.factories import UserFactory
+
+ROWS = [
+    {'name': 'First', 'details': {'code': 1, 'active': True}},
+    {'name': 'Second, with comma', 'details': {'code': 2}, 'tags': ['a', 'b']},
+]
+
+
+class NameCSVRenderer(CSVRenderer):
+    header = ['name', 'details.code']
+    labels = {'name': 'Name'}
+
+
+class TestStreamCSV(BaseTenantTestCase):
+    def assertStreamedAsRendered(self, renderer, rows, renderer_context=None):
+        streamed = ''.join(stream_csv(renderer, lambda: iter(rows), renderer_context))
+        self.assertEqual(streamed, renderer.render(rows, renderer_context=renderer_context or {}).decode('utf-8'))
+
+    def test_header(self):
+        self.assertStreamedAsRendered(NameCSVRenderer(), ROWS)
+        self.assertStreamedAsRendered(NameCSVRenderer(), [])
+        self.assertStreamedAsRendered(NameCSVRenderer(), ROWS, {'labels': {'details.code': 'Code'}})
+
+    def test_without_header(self):
+        self.assertStreamedAsRendered(CSVFlatRenderer(), ROWS)
+        self.assertStreamedAsRendered(CSVFlatRenderer(), [])
+
+
+class TestStreamingExportMixin(BaseTenantTestCase):
+    def test_iterate_queryset(self):
+        users = [UserFactory(groups__data=['UNICEF User']) for __ in range(3)]
+
+        mixin = StreamingExportMixin()
+        mixin.export_chunk_size = 2
+        queryset = get_user_model().objects.filter(pk__in=[user.pk for user in users]).order_by('pk')
+        with self.assertNumQueries(3):
+            # the users and the groups of every chunk
+            iterated = list(mixin.iterate_queryset(queryset.prefetch_related('groups')))
+            self.assertEqual(
+                [[group.name for group in user.groups.all()] for user in iterated],
+                [['UNICEF User']] * 3,
+            )
+        self.assertEqual(iterated, users)
@@ -0,0 +1,140 @@
+from django.db import connection
+from django.http import HttpResponse
+from django.test import override_settings, RequestFactory
+from django.urls import path
+
+from mock import patch
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from etools.applications.core.middleware import QueryBudgetMiddleware
+from etools.applications.core.query_budget import (
+    get_budgeted_views,
+    normalize_sql,
+    query_budget,
+    QueryBudget,
+    QueryRecorder,
+)
+from etools.applications.core.tests.cases import BaseTenantTestCase
+from etools.applications.core.tests.mixins import QueryBudgetMixin
+from etools.applications.field_monitoring.planning.tests.factories import MonitoringActivityFactory
+from etools.applications.partners.tests.factories import InterventionFactory
+from etools.applications.reports.models import ResultType
+from etools.applications.reports.tests.factories import (
+    CountryProgrammeFactory,
+    ResultFactory,
+    ResultTypeFactory,
+    SectionFactory,
+)
+from etools.applications.users.models import Country
+from etools.applications.users.tests.factories import UserFactory
+
+
+def get_countries(count):
+    for pk in range(count):
+        Country.objects.filter(pk=pk).exists()
+
+
+@query_budget(max_queries=2, max_duplicates=1)
+def countries_view(request):
+    get_countries(int(request.GET.get('count', 1)))
+    return HttpResponse()
+
+
+@query_budget(max_queries=5, max_duplicates=2)
+class CountriesAPIView(APIView):
+    def get(self, request):
+        get_countries(2)
+        return Response({})
+
+
+urlpatterns = [
+    path('countries/', CountriesAPIView.as_view(), name='countries'),
+    path('countries/<int:pk>/', CountriesAPIView.as_view(), name='country'),
+]
+
+
+class TestQueryBudget(QueryBudgetMixin, BaseTenantTestCase):
+
+    def test_normalize_sql(self):
+        self.assertEqual(
+            normalize_sql('SELECT "T3"."id" FROM "t" T3 WHERE "T3"."name" = \'it\'\'s\' AND "T3"."id" IN (%s, %s) '
+                          'LIMIT 21'),
+            'SELECT "T3"."id" FROM "t" T3 WHERE "T3"."name" = ? AND "T3"."id" IN (...) LIMIT ?',
+        )
+
+    def test_fingerprints(self):
+        recorder = QueryRecorder()
+        with self.assertNumQueries(4), connection.execute_wrapper(recorder):
+            get_countries(3)
+            Country.objects.count()
+        fingerprints = recorder.get_fingerprints()
+        self.assertEqual([fingerprint.count for fingerprint in fingerprints], [3, 1])
+        self.assertEqual(len(fingerprints[0].call_sites), 1)
+        self.assertIn('test_query_budget.py', fingerprints[0].call_sites[0])
+        self.assertIn('in get_countries', fingerprints[0].call_sites[0])
+
+        self.assertEqual(recorder.get_violations(QueryBudget(4, 3)), [])
+        violations = recorder.get_violations(QueryBudget(3, 2))
+        self.assertEqual(len(violations), 2)
+        self.assertEqual(violations[0], '4 queries, the budget is 3')
+
+    def test_assert_query_budget(self):
+        self.assertQueryBudget(QueryBudget(3, 3), get_countries, 3)
+        with self.assertRaises(AssertionError):
+            self.assertQueryBudget(QueryBudget(None, 2), get_countries, 3)
+
+    @patch('etools.applications.core.middleware.logger')
+    def test_middleware(self, mock_logger):
+        def get_response(request):
+            middleware.process_view(request, countries_view, (), {})
+            return countries_view(request)
+        middleware = QueryBudgetMiddleware(get_response)
+
+        middleware(RequestFactory().get('/'))
+        mock_logger.warning.assert_not_called()
+
+        middleware(RequestFactory().get('/', {'count': 3}))
+        mock_logger.warning.assert_called_once()
+        self.assertIn('3 queries, the budget is 2', mock_logger.warning.call_args[0][3])
+
+    @override_settings(ROOT_URLCONF=__name__)
+    def test_view_query_budgets(self):
+        self.assertEqual(list(get_budgeted_views()), [
+            ('countries', QueryBudget(5, 2)),
+            ('country', QueryBudget(5, 2)),
+        ])
+        self.assertViewQueryBudgets(UserFactory(), url_kwargs={'country': {'pk': 1}})
+
+
+class TestViewQueryBudgets(QueryBudgetMixin, BaseTenantTestCase):
+    """The budgets declared on the views, with more rows than the duplicates allowed so that an N+1 exceeds them"""
+    ROWS = 6
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory(is_staff=True, groups__data=['UNICEF User', 'Partnership Manager', 'PME'])
+        country_programme = CountryProgrammeFactory()
+        section = SectionFactory()
+        output_type = ResultTypeFactory(name=ResultType.OUTPUT)
+
+        cls.activities = []
+        for __ in range(cls.ROWS):
+            intervention = InterventionFactory(agreement__country_programme=country_programme)
+            intervention.sections.add(section)
+            output = ResultFactory(result_type=output_type, country_programme=country_programme)
+            cls.activities.append(MonitoringActivityFactory(
+                sections=[section],
+                team_members=[cls.user],
+                partners=[intervention.agreement.partner],
+                interventions=[intervention],
+                cp_outputs=[output],
+            ))
+
+    def test_view_query_budgets(self):
+        activity = self.activities[0]
+        self.assertViewQueryBudgets(self.user, url_kwargs={
+            'partners_api:agreement-detail': {'pk': activity.interventions.first().agreement_id},
+            'reports:report-result-detail': {'pk': activity.cp_outputs.first().pk},
+            'field_monitoring_planning:activities-detail': {'pk': activity.pk},
+        })
@@ -12,6 +12,7 @@ from waffle.models import BaseModel, CACHE_EMPTY, set_flag
 from waffle.utils import get_cache, get_setting, keyfmt
 
 from etools.applications.users.models import Country
+from etools.libraries.djangolib.utils import get_user_group_ids
 
 cache = get_cache()
 
@@ -141,8 +142,7 @@ class TenantFlag(BaseModel):
             return True
 
         group_ids = self._get_group_ids()
-        user_groups = set(user.groups.all().values_list('pk', flat=True))
-        if group_ids.intersection(user_groups):
+        if group_ids.intersection(get_user_group_ids(user)):
             return True
 
         return None
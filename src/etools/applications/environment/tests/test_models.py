@@ -109,8 +109,8 @@ class TenantFlagTest(TestCase):
         f = TenantFlagFactory()
         with self.assertNumQueries(4):
             self.assertFalse(f.is_active(self.request))
-        with self.assertNumQueries(1):
-            # we still need to query the user's list of groups
+        with self.assertNumQueries(0):
+            # the groups of the user are memoized on the user
             self.assertFalse(f.is_active(self.request))
 
     def test_group_set_is_cached(self):
@@ -121,8 +121,8 @@ class TenantFlagTest(TestCase):
         self.user.groups.add(group)
         with self.assertNumQueries(4):
             self.assertTrue(f.is_active(self.request))
-        with self.assertNumQueries(1):
-            # we still need to query the user's list of groups
+        with self.assertNumQueries(0):
+            # the groups of the user are memoized on the user
             self.assertTrue(f.is_active(self.request))
 
     def test_authenticated_flag(self):
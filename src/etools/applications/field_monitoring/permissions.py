@@ -4,6 +4,7 @@ from etools.applications.field_monitoring.groups import FMUser
 from etools.applications.field_monitoring.planning.activity_validation.permissions import ActivityPermissions
 from etools.applications.field_monitoring.planning.models import MonitoringActivity
 from etools.applications.tpm.models import PME
+from etools.libraries.djangolib.utils import get_user_group_names
 
 
 class UserInGroup(BasePermission):
@@ -13,7 +14,7 @@ class UserInGroup(BasePermission):
     group = None
 
     def has_permission(self, request, view):
-        return self.group in map(lambda g: g.name, request.user.groups.all())
+        return self.group in get_user_group_names(request.user)
 
 
 class SimplePermission(BasePermission):
@@ -26,6 +26,7 @@ from etools.applications.field_monitoring.planning.transitions.permissions impor
     user_is_pme_permission,
     user_is_visit_lead_permission,
 )
+from etools.applications.hact.tracker import mark_partners_dirty
 from etools.applications.partners.models import Intervention, PartnerOrganization
 from etools.applications.reports.models import Result, Section
 from etools.applications.tpm.models import PME
@@ -104,6 +105,10 @@ class QuestionTemplate(QuestionTargetMixin, models.Model):
 
 class MonitoringActivitiesQuerySet(models.QuerySet):
     def filter_hact_for_partner(self, partner_id: int):
+        return self.filter_hact().filter(partners=partner_id)
+
+    def filter_hact(self):
+        """completed activities where the hact question was answered, whatever the partner"""
         from etools.applications.field_monitoring.data_collection.models import ActivityQuestionOverallFinding
 
         question_sq = ActivityQuestionOverallFinding.objects.filter(
@@ -124,7 +129,6 @@ class MonitoringActivitiesQuerySet(models.QuerySet):
             is_hact=Exists(question_sq),
             # has_finding_for_partner=Exists(finding_sq),
         ).filter(
-            partners=partner_id,
             status=MonitoringActivity.STATUS_COMPLETED,
             is_hact=True,
             # has_finding_for_partner=True,
@@ -571,6 +575,8 @@ class MonitoringActivity(
         for partner_org in partner_orgs:
             partner_org.update_programmatic_visits(event_date=self.end_date, update_one=True)
 
+        mark_partners_dirty(self.partners.values_list('id', flat=True))
+
     def init_offline_blueprints(self):
         MonitoringActivityOfflineSynchronizer(self).initialize_blueprints()
 
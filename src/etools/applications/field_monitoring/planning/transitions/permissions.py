@@ -3,11 +3,11 @@ from etools.applications.tpm.models import PME
 
 
 def user_is_pme_permission(activity, user):
-    return PME.as_group() in user.groups.all()
+    return PME.name in user.group_names
 
 
 def user_is_field_monitor_permission(activity, user):
-    if {FMUser.as_group(), PME.as_group()}.intersection(user.groups.all()):
+    if {FMUser.name, PME.name}.intersection(user.group_names):
         return True
     return False
 
@@ -19,6 +19,7 @@ from unicef_restlib.views import NestedViewSetMixin
 from unicef_snapshot.models import Activity as HistoryActivity
 
 from etools.applications.audit.models import UNICEFUser
+from etools.applications.core.query_budget import query_budget
 from etools.applications.field_monitoring.fm_settings.models import Question
 from etools.applications.field_monitoring.fm_settings.serializers import FMCommonAttachmentSerializer
 from etools.applications.field_monitoring.permissions import (
@@ -133,6 +134,7 @@ class TemplatedQuestionsViewSet(
         return _('Templates')
 
 
+@query_budget(max_queries=30, max_duplicates=4)
 class MonitoringActivitiesViewSet(
     ValidatorViewMixin,
     FMBaseViewSet,
@@ -142,9 +144,9 @@ class MonitoringActivitiesViewSet(
     Retrieve and Update Agreement.
     """
     queryset = MonitoringActivity.objects.annotate(checklists_count=Count('checklists')).select_related(
-        'tpm_partner', 'visit_lead', 'location__gateway', 'location_site',
+        'tpm_partner', 'visit_lead', 'location__gateway', 'location_site__parent__gateway',
     ).prefetch_related(
-        'team_members', 'partners', 'interventions', 'cp_outputs'
+        'team_members', 'partners', 'interventions', 'cp_outputs', 'sections',
     ).order_by("-id")
     serializer_class = MonitoringActivitySerializer
     serializer_action_classes = {
@@ -169,7 +171,7 @@ class MonitoringActivitiesViewSet(
         queryset = super().get_queryset()
 
         # todo: change to the user.is_unicef
-        if UNICEFUser.name not in [g.name for g in self.request.user.groups.all()]:
+        if UNICEFUser.name not in self.request.user.group_names:
             # we should hide activities before assignment
             # if reject reason available activity should be visible (draft + reject_reason = rejected)
             queryset = queryset.filter(
@@ -0,0 +1,25 @@
+from django.core.management import BaseCommand
+
+from etools.applications.funds.synchronizers import FundReservationsSynchronizer
+from etools.applications.users.models import Country
+
+
+class Command(BaseCommand):
+    help = 'Sync Fund Reservations from VISION'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--schema', dest='schema')
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Repair run: process unchanged records too and recompute the totals of every FR header',
+        )
+
+    def handle(self, *args, **options):
+        countries = Country.objects.filter(vision_sync_enabled=True)
+        if options['schema']:
+            countries = countries.filter(schema_name=options['schema'])
+
+        for country in countries:
+            self.stdout.write('Syncing Fund Reservations for {}'.format(country.name))
+            FundReservationsSynchronizer(business_area_code=country.business_area_code, full=options['full']).sync()
@@ -2,10 +2,12 @@ import datetime
 import logging
 from decimal import Decimal
 
-from django.db.models import Sum
+from django.db.models import DecimalField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
 from unicef_vision.settings import INSIGHT_DATE_FORMAT
-from unicef_vision.synchronizers import FileDataSynchronizer, MultiModelDataSynchronizer
+from unicef_vision.synchronizers import MultiModelDataSynchronizer
 from unicef_vision.utils import comp_decimals
 
 from etools.applications.funds.models import (
@@ -14,13 +16,17 @@ from etools.applications.funds.models import (
     FundsReservationHeader,
     FundsReservationItem,
 )
-from etools.applications.vision.synchronizers import VisionDataTenantSynchronizer
+from etools.applications.vision.synchronizers import FileDataSynchronizer, VisionDataTenantSynchronizer
 
 
 class FundReservationsSynchronizer(VisionDataTenantSynchronizer):
     # DELEGATED flag to inform whether we're synching delegated FRs or local FRs. This is used by the manual
     # synchronizer
     DELEGATED = False
+    STREAMING = True
+    HASH_KEY = 'FR_NUMBER'
+    # number of rows sent to the database per bulk_create / bulk_update statement
+    BATCH_SIZE = 500
 
     ENDPOINT = 'fundsreservations'
     REQUIRED_NON_NULL_VALUE_KEYS = (
@@ -103,6 +109,7 @@ class FundReservationsSynchronizer(VisionDataTenantSynchronizer):
         self.header_records = {}
         self.item_records = {}
         self.fr_headers = {}
+        self.touched_headers = set()
         self.REVERSE_MAPPING = {v: k for k, v in self.MAPPING.items()}
         self.REVERSE_HEADER_FIELDS = [self.REVERSE_MAPPING[v] for v in self.HEADER_FIELDS]
         self.REVERSE_ITEM_FIELDS = [self.REVERSE_MAPPING[v] for v in self.LINE_ITEM_FIELDS]
@@ -169,6 +176,7 @@ class FundReservationsSynchronizer(VisionDataTenantSynchronizer):
     def set_mapping(self, records):
         self.header_records = {}
         self.item_records = {}
+        self.fr_headers = {}
         for r in records:
             if r['FR_NUMBER'] not in self.header_records:
                 self.header_records[r['FR_NUMBER']] = self.map_header_from_record(r)
@@ -213,17 +221,14 @@ class FundReservationsSynchronizer(VisionDataTenantSynchronizer):
             to_create.append(FundsReservationHeader(**record))
 
         if to_create:
-            created_objects = FundsReservationHeader.objects.bulk_create(to_create)
+            created_objects = FundsReservationHeader.objects.bulk_create(to_create, batch_size=self.BATCH_SIZE)
             self.map_header_objects(created_objects)
 
         self.map_header_objects(to_update)
-        updated = 0
-        for h in to_update:
-            if self.update_obj(h, self.header_records.get(h.fr_number)):
-                h.save()
-                updated += 1
+        changed = [h for h in to_update if self.update_obj(h, self.header_records.get(h.fr_number))]
+        self.bulk_update(FundsReservationHeader, changed, self.REVERSE_HEADER_FIELDS)
 
-        return updated, len(to_create)
+        return len(changed), len(to_create)
 
     def li_sync(self):
 
@@ -245,48 +250,95 @@ class FundReservationsSynchronizer(VisionDataTenantSynchronizer):
             del record['fr_number']
             to_create.append(FundsReservationItem(**record))
 
-        FundsReservationItem.objects.bulk_create(to_create)
-        updated = 0
+        FundsReservationItem.objects.bulk_create(to_create, batch_size=self.BATCH_SIZE)
+        changed = []
         for li in to_update:
             local_record = self.item_records.get(li.fr_ref_number)
             del local_record['fr_number']
             if self.update_obj(li, local_record):
-                li.save()
-                updated += 1
+                changed.append(li)
+        update_fields = [f for f in self.REVERSE_ITEM_FIELDS if f != 'fr_number'] + ['fr_ref_number']
+        self.bulk_update(FundsReservationItem, changed, update_fields)
 
-        return updated, len(to_create)
+        # only headers with new or changed line items can have a different total
+        self.touched_headers.update(li.fund_reservation_id for li in to_create + changed)
 
-    @staticmethod
-    def update_fr_totals():
-        totals_updated = 0
-        qs = FundsReservationHeader.objects
-        qs = qs.annotate(my_li_total_sum=Sum('fr_items__overall_amount_dc'))
-        for fr in qs:
-            # Note that Sum() returns None, not 0, if there's nothing to sum.
-            total_li_sum = fr.my_li_total_sum or Decimal('0.00')
-            if not comp_decimals(total_li_sum, fr.total_amt_local):
-                fr.total_amt_local = total_li_sum
-                fr.save()
-                totals_updated += 1
-        return totals_updated
+        return len(changed), len(to_create)
 
-    def _save_records(self, records):
+    def bulk_update(self, model, objs, fields):
+        # bulk_update skips save(), so the TimeStampedModel modified date has to be set by hand
+        if not objs:
+            return
+        now = timezone.now()
+        for obj in objs:
+            obj.modified = now
+        model.objects.bulk_update(objs, list(fields) + ['modified'], batch_size=self.BATCH_SIZE)
 
-        filtered_records = self._filter_records(records)
+    @staticmethod
+    def update_fr_totals(header_ids=None):
+        """
+        Recompute total_amt_local from the line items in a single UPDATE.
+        If header_ids is given only those headers are recomputed, otherwise every header in the schema.
+        """
+        qs = FundsReservationHeader.objects.all()
+        if header_ids is not None:
+            if not header_ids:
+                return 0
+            qs = qs.filter(pk__in=header_ids)
+
+        li_total = FundsReservationItem.objects.filter(
+            fund_reservation=OuterRef('pk'),
+        ).order_by().values('fund_reservation').annotate(
+            total=Sum('overall_amount_dc'),
+        ).values('total')
+        # Note that Sum() returns None, not 0, if there's nothing to sum.
+        total = Coalesce(
+            Subquery(li_total),
+            Value(Decimal('0.00')),
+            output_field=DecimalField(max_digits=20, decimal_places=2),
+        )
+        return qs.exclude(
+            total_amt_local=total,
+        ).update(total_amt_local=total, modified=timezone.now())
+
+    def get_record_key(self, record):
+        return self.get_fr_item_number(record)
+
+    def _sync_records(self, records):
+
+        filtered_records = self._changed_records(self._filter_records(records))
         self.set_mapping(filtered_records)
         h_processed = self.header_sync()
         i_processed = self.li_sync()
-        h_totals_updated = self.update_fr_totals()
+        self._store_record_hashes()
 
         logging.info('tocreate {}'.format(h_processed[1]))
         logging.info('toupdate {}'.format(h_processed[0]))
         logging.info('tocreate li {}'.format(i_processed[1]))
         logging.info('toupdate li {}'.format(i_processed[0]))
-        logging.info('totals_updated {}'.format(h_totals_updated))
+        logging.info('unchanged {}'.format(len(self.header_records) - sum(h_processed)))
+        logging.info('unchanged li {}'.format(len(self.item_records) - sum(i_processed)))
         processed = h_processed[0] + i_processed[0] + h_processed[1] + i_processed[1]
 
         return processed
 
+    def _sync_totals(self):
+        h_totals_updated = self.update_fr_totals(None if self.full else self.touched_headers)
+        logging.info('totals_updated {}'.format(h_totals_updated))
+
+    def _save_records(self, records):
+        processed = self._sync_records(records)
+        self._sync_totals()
+        return processed
+
+    def _save_batches(self, batches):
+        # totals are recomputed once, after the line items of every batch are saved
+        processed = 0
+        for batch in batches:
+            processed += self._sync_records(batch)
+        self._sync_totals()
+        return processed
+
 
 class DelegatedFundReservationsSynchronizer(FundReservationsSynchronizer, MultiModelDataSynchronizer):
     DELEGATED = True
@@ -295,6 +347,8 @@ class DelegatedFundReservationsSynchronizer(FundReservationsSynchronizer, MultiM
 class FundCommitmentSynchronizer(VisionDataTenantSynchronizer):
 
     ENDPOINT = 'fundscommitments'
+    STREAMING = True
+    HASH_KEY = 'FC_NUMBER'
     REQUIRED_KEYS = (
         "VENDOR_CODE",
         "FC_NUMBER",
@@ -399,6 +453,7 @@ class FundCommitmentSynchronizer(VisionDataTenantSynchronizer):
     def set_mapping(self, records):
         self.header_records = {}
         self.item_records = {}
+        self.fc_headers = {}
         for r in records:
             if r['FC_NUMBER'] not in self.header_records:
                 self.header_records[r['FC_NUMBER']] = self.map_header_from_record(r)
@@ -481,12 +536,16 @@ class FundCommitmentSynchronizer(VisionDataTenantSynchronizer):
                 updated += 1
         return updated, len(to_create)
 
+    def get_record_key(self, record):
+        return self.get_fc_item_number(record)
+
     def _save_records(self, records):
 
-        filtered_records = self._filter_records(records)
+        filtered_records = self._changed_records(self._filter_records(records))
         self.set_mapping(filtered_records)
         h_processed = self.header_sync()
         i_processed = self.li_sync()
+        self._store_record_hashes()
 
         logging.info('tocreate {}'.format(h_processed[1]))
         logging.info('toupdate {}'.format(h_processed[0]))
@@ -128,6 +128,37 @@ class TestFundReservationsSynchronizer(BaseTenantTestCase):
         # return a value, but if there's nothing to sum, it returns None.
         self.adapter.update_fr_totals()
 
+    def test_update_fr_totals(self):
+        self.fund_item.fund_reservation = self.fund_header
+        self.fund_item.save()
+        FundsReservationItemFactory(
+            fund_reservation=self.fund_header,
+            overall_amount_dc="7.50",
+        )
+        empty_header = FundsReservationHeaderFactory(total_amt_local="3.00")
+        self.adapter.update_fr_totals()
+        self.fund_header.refresh_from_db()
+        self.assertEqual(self.fund_header.total_amt_local, Decimal("12.50"))
+        empty_header.refresh_from_db()
+        self.assertEqual(empty_header.total_amt_local, Decimal("0.00"))
+        # second run has nothing left to fix
+        self.assertEqual(self.adapter.update_fr_totals(), 0)
+
+    def test_update_fr_totals_touched_headers_only(self):
+        other_header = FundsReservationHeaderFactory(total_amt_local="3.00")
+        FundsReservationHeader.objects.filter(pk=self.fund_item.fund_reservation_id).update(total_amt_local="1.00")
+        self.assertEqual(self.adapter.update_fr_totals(set()), 0)
+        self.assertEqual(self.adapter.update_fr_totals({self.fund_item.fund_reservation_id}), 1)
+        other_header.refresh_from_db()
+        self.assertEqual(other_header.total_amt_local, Decimal("3.00"))
+
+    def test_li_sync_touched_headers(self):
+        self.data["LINE_ITEM"] = "333"
+        self.adapter.set_mapping([self.data])
+        self.adapter.map_header_objects([self.fund_header])
+        self.adapter.li_sync()
+        self.assertEqual(self.adapter.touched_headers, {self.fund_header.pk})
+
     def test_filter_records_no_overall_amount(self):
         """If no overall amount then ignore record"""
         self.data["OVERALL_AMOUNT"] = ""
@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+GRAPH_PAYLOADS = ('graph', 'graph-export')
+HISTORY_PAYLOADS = ('history', 'history-export')
+
+
+def get_cache_key(name, year=None):
+    return 'hact-{}-{}-{}'.format(connection.schema_name, name, year or 'all')
+
+
+def get_cached_payload(name, year, build):
+    """Return the payload of the dashboard or history endpoint for the year, build and cache it if missing"""
+    key = get_cache_key(name, year)
+    payload = cache.get(key)
+    if payload is None:
+        payload = build()
+        cache.set(key, payload, timeout=settings.HACT_CACHE_TIMEOUT)
+    return payload
+
+
+def clear_cached_payloads(names, years):
+    keys = [get_cache_key(name, year) for name in names for year in years]
+    # after the commit, otherwise a request in between would cache the previous values again
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def clear_aggregate_hact_cache(sender, instance, **kwargs):
+    clear_cached_payloads(GRAPH_PAYLOADS, [instance.year])
+
+
+def clear_hact_history_cache(sender, instance, **kwargs):
+    clear_cached_payloads(HISTORY_PAYLOADS, [instance.year, None])
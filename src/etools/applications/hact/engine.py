@@ -0,0 +1,213 @@
+import datetime
+import json
+from collections import Counter, defaultdict
+
+from django.db.models import Count, F, Max, Q, Sum
+from django.utils import timezone
+
+from etools.applications.audit.models import Audit, Engagement, SpecialAudit, SpotCheck
+from etools.applications.field_monitoring.planning.models import MonitoringActivity, MonitoringActivityGroup
+from etools.applications.partners.models import (
+    Intervention,
+    InterventionPlannedVisits,
+    PartnerOrganization,
+    PartnerPlannedVisits,
+    PartnerType,
+)
+from etools.applications.t2f.models import Travel, TravelType
+from etools.applications.tpm.models import TPMActivity, TPMVisit
+from etools.libraries.pythonlib.encoders import CustomJSONEncoder
+
+QUARTERS = ('q1', 'q2', 'q3', 'q4')
+HACT_ENGAGEMENTS = ('programmatic_visits', 'spot_checks', 'audits')
+
+
+def quarter_counts(queryset, partner_field, date_field):
+    """Count the rows of queryset per partner and per quarter of date_field with a single grouped query"""
+    quarters = {
+        quarter: Count('pk', filter=Q(**{'{}__quarter'.format(date_field): number}))
+        for number, quarter in enumerate(QUARTERS, start=1)
+    }
+    rows = queryset.values(partner_field).annotate(total=Count('pk'), **quarters).order_by()
+    return {row.pop(partner_field): Counter(row) for row in rows}
+
+
+def get_quarter_name(date):
+    return QUARTERS[(date.month - 1) // 3]
+
+
+class HactEngine:
+    """
+    Compute the HACT values of all the hact active partners of the current tenant with one grouped query per
+    source (planned visits, travels, tpm activities, monitoring activities, spot checks and audits) instead of
+    the per partner update_* methods of PartnerOrganization, which issue some forty queries and five saves
+    per partner. The values are the same, only the partners whose values changed are written back.
+    """
+    BATCH_SIZE = 500
+
+    def __init__(self, partner_ids=None, year=None):
+        self.year = year or datetime.date.today().year
+        partners = PartnerOrganization.objects.hact_active().select_related('planned_engagement')
+        if partner_ids is not None:
+            partners = partners.filter(pk__in=partner_ids)
+        self.partners = list(partners)
+        self.partner_ids = [partner.pk for partner in self.partners]
+        # partners whose values were written by update()
+        self.changed = []
+
+    def get_planned_visits(self):
+        government = [partner.pk for partner in self.partners if partner.partner_type == PartnerType.GOVERNMENT]
+        others = [partner.pk for partner in self.partners if partner.partner_type != PartnerType.GOVERNMENT]
+
+        planned = {}
+        interventions_visits = InterventionPlannedVisits.objects.filter(
+            intervention__agreement__partner__in=others,
+            year=self.year,
+        ).exclude(
+            intervention__status=Intervention.DRAFT,
+        ).values('intervention__agreement__partner').annotate(
+            **{quarter: Sum('programmatic_{}'.format(quarter)) for quarter in QUARTERS}
+        ).order_by()
+        for row in interventions_visits:
+            planned[row['intervention__agreement__partner']] = [row[quarter] or 0 for quarter in QUARTERS]
+
+        partners_visits = PartnerPlannedVisits.objects.filter(partner__in=government, year=self.year).values_list(
+            'partner', *['programmatic_{}'.format(quarter) for quarter in QUARTERS]
+        )
+        for partner_id, *quarters in partners_visits:
+            planned[partner_id] = quarters
+        return planned
+
+    def get_completed_visits(self):
+        travels = Travel.objects.filter(
+            activities__travel_type=TravelType.PROGRAMME_MONITORING,
+            traveler=F('activities__primary_traveler'),
+            status=Travel.COMPLETED,
+            end_date__year=self.year,
+            activities__partner__in=self.partner_ids,
+        )
+        completed = defaultdict(Counter)
+        for partner_id, counts in quarter_counts(travels, 'activities__partner', 'end_date').items():
+            completed[partner_id].update(counts)
+
+        tpm_activities = TPMActivity.objects.filter(
+            is_pv=True,
+            partner__in=self.partner_ids,
+            tpm_visit__status=TPMVisit.UNICEF_APPROVED,
+            date__year=self.year,
+        )
+        for partner_id, counts in quarter_counts(tpm_activities, 'partner', 'date').items():
+            completed[partner_id].update(counts)
+
+        # a group of monitoring activities is one visit, in the quarter its last completed activity ended
+        groups = MonitoringActivityGroup.objects.filter(
+            partner__in=self.partner_ids,
+            monitoring_activities__status=MonitoringActivity.STATUS_COMPLETED,
+        ).values('pk', 'partner').annotate(
+            end_date=Max('monitoring_activities__end_date'),
+        ).filter(
+            end_date__year=self.year,
+        ).order_by()
+        for group in groups:
+            completed[group['partner']].update({get_quarter_name(group['end_date']): 1, 'total': 1})
+
+        grouped_activities = defaultdict(set)
+        for partner_id, activity_id in MonitoringActivityGroup.objects.filter(
+                partner__in=self.partner_ids).values_list('partner', 'monitoring_activities__id'):
+            grouped_activities[partner_id].add(activity_id)
+
+        activities = MonitoringActivity.objects.filter(
+            end_date__year=self.year,
+            partners__in=self.partner_ids,
+        ).filter_hact().values_list('partners', 'pk', 'end_date')
+        for partner_id, activity_id, end_date in activities:
+            # same as the exclude(id__in=grouped activities) of the per partner query, where the null id
+            # of an empty group makes NOT IN exclude all the activities of the partner
+            if activity_id in grouped_activities[partner_id] or None in grouped_activities[partner_id]:
+                continue
+            completed[partner_id].update({get_quarter_name(end_date): 1, 'total': 1})
+        return completed
+
+    def get_spot_checks(self):
+        spot_checks = SpotCheck.objects.filter(
+            partner__in=self.partner_ids,
+            date_of_draft_report_to_ip__year=self.year,
+        ).exclude(status=Engagement.CANCELLED)
+        return quarter_counts(spot_checks, 'partner', 'date_of_draft_report_to_ip')
+
+    def get_audits(self):
+        """Return the completed audits and special audits and the outstanding findings of the audits per partner"""
+        audits = Audit.objects.filter(
+            partner__in=self.partner_ids,
+            date_of_draft_report_to_ip__year=self.year,
+        ).exclude(status=Engagement.CANCELLED).values('partner').annotate(
+            completed=Count('pk'),
+            outstanding_findings=Sum(
+                F('financial_findings') - F('amount_refunded') - F('additional_supporting_documentation_provided') -
+                F('justification_provided_and_accepted') - F('write_off_required')
+            ),
+        ).order_by()
+        completed = Counter()
+        outstanding_findings = {}
+        for row in audits:
+            completed[row['partner']] += row['completed']
+            outstanding_findings[row['partner']] = row['outstanding_findings'] or 0
+
+        special_audits = SpecialAudit.objects.filter(
+            partner__in=self.partner_ids,
+            date_of_draft_report_to_ip__year=self.year,
+        ).exclude(status=Engagement.CANCELLED).values('partner').annotate(completed=Count('pk')).order_by()
+        for row in special_audits:
+            completed[row['partner']] += row['completed']
+        return completed, outstanding_findings
+
+    def update_partner(self, partner, planned, completed, spot_checks, audits, outstanding_findings):
+        """Set the new values in partner.hact_values, return the minimum requirements which changed"""
+        programmatic_visits = partner.hact_values['programmatic_visits']
+        for quarter, value in zip(QUARTERS, planned):
+            programmatic_visits['planned'][quarter] = value
+        programmatic_visits['planned']['total'] = sum(planned)
+        for key in QUARTERS + ('total', ):
+            programmatic_visits['completed'][key] = completed[key]
+            partner.hact_values['spot_checks']['completed'][key] = spot_checks[key]
+        partner.hact_values['audits']['completed'] = audits
+        partner.hact_values['outstanding_findings'] = outstanding_findings
+        partner.hact_values['assurance_coverage'] = partner.assurance_coverage
+
+        updated = []
+        for hact_eng in HACT_ENGAGEMENTS:
+            if partner.hact_values[hact_eng]['minimum_requirements'] != partner.hact_min_requirements[hact_eng]:
+                partner.hact_values[hact_eng]['minimum_requirements'] = partner.hact_min_requirements[hact_eng]
+                updated.append(hact_eng)
+        return updated
+
+    def update(self):
+        """
+        Update the hact values of the partners
+        :return: list of (partner, updated minimum requirements) for the partners whose requirements changed
+        """
+        planned_visits = self.get_planned_visits()
+        completed_visits = self.get_completed_visits()
+        spot_checks = self.get_spot_checks()
+        audits, outstanding_findings = self.get_audits()
+
+        min_requirements_updated = []
+        now = timezone.now()
+        for partner in self.partners:
+            previous = json.dumps(partner.hact_values, cls=CustomJSONEncoder, sort_keys=True)
+            updated = self.update_partner(
+                partner,
+                planned_visits.get(partner.pk, [0, 0, 0, 0]),
+                completed_visits.get(partner.pk, Counter()),
+                spot_checks.get(partner.pk, Counter()),
+                audits[partner.pk],
+                outstanding_findings.get(partner.pk, 0),
+            )
+            if updated:
+                min_requirements_updated.append((partner, updated))
+            if json.dumps(partner.hact_values, cls=CustomJSONEncoder, sort_keys=True) != previous:
+                partner.modified = now
+                self.changed.append(partner)
+
+        PartnerOrganization.objects.bulk_update(self.changed, ['hact_values', 'modified'], batch_size=self.BATCH_SIZE)
+        return min_requirements_updated
@@ -1,20 +1,31 @@
 from datetime import datetime
 
 from django.core.management import BaseCommand
-from django.db import transaction
+from django.db import connection, transaction
+from django.utils import timezone
 
-from etools.applications.core.util_scripts import set_country
+from etools.applications.hact.cache import clear_cached_payloads, HISTORY_PAYLOADS
 from etools.applications.hact.models import HactHistory
 from etools.applications.partners.models import hact_default, PartnerOrganization, PlannedEngagement
 from etools.applications.users.models import Country
 
 
 class Command(BaseCommand):
+    """
+    Freeze the hact values of the partners in their HactHistory of the year and reset them for the next year.
+
+    Each country is frozen in its own transaction with a single partner query and chunked bulk writes,
+    so an interrupted run can be started again: the countries which already have a history for the
+    year are skipped, unless --force is given.
+    """
     help = 'Freeze Hact Data for Current Year'
+    BATCH_SIZE = 500
 
     def add_arguments(self, parser):
         parser.add_argument('--schema', dest='schema')
         parser.add_argument('--year', dest='year', help='History year', type=int, default=datetime.now().year)
+        parser.add_argument('--force', dest='force', action='store_true',
+                            help='Freeze again the countries which already have a history for the year')
 
     def get_or_empty(self, hact_json, keys):
         value = hact_json
@@ -26,10 +37,9 @@ class Command(BaseCommand):
             return None
         return value
 
-    def freeze_data(self, hact_history):
+    def get_partner_values(self, partner):
         # partner values list needs to be in the desired order for export results
-        partner = hact_history.partner
-        partner_hact = hact_history.partner.hact_values
+        partner_hact = partner.hact_values
         planned_engagement = getattr(partner, 'planned_engagement', {})
         partner_values = [
             ('Implementing Partner', partner.name),
@@ -78,10 +88,48 @@ class Command(BaseCommand):
             ('Audit Completed', self.get_or_empty(partner_hact, ['audits', 'completed'])),
             ('Audit Outstanding Findings', self.get_or_empty(partner_hact, ['outstanding_findings', ])),
         ]
-        hact_history.partner_values = partner_values
-        hact_history.save()
+        return partner_values
+
+    def freeze_country(self, year):
+        now = timezone.now()
+        partners = list(PartnerOrganization.objects.select_related('planned_engagement'))
+        histories = {history.partner_id: history for history in HactHistory.objects.filter(year=year)}
+
+        new_histories, updated_histories = [], []
+        for partner in partners:
+            if (partner.reported_cy and partner.reported_cy > 0) or (
+                    partner.total_ct_cy and partner.total_ct_cy > 0):
+                partner_values = self.get_partner_values(partner)
+                if partner.pk in histories:
+                    hact_history = histories[partner.pk]
+                    hact_history.partner_values = partner_values
+                    hact_history.modified = now
+                    updated_histories.append(hact_history)
+                else:
+                    new_histories.append(HactHistory(partner=partner, year=year, partner_values=partner_values))
+        HactHistory.objects.bulk_create(new_histories, batch_size=self.BATCH_SIZE)
+        HactHistory.objects.bulk_update(updated_histories, ['partner_values', 'modified'], batch_size=self.BATCH_SIZE)
+        # bulk writes don't send the signals which clear the cached history
+        clear_cached_payloads(HISTORY_PAYLOADS, [year, None])
+
+        # reset the values for the next year
+        PartnerOrganization.objects.update(hact_values=hact_default(), modified=now)
+        PlannedEngagement.objects.bulk_create([
+            PlannedEngagement(partner=partner) for partner in partners
+            if getattr(partner, 'planned_engagement', None) is None
+        ], batch_size=self.BATCH_SIZE)
+        PlannedEngagement.objects.update(
+            spot_check_follow_up=0,
+            spot_check_planned_q1=0,
+            spot_check_planned_q2=0,
+            spot_check_planned_q3=0,
+            spot_check_planned_q4=0,
+            scheduled_audit=False,
+            special_audit=False,
+            modified=now,
+        )
+        return len(new_histories) + len(updated_histories)
 
-    @transaction.atomic
     def handle(self, *args, **options):
 
         countries = Country.objects.exclude(name__iexact='global')
@@ -92,15 +140,11 @@ class Command(BaseCommand):
         self.stdout.write('Freeze HACT data for {}'.format(year))
 
         for country in countries:
-            set_country(country.name)
+            connection.set_tenant(country)
+            if not options['force'] and HactHistory.objects.filter(year=year).exists():
+                self.stdout.write('Skipping {}, already frozen'.format(country.name))
+                continue
             self.stdout.write('Freezing data for {}'.format(country.name))
-            for partner in PartnerOrganization.objects.all():
-                if (partner.reported_cy and partner.reported_cy > 0) or (
-                        partner.total_ct_cy and partner.total_ct_cy > 0):
-                    hact_history, _ = HactHistory.objects.get_or_create(partner=partner, year=year)
-                    self.freeze_data(hact_history)
-                partner.hact_values = hact_default()
-                partner.save()
-
-                plan, _ = PlannedEngagement.objects.get_or_create(partner=partner)
-                plan.reset()
+            with transaction.atomic():
+                frozen = self.freeze_country(year)
+            self.stdout.write('Frozen {} partners for {}'.format(frozen, country.name))
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.6 on 2026-10-18 14:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partners', '0049_alter_interventionresultlink_unique_together'),
+        ('hact', '0003_auto_20190122_1412'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HactDirtyPartner',
+            fields=[
+                ('partner', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='+', serialize=False, to='partners.partnerorganization', verbose_name='Partner')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Created')),
+            ],
+            options={
+                'verbose_name_plural': 'Hact Dirty Partners',
+            },
+        ),
+    ]
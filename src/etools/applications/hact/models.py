@@ -3,16 +3,56 @@ from decimal import Decimal
 
 from django.db import models
 from django.db.models import Count, Q, Sum
-from django.db.models.functions import Coalesce
+from django.db.models.fields.json import KeyTextTransform, KeyTransform
+from django.db.models.functions import Cast, Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from model_utils.models import TimeStampedModel
 
-from etools.applications.audit.models import Audit, Engagement, MicroAssessment, SpecialAudit, SpotCheck
+from etools.applications.audit.models import Audit, Engagement
+from etools.applications.hact.cache import clear_aggregate_hact_cache, clear_hact_history_cache
 from etools.applications.partners.models import PartnerOrganization, PartnerType
 from etools.libraries.pythonlib.datetime import get_current_year
 from etools.libraries.pythonlib.encoders import CustomJSONEncoder
 
+# (label, lower bound excluded, upper bound included) of the cash transfers amount buckets
+CASH_TRANSFER_LEVELS = [
+    ('$0-50,000', None, Decimal(50000.00)),
+    ('$50,001-100,000', Decimal(50000.00), Decimal(100000.00)),
+    ('$100,001-350,000', Decimal(100000.00), Decimal(350000.00)),
+    ('$350,001-500,000', Decimal(350000.00), Decimal(500000.00)),
+    ('>$500,000', Decimal(500000.00), None),
+]
+RISK_RATINGS = [
+    ('not_required', [PartnerOrganization.RATING_NOT_REQUIRED, PartnerOrganization.RATING_NOT_ASSESSED]),
+    ('low', [PartnerOrganization.RATING_LOW, PartnerOrganization.RATING_LOW_RISK_ASSUMED]),
+    ('medium', [PartnerOrganization.RATING_MEDIUM]),
+    ('significant', [PartnerOrganization.RATING_SIGNIFICANT]),
+    ('high', [PartnerOrganization.RATING_HIGH, PartnerOrganization.RATING_HIGH_RISK_ASSUMED]),
+]
+RISK_RATINGS_CHART = [
+    ('Not Required', '#D8D8D8'),
+    ('Low', '#2BB0F2'),
+    ('Medium', '#FECC02'),
+    ('Significant', '#F05656'),
+    ('High', '#751010'),
+]
+ASSURANCE_COVERAGES = [
+    PartnerOrganization.ASSURANCE_VOID,
+    PartnerOrganization.ASSURANCE_PARTIAL,
+    PartnerOrganization.ASSURANCE_COMPLETE,
+]
+AUDIT_AMOUNTS = [
+    'audited_expenditure',
+    'financial_findings',
+    'amount_refunded',
+    'additional_supporting_documentation_provided',
+    'justification_provided_and_accepted',
+    'write_off_required',
+]
+
 
 class HactHistory(TimeStampedModel):
 
@@ -28,6 +68,22 @@ class HactHistory(TimeStampedModel):
         verbose_name_plural = _('Hact Histories')
 
 
+class HactDirtyPartner(models.Model):
+    """Partner whose hact values are outdated, see hact.tracker"""
+
+    partner = models.OneToOneField(
+        PartnerOrganization, verbose_name=_('Partner'), primary_key=True, related_name='+',
+        on_delete=models.CASCADE,
+    )
+    created = models.DateTimeField(auto_now_add=True, verbose_name=_('Created'))
+
+    class Meta:
+        verbose_name_plural = _('Hact Dirty Partners')
+
+    def __str__(self):
+        return f'{self.partner_id}'
+
+
 class AggregateHact(TimeStampedModel):
 
     year = models.IntegerField(default=get_current_year, unique=True, verbose_name=_('Year'))
@@ -40,6 +96,8 @@ class AggregateHact(TimeStampedModel):
         return f'{self.year}'
 
     def update(self):
+        for totals in ['hact_partners', 'partner_totals', 'engagement_totals', 'audit_totals']:
+            self.__dict__.pop(totals, None)
         self.partner_values = {
             'assurance_activities': self.get_assurance_activities(),
             'assurance_coverage': self.get_assurance_coverage(),
@@ -58,385 +116,256 @@ class AggregateHact(TimeStampedModel):
     def get_queryset():
         return PartnerOrganization.objects.hact_active()
 
-    def _sum_json_values(self, qs_filters, filter_dict={}):
-        partners = self.get_queryset().filter(**filter_dict)
+    @staticmethod
+    def get_engagements_queryset(model, year):
+        return model.objects.filter(
+            Q(partner__reported_cy__gt=0) | Q(partner__total_ct_cy__gt=0),
+            date_of_draft_report_to_ip__year=year,
+        ).exclude(status=Engagement.CANCELLED)
 
-        def get_value(obj, qs_filters):
-            qs_filters = qs_filters.split('__')
-            json_field_name = qs_filters.pop(0)
-            json_field = getattr(obj, json_field_name)
-            for qs_filter in qs_filters:
-                json_field = json_field[qs_filter]
-            return json_field
+    @cached_property
+    def hact_partners(self):
+        return list(self.get_queryset().select_related('planned_engagement'))
 
-        return sum([get_value(p, qs_filters) for p in partners])
+    @cached_property
+    def partner_totals(self):
+        """Totals over the hact active partners, bucketed with conditional aggregates in a single query"""
+        year_limit = date.today().year - PartnerOrganization.EXPIRING_ASSESSMENT_LIMIT_YEAR
+        pv_completed = KeyTextTransform('total', KeyTransform('completed', KeyTransform(
+            'programmatic_visits', 'hact_values')))
+        aggregates = {
+            'count': Count('pk'),
+            'pv_completed': Coalesce(Sum(Cast(pv_completed, models.IntegerField())), 0),
+            'spot_check_follow_up': Coalesce(Sum('planned_engagement__spot_check_follow_up'), 0),
+            'missing_micro_assessment': Count('pk', filter=Q(
+                last_assessment_date__isnull=False, last_assessment_date__year__lte=year_limit)),
+        }
+        for level, (__, lower, upper) in enumerate(CASH_TRANSFER_LEVELS):
+            level_filter = Q(total_ct_ytd__lte=upper) if upper is not None else Q()
+            if lower is not None:
+                level_filter &= Q(total_ct_ytd__gt=lower)
+            aggregates['ct_{}_count'.format(level)] = Count('total_ct_ytd', filter=level_filter)
+            for rating, rating_names in RISK_RATINGS:
+                aggregates['ct_{}_{}'.format(level, rating)] = Coalesce(Sum(
+                    'total_ct_ytd', filter=level_filter & Q(highest_risk_rating_name__in=rating_names),
+                ), Decimal(0.0))
+        for rating, rating_names in RISK_RATINGS:
+            rating_filter = Q(highest_risk_rating_name__in=rating_names)
+            aggregates['rating_{}_total'.format(rating)] = Sum('total_ct_ytd', filter=rating_filter)
+            aggregates['rating_{}_count'.format(rating)] = Count('total_ct_ytd', filter=rating_filter)
+        for partner_type in [PartnerType.GOVERNMENT, PartnerType.CIVIL_SOCIETY_ORGANIZATION]:
+            aggregates['type_{}_total'.format(partner_type)] = Sum('total_ct_ytd', filter=Q(partner_type=partner_type))
+            aggregates['type_{}_count'.format(partner_type)] = Count(
+                'total_ct_ytd', filter=Q(partner_type=partner_type))
+        for coverage in ASSURANCE_COVERAGES:
+            coverage_filter = Q(hact_values__assurance_coverage=coverage)
+            aggregates['coverage_{}_count'.format(coverage)] = Count('pk', filter=coverage_filter)
+            aggregates['coverage_{}_total'.format(coverage)] = Coalesce(
+                Sum('total_ct_ytd', filter=coverage_filter), Decimal(0.0))
+        return self.get_queryset().aggregate(**aggregates)
+
+    @cached_property
+    def engagement_totals(self):
+        """Number of engagements of the current year by type in a single query"""
+        types = Engagement.TYPES
+        return self.get_engagements_queryset(Engagement, datetime.now().year).aggregate(
+            spot_checks=Count('pk', filter=Q(engagement_type=types.sc)),
+            staff_spot_checks=Count('pk', filter=Q(
+                engagement_type=types.sc, agreement__auditor_firm__unicef_users_allowed=True)),
+            service_providers_spot_checks=Count('pk', filter=Q(
+                engagement_type=types.sc, agreement__auditor_firm__unicef_users_allowed=False)),
+            audits=Count('pk', filter=Q(engagement_type=types.audit)),
+            special_audits=Count('pk', filter=Q(engagement_type=types.sa)),
+            micro_assessments=Count('pk', filter=Q(engagement_type=types.ma)),
+        )
+
+    @cached_property
+    def audit_totals(self):
+        """Sums of the audits amounts of the current and the prior year in a single query"""
+        year = datetime.now().year
+        audits = Audit.objects.filter(
+            Q(partner__reported_cy__gt=0) | Q(partner__total_ct_cy__gt=0),
+            date_of_draft_report_to_ip__year__gte=year - 1,
+            date_of_draft_report_to_ip__year__lte=year,
+        ).exclude(status=Engagement.CANCELLED)
+        aggregates = {}
+        for period, period_year in [('current', year), ('prior', year - 1)]:
+            for field in AUDIT_AMOUNTS:
+                aggregates['{}_{}'.format(period, field)] = Coalesce(
+                    Sum(field, filter=Q(date_of_draft_report_to_ip__year=period_year)), Decimal(0.0))
+        return audits.aggregate(**aggregates)
 
     def cash_transfers_amounts(self):
-        FIRST_LEVEL = Decimal(50000.00)
-        SECOND_LEVEL = Decimal(100000.00)
-        THIRD_LEVEL = Decimal(350000.00)
-        FOURTH_LEVEL = Decimal(500000.00)
-
-        ct_amount_first = self.get_queryset().filter(total_ct_ytd__lte=FIRST_LEVEL)
-        cash_transfers_amounts_first = [
-            '$0-50,000',
-            ct_amount_first.filter(highest_risk_rating_name__in=[
-                PartnerOrganization.RATING_NOT_REQUIRED, PartnerOrganization.RATING_NOT_ASSESSED
-            ]).aggregate(total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_first.filter(highest_risk_rating_name__in=[
-                PartnerOrganization.RATING_LOW, PartnerOrganization.RATING_LOW_RISK_ASSUMED
-            ]).aggregate(total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_first.filter(highest_risk_rating_name=PartnerOrganization.RATING_MEDIUM).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_first.filter(highest_risk_rating_name=PartnerOrganization.RATING_SIGNIFICANT).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_first.filter(highest_risk_rating_name__in=[
-                PartnerOrganization.RATING_HIGH, PartnerOrganization.RATING_HIGH_RISK_ASSUMED
-            ]).aggregate(total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_first.aggregate(count=Count('total_ct_ytd'))['count'],
-        ]
-
-        ct_amount_second = self.get_queryset().filter(total_ct_ytd__gt=FIRST_LEVEL, total_ct_ytd__lte=SECOND_LEVEL)
-        cash_transfers_amounts_second = [
-            '$50,001-100,000',
-            ct_amount_second.filter(highest_risk_rating_name__in=[
-                PartnerOrganization.RATING_NOT_REQUIRED, PartnerOrganization.RATING_NOT_ASSESSED
-            ]).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_second.filter(highest_risk_rating_name__in=[
-                PartnerOrganization.RATING_LOW, PartnerOrganization.RATING_LOW_RISK_ASSUMED
-            ]).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_second.filter(highest_risk_rating_name=PartnerOrganization.RATING_MEDIUM).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_second.filter(highest_risk_rating_name=PartnerOrganization.RATING_SIGNIFICANT).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_second.filter(highest_risk_rating_name__in=[
-                PartnerOrganization.RATING_HIGH, PartnerOrganization.RATING_HIGH_RISK_ASSUMED
-            ]).aggregate(total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_second.aggregate(count=Count('total_ct_ytd'))['count'],
-        ]
-
-        ct_amount_third = self.get_queryset().filter(total_ct_ytd__gt=SECOND_LEVEL, total_ct_ytd__lte=THIRD_LEVEL)
-        cash_transfers_amounts_third = [
-            '$100,001-350,000',
-            ct_amount_third.filter(highest_risk_rating_name__in=[
-                PartnerOrganization.RATING_NOT_REQUIRED, PartnerOrganization.RATING_NOT_ASSESSED
-            ]).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_third.filter(highest_risk_rating_name__in=[
-                PartnerOrganization.RATING_LOW, PartnerOrganization.RATING_LOW_RISK_ASSUMED
-            ]).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_third.filter(highest_risk_rating_name=PartnerOrganization.RATING_MEDIUM).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_third.filter(highest_risk_rating_name=PartnerOrganization.RATING_SIGNIFICANT).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_third.filter(highest_risk_rating_name__in=[
-                PartnerOrganization.RATING_HIGH, PartnerOrganization.RATING_HIGH_RISK_ASSUMED
-            ]).aggregate(total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_third.aggregate(count=Count('total_ct_ytd'))['count'],
-        ]
-
-        ct_amount_fourth = self.get_queryset().filter(total_ct_ytd__gt=THIRD_LEVEL, total_ct_ytd__lte=FOURTH_LEVEL)
-        cash_transfers_amounts_fourth = [
-            '$350,001-500,000',
-            ct_amount_fourth.filter(highest_risk_rating_name__in=[
-                PartnerOrganization.RATING_NOT_REQUIRED, PartnerOrganization.RATING_NOT_ASSESSED
-            ]).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_fourth.filter(highest_risk_rating_name__in=[
-                PartnerOrganization.RATING_LOW, PartnerOrganization.RATING_LOW_RISK_ASSUMED
-            ]).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_fourth.filter(highest_risk_rating_name=PartnerOrganization.RATING_MEDIUM).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_fourth.filter(highest_risk_rating_name=PartnerOrganization.RATING_SIGNIFICANT).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_fourth.filter(highest_risk_rating_name__in=[
-                PartnerOrganization.RATING_HIGH, PartnerOrganization.RATING_HIGH_RISK_ASSUMED
-            ]).aggregate(total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_fourth.aggregate(count=Count('total_ct_ytd'))['count'],
-        ]
-
-        ct_amount_fifth = self.get_queryset().filter(total_ct_ytd__gt=FOURTH_LEVEL)
-        cash_transfers_amounts_fifth = [
-            '>$500,000',
-            ct_amount_fifth.filter(highest_risk_rating_name__in=[
-                PartnerOrganization.RATING_NOT_REQUIRED, PartnerOrganization.RATING_NOT_ASSESSED
-            ]).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_fifth.filter(highest_risk_rating_name__in=[
-                PartnerOrganization.RATING_LOW, PartnerOrganization.RATING_LOW_RISK_ASSUMED
-            ]).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_fifth.filter(highest_risk_rating_name__in=PartnerOrganization.RATING_MEDIUM).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_fifth.filter(highest_risk_rating_name__in=PartnerOrganization.RATING_SIGNIFICANT).aggregate(
-                total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_fifth.filter(highest_risk_rating_name__in=[
-                PartnerOrganization.RATING_HIGH, PartnerOrganization.RATING_HIGH_RISK_ASSUMED
-            ]).aggregate(total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total'],
-            ct_amount_fifth.aggregate(count=Count('total_ct_ytd'))['count'],
-        ]
-
-        return [
-            ['Risk Rating', 'Not Required', 'Low', 'Medium', 'Significant', 'High', 'Number of IPs'],
-            cash_transfers_amounts_first,
-            cash_transfers_amounts_second,
-            cash_transfers_amounts_third,
-            cash_transfers_amounts_fourth,
-            cash_transfers_amounts_fifth,
+        totals = self.partner_totals
+        return [['Risk Rating', 'Not Required', 'Low', 'Medium', 'Significant', 'High', 'Number of IPs']] + [
+            [label] + [totals['ct_{}_{}'.format(level, rating)] for rating, __ in RISK_RATINGS] + [
+                totals['ct_{}_count'.format(level)]]
+            for level, (label, __, ___) in enumerate(CASH_TRANSFER_LEVELS)
         ]
 
     def get_cash_transfer_risk_rating(self):
-        total_ct_dict = {
-            'total': Sum('total_ct_ytd'),
-            'count': Count('total_ct_ytd')
-        }
-
-        high = self.get_queryset().filter(
-            highest_risk_rating_name__in=[PartnerOrganization.RATING_HIGH, PartnerOrganization.RATING_HIGH_RISK_ASSUMED]
-        ).aggregate(**total_ct_dict)
-        significant = self.get_queryset().filter(
-            highest_risk_rating_name__in=PartnerOrganization.RATING_SIGNIFICANT).aggregate(**total_ct_dict)
-        moderate = self.get_queryset().filter(
-            highest_risk_rating_name__in=PartnerOrganization.RATING_MEDIUM).aggregate(**total_ct_dict)
-        low = self.get_queryset().filter(highest_risk_rating_name__in=[
-            PartnerOrganization.RATING_LOW, PartnerOrganization.RATING_LOW_RISK_ASSUMED]).aggregate(**total_ct_dict)
-        non_assessed = self.get_queryset().filter(
-            highest_risk_rating_name__in=[
-                PartnerOrganization.RATING_NOT_REQUIRED, PartnerOrganization.RATING_NOT_ASSESSED
-            ]).aggregate(**total_ct_dict)
-
-        return [
-            ['Risk Rating', 'Total Cash Transfers', {'role': 'style'}, 'Number of IPs'],
-            ['Not Required', non_assessed['total'], '#D8D8D8', non_assessed['count']],
-            ['Low', low['total'], '#2BB0F2', low['count']],
-            ['Medium', moderate['total'], '#FECC02', moderate['count']],
-            ['Significant', significant['total'], '#F05656', significant['count']],
-            ['High', high['total'], '#751010', high['count']],
+        totals = self.partner_totals
+        return [['Risk Rating', 'Total Cash Transfers', {'role': 'style'}, 'Number of IPs']] + [
+            [label, totals['rating_{}_total'.format(rating)], color, totals['rating_{}_count'.format(rating)]]
+            for (rating, __), (label, color) in zip(RISK_RATINGS, RISK_RATINGS_CHART)
         ]
 
     def get_cash_transfer_partner_type(self):
-        total_ct_dict = {
-            'total': Sum('total_ct_ytd'),
-            'count': Count('total_ct_ytd')
-        }
-
-        gov = self.get_queryset().filter(partner_type=PartnerType.GOVERNMENT).aggregate(**total_ct_dict)
-        cso = self.get_queryset().filter(
-            partner_type=PartnerType.CIVIL_SOCIETY_ORGANIZATION).aggregate(**total_ct_dict)
+        totals = self.partner_totals
+        gov = PartnerType.GOVERNMENT
+        cso = PartnerType.CIVIL_SOCIETY_ORGANIZATION
 
         return [
             ['Partner Type', 'Total Cash Transfers', {'role': 'style'}, 'Number of Partners'],
-            ['CSO', cso['total'], '#FECC02', cso['count']],
-            ['GOV', gov['total'], '#F05656', gov['count']],
+            ['CSO', totals['type_{}_total'.format(cso)], '#FECC02', totals['type_{}_count'.format(cso)]],
+            ['GOV', totals['type_{}_total'.format(gov)], '#F05656', totals['type_{}_count'.format(gov)]],
         ]
 
-    @staticmethod
-    def get_spot_checks_completed():
-        qs = SpotCheck.objects.filter(
-            Q(partner__reported_cy__gt=0) | Q(partner__total_ct_cy__gt=0),
-            date_of_draft_report_to_ip__year=datetime.now().year).exclude(status=Engagement.CANCELLED)
+    def get_spot_checks_completed(self):
         return [
             ['Completed by', 'Count'],
-            ['Staff', qs.filter(agreement__auditor_firm__unicef_users_allowed=True).count()],
-            ['Service Providers', qs.filter(agreement__auditor_firm__unicef_users_allowed=False).count()],
+            ['Staff', self.engagement_totals['staff_spot_checks']],
+            ['Service Providers', self.engagement_totals['service_providers_spot_checks']],
         ]
 
     def get_assurance_activities(self):
-        year_limit = date.today().year - PartnerOrganization.EXPIRING_ASSESSMENT_LIMIT_YEAR
         return {
             'programmatic_visits': {
-                'completed': self._sum_json_values('hact_values__programmatic_visits__completed__total'),
-                'min_required': sum([p.min_req_programme_visits for p in self.get_queryset()]),
+                'completed': self.partner_totals['pv_completed'],
+                'min_required': sum([p.min_req_programme_visits for p in self.hact_partners]),
             },
             'spot_checks': {
-                'completed': SpotCheck.objects.filter(
-                    Q(partner__reported_cy__gt=0) | Q(partner__total_ct_cy__gt=0),
-                    date_of_draft_report_to_ip__year=datetime.now().year).exclude(
-                    status=Engagement.CANCELLED).count(),
-                'required': sum([p.planned_engagement.spot_check_required for p in self.get_queryset().filter(
-                    planned_engagement__isnull=False)]),
-                'follow_up': self.get_queryset().aggregate(total=Coalesce(Sum(
-                    'planned_engagement__spot_check_follow_up'), 0))['total']
+                'completed': self.engagement_totals['spot_checks'],
+                'required': sum([p.planned_engagement.spot_check_required for p in self.hact_partners
+                                 if getattr(p, 'planned_engagement', None)]),
+                'follow_up': self.partner_totals['spot_check_follow_up'],
             },
-            'scheduled_audit': Audit.objects.filter(
-                Q(partner__reported_cy__gt=0) | Q(partner__total_ct_cy__gt=0),
-                date_of_draft_report_to_ip__year=datetime.now().year).exclude(
-                status=Engagement.CANCELLED).count(),
-            'special_audit': SpecialAudit.objects.filter(
-                Q(partner__reported_cy__gt=0) | Q(partner__total_ct_cy__gt=0),
-                date_of_draft_report_to_ip__year=datetime.now().year).exclude(
-                status=Engagement.CANCELLED).count(),
-            'micro_assessment': MicroAssessment.objects.filter(
-                Q(partner__reported_cy__gt=0) | Q(partner__total_ct_cy__gt=0),
-                date_of_draft_report_to_ip__year=datetime.now().year).exclude(
-                status=Engagement.CANCELLED).count(),
-            'missing_micro_assessment': PartnerOrganization.objects.hact_active(
-                last_assessment_date__isnull=False, last_assessment_date__year__lte=year_limit).count(),
+            'scheduled_audit': self.engagement_totals['audits'],
+            'special_audit': self.engagement_totals['special_audits'],
+            'micro_assessment': self.engagement_totals['micro_assessments'],
+            'missing_micro_assessment': self.partner_totals['missing_micro_assessment'],
         }
 
-    @staticmethod
-    def get_financial_findings():
-        audits = Audit.objects.filter(
-            Q(partner__reported_cy__gt=0) | Q(partner__total_ct_cy__gt=0),
-            date_of_draft_report_to_ip__year=datetime.now().year).exclude(status=Engagement.CANCELLED)
-
-        refunds = audits.filter(amount_refunded__isnull=False).aggregate(
-            total=Coalesce(Sum('amount_refunded'), Decimal(0.0)))['total']
-        additional_supporting_document_provided = audits.filter(
-            additional_supporting_documentation_provided__isnull=False,
-        ).aggregate(
-            total=Coalesce(Sum('additional_supporting_documentation_provided'), Decimal(0.0)))['total']
-        justification_provided_and_accepted = audits.filter(
-            justification_provided_and_accepted__isnull=False).aggregate(
-            total=Coalesce(Sum('justification_provided_and_accepted'), Decimal(0.0)))['total']
-        impairment = audits.filter(
-            write_off_required__isnull=False).aggregate(
-            total=Coalesce(Sum('write_off_required'), Decimal(0.0)))['total']
+    def get_financial_findings(self):
+        totals = self.audit_totals
 
         # pending_unsupported_amount property
-        _ff = audits.filter(financial_findings__isnull=False).aggregate(
-            total=Coalesce(Sum('financial_findings'), Decimal(0.0)))['total']
-        _ar = audits.filter(amount_refunded__isnull=False).aggregate(
-            total=Coalesce(Sum('amount_refunded'), Decimal(0.0)))['total']
-        _asdp = audits.filter(additional_supporting_documentation_provided__isnull=False).aggregate(
-            total=Coalesce(Sum('additional_supporting_documentation_provided'), Decimal(0.0)))['total']
-        _wor = audits.filter(write_off_required__isnull=False).aggregate(
-            total=Coalesce(Sum('write_off_required'), Decimal(0.0)))['total']
-        outstanding = _ff - _ar - _asdp - _wor
-
-        outstanding_audits_y1 = Audit.objects.filter(
-            Q(partner__reported_cy__gt=0) | Q(partner__total_ct_cy__gt=0),
-            date_of_draft_report_to_ip__year=datetime.now().year - 1).exclude(status=Engagement.CANCELLED)
-        _ff_y1 = outstanding_audits_y1.filter(financial_findings__isnull=False).aggregate(
-            total=Coalesce(Sum('financial_findings'), Decimal(0.0)))['total']
-        _ar_y1 = outstanding_audits_y1.filter(amount_refunded__isnull=False).aggregate(
-            total=Coalesce(Sum('amount_refunded'), Decimal(0.0)))['total']
-        _asdp_y1 = outstanding_audits_y1.filter(additional_supporting_documentation_provided__isnull=False).aggregate(
-            total=Coalesce(Sum('additional_supporting_documentation_provided'), Decimal(0.0)))['total']
-        _wor_y1 = outstanding_audits_y1.filter(write_off_required__isnull=False).aggregate(
-            total=Coalesce(Sum('write_off_required'), Decimal(0.0)))['total']
-        outstanding_y1 = _ff_y1 - _ar_y1 - _asdp_y1 - _wor_y1
-
-        total_financial_findings = audits.filter(
-            financial_findings__isnull=False).aggregate(total=Coalesce(Sum('financial_findings'), Decimal(0.0)))['total']
-        total_audited_expenditure = audits.filter(audited_expenditure__isnull=False).aggregate(
-            total=Coalesce(Sum('audited_expenditure'), Decimal(0.0)))['total']
+        def outstanding(period):
+            return totals['{}_financial_findings'.format(period)] - totals['{}_amount_refunded'.format(period)] - \
+                totals['{}_additional_supporting_documentation_provided'.format(period)] - \
+                totals['{}_write_off_required'.format(period)]
 
         return [
             {
                 'name': 'Total Audited Expenditure',
-                'value': total_audited_expenditure,
+                'value': totals['current_audited_expenditure'],
                 'highlighted': False,
             },
             {
                 'name': 'Total Financial Findings',
-                'value': total_financial_findings,
+                'value': totals['current_financial_findings'],
                 'highlighted': True,
             },
             {
                 'name': 'Refunds',
-                'value': refunds,
+                'value': totals['current_amount_refunded'],
                 'highlighted': False,
             },
             {
                 'name': 'Additional Supporting Documentation Received',
-                'value': additional_supporting_document_provided,
+                'value': totals['current_additional_supporting_documentation_provided'],
                 'highlighted': False,
             },
             {
                 'name': 'Justification Provided and Accepted',
-                'value': justification_provided_and_accepted,
+                'value': totals['current_justification_provided_and_accepted'],
                 'highlighted': False,
             },
             {
                 'name': 'Impairment',
-                'value': impairment,
+                'value': totals['current_write_off_required'],
                 'highlighted': False,
             },
             {
                 'name': 'Outstanding current year (Requires Follow-up)',
-                'value': outstanding,
+                'value': outstanding('current'),
                 'highlighted': True,
             },
             {
                 'name': 'Outstanding prior year',
-                'value': outstanding_y1,
+                'value': outstanding('prior'),
                 'highlighted': True,
             }
         ]
 
-    @staticmethod
-    def get_financial_findings_numbers():
-
-        audits = Audit.objects.filter(
-            Q(partner__reported_cy__gt=0) | Q(partner__total_ct_cy__gt=0),
-            date_of_draft_report_to_ip__year=datetime.now().year).exclude(status=Engagement.CANCELLED)
+    def get_financial_findings_numbers(self):
+        # the findings are counted by joined risk rows while the opinions are counted by audit
+        numbers = self.get_engagements_queryset(Audit, datetime.now().year).aggregate(
+            high=Count('risks', filter=Q(risks__value=4)),
+            medium=Count('risks', filter=Q(risks__value=2)),
+            low=Count('risks', filter=Q(risks__value=1)),
+            qualified=Count('pk', distinct=True, filter=Q(audit_opinion=Audit.OPTION_QUALIFIED)),
+            unqualified=Count('pk', distinct=True, filter=Q(audit_opinion=Audit.OPTION_UNQUALIFIED)),
+            denial=Count('pk', distinct=True, filter=Q(audit_opinion=Audit.OPTION_DENIAL)),
+            adverse=Count('pk', distinct=True, filter=Q(audit_opinion=Audit.OPTION_ADVERSE)),
+        )
         return [
             {
                 'name': 'Number of High Priority Findings',
-                'value': audits.filter(risks__value=4).count(),
+                'value': numbers['high'],
             },
             {
                 'name': 'Number of Medium Priority Findings',
-                'value': audits.filter(risks__value=2).count(),
+                'value': numbers['medium'],
             },
             {
                 'name': 'Number of Low Priority Findings',
-                'value': audits.filter(risks__value=1).count(),
+                'value': numbers['low'],
             },
             {
                 'name': 'Audit Opinion',
                 'value': [
                     {
                         'name': 'qualified',
-                        'value': audits.filter(audit_opinion=Audit.OPTION_QUALIFIED).count(),
+                        'value': numbers['qualified'],
                     },
                     {
                         'name': 'unqualified',
-                        'value': audits.filter(audit_opinion=Audit.OPTION_UNQUALIFIED).count(),
+                        'value': numbers['unqualified'],
                     },
                     {
                         'name': 'denial',
-                        'value': audits.filter(audit_opinion=Audit.OPTION_DENIAL).count(),
+                        'value': numbers['denial'],
                     },
                     {
                         'name': 'adverse',
-                        'value': audits.filter(audit_opinion=Audit.OPTION_ADVERSE).count(),
+                        'value': numbers['adverse'],
                     },
                 ],
             }
         ]
 
-    @staticmethod
-    def get_assurance_coverage():
-        qs = PartnerOrganization.objects.hact_active()
-
-        no_coverage = qs.filter(hact_values__assurance_coverage=PartnerOrganization.ASSURANCE_VOID)
-        partial_coverage = qs.filter(hact_values__assurance_coverage=PartnerOrganization.ASSURANCE_PARTIAL)
-        full_coverage = qs.filter(hact_values__assurance_coverage=PartnerOrganization.ASSURANCE_COMPLETE)
+    def get_assurance_coverage(self):
+        totals = self.partner_totals
+        void, partial, complete = ASSURANCE_COVERAGES
         return {
             'coverage_by_number_of_ips': [
                 ['Coverage by number of IPs', 'Count'],
-                ['Without Assurance', no_coverage.count()],
-                ['Partially Met Requirements', partial_coverage.count()],
-                ['Met Requirements', full_coverage.count()]
+                ['Without Assurance', totals['coverage_{}_count'.format(void)]],
+                ['Partially Met Requirements', totals['coverage_{}_count'.format(partial)]],
+                ['Met Requirements', totals['coverage_{}_count'.format(complete)]]
             ],
             'coverage_by_cash_transfer': [
                 ['Coverage by Cash Transfer (USD) (Total)', 'Count'],
-                ['Without Assurance', no_coverage.aggregate(total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total']],
-                ['Partially Met Requirements', partial_coverage.aggregate(
-                    total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total']],
-                ['Met Requirements', full_coverage.aggregate(total=Coalesce(Sum('total_ct_ytd'), Decimal(0.0)))['total']],
+                ['Without Assurance', totals['coverage_{}_total'.format(void)]],
+                ['Partially Met Requirements', totals['coverage_{}_total'.format(partial)]],
+                ['Met Requirements', totals['coverage_{}_total'.format(complete)]],
 
             ],
             'table': [
                 {
                     'label': 'Partners',
-                    'value': PartnerOrganization.objects.hact_active().count()
+                    'value': totals['count']
                 },
                 {
                     'label': 'IPs without required PV',
@@ -452,3 +381,9 @@ class AggregateHact(TimeStampedModel):
                 }
             ]
         }
+
+
+post_save.connect(clear_hact_history_cache, sender=HactHistory)
+post_delete.connect(clear_hact_history_cache, sender=HactHistory)
+post_save.connect(clear_aggregate_hact_cache, sender=AggregateHact)
+post_delete.connect(clear_aggregate_hact_cache, sender=AggregateHact)
@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import connection, transaction
 
 from celery.utils.log import get_task_logger
@@ -8,23 +9,38 @@ from unicef_vision.exceptions import VisionException
 
 from etools.applications.audit.models import UNICEFAuditFocalPoint
 from etools.applications.environment.notifications import send_notification_with_template
-from etools.applications.hact.models import AggregateHact
-from etools.applications.partners.models import PartnerOrganization
+from etools.applications.hact.engine import HactEngine
+from etools.applications.hact.models import AggregateHact, HactDirtyPartner
+from etools.applications.hact.tracker import get_debounce_key
 from etools.applications.users.models import Country
 from etools.applications.vision.models import VisionSyncLog
 from etools.config.celery import app
 from etools.libraries.djangolib.utils import get_environment
+from etools.libraries.tenant_support.utils import TenantExecutor
 
 logger = get_task_logger(__name__)
 
 
+HACT_UPDATED_LABELS = {
+    'programmatic_visits': 'PV',
+    'spot_checks': 'SC',
+    'audits': 'Audits',
+}
+
+
+def get_hact_updated_partner_list(min_requirements_updated):
+    return [
+        (partner.vendor_number, partner.name, ', '.join([HACT_UPDATED_LABELS[item] for item in updated]))
+        for partner, updated in min_requirements_updated
+    ]
+
+
 @app.task
 def update_hact_for_country(business_area_code):
-    updated_dict = {
-        'programmatic_visits': 'PV',
-        'spot_checks': 'SC',
-        'audits': 'Audits',
-    }
+    """
+    Recompute the hact values of all the partners of the country. The partners are kept up to date
+    by update_dirty_partners during the day, this reconciles whatever was missed.
+    """
     country = Country.objects.get(business_area_code=business_area_code)
     log = VisionSyncLog(
         country=country,
@@ -34,33 +50,62 @@ def update_hact_for_country(business_area_code):
     logger.info('Set country {}'.format(business_area_code))
     hact_updated_partner_list = []
     try:
-        partners = PartnerOrganization.objects.hact_active()
-        for partner in partners:
-            logger.debug('Updating Partner {}'.format(partner.name))
-            partner.update_planned_visits_to_hact()
-            partner.update_programmatic_visits()
-            partner.update_spot_checks()
-            partner.update_audits_completed()
-            partner.update_hact_support()
-            updated = partner.update_min_requirements()
-            if updated:
-                updated_string = ', '.join([updated_dict[item] for item in updated])
-                hact_updated_partner_list.append((partner.vendor_number, partner.name, updated_string))
+        # every partner is recomputed below, pending marks are covered
+        HactDirtyPartner.objects.all().delete()
+        engine = HactEngine()
+        hact_updated_partner_list = get_hact_updated_partner_list(engine.update())
 
     except Exception as e:
         logger.info('HACT Sync', exc_info=True)
         log.exception_message = e
         raise VisionException
     else:
-        log.total_records = partners.count()
-        log.total_processed = partners.count()
+        log.total_records = len(engine.partners)
+        log.total_processed = len(engine.partners)
+        log.total_changed = len(engine.changed)
         log.successful = True
+        if engine.changed:
+            logger.info('HACT reconciliation updated {} partners'.format(len(engine.changed)))
     finally:
         log.save()
     if hact_updated_partner_list:
         notify_hact_update.delay(hact_updated_partner_list, country.id)
 
 
+@app.task
+def update_dirty_partners(business_area_code):
+    """Recompute the hact values of the partners marked by hact.tracker and the aggregate of the year"""
+    country = Country.objects.get(business_area_code=business_area_code)
+    connection.set_tenant(country)
+    # marks made from now on schedule a new run
+    cache.delete(get_debounce_key())
+
+    # the marks are taken in a short transaction, so that the transitions marking partners don't wait
+    # for the recompute; a partner marked again during the run is kept for the run it schedules
+    with transaction.atomic():
+        dirty_partners = HactDirtyPartner.objects.select_for_update()
+        partner_ids = list(dirty_partners.values_list('partner_id', flat=True))
+        dirty_partners.filter(partner_id__in=partner_ids).delete()
+    if not partner_ids:
+        return
+
+    try:
+        with transaction.atomic():
+            hact_updated_partner_list = get_hact_updated_partner_list(HactEngine(partner_ids=partner_ids).update())
+            aggregate_hact, _ = AggregateHact.objects.get_or_create(year=datetime.today().year)
+            aggregate_hact.update()
+    except Exception:
+        # the partners stay marked for the next run or the reconciliation
+        HactDirtyPartner.objects.bulk_create(
+            [HactDirtyPartner(partner_id=partner_id) for partner_id in partner_ids], ignore_conflicts=True,
+        )
+        raise
+
+    logger.info('Updated hact values of {} partners for {}'.format(len(partner_ids), business_area_code))
+    if hact_updated_partner_list:
+        notify_hact_update.delay(hact_updated_partner_list, country.id)
+
+
 @app.task
 def update_hact_values(*args, **kwargs):
 
@@ -74,24 +119,24 @@ def update_hact_values(*args, **kwargs):
     logger.info('Hact Freeze Task generated all tasks')
 
 
+def update_aggregate_hact():
+    with transaction.atomic():
+        aggregate_hact, _ = AggregateHact.objects.get_or_create(year=datetime.today().year)
+        aggregate_hact.update()
+
+
 @app.task
 def update_aggregate_hact_values(*args, **kwargs):
     logger.info('Hact Aggregator Task process started')
 
     schema_names = kwargs.get('schema_names', [None])[0]
-    countries = Country.objects.exclude(schema_name='public')
-    if schema_names:
-        countries = countries.filter(schema_name__in=schema_names.split(','))
-    for country in countries:
-        connection.set_tenant(country)
-        with transaction.atomic():
-            aggregate_hact, _ = AggregateHact.objects.get_or_create(year=datetime.today().year)
-            try:
-                aggregate_hact.update()
-            except BaseException:
-                logger.exception(country)
+    # the failures are logged by the executor, a failing country doesn't stop the others
+    results = TenantExecutor(schema_names=schema_names.split(',') if schema_names else None).run(
+        update_aggregate_hact,
+    )
+    failed = [result.schema_name for result in results if result.exception]
 
-    logger.info('Hact Aggregator Task process finished')
+    logger.info('Hact Aggregator Task process finished, failed: {}'.format(', '.join(failed) or 'none'))
 
 
 @app.task
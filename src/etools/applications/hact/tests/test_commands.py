@@ -0,0 +1,51 @@
+from django.core.management import call_command
+
+from etools.applications.core.tests.cases import BaseTenantTestCase
+from etools.applications.hact.models import HactHistory
+from etools.applications.partners.models import hact_default, PartnerOrganization, PlannedEngagement
+from etools.applications.partners.tests.factories import PartnerFactory, PlannedEngagementFactory
+
+
+class TestFreezeHactData(BaseTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        hact_values = hact_default()
+        hact_values['programmatic_visits']['planned']['q1'] = 3
+        self.partner = PartnerFactory(reported_cy=100, hact_values=hact_values)
+        PlannedEngagementFactory(partner=self.partner, spot_check_planned_q2=2, scheduled_audit=True)
+        self.partner_without_plan = PartnerFactory(total_ct_cy=50, hact_values=hact_values)
+        self.inactive = PartnerFactory(reported_cy=0, total_ct_cy=0, hact_values=hact_values)
+
+    def freeze(self, **kwargs):
+        call_command('freeze_hact_data', schema=self.tenant.schema_name, year=2020, **kwargs)
+
+    def test_freeze(self):
+        with self.assertNumQueries(10):
+            self.freeze()
+
+        histories = {history.partner_id: history for history in HactHistory.objects.filter(year=2020)}
+        self.assertCountEqual(histories.keys(), [self.partner.pk, self.partner_without_plan.pk])
+        partner_values = dict(histories[self.partner.pk].partner_values)
+        self.assertEqual(partner_values['Implementing Partner'], self.partner.name)
+        self.assertEqual(partner_values['Programmatic Visits Planned Q1'], 3)
+        self.assertEqual(partner_values['Spot Checks Planned Q2'], 2)
+        self.assertEqual(partner_values['Audits M.R'], 1)
+        self.assertIsNone(dict(histories[self.partner_without_plan.pk].partner_values)['Spot Checks Planned Q2'])
+
+        for partner in PartnerOrganization.objects.all():
+            self.assertEqual(partner.hact_values, hact_default())
+        self.assertEqual(PlannedEngagement.objects.count(), 3)
+        self.assertFalse(PlannedEngagement.objects.filter(spot_check_planned_q2=2).exists())
+
+    def test_resume(self):
+        self.freeze()
+        partner_values = HactHistory.objects.get(partner=self.partner, year=2020).partner_values
+
+        # the country is already frozen, the values reset for the new year don't overwrite the history
+        self.freeze()
+        self.assertEqual(HactHistory.objects.get(partner=self.partner, year=2020).partner_values, partner_values)
+
+        self.freeze(force=True)
+        self.assertEqual(HactHistory.objects.filter(year=2020).count(), 2)
+        self.assertNotEqual(HactHistory.objects.get(partner=self.partner, year=2020).partner_values, partner_values)
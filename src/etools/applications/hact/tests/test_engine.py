@@ -0,0 +1,155 @@
+import datetime
+
+from etools.applications.audit.models import Engagement
+from etools.applications.audit.tests.factories import AuditFactory, SpecialAuditFactory, SpotCheckFactory
+from etools.applications.core.tests.cases import BaseTenantTestCase
+from etools.applications.field_monitoring.data_collection.models import ActivityQuestionOverallFinding
+from etools.applications.field_monitoring.data_collection.tests.factories import ActivityQuestionFactory
+from etools.applications.field_monitoring.planning.tests.factories import (
+    MonitoringActivityFactory,
+    MonitoringActivityGroupFactory,
+)
+from etools.applications.hact.engine import HactEngine
+from etools.applications.partners.models import hact_default, Intervention, PartnerOrganization, PartnerType
+from etools.applications.partners.tests.factories import (
+    AgreementFactory,
+    InterventionFactory,
+    InterventionPlannedVisitsFactory,
+    PartnerFactory,
+    PartnerPlannedVisitsFactory,
+    PlannedEngagementFactory,
+)
+from etools.applications.t2f.models import Travel, TravelType
+from etools.applications.t2f.tests.factories import TravelActivityFactory, TravelFactory
+from etools.applications.tpm.models import TPMVisit
+from etools.applications.tpm.tests.factories import TPMActivityFactory, TPMVisitFactory
+from etools.applications.users.tests.factories import UserFactory
+
+
+class TestHactEngine(BaseTenantTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        year = datetime.date.today().year
+        cls.government = PartnerFactory(
+            partner_type=PartnerType.GOVERNMENT,
+            reported_cy=600000,
+            net_ct_cy=600000,
+            highest_risk_rating_name=PartnerOrganization.RATING_HIGH,
+        )
+        PartnerPlannedVisitsFactory(partner=cls.government, year=year, programmatic_q1=2, programmatic_q3=1)
+        PartnerPlannedVisitsFactory(partner=cls.government, year=year - 1, programmatic_q2=5)
+        PlannedEngagementFactory(partner=cls.government, scheduled_audit=True)
+        AgreementFactory(partner=cls.government)
+
+        cls.cso = PartnerFactory(
+            partner_type=PartnerType.CIVIL_SOCIETY_ORGANIZATION,
+            reported_cy=40000,
+            net_ct_cy=60000,
+            highest_risk_rating_name=PartnerOrganization.RATING_MEDIUM,
+        )
+        agreement = AgreementFactory(partner=cls.cso)
+        for status in [Intervention.ACTIVE, Intervention.SIGNED, Intervention.DRAFT]:
+            InterventionPlannedVisitsFactory(
+                intervention=InterventionFactory(agreement=agreement, status=status),
+                year=year,
+                programmatic_q2=1,
+                programmatic_q4=2,
+            )
+        cls.inactive = PartnerFactory(reported_cy=0, total_ct_cy=0)
+        AgreementFactory(partner=cls.inactive)
+
+        for partner in [cls.government, cls.cso, cls.inactive]:
+            traveler = UserFactory()
+            for month in [2, 8]:
+                travel = TravelFactory(
+                    traveler=traveler,
+                    status=Travel.COMPLETED,
+                    end_date=datetime.date(year, month, 1),
+                )
+                TravelActivityFactory(
+                    travels=[travel],
+                    primary_traveler=traveler,
+                    travel_type=TravelType.PROGRAMME_MONITORING,
+                    partner=partner,
+                )
+
+            visit = TPMVisitFactory(status=TPMVisit.UNICEF_APPROVED)
+            TPMActivityFactory(tpm_visit=visit, partner=partner, is_pv=True, date=datetime.date(year, 5, 1))
+            TPMActivityFactory(tpm_visit=visit, partner=partner, date=datetime.date(year, 5, 1))
+
+            activities = [
+                MonitoringActivityFactory(
+                    partners=[partner], end_date=datetime.date(year, month, 1), status='completed',
+                ) for month in [3, 4, 11]
+            ]
+            for activity in activities:
+                ActivityQuestionOverallFinding.objects.create(
+                    activity_question=ActivityQuestionFactory(
+                        monitoring_activity=activity,
+                        question__is_hact=True,
+                        question__level='partner',
+                    ),
+                    value=True,
+                )
+            MonitoringActivityGroupFactory(partner=partner, monitoring_activities=activities[:2])
+
+            SpotCheckFactory(partner=partner, status=Engagement.FINAL,
+                             date_of_draft_report_to_ip=datetime.date(year, 7, 1))
+            SpotCheckFactory(partner=partner, status=Engagement.CANCELLED,
+                             date_of_draft_report_to_ip=datetime.date(year, 7, 1))
+            AuditFactory(partner=partner, status=Engagement.FINAL, financial_findings=1000, amount_refunded=250.5,
+                         date_of_draft_report_to_ip=datetime.date(year, 4, 1))
+            AuditFactory(partner=partner, status=Engagement.FINAL, financial_findings=300,
+                         date_of_draft_report_to_ip=datetime.date(year - 1, 4, 1))
+            SpecialAuditFactory(partner=partner, status=Engagement.REPORT_SUBMITTED,
+                                date_of_draft_report_to_ip=datetime.date(year, 8, 1))
+
+    def get_hact_values(self):
+        return dict(PartnerOrganization.objects.values_list('pk', 'hact_values'))
+
+    def update_per_partner(self):
+        for partner in PartnerOrganization.objects.hact_active():
+            partner.update_planned_visits_to_hact()
+            partner.update_programmatic_visits()
+            partner.update_spot_checks()
+            partner.update_audits_completed()
+            partner.update_hact_support()
+            partner.update_min_requirements()
+
+    def test_update_same_as_per_partner(self):
+        self.update_per_partner()
+        expected = self.get_hact_values()
+        PartnerOrganization.objects.update(hact_values=hact_default())
+
+        HactEngine().update()
+        self.assertEqual(self.get_hact_values(), expected)
+
+        hact_values = expected[self.government.pk]
+        self.assertEqual(hact_values['programmatic_visits']['planned']['total'], 3)
+        self.assertEqual(hact_values['programmatic_visits']['completed'],
+                         {'q1': 1, 'q2': 2, 'q3': 1, 'q4': 1, 'total': 5})
+        self.assertEqual(hact_values['spot_checks']['completed']['total'], 1)
+        self.assertEqual(hact_values['audits']['completed'], 2)
+        self.assertEqual(hact_values['outstanding_findings'], 749.5)
+        self.assertEqual(expected[self.cso.pk]['programmatic_visits']['planned']['total'], 6)
+        self.assertEqual(expected[self.inactive.pk], hact_default())
+
+    def test_update_min_requirements(self):
+        updated = HactEngine().update()
+        self.assertCountEqual(
+            [(partner.pk, requirements) for partner, requirements in updated],
+            [
+                (self.government.pk, ['programmatic_visits', 'spot_checks', 'audits']),
+                (self.cso.pk, ['programmatic_visits']),
+            ]
+        )
+        self.assertEqual(HactEngine().update(), [])
+
+    def test_update_unchanged(self):
+        HactEngine().update()
+        modified = dict(PartnerOrganization.objects.values_list('pk', 'modified'))
+        engine = HactEngine()
+        with self.assertNumQueries(10):
+            engine.update()
+        self.assertEqual(dict(PartnerOrganization.objects.values_list('pk', 'modified')), modified)
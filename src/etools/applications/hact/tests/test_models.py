@@ -91,6 +91,26 @@ class TestAggregateHact(BaseTenantTestCase):
         self.assertEqual(cash_transfer_risk_rating[5][1], self.partner.total_ct_ytd)
         self.assertEqual(cash_transfer_risk_rating[5][3], 1)
 
+    def test_get_cash_transfer_risk_rating_medium(self):
+        partner = PartnerFactory(
+            highest_risk_rating_name=PartnerOrganization.RATING_MEDIUM,
+            reported_cy=300.0,
+            total_ct_ytd=600000.0,
+        )
+        cash_transfer_risk_rating = self.aggregate_hact.get_cash_transfer_risk_rating()
+        self.assertEqual(cash_transfer_risk_rating[3][1], partner.total_ct_ytd)
+        self.assertEqual(cash_transfer_risk_rating[3][3], 1)
+        self.assertEqual(self.aggregate_hact.cash_transfers_amounts()[5][3], partner.total_ct_ytd)
+
+    def test_update(self):
+        with self.assertNumQueries(9):
+            self.aggregate_hact.update()
+        self.aggregate_hact.refresh_from_db()
+        self.assertEqual(
+            self.aggregate_hact.partner_values['assurance_coverage']['table'][0]['value'],
+            PartnerOrganization.objects.hact_active().count(),
+        )
+
     def test_get_cash_transfer_partner_type(self):
         cash_transfer_partner_type = self.aggregate_hact.get_cash_transfer_partner_type()
         self.assertEqual(len(cash_transfer_partner_type), 3)
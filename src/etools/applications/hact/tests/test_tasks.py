@@ -1,9 +1,18 @@
+from django.core.cache import cache
+from django.test.utils import override_settings
+
 from mock import Mock, patch
 
 from etools.applications.core.tests.cases import BaseTenantTestCase
-from etools.applications.hact.models import AggregateHact
-from etools.applications.hact.tasks import update_aggregate_hact_values, update_hact_for_country, update_hact_values
+from etools.applications.hact.models import AggregateHact, HactDirtyPartner
+from etools.applications.hact.tasks import (
+    update_aggregate_hact_values,
+    update_dirty_partners,
+    update_hact_for_country,
+    update_hact_values,
+)
 from etools.applications.hact.tests.factories import AggregateHactFactory
+from etools.applications.hact.tracker import mark_partners_dirty
 from etools.applications.partners.tests.factories import PartnerFactory
 from etools.applications.vision.models import VisionSyncLog
 
@@ -24,6 +33,17 @@ class TestAggregateHactValues(BaseTenantTestCase):
         update_aggregate_hact_values()
         self.assertEqual(AggregateHact.objects.count(), 1)
 
+    def test_task_failed(self):
+        with patch.object(AggregateHact, 'update', side_effect=ValueError('failed')):
+            update_aggregate_hact_values()
+        self.assertEqual(AggregateHact.objects.count(), 0)
+
+    def test_task_schema_names(self):
+        update_aggregate_hact_values(schema_names=['other'])
+        self.assertEqual(AggregateHact.objects.count(), 0)
+        update_aggregate_hact_values(schema_names=[self.tenant.schema_name])
+        self.assertEqual(AggregateHact.objects.count(), 1)
+
 
 class TestHactForCountry(BaseTenantTestCase):
 
@@ -39,6 +59,15 @@ class TestHactForCountry(BaseTenantTestCase):
         self.assertEqual(log.total_processed, 1)
         self.assertTrue(log.successful)
 
+    def test_task_reconcile(self):
+        partner = PartnerFactory(reported_cy=20000)
+        HactDirtyPartner.objects.create(partner=partner)
+        update_hact_for_country(self.tenant.business_area_code)
+        self.assertFalse(HactDirtyPartner.objects.exists())
+
+        update_hact_for_country(self.tenant.business_area_code)
+        self.assertEqual(VisionSyncLog.objects.order_by('pk').last().total_changed, 0)
+
 
 class TestUpdateHactValues(BaseTenantTestCase):
 
@@ -47,3 +76,62 @@ class TestUpdateHactValues(BaseTenantTestCase):
         with patch("etools.applications.hact.tasks.update_hact_for_country.delay", mock_send):
             update_hact_values()
         self.assertEqual(mock_send.call_count, 1)
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    HACT_DIRTY_PARTNERS_COUNTDOWN=60,
+)
+class TestDirtyPartners(BaseTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    @patch('etools.applications.hact.tasks.update_dirty_partners.apply_async')
+    def test_mark_partners_dirty(self, mock_apply):
+        partner1 = PartnerFactory()
+        partner2 = PartnerFactory()
+        with self.captureOnCommitCallbacks(execute=True):
+            mark_partners_dirty([partner1.pk, None])
+            mark_partners_dirty([partner1.pk, partner2.pk])
+        self.assertCountEqual(
+            HactDirtyPartner.objects.values_list('partner_id', flat=True), [partner1.pk, partner2.pk]
+        )
+        mock_apply.assert_called_once_with((self.tenant.business_area_code, ), countdown=60)
+
+    @patch('etools.applications.hact.tasks.notify_hact_update.delay')
+    @patch('etools.applications.hact.tasks.update_dirty_partners.apply_async')
+    def test_update_dirty_partners(self, mock_apply, mock_notify):
+        partner = PartnerFactory(reported_cy=60000, net_ct_cy=60000)
+        other = PartnerFactory(reported_cy=60000, net_ct_cy=60000)
+        with self.captureOnCommitCallbacks(execute=True):
+            mark_partners_dirty([partner.pk])
+
+        update_dirty_partners(self.tenant.business_area_code)
+        self.assertFalse(HactDirtyPartner.objects.exists())
+        partner.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(partner.hact_values['programmatic_visits']['minimum_requirements'], 1)
+        self.assertEqual(other.hact_values['programmatic_visits']['minimum_requirements'], 0)
+        self.assertTrue(AggregateHact.objects.exists())
+        self.assertEqual(mock_notify.call_count, 1)
+
+        # the debounce window is over, the next mark schedules a new run
+        with self.captureOnCommitCallbacks(execute=True):
+            mark_partners_dirty([other.pk])
+        self.assertEqual(mock_apply.call_count, 2)
+
+    def test_update_dirty_partners_none(self):
+        update_dirty_partners(self.tenant.business_area_code)
+        self.assertFalse(AggregateHact.objects.exists())
+
+    @patch('etools.applications.hact.tasks.HactEngine')
+    def test_update_dirty_partners_failed(self, mock_engine):
+        partner = PartnerFactory()
+        HactDirtyPartner.objects.create(partner=partner)
+        mock_engine.return_value.update.side_effect = ValueError()
+
+        with self.assertRaises(ValueError):
+            update_dirty_partners(self.tenant.business_area_code)
+        self.assertTrue(HactDirtyPartner.objects.filter(partner=partner).exists())
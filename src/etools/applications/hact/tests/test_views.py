@@ -1,3 +1,5 @@
+from django.core.cache import cache
+from django.test import override_settings
 from django.urls import resolve, reverse
 
 from rest_framework import status
@@ -5,12 +7,13 @@ from rest_framework.test import APIRequestFactory
 from tablib.core import Dataset
 
 from etools.applications.core.tests.cases import BaseTenantTestCase
-from etools.applications.hact.tests.factories import HactHistoryFactory
+from etools.applications.hact.tests.factories import AggregateHactFactory, HactHistoryFactory
 from etools.applications.partners.models import PartnerOrganization, PartnerType
 from etools.applications.partners.tests.factories import PartnerFactory
 from etools.applications.users.tests.factories import UserFactory
 
 
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
 class TestHactBaseAPIView(BaseTenantTestCase):
     @classmethod
     def setUpTestData(cls):
@@ -29,6 +32,7 @@ class TestHactBaseAPIView(BaseTenantTestCase):
         cls.url = reverse("hact:hact-history")
 
     def setUp(self):
+        cache.clear()
         self.hact_data = [
             ['Implementing Partner', "Partner Name"],
             ['Partner Type', PartnerType.UN_AGENCY],
@@ -156,6 +160,22 @@ class TestHactHistoryAPIView(TestHactBaseAPIView):
             "No",
         ))
 
+    def test_cached(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            HactHistoryFactory(partner=self.partner, year=2017, partner_values=self.hact_data)
+        for data in [{"year": 2017}, {"year": 2017, "format": "csv"}]:
+            self.forced_auth_req("get", self.url, user=self.unicef_user, data=data)
+            with self.assertNumQueries(0):
+                response = self.forced_auth_req("get", self.url, user=self.unicef_user, data=data)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            HactHistoryFactory(partner=PartnerFactory(), year=2017, partner_values=self.hact_data)
+        response = self.forced_auth_req("get", self.url, user=self.unicef_user, data={"year": 2017})
+        self.assertEqual(len(response.data), 2)
+        response = self.forced_auth_req("get", self.url, user=self.unicef_user, data={"year": 2017, "format": "csv"})
+        self.assertEqual(Dataset().load(response.content.decode('utf-8'), "csv").height, 2)
+
     def test_export_csv_empty_shared_with(self):
         """If partner shared_with value is empty
         make sure we handle that gracefully
@@ -217,3 +237,23 @@ class TestHactGraphAPIView(TestHactBaseAPIView):
     def test_get(self):
         response = self.forced_auth_req("get", self.url, user=self.unicef_user)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_graph_cached(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            aggregate_hact = AggregateHactFactory(year=2017, partner_values={'charts': {}})
+        url = reverse("hact:hact-graph", args=[2017])
+        self.forced_auth_req("get", url, user=self.unicef_user)
+        with self.assertNumQueries(0):
+            response = self.forced_auth_req("get", url, user=self.unicef_user)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["partner_values"], {'charts': {}})
+
+        aggregate_hact.partner_values = {'charts': {'spot_checks_completed': []}}
+        with self.captureOnCommitCallbacks(execute=True):
+            aggregate_hact.save()
+        response = self.forced_auth_req("get", url, user=self.unicef_user)
+        self.assertEqual(response.data["partner_values"], {'charts': {'spot_checks_completed': []}})
+
+    def test_graph_not_found(self):
+        response = self.forced_auth_req("get", reverse("hact:hact-graph", args=[2000]), user=self.unicef_user)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
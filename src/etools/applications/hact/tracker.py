@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+
+def get_debounce_key():
+    return 'hact-dirty-partners-{}'.format(connection.schema_name)
+
+
+def mark_partners_dirty(partner_ids):
+    """
+    Mark the hact values of the partners as outdated after a visit or an engagement changed.
+    The first mark of a tenant schedules update_dirty_partners in HACT_DIRTY_PARTNERS_COUNTDOWN seconds,
+    the marks made in the meantime are recomputed by the same run.
+    """
+    from etools.applications.hact.models import HactDirtyPartner
+
+    partner_ids = set(filter(None, partner_ids))
+    if not partner_ids:
+        return
+    HactDirtyPartner.objects.bulk_create(
+        [HactDirtyPartner(partner_id=partner_id) for partner_id in partner_ids], ignore_conflicts=True,
+    )
+    transaction.on_commit(schedule_dirty_partners_update)
+
+
+def schedule_dirty_partners_update():
+    from etools.applications.hact.tasks import update_dirty_partners
+
+    countdown = settings.HACT_DIRTY_PARTNERS_COUNTDOWN
+    # the key expires on its own if the task is lost, so that a later mark schedules a new run
+    if cache.add(get_debounce_key(), True, timeout=countdown * 2):
+        update_dirty_partners.apply_async((connection.tenant.business_area_code, ), countdown=countdown)
@@ -1,13 +1,16 @@
 from csv import DictWriter
+from io import StringIO
 
 from django.http import HttpResponse
 from django.views.generic import DetailView
 
 from rest_framework.generics import ListAPIView, RetrieveAPIView
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
 from rest_framework_csv.renderers import JSONRenderer
 from unicef_restlib.views import QueryStringFilterMixin
 
+from etools.applications.hact.cache import get_cached_payload
 from etools.applications.hact.models import AggregateHact, HactHistory
 from etools.applications.hact.renderers import HactHistoryCSVRenderer
 from etools.applications.hact.serializers import (
@@ -47,13 +50,30 @@ class HactHistoryAPIView(QueryStringFilterMixin, ListAPIView):
     def list(self, request):
         """
         Checks for format query parameter
-        :returns: JSON or CSV file
+        :returns: JSON or CSV file, cached per year until the history changes
         """
         query_params = self.request.query_params
-        response = super().list(request)
-        if query_params.get("format") == 'csv':
+        year = query_params.get("year")
+        export = query_params.get("format") == 'csv'
+        if year and not year.isdigit():
+            # only the history of a single year or of all the years is cached
+            payload = self.get_payload(request, export)
+        else:
+            payload = get_cached_payload(
+                'history-export' if export else 'history', year, lambda: self.get_payload(request, export),
+            )
+
+        if export:
+            response = HttpResponse(payload, content_type='text/csv; charset=utf-8')
             response['Content-Disposition'] = "attachment;filename={}.csv".format(self.filename)
-        return response
+            return response
+        return Response(payload)
+
+    def get_payload(self, request, export):
+        data = super().list(request).data
+        if export:
+            return HactHistoryCSVRenderer().render(data, renderer_context=self.get_renderer_context())
+        return list(data)
 
 
 class GraphHactView(RetrieveAPIView):
@@ -63,6 +83,12 @@ class GraphHactView(RetrieveAPIView):
     queryset = AggregateHact.objects.all()
     serializer_class = AggregateHactSerializer
 
+    def retrieve(self, request, *args, **kwargs):
+        payload = get_cached_payload(
+            'graph', int(self.kwargs['year']), lambda: super(GraphHactView, self).retrieve(request, *args, **kwargs).data,
+        )
+        return Response(payload)
+
 
 class GraphHactExportView(DetailView):
     model = AggregateHact
@@ -71,8 +97,14 @@ class GraphHactExportView(DetailView):
     filename = 'hact_dashboard'
 
     def get(self, request, *args, **kwargs):
-        response = HttpResponse(content_type='text/csv')
+        response = HttpResponse(
+            get_cached_payload('graph-export', int(self.kwargs['year']), self.get_export_content),
+            content_type='text/csv',
+        )
         response['Content-Disposition'] = f'attachment; filename="{self.filename}.csv"'
+        return response
+
+    def get_export_content(self):
         partner_values = self.get_object().partner_values
         export_values = (
             ('Assessment and Assurance Activities', 'Programmatic Visits: Completed',
@@ -243,9 +275,10 @@ class GraphHactExportView(DetailView):
 
         )
 
-        writer = DictWriter(response, self.fieldnames)
+        content = StringIO()
+        writer = DictWriter(content, self.fieldnames)
         writer.writeheader()
         for label, key, value in export_values:
             writer.writerow({'Label': label, 'Column': key, 'Value': value})
 
-        return response
+        return content.getvalue()
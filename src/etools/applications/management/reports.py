@@ -0,0 +1,120 @@
+import uuid
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from etools.applications.core.models import ReportPartition
+
+
+class ReportJobLost(Exception):
+    """The job is not the running job of the report anymore, it expired or a new one started"""
+
+
+class ReportStore:
+    """
+    Store of a report built in the background.
+
+    The rows of each tenant are written to their own partition, in the database, as soon as the tenant is done,
+    the partitions of a job become the snapshot of the report once all the tenants are done, so that the previous
+    snapshot is served while a new one is being built. The status of the jobs is kept in the cache.
+    """
+    PENDING = 'pending'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+
+    # a pending job which never started (lost task) doesn't prevent a new one after this many seconds
+    PENDING_TIMEOUT = 60 * 60
+    # a running job which didn't write a partition for this many seconds (killed worker) is considered dead
+    RUNNING_TIMEOUT = 60 * 60
+
+    def __init__(self, name):
+        self.name = name
+
+    def get_key(self, *parts):
+        return ':'.join(('report', self.name) + parts)
+
+    def get_status(self):
+        return cache.get(self.get_key('status'))
+
+    def set_status(self, status, timeout=None, **kwargs):
+        cache.set(self.get_key('status'), dict(status=status, **kwargs), timeout=timeout)
+
+    def get_partitions(self, job_id):
+        return ReportPartition.objects.filter(report=self.name, job_id=job_id)
+
+    def is_building(self):
+        return cache.get(self.get_key('build')) is not None
+
+    def is_current(self, job_id):
+        return cache.get(self.get_key('build')) == job_id
+
+    def schedule(self):
+        """Schedule a new job unless one is pending or running, return whether it was scheduled"""
+        if not cache.add(self.get_key('build'), self.PENDING, timeout=self.PENDING_TIMEOUT):
+            return False
+        self.set_status(self.PENDING, scheduled=timezone.now())
+        return True
+
+    def start(self, schema_names):
+        """Start a new job building the partitions of schema_names, return its id"""
+        job_id = uuid.uuid4().hex
+        cache.set(self.get_key('build'), job_id, timeout=self.RUNNING_TIMEOUT)
+        self.set_status(self.RUNNING, job_id=job_id, started=timezone.now(), schema_names=schema_names, done=[])
+        return job_id
+
+    def add_partition(self, job_id, schema_name, rows):
+        if not self.is_current(job_id):
+            raise ReportJobLost('Job {} of the {} report is not running'.format(job_id, self.name))
+
+        # the values are kept as the csv writer writes them
+        ReportPartition.objects.create(
+            report=self.name, job_id=job_id, schema_name=schema_name,
+            rows=[['' if value is None else str(value) for value in row] for row in rows],
+        )
+
+        # the job is alive as long as it adds partitions
+        cache.set(self.get_key('build'), job_id, timeout=self.RUNNING_TIMEOUT)
+        status = self.get_status()
+        status['done'].append(schema_name)
+        cache.set(self.get_key('status'), status, timeout=None)
+
+    def finish(self, job_id):
+        if not self.is_current(job_id):
+            raise ReportJobLost('Job {} of the {} report is not running'.format(job_id, self.name))
+
+        status = self.get_status()
+        cache.set(self.get_key('snapshot'), {
+            'job_id': job_id,
+            'created': timezone.now(),
+            'schema_names': status['schema_names'],
+        }, timeout=None)
+        self.set_status(self.COMPLETED, job_id=job_id, started=status['started'], finished=timezone.now())
+        cache.delete(self.get_key('build'))
+
+        # the partitions of the previous snapshot and of the lost jobs
+        ReportPartition.objects.filter(report=self.name).exclude(job_id=job_id).delete()
+
+    def fail(self, job_id, error):
+        self.get_partitions(job_id).delete()
+        if self.is_current(job_id):
+            status = self.get_status()
+            self.set_status(self.FAILED, job_id=job_id, started=status['started'], error=error)
+            cache.delete(self.get_key('build'))
+
+    def get_snapshot(self):
+        """Latest snapshot, None unless all its partitions are available"""
+        snapshot = cache.get(self.get_key('snapshot'))
+        if not snapshot or self.get_partitions(snapshot['job_id']).count() != len(snapshot['schema_names']):
+            return None
+        return snapshot
+
+    def get_rows(self, snapshot, schema_names=None):
+        """Rows of the snapshot, limited to the partitions of schema_names if given"""
+        partitions = self.get_partitions(snapshot['job_id'])
+        if schema_names is not None:
+            partitions = partitions.filter(schema_name__in=schema_names)
+
+        # the partitions are written in the order of the snapshot, and read one at a time
+        for rows in partitions.order_by('pk').values_list('rows', flat=True).iterator(chunk_size=1):
+            yield from rows
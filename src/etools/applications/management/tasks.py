@@ -1,15 +1,14 @@
 import logging
 from datetime import date, datetime
 
-from django.contrib.auth import get_user_model
 from django.core.mail import send_mail
-from django.db.models import Sum
-from django.db.models.functions import Coalesce
+from django.db import connection
+from django.db.models import Count, Prefetch, Q
 
 from dateutil.relativedelta import relativedelta
 
-from etools.applications.core.util_scripts import set_country
-from etools.applications.partners.models import Intervention, PartnerOrganization
+from etools.applications.management.reports import ReportStore
+from etools.applications.partners.models import CoreValuesAssessment, Intervention
 from etools.applications.users.models import Country
 from etools.config.celery import app
 
@@ -54,94 +53,126 @@ def user_report(writer, **kwargs):
     dict_writer = writer(fieldnames=fieldnames)
     dict_writer.writeheader()
 
+    # the profiles are on public, all the countries are counted with one query
+    unicef = Q(userprofile__user__email__endswith='@unicef.org')
+    last_month = Q(userprofile__user__last_login__gte=start_date)
+    qs = qs.annotate(
+        total_users=Count('userprofile'),
+        unicef_users=Count('userprofile', filter=unicef),
+        last_month_users=Count('userprofile', filter=last_month),
+        last_month_unicef_users=Count('userprofile', filter=unicef & last_month),
+    )
     for country in qs:
         dict_writer.writerow({
             'Country': country,
-            'Total Users': get_user_model().objects.filter(profile__country=country).count(),
-            'Unicef Users': get_user_model().objects.filter(
-                profile__country=country,
-                email__endswith='@unicef.org'
-            ).count(),
-            'Last month Users': get_user_model().objects.filter(
-                profile__country=country,
-                last_login__gte=start_date
-            ).count(),
-            'Last month Unicef Users': get_user_model().objects.filter(
-                profile__country=country,
-                email__endswith='@unicef.org',
-                last_login__gte=start_date
-            ).count(),
+            'Total Users': country.total_users,
+            'Unicef Users': country.unicef_users,
+            'Last month Users': country.last_month_users,
+            'Last month Unicef Users': country.last_month_unicef_users,
         })
 
 
-@app.task
-def pmp_indicator_report(writer, **kwargs):
+PMP_INDICATOR_REPORT = 'pmp_indicators'
+PMP_INDICATOR_FIELDNAMES = [
+    'Country',
+    'Partner Name',
+    'Partner Type',
+    'PD / SSFA ref',
+    'PD / SSFA status',
+    'PD / SSFA start date',
+    'PD / SSFA creation date',
+    'PD / SSFA end date',
+    'UNICEF US$ Cash contribution',
+    'UNICEF US$ Supply contribution',
+    'Total Budget',
+    'UNICEF Budget',
+    'Currency',
+    'Partner Contribution',
+    'Unicef Cash',
+    'In kind Amount',
+    'Total',
+    'FR numbers against PD / SSFA',
+    'FR currencies',
+    'Sum of all FR planned amount',
+    'Core value attached',
+    'Partner Link',
+    'Intervention Link',
+]
+
+
+def get_pmp_indicator_rows(country):
+    """Rows of the pmp indicator report for the interventions of the current tenant, loaded in bulk"""
     base_url = 'https://etools.unicef.org'
+    interventions = Intervention.objects.prefetch_related(None).select_related(
+        'planned_budget', 'agreement__partner',
+    ).prefetch_related(
+        'frs',
+        Prefetch(
+            'agreement__partner__core_values_assessments',
+            queryset=CoreValuesAssessment.objects.filter(archived=False).order_by('pk'),
+            to_attr='current_core_values_assessments',
+        ),
+    ).order_by('agreement__partner__name', 'agreement__partner', '-created')
+
+    rows = []
+    for intervention in interventions:
+        partner = intervention.agreement.partner
+        planned_budget = getattr(intervention, 'planned_budget', None)
+        frs = intervention.frs.all()
+        fr_currencies = list(dict.fromkeys(fr.currency for fr in frs))
+        current_assessment = next(iter(partner.current_core_values_assessments), None)
+        has_assessment = bool(getattr(current_assessment, 'assessment', False))
+        rows.append([
+            str(country),
+            str(partner),
+            partner.cso_type,
+            intervention.number.replace(',', '-'),
+            intervention.get_status_display(),
+            intervention.start,
+            intervention.created,
+            intervention.end,
+            intervention.total_unicef_cash,
+            intervention.total_in_kind_amount,
+            intervention.total_budget,
+            intervention.total_unicef_budget,
+            planned_budget.currency if planned_budget else '-',
+            planned_budget.partner_contribution if planned_budget else '-',
+            planned_budget.unicef_cash if planned_budget else '-',
+            planned_budget.in_kind_amount if planned_budget else '-',
+            planned_budget.total if planned_budget else '-',
+            ' - '.join([fh.fr_number for fh in frs]),
+            ', '.join(fr_currencies),
+            sum((fr.intervention_amt for fr in frs), 0) if len(fr_currencies) <= 1 else '-',
+            has_assessment,
+            '{}/pmp/partners/{}/details'.format(base_url, partner.pk),
+            '{}/pmp/interventions/{}/details'.format(base_url, intervention.pk),
+        ])
+    return rows
+
+
+@app.task
+def build_pmp_indicator_report():
+    """Build a new snapshot of the pmp indicator report, one partition per country"""
+    store = ReportStore(PMP_INDICATOR_REPORT)
+    countries = list(Country.objects.exclude(schema_name__in=['public', 'uat', 'frg']))
+    job_id = store.start([country.schema_name for country in countries])
+    try:
+        for country in countries:
+            connection.set_tenant(country)
+            logger.info('Running on %s' % country.name)
+            store.add_partition(job_id, country.schema_name, get_pmp_indicator_rows(country))
+    except Exception as e:
+        store.fail(job_id, str(e))
+        raise
+    store.finish(job_id)
+
+
+def pmp_indicator_report(writer, snapshot, **kwargs):
+    """Write the rows of a snapshot of the pmp indicator report"""
     countries = kwargs.get('countries', None)
-    qs = Country.objects.exclude(schema_name__in=['public', 'uat', 'frg'])
-    if countries:
-        qs = qs.filter(schema_name__in=countries.pop().split(','))
-    fieldnames = [
-        'Country',
-        'Partner Name',
-        'Partner Type',
-        'PD / SSFA ref',
-        'PD / SSFA status',
-        'PD / SSFA start date',
-        'PD / SSFA creation date',
-        'PD / SSFA end date',
-        'UNICEF US$ Cash contribution',
-        'UNICEF US$ Supply contribution',
-        'Total Budget',
-        'UNICEF Budget',
-        'Currency',
-        'Partner Contribution',
-        'Unicef Cash',
-        'In kind Amount',
-        'Total',
-        'FR numbers against PD / SSFA',
-        'FR currencies',
-        'Sum of all FR planned amount',
-        'Core value attached',
-        'Partner Link',
-        'Intervention Link',
-    ]
+    schema_names = countries.pop().split(',') if countries else None
 
-    dict_writer = writer(fieldnames=fieldnames)
+    dict_writer = writer(fieldnames=PMP_INDICATOR_FIELDNAMES)
     dict_writer.writeheader()
-
-    for country in qs:
-        set_country(country.name)
-        logger.info('Running on %s' % country.name)
-        for partner in PartnerOrganization.objects.prefetch_related('core_values_assessments'):
-            for intervention in Intervention.objects.filter(
-                    agreement__partner=partner).select_related('planned_budget'):
-                planned_budget = getattr(intervention, 'planned_budget', None)
-                fr_currencies = intervention.frs.all().values_list('currency', flat=True).distinct()
-                has_assessment = bool(getattr(partner.current_core_value_assessment, 'assessment', False))
-                dict_writer.writerow({
-                    'Country': country,
-                    'Partner Name': str(partner),
-                    'Partner Type': partner.cso_type,
-                    'PD / SSFA ref': intervention.number.replace(',', '-'),
-                    'PD / SSFA status': intervention.get_status_display(),
-                    'PD / SSFA start date': intervention.start,
-                    'PD / SSFA creation date': intervention.created,
-                    'PD / SSFA end date': intervention.end,
-                    'UNICEF US$ Cash contribution': intervention.total_unicef_cash,
-                    'UNICEF US$ Supply contribution': intervention.total_in_kind_amount,
-                    'Total Budget': intervention.total_budget,
-                    'UNICEF Budget': intervention.total_unicef_budget,
-                    'Currency': intervention.planned_budget.currency if planned_budget else '-',
-                    'Partner Contribution': intervention.planned_budget.partner_contribution if planned_budget else '-',
-                    'Unicef Cash': intervention.planned_budget.unicef_cash if planned_budget else '-',
-                    'In kind Amount': intervention.planned_budget.in_kind_amount if planned_budget else '-',
-                    'Total': intervention.planned_budget.total if planned_budget else '-',
-                    'FR numbers against PD / SSFA': ' - '.join([fh.fr_number for fh in intervention.frs.all()]),
-                    'FR currencies': ', '.join(fr for fr in fr_currencies),
-                    'Sum of all FR planned amount': intervention.frs.aggregate(
-                        total=Coalesce(Sum('intervention_amt'), 0))['total'] if fr_currencies.count() <= 1 else '-',
-                    'Core value attached': has_assessment,
-                    'Partner Link': '{}/pmp/partners/{}/details'.format(base_url, partner.pk),
-                    'Intervention Link': '{}/pmp/interventions/{}/details'.format(base_url, intervention.pk),
-                })
+    for row in ReportStore(PMP_INDICATOR_REPORT).get_rows(snapshot, schema_names):
+        dict_writer.writerow(dict(zip(PMP_INDICATOR_FIELDNAMES, row)))
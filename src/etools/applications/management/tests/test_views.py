@@ -1,4 +1,9 @@
+import csv
+import datetime
+
+from django.core.cache import cache
 from django.core.management import call_command
+from django.test import override_settings
 from django.urls import reverse
 
 from django_tenants.test.client import TenantClient
@@ -10,10 +15,19 @@ from etools.applications.action_points.models import ActionPoint
 from etools.applications.action_points.tests.factories import ActionPointFactory
 from etools.applications.activities.models import Activity
 from etools.applications.audit.tests.factories import EngagementFactory
+from etools.applications.core.models import ReportPartition
 from etools.applications.core.tests.cases import BaseTenantTestCase
 from etools.applications.field_monitoring.fm_settings.tests.factories import QuestionFactory
 from etools.applications.field_monitoring.planning.tests.factories import MonitoringActivityFactory
-from etools.applications.partners.models import Intervention
+from etools.applications.funds.tests.factories import FundsReservationHeaderFactory
+from etools.applications.management.reports import ReportJobLost, ReportStore
+from etools.applications.management.tasks import (
+    build_pmp_indicator_report,
+    get_pmp_indicator_rows,
+    PMP_INDICATOR_FIELDNAMES,
+    PMP_INDICATOR_REPORT,
+)
+from etools.applications.partners.models import Agreement, Intervention
 from etools.applications.partners.tests.factories import (
     AgreementFactory,
     InterventionFactory,
@@ -161,6 +175,95 @@ class TestAgreementsStatisticsView(BaseTenantTestCase):
             "totalAgreements": 0
         }])
 
+    def test_get_active(self):
+        today = datetime.date.today()
+        AgreementFactory.create_batch(
+            2,
+            agreement_type=Agreement.MOU,
+            start=today - datetime.timedelta(days=10),
+            end=today + datetime.timedelta(days=10),
+        )
+        AgreementFactory(agreement_type=Agreement.MOU, start=today - datetime.timedelta(days=10), end=today)
+        response = self.forced_auth_req(
+            "get",
+            reverse("management:stats_agreements"),
+            user=self.unicef_staff
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [{
+            "countryName": "",
+            "totalAgreements": 2
+        }])
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class TestPMPIndicatorsReportView(BaseTenantTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.superuser = UserFactory(is_superuser=True)
+        self.url = reverse('management:reports_pmp_indicators')
+
+    @patch('etools.applications.management.views.tasks_endpoints.build_pmp_indicator_report')
+    def test_get_without_snapshot(self, mock_build):
+        response = self.forced_auth_req('get', self.url, user=self.superuser)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['status'], 'pending')
+        mock_build.delay.assert_called_once_with()
+
+        response = self.forced_auth_req('get', self.url, user=self.superuser)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        mock_build.delay.assert_called_once_with()
+
+    def test_get_snapshot(self):
+        intervention = InterventionFactory()
+        FundsReservationHeaderFactory(intervention=intervention, currency='USD', intervention_amt=10)
+        FundsReservationHeaderFactory(intervention=intervention, currency='USD', intervention_amt=5)
+        build_pmp_indicator_report()
+
+        response = self.forced_auth_req('get', self.url, user=self.superuser)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = list(csv.DictReader(response.content.decode().splitlines()))
+        self.assertEqual(list(rows[0].keys()), PMP_INDICATOR_FIELDNAMES)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['PD / SSFA ref'], intervention.number)
+        self.assertEqual(rows[0]['FR currencies'], 'USD')
+        self.assertEqual(rows[0]['Sum of all FR planned amount'], '15.00')
+
+        response = self.forced_auth_req('get', self.url, data={'countries': 'other'}, user=self.superuser)
+        self.assertEqual(list(csv.DictReader(response.content.decode().splitlines())), [])
+
+    @patch('etools.applications.management.views.tasks_endpoints.build_pmp_indicator_report')
+    def test_get_snapshot_missing_partition(self, mock_build):
+        build_pmp_indicator_report()
+        ReportPartition.objects.all().delete()
+
+        response = self.forced_auth_req('get', self.url, user=self.superuser)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        mock_build.delay.assert_called_once_with()
+
+    def test_lost_job(self):
+        store = ReportStore(PMP_INDICATOR_REPORT)
+        self.assertTrue(store.schedule())
+        self.assertFalse(store.schedule())
+
+        job_id = store.start([self.tenant.schema_name])
+        self.assertTrue(store.is_building())
+        # the running job expires when its worker is killed
+        cache.delete(store.get_key('build'))
+        self.assertFalse(store.is_building())
+        with self.assertRaises(ReportJobLost):
+            store.add_partition(job_id, self.tenant.schema_name, [])
+        self.assertTrue(store.schedule())
+
+    def test_rows_queries(self):
+        partner = PartnerFactory()
+        for __ in range(3):
+            FundsReservationHeaderFactory(intervention=InterventionFactory(agreement__partner=partner))
+        with self.assertNumQueries(3):
+            rows = get_pmp_indicator_rows(self.tenant)
+        self.assertEqual(len(rows), 3)
+
 
 class TestPortalDashView(BaseTenantTestCase):
     def test_get(self):
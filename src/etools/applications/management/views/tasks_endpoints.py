@@ -10,7 +10,14 @@ from rest_framework.views import APIView
 from unicef_restlib.permissions import IsSuperUser
 
 from etools.applications.hact.tasks import update_aggregate_hact_values, update_hact_values
-from etools.applications.management.tasks import pmp_indicator_report, send_test_email, user_report
+from etools.applications.management.reports import ReportStore
+from etools.applications.management.tasks import (
+    build_pmp_indicator_report,
+    PMP_INDICATOR_REPORT,
+    pmp_indicator_report,
+    send_test_email,
+    user_report,
+)
 from etools.libraries.azure_graph_api.tasks import sync_all_users, sync_delta_users
 
 
@@ -95,5 +102,19 @@ class UsersReportView(BasicReportAPIView):
 
 
 class PMPIndicatorsReportView(BasicReportAPIView):
-    report_function = pmp_indicator_report
+    """
+    Return the latest snapshot of the report, built in the background by build_pmp_indicator_report.
+    Without a snapshot, or with the refresh parameter, a new build is scheduled and the status of the job returned.
+    """
     base_filename = 'pmp_indicators_report'
+
+    def get(self, request, *args, **kwargs):
+        store = ReportStore(PMP_INDICATOR_REPORT)
+        snapshot = store.get_snapshot()
+        if snapshot and 'refresh' not in request.query_params:
+            self.report_function = partial(pmp_indicator_report, snapshot=snapshot)
+            return super().get(request, *args, **kwargs)
+
+        if store.schedule():
+            build_pmp_indicator_report.delay()
+        return Response(status=202, data=store.get_status())
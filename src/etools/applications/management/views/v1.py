@@ -1,6 +1,6 @@
 from datetime import date
 
-from django.db import connection
+from django.db.models import Count, Q
 from django.views.generic import TemplateView
 
 from rest_framework.response import Response
@@ -9,6 +9,7 @@ from rest_framework.views import APIView
 from etools.applications.partners.models import Agreement
 from etools.applications.users.models import Country, UserProfile
 from etools.applications.vision.models import VisionSyncLog
+from etools.libraries.tenant_support.utils import TenantUnionQuery
 
 
 class PortalDashView(TemplateView):
@@ -39,22 +40,16 @@ class ActiveUsers(APIView):
     model = UserProfile
 
     def get(self, request, **kwargs):
-        country_list = Country.objects.values_list('name', flat=True)
+        # the profiles are on public, the users of all the countries are counted with one query
+        country_list = Country.objects.annotate(total=Count('userprofile', filter=Q(
+            userprofile__user__is_staff=True,
+            userprofile__user__is_active=True,
+        ))).values_list('name', 'total')
 
         results = []
-        for country in country_list:
-            country_records = {}
-            user_qry = UserProfile.objects.filter(
-                user__is_staff=True,
-                user__is_active=True,
-                country__name=country
-            )
-            country_records[country] = {
-                'total': user_qry.count()
-            }
-
+        for country, total in country_list:
             results.append({'countryName': country,
-                            'records': country_records[country]})
+                            'records': {'total': total}})
 
         return Response(results)
 
@@ -69,18 +64,15 @@ class AgreementsStatisticsView(APIView):
         today = date.today()
         # get all the countries:
         country_list = Country.objects.exclude(schema_name='public').all()
+        # count the agreements of all the countries with one query
+        totals = TenantUnionQuery(
+            Agreement.objects.filter(start__lt=today, end__gt=today),
+            [country.schema_name for country in country_list],
+        ).counts()
         results = []
         for country in country_list:
-            # set tenant for country
-            connection.set_tenant(country)
-            # get count for agreements
-            country_agreements_count = Agreement.objects.filter(
-                start__lt=today,
-                end__gt=today
-            ).count()
-
             results.append({
                 "countryName": country.name,
-                "totalAgreements": country_agreements_count
+                "totalAgreements": totals[country.schema_name]
             })
         return Response(results)
@@ -349,7 +349,7 @@ class InterventionAdmin(
     section_names.short_description = "Sections"
 
     def has_module_permission(self, request):
-        return request.user.is_superuser or request.user.groups.filter(name='Country Office Administrator').exists()
+        return request.user.is_superuser or 'Country Office Administrator' in request.user.group_names
 
     def attachments_link(self, obj):
         url = "{}?intervention__id__exact={}".format(
@@ -431,7 +431,7 @@ class PartnerStaffMemberAdmin(SnapshotModelAdmin):
     ]
 
     def has_module_permission(self, request):
-        return request.user.is_superuser or request.user.groups.filter(name='Country Office Administrator').exists()
+        return request.user.is_superuser or 'Country Office Administrator' in request.user.group_names
 
 
 class HiddenPartnerFilter(admin.SimpleListFilter):
@@ -579,7 +579,7 @@ class PartnerAdmin(ExtraUrlMixin, ExportMixin, admin.ModelAdmin):
         self.message_user(request, '{} partners were shown'.format(partners))
 
     def has_module_permission(self, request):
-        return request.user.is_superuser or request.user.groups.filter(name='Country Office Administrator').exists()
+        return request.user.is_superuser or 'Country Office Administrator' in request.user.group_names
 
     @button()
     def sync_partner(self, request, pk):
@@ -727,13 +727,13 @@ class AgreementAdmin(
     ]
 
     def has_module_permission(self, request):
-        return request.user.is_superuser or request.user.groups.filter(name='Country Office Administrator').exists()
+        return request.user.is_superuser or 'Country Office Administrator' in request.user.group_names
 
 
 class FileTypeAdmin(admin.ModelAdmin):
 
     def has_module_permission(self, request):
-        return request.user.is_superuser or request.user.groups.filter(name='Country Office Administrator').exists()
+        return request.user.is_superuser or 'Country Office Administrator' in request.user.group_names
 
 
 admin.site.register(PartnerOrganization, PartnerAdmin)
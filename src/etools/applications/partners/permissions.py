@@ -1,5 +1,4 @@
 import datetime
-from functools import lru_cache
 
 from django.apps import apps
 from django.utils.translation import gettext as _
@@ -9,7 +8,6 @@ from rest_framework import permissions
 
 from etools.applications.environment.helpers import tenant_switch_is_active
 from etools.libraries.djangolib.utils import get_all_field_names, is_user_in_groups
-from etools.libraries.pythonlib.collections import HashableDict
 
 # READ_ONLY_API_GROUP_NAME is the name of the permissions group that provides read-only access to some list views.
 # Initially, this is only being used for PRP-related endpoints.
@@ -21,6 +19,90 @@ PARTNERSHIP_MANAGER_GROUP = 'Partnership Manager'
 REPRESENTATIVE_OFFICE_GROUP = 'Representative Office'
 
 
+def is_wildcard(value):
+    return not value or value == '*'
+
+
+class CompiledPermissionMatrix:
+    """
+    Permission matrix compiled into bitsets. Every distinct condition group of the matrix is a bit,
+    each field and action keeps the bits of its condition groups, and each status, user group and condition
+    keeps the bits of the condition groups requiring it. The condition groups valid for an instance are
+    the ones not requiring anything inactive, so that a permission is a single AND with them.
+    """
+
+    def __init__(self, permission_structure, possible_actions):
+        condition_groups = {}
+        self.status_groups = {}
+        self.user_group_groups = {}
+        self.condition_groups = {}
+        # field -> action -> (condition groups bits, default when none of them is valid)
+        self.fields = {}
+
+        for field, actions in permission_structure.items():
+            self.fields[field] = {}
+            for action in possible_actions:
+                bits = 0
+                # only the conditions opposite to the default are defined, see process_permissions
+                default = bool(len(actions.get(action, {}).get('false', [])))
+                for allowed in ['true', 'false']:
+                    for condition_group in actions.get(action, {}).get(allowed, []):
+                        key = (condition_group['status'], condition_group['group'], condition_group['condition'])
+                        if key not in condition_groups:
+                            condition_groups[key] = 1 << len(condition_groups)
+                            self.add_requirements(condition_groups[key], *key)
+                        bits |= condition_groups[key]
+                self.fields[field][action] = (bits, default)
+
+        self.all_groups = (1 << len(condition_groups)) - 1
+
+    def add_requirements(self, bit, status, user_group, condition):
+        for requirements, value in [
+            (self.status_groups, status),
+            (self.user_group_groups, user_group),
+            (self.condition_groups, condition),
+        ]:
+            if not is_wildcard(value):
+                requirements[value] = requirements.get(value, 0) | bit
+
+    def get_valid_groups(self, get_status, user_groups, condition_map):
+        """Bits of the condition groups valid for the instance status, the user groups and the conditions"""
+        invalid = 0
+        if self.status_groups:
+            status = get_status()
+            for value, bits in self.status_groups.items():
+                if value != status:
+                    invalid |= bits
+        user_groups = set(user_groups) if self.user_group_groups else set()
+        for value, bits in self.user_group_groups.items():
+            if value not in user_groups:
+                invalid |= bits
+        for value, bits in self.condition_groups.items():
+            if not condition_map[value]:
+                invalid |= bits
+        return self.all_groups & ~invalid
+
+    def get_permission(self, field, action, valid_groups):
+        bits, default = self.fields[field][action]
+        if bits & valid_groups:
+            return not default
+        return default
+
+
+# the matrices are loaded once per process by import_permissions, so they are compiled once as well
+compiled_permission_matrices = {}
+
+
+def compile_permission_matrix(permission_structure, possible_actions):
+    compiled = compiled_permission_matrices.get(id(permission_structure))
+    if compiled is None or compiled[0] is not permission_structure:
+        if len(compiled_permission_matrices) > 32:
+            compiled_permission_matrices.clear()
+        compiled = (permission_structure, CompiledPermissionMatrix(permission_structure, possible_actions))
+        compiled_permission_matrices[id(permission_structure)] = compiled
+    return compiled[1]
+
+
 class PMPPermissions:
     # this property specifies an array of model properties in order to check against the permission matrix. The fields
     # declared under this property need to be both property on the model and delcared in the permission matrix
@@ -35,57 +117,26 @@ class PMPPermissions:
     def __init__(self, user, instance, permission_structure, **kwargs):
         self.MODEL = apps.get_model(self.MODEL_NAME)
         self.user = user
-        self.user_groups = self.user.groups.values_list('name', flat=True)
+        self.user_groups = self.user.group_names
         self.instance = instance
-        self.condition_group_valid = lru_cache(maxsize=16)(self.condition_group_valid)
         self.permission_structure = permission_structure
+        self.matrix = compile_permission_matrix(permission_structure, self.possible_actions)
         self.all_model_fields = get_all_field_names(self.MODEL)
         self.all_model_fields += self.EXTRA_FIELDS
 
-    def condition_group_valid(self, condition_group):
-        if condition_group['status'] and condition_group['status'] != '*':
-            if self.instance.status != condition_group['status']:
-                return False
-        if condition_group['group'] and condition_group['group'] != '*':
-            if condition_group['group'] not in self.user_groups:
-                return False
-        if condition_group['condition'] and condition_group['condition'] != '*':
-            # use the following commented line in case we want to not use a condition mapper and interpret the
-            # condition directly from the sheet (not recommended)
-            # if not eval(condition_group['condition'], globals=globals(), locals=locals()):
-            if not self.condition_map[condition_group['condition']]:
-                return False
-        return True
-
-    def get_field_permissions(self, action, field):
-        condition_groups = field[action]
-
-        # For a field and one action (start_date, can_view) you can't define both true conditions and false conditions
-        # because if both groups fail, we can't know what to default to
-        # this assertion should be in the ingestion script
-
-        # if the "false" conditions were defined that means that by default allowed will be "true"
-        # otherwise it means that the "true" conditions were defined and therefore default will be "false"
-        default_return = bool(len(condition_groups['false']))
-
-        for allowed in ['true', 'false']:
-            for condition_group in condition_groups[allowed]:
-                if self.condition_group_valid(HashableDict(condition_group)):
-                    return True if allowed == 'true' else False
-
-        return default_return
-
     def get_permissions(self):
-        ps = self.permission_structure
+        valid_groups = self.matrix.get_valid_groups(
+            lambda: self.instance.status, self.user_groups, self.condition_map,
+        )
 
         my_permissions = {}
         for action in self.possible_actions:
             my_permissions[action] = {}
             for field in self.all_model_fields:
-                if field not in ps:
+                if field not in self.matrix.fields:
                     my_permissions[action][field] = self.actions_default_permissions[action]
                 else:
-                    my_permissions[action][field] = self.get_field_permissions(action, ps[field])
+                    my_permissions[action][field] = self.matrix.get_permission(field, action, valid_groups)
         return my_permissions
 
 
@@ -2,23 +2,28 @@ import logging
 from datetime import datetime
 from decimal import Decimal
 
-from django.core.exceptions import ValidationError
-from django.db import connection, transaction
+from django.db import connection, DatabaseError, transaction
+from django.utils import timezone
 
 from unicef_vision.settings import INSIGHT_DATE_FORMAT
-from unicef_vision.synchronizers import FileDataSynchronizer
 from unicef_vision.utils import comp_decimals
 
-from etools.applications.partners.models import PartnerOrganization, PlannedEngagement
+from etools.applications.partners.models import CoreValuesAssessment, PartnerOrganization, PlannedEngagement
 from etools.applications.partners.tasks import notify_partner_hidden
-from etools.applications.vision.synchronizers import VisionDataTenantSynchronizer
+from etools.applications.vision.synchronizers import FileDataSynchronizer, VisionDataTenantSynchronizer
 
 logger = logging.getLogger(__name__)
 
+AMOUNT_PRECISION = Decimal('0.01')
+
 
 class PartnerSynchronizer(VisionDataTenantSynchronizer):
 
     ENDPOINT = 'partners'
+    STREAMING = True
+    HASH_KEY = 'VENDOR_CODE'
+    # number of rows sent to the database per bulk_create / bulk_update statement
+    BATCH_SIZE = 500
     REQUIRED_KEYS = (
         'PARTNER_TYPE_DESC',
         'VENDOR_NAME',
@@ -86,6 +91,15 @@ class PartnerSynchronizer(VisionDataTenantSynchronizer):
         'short_name': 'SEARCH_TERM1',
     }
 
+    # every field _update_partner and _hide_partner may change
+    PARTNER_UPDATE_FIELDS = [
+        'name', 'cso_type', 'rating', 'type_of_assessment', 'address', 'city', 'postal_code', 'country',
+        'phone_number', 'email', 'core_values_assessment_date', 'last_assessment_date', 'partner_type',
+        'deleted_flag', 'blocked', 'hidden', 'vision_synced', 'short_name', 'highest_risk_rating_name',
+        'highest_risk_rating_type', 'psea_assessment_date', 'sea_risk_rating_name', 'total_ct_cy', 'total_ct_cp',
+        'net_ct_cy', 'total_ct_ytd', 'reported_cy', 'basis_for_risk_rating', 'modified',
+    ]
+
     def _filter_records(self, records):
         records = super()._filter_records(records)
 
@@ -137,93 +151,104 @@ class PartnerSynchronizer(VisionDataTenantSynchronizer):
                 return True
         return False
 
-    def _partner_save(self, partner, full_sync=True):
-        processed = 0
+    def _update_partner(self, partner_org, partner, new, full_sync=True):
+        """
+        Apply the vision record to partner_org in memory.
+        Returns (saving, notify_block), where saving tells whether partner_org needs to be written
+        """
         saving = False
         notify_block = False
 
+        if new or self._changed_fields(partner_org, partner):
+            partner_org.name = partner['VENDOR_NAME']
+            partner_org.cso_type = self.get_cso_type(partner)
+            partner_org.rating = self.get_partner_rating(partner)
+            partner_org.type_of_assessment = self.get_type_of_assessment(partner)
+            partner_org.address = partner.get('STREET', '')
+            partner_org.city = partner.get('CITY', '')
+            partner_org.postal_code = partner.get('POSTAL_CODE', '')
+            partner_org.country = partner['COUNTRY']
+            partner_org.phone_number = partner.get('PHONE_NUMBER', '')
+            partner_org.email = partner.get('EMAIL', '')
+            partner_org.core_values_assessment_date = datetime.strptime(
+                partner['CORE_VALUE_ASSESSMENT_DT'],
+                '%d-%b-%y') if partner['CORE_VALUE_ASSESSMENT_DT'] else None
+            partner_org.last_assessment_date = datetime.strptime(
+                partner['DATE_OF_ASSESSMENT'], '%d-%b-%y') if partner["DATE_OF_ASSESSMENT"] else None
+            partner_org.partner_type = self.get_partner_type(partner)
+            partner_org.deleted_flag = bool(partner['MARKED_FOR_DELETION'])
+            posting_block = bool(partner['POSTING_BLOCK'])
+
+            if posting_block and not partner_org.blocked:  # i'm blocking the partner now
+                notify_block = True
+            partner_org.blocked = posting_block
+
+            partner_org.hidden = partner_org.deleted_flag or partner_org.blocked or partner_org.manually_blocked
+            partner_org.vision_synced = True
+            partner_org.short_name = partner['SEARCH_TERM1'] or ''
+            partner_org.highest_risk_rating_name = self.get_partner_higest_rating(partner)
+            partner_org.highest_risk_rating_type = partner.get("HIGEST_RISK_RATING_TYPE", "")
+            partner_org.psea_assessment_date = datetime.strptime(
+                partner['PSEA_ASSESSMENT_DATE'], INSIGHT_DATE_FORMAT) if partner['PSEA_ASSESSMENT_DATE'] else None
+            partner_org.sea_risk_rating_name = partner["SEA_RISK_RATING_NAME"] \
+                if partner["SEA_RISK_RATING_NAME"] else ''
+            saving = True
+
+        if full_sync and (
+                partner_org.total_ct_cp is None or
+                partner_org.total_ct_cy is None or
+                partner_org.net_ct_cy is None or
+                partner_org.total_ct_ytd is None or
+                partner_org.reported_cy is None or
+                not comp_decimals(partner_org.total_ct_cp, Decimal(partner['TOTAL_CASH_TRANSFERRED_CP'])) or
+                not comp_decimals(partner_org.total_ct_cy, Decimal(partner['TOTAL_CASH_TRANSFERRED_CY'])) or
+                not comp_decimals(partner_org.net_ct_cy, Decimal(partner['NET_CASH_TRANSFERRED_CY'])) or
+                not comp_decimals(partner_org.total_ct_ytd, Decimal(partner['TOTAL_CASH_TRANSFERRED_YTD'])) or
+                not comp_decimals(partner_org.reported_cy, Decimal(partner['REPORTED_CY']))):
+
+            partner_org.total_ct_cy = partner['TOTAL_CASH_TRANSFERRED_CY']
+            partner_org.total_ct_cp = partner['TOTAL_CASH_TRANSFERRED_CP']
+            partner_org.net_ct_cy = partner['NET_CASH_TRANSFERRED_CY']
+            partner_org.total_ct_ytd = partner['TOTAL_CASH_TRANSFERRED_YTD']
+            partner_org.reported_cy = partner['REPORTED_CY']
+
+            saving = True
+            logger.debug('sums changed', partner_org)
+
+        if saving:
+            # clear basis_for_risk_rating in certain cases
+            if partner_org.basis_for_risk_rating and (
+                    partner_org.type_of_assessment.upper() in [PartnerOrganization.HIGH_RISK_ASSUMED,
+                                                               PartnerOrganization.LOW_RISK_ASSUMED] or (
+                    partner_org.rating == PartnerOrganization.RATING_NOT_REQUIRED and
+                    partner_org.type_of_assessment == PartnerOrganization.MICRO_ASSESSMENT)
+            ):
+                partner_org.basis_for_risk_rating = ''
+
+        return saving, notify_block
+
+    def _hide_partner(self, partner_org, partner):
+        logger.info('Partner {} skipped, because PartnerType is {}'.format(
+            partner['VENDOR_NAME'], partner['PARTNER_TYPE_DESC']
+        ))
+        partner_org.deleted_flag = bool(partner['MARKED_FOR_DELETION'])
+        partner_org.blocked = bool(partner['POSTING_BLOCK'])
+        partner_org.hidden = True
+
+    def _partner_save(self, partner, full_sync=True):
+        processed = 0
+
         try:
             partner_org, new = PartnerOrganization.objects.get_or_create(vendor_number=partner['VENDOR_CODE'])
 
             if not self.get_partner_type(partner):
-                logger.info('Partner {} skipped, because PartnerType is {}'.format(
-                    partner['VENDOR_NAME'], partner['PARTNER_TYPE_DESC']
-                ))
-
-                if partner_org.id:
-                    partner_org.deleted_flag = bool(partner['MARKED_FOR_DELETION'])
-                    partner_org.blocked = bool(partner['POSTING_BLOCK'])
-                    partner_org.hidden = True
-                    partner_org.save()
+                self._hide_partner(partner_org, partner)
+                partner_org.save()
                 return processed
 
-            if new or self._changed_fields(partner_org, partner):
-                partner_org.name = partner['VENDOR_NAME']
-                partner_org.cso_type = self.get_cso_type(partner)
-                partner_org.rating = self.get_partner_rating(partner)
-                partner_org.type_of_assessment = self.get_type_of_assessment(partner)
-                partner_org.address = partner.get('STREET', '')
-                partner_org.city = partner.get('CITY', '')
-                partner_org.postal_code = partner.get('POSTAL_CODE', '')
-                partner_org.country = partner['COUNTRY']
-                partner_org.phone_number = partner.get('PHONE_NUMBER', '')
-                partner_org.email = partner.get('EMAIL', '')
-                partner_org.core_values_assessment_date = datetime.strptime(
-                    partner['CORE_VALUE_ASSESSMENT_DT'],
-                    '%d-%b-%y') if partner['CORE_VALUE_ASSESSMENT_DT'] else None
-                partner_org.last_assessment_date = datetime.strptime(
-                    partner['DATE_OF_ASSESSMENT'], '%d-%b-%y') if partner["DATE_OF_ASSESSMENT"] else None
-                partner_org.partner_type = self.get_partner_type(partner)
-                partner_org.deleted_flag = bool(partner['MARKED_FOR_DELETION'])
-                posting_block = bool(partner['POSTING_BLOCK'])
-
-                if posting_block and not partner_org.blocked:  # i'm blocking the partner now
-                    notify_block = True
-                partner_org.blocked = posting_block
-
-                partner_org.hidden = partner_org.deleted_flag or partner_org.blocked or partner_org.manually_blocked
-                partner_org.vision_synced = True
-                partner_org.short_name = partner['SEARCH_TERM1'] or ''
-                partner_org.highest_risk_rating_name = self.get_partner_higest_rating(partner)
-                partner_org.highest_risk_rating_type = partner.get("HIGEST_RISK_RATING_TYPE", "")
-                partner_org.psea_assessment_date = datetime.strptime(
-                    partner['PSEA_ASSESSMENT_DATE'], INSIGHT_DATE_FORMAT) if partner['PSEA_ASSESSMENT_DATE'] else None
-                partner_org.sea_risk_rating_name = partner["SEA_RISK_RATING_NAME"] \
-                    if partner["SEA_RISK_RATING_NAME"] else ''
-                saving = True
-
-            if full_sync and (
-                    partner_org.total_ct_cp is None or
-                    partner_org.total_ct_cy is None or
-                    partner_org.net_ct_cy is None or
-                    partner_org.total_ct_ytd is None or
-                    partner_org.reported_cy is None or
-                    not comp_decimals(partner_org.total_ct_cp, Decimal(partner['TOTAL_CASH_TRANSFERRED_CP'])) or
-                    not comp_decimals(partner_org.total_ct_cy, Decimal(partner['TOTAL_CASH_TRANSFERRED_CY'])) or
-                    not comp_decimals(partner_org.net_ct_cy, Decimal(partner['NET_CASH_TRANSFERRED_CY'])) or
-                    not comp_decimals(partner_org.total_ct_ytd, Decimal(partner['TOTAL_CASH_TRANSFERRED_YTD'])) or
-                    not comp_decimals(partner_org.reported_cy, Decimal(partner['REPORTED_CY']))):
-
-                partner_org.total_ct_cy = partner['TOTAL_CASH_TRANSFERRED_CY']
-                partner_org.total_ct_cp = partner['TOTAL_CASH_TRANSFERRED_CP']
-                partner_org.net_ct_cy = partner['NET_CASH_TRANSFERRED_CY']
-                partner_org.total_ct_ytd = partner['TOTAL_CASH_TRANSFERRED_YTD']
-                partner_org.reported_cy = partner['REPORTED_CY']
-
-                saving = True
-                logger.debug('sums changed', partner_org)
-
+            saving, notify_block = self._update_partner(partner_org, partner, new, full_sync=full_sync)
             if saving:
                 logger.debug('Updating Partner', partner_org)
-
-                # clear basis_for_risk_rating in certain cases
-                if partner_org.basis_for_risk_rating and (
-                        partner_org.type_of_assessment.upper() in [PartnerOrganization.HIGH_RISK_ASSUMED,
-                                                                   PartnerOrganization.LOW_RISK_ASSUMED] or (
-                        partner_org.rating == PartnerOrganization.RATING_NOT_REQUIRED and
-                        partner_org.type_of_assessment == PartnerOrganization.MICRO_ASSESSMENT)
-                ):
-                    partner_org.basis_for_risk_rating = ''
                 partner_org.save()
 
                 if notify_block:
@@ -244,15 +269,134 @@ class PartnerSynchronizer(VisionDataTenantSynchronizer):
 
         return processed
 
-    def _save_records(self, records):
+    @staticmethod
+    def _as_date(value):
+        return value.date() if isinstance(value, datetime) else value
+
+    def _save_records(self, records, full_sync=True):
+        """
+        Batch version of _partner_save: partners, planned engagements and core values assessments
+        are read with one query each, diffed in memory and written with bulk create / update
+        """
         processed = 0
-        filtered_records = self._filter_records(records)
+        filtered_records = self._changed_records(self._filter_records(records))
 
-        for partner in filtered_records:
-            processed += self._partner_save(partner)
+        partners = PartnerOrganization.objects.in_bulk(
+            {partner['VENDOR_CODE'] for partner in filtered_records}, field_name='vendor_number',
+        )
+        to_create, to_update, to_notify, synced = {}, {}, [], {}
 
+        records_by_vendor = {}
+        for partner in filtered_records:
+            try:
+                vendor_number = partner['VENDOR_CODE']
+                records_by_vendor[vendor_number] = partner
+                partner_org = partners.get(vendor_number)
+                new = partner_org is None
+                if new:
+                    partner_org = PartnerOrganization(vendor_number=vendor_number)
+                    partners[vendor_number] = partner_org
+
+                if not self.get_partner_type(partner):
+                    self._hide_partner(partner_org, partner)
+                    saving, notify_block = True, False
+                else:
+                    saving, notify_block = self._update_partner(partner_org, partner, new, full_sync=full_sync)
+                    synced[vendor_number] = partner_org
+                    processed += 1
+
+                if partner_org.pk is None:
+                    to_create[vendor_number] = partner_org
+                elif saving:
+                    to_update[vendor_number] = partner_org
+                if notify_block:
+                    to_notify.append(partner_org)
+            except Exception:
+                logger.exception('Exception occurred during Partner Sync')
+                # retry it on the next sync even if the record does not change
+                self.record_hashes.pop(self.get_record_key(partner), None)
+
+        failed = self._write_partners(to_create, to_update)
+        for vendor_number in failed:
+            # retry it on the next sync even if the record does not change
+            self.record_hashes.pop(self.get_record_key(records_by_vendor[vendor_number]), None)
+            to_create.pop(vendor_number, None)
+            to_update.pop(vendor_number, None)
+            if synced.pop(vendor_number, None) is not None:
+                processed -= 1
+
+        for partner_org in to_notify:
+            if partner_org.vendor_number not in failed:
+                notify_partner_hidden.delay(partner_org.pk, connection.schema_name)
+
+        self._sync_planned_engagements(list(synced.values()))
+        self._sync_core_values_assessments(list(synced.values()))
+        self._store_record_hashes()
+
+        logger.info('Partners created {}, updated {}, unchanged {}'.format(
+            len(to_create), len(to_update), len(partners) - len(to_create) - len(to_update)))
         return processed
 
+    def _write_partners(self, to_create, to_update):
+        """
+        Bulk create and update the partners, on a database error save them one at a time so that a bad record
+        doesn't fail the others, return the vendor numbers of the partners which could not be saved
+        """
+        now = timezone.now()
+        for partner_org in to_update.values():
+            partner_org.modified = now
+
+        try:
+            with transaction.atomic():
+                PartnerOrganization.objects.bulk_create(to_create.values(), batch_size=self.BATCH_SIZE)
+                PartnerOrganization.objects.bulk_update(
+                    to_update.values(), self.PARTNER_UPDATE_FIELDS, batch_size=self.BATCH_SIZE,
+                )
+        except DatabaseError:
+            logger.exception('Bulk save of the partners failed, saving them one at a time')
+        else:
+            return set()
+
+        failed = set()
+        for vendor_number, partner_org in list(to_create.items()) + list(to_update.items()):
+            if vendor_number in to_create:
+                # the primary keys of the rolled back batches
+                partner_org.pk = None
+                partner_org._state.adding = True
+            try:
+                with transaction.atomic():
+                    partner_org.save()
+            except DatabaseError:
+                logger.exception('Exception occurred during Partner Sync')
+                failed.add(vendor_number)
+        return failed
+
+    def _sync_planned_engagements(self, partner_orgs):
+        with_engagement = set(PlannedEngagement.objects.filter(
+            partner__in=partner_orgs,
+        ).values_list('partner_id', flat=True))
+        PlannedEngagement.objects.bulk_create([
+            PlannedEngagement(partner=partner_org) for partner_org in partner_orgs
+            if partner_org.pk not in with_engagement
+        ], batch_size=self.BATCH_SIZE)
+
+    def _sync_core_values_assessments(self, partner_orgs):
+        # if date has changed, archive old and create a new one not archived
+        assessed = set(CoreValuesAssessment.objects.filter(
+            partner__in=partner_orgs,
+        ).values_list('partner_id', 'date'))
+        changed = [
+            partner_org for partner_org in partner_orgs
+            if (partner_org.pk, self._as_date(partner_org.core_values_assessment_date)) not in assessed
+        ]
+        if not changed:
+            return
+        CoreValuesAssessment.objects.filter(partner__in=changed).update(archived=True)
+        CoreValuesAssessment.objects.bulk_create([
+            CoreValuesAssessment(partner=partner_org, date=partner_org.core_values_assessment_date, archived=False)
+            for partner_org in changed
+        ], batch_size=self.BATCH_SIZE)
+
     @staticmethod
     def get_cso_type(partner):
         cso_type_mapping = {
@@ -308,6 +452,8 @@ class DirectCashTransferSynchronizer(VisionDataTenantSynchronizer):
     model = PartnerOrganization
 
     ENDPOINT = 'dcts'
+    STREAMING = True
+    BATCH_SIZE = 500
     UNIQUE_KEY = 'VENDOR_CODE'
 
     REQUIRED_KEYS = (
@@ -343,34 +489,54 @@ class DirectCashTransferSynchronizer(VisionDataTenantSynchronizer):
         'outstanding_dct_amount_more_than_9_months_usd': 'AMT_MORE9_MONTHS_USD',
     }
 
-    def create_dict(self, records):
-        dcts = {}
+    def create_dict(self, records, dcts=None):
+        if dcts is None:
+            dcts = {}
         for record in records:
             vendor_code = record[self.UNIQUE_KEY]
             if vendor_code not in dcts:
-                dcts[vendor_code] = {key: 0 for key, value in self.MAPPING.items()}
+                dcts[vendor_code] = {key: Decimal('0.00') for key, value in self.MAPPING.items()}
             for key, value in self.MAPPING.items():
-                dcts[vendor_code][key] += float(record[value])
+                # amounts come as json numbers or strings, str() keeps floats from adding binary rounding errors
+                dcts[vendor_code][key] += Decimal(str(record[value]))
         return dcts
 
     @transaction.atomic
     def _save(self, dcts):
-        processed = 0
+        partners = self.model.objects.in_bulk(list(dcts.keys()), field_name='vendor_number')
+        changed = []
+        fields = set()
         for key, dct_dict in dcts.items():
-            try:
-                partner = self.model.objects.get(vendor_number=key)
-                for field, value in dct_dict.items():
-                    setattr(partner, field, value)
-                partner.save()
-                processed += 1
-            except self.model.DoesNotExist:
+            partner = partners.get(key)
+            if partner is None:
                 logger.info('No object found')
-            except ValidationError:
-                logger.info('Validation error')
-        return processed
+                continue
+            # rounded like the database columns, so that unchanged amounts compare equal
+            dct_dict = {field: Decimal(str(value)).quantize(AMOUNT_PRECISION) for field, value in dct_dict.items()}
+            partner_fields = [field for field, value in dct_dict.items() if getattr(partner, field) != value]
+            for field in partner_fields:
+                setattr(partner, field, dct_dict[field])
+            if partner_fields:
+                changed.append(partner)
+                fields.update(partner_fields)
+
+        if changed:
+            now = timezone.now()
+            for partner in changed:
+                partner.modified = now
+            self.model.objects.bulk_update(changed, list(fields) + ['modified'], batch_size=self.BATCH_SIZE)
+        logger.info('{} partners with DCT amounts, {} changed'.format(len(partners), len(changed)))
+        return len(partners)
 
     def _save_records(self, records):
         filtered_records = self._filter_records(records)
         dcts = self.create_dict(filtered_records)
         processed = self._save(dcts)
         return processed
+
+    def _save_batches(self, batches):
+        # amounts are aggregated per vendor across the whole payload, so only save once every batch is read
+        dcts = {}
+        for batch in batches:
+            self.create_dict(self._filter_records(batch), dcts)
+        return self._save(dcts)
@@ -9,7 +9,6 @@ from django.db.models import F, Sum
 from celery.utils.log import get_task_logger
 from django_tenants.utils import schema_context
 from unicef_vision.exceptions import VisionException
-from unicef_vision.utils import get_data_from_insight
 
 from etools.applications.environment.notifications import send_notification_with_template
 from etools.applications.partners.models import Agreement, Intervention, PartnerOrganization
@@ -23,6 +22,7 @@ from etools.applications.partners.utils import (
 from etools.applications.partners.validation.agreements import AgreementValid
 from etools.applications.partners.validation.interventions import InterventionValid
 from etools.applications.users.models import Country
+from etools.applications.vision.client import get_data_from_insight
 from etools.config.celery import app
 from etools.libraries.djangolib.utils import get_environment
 from etools.libraries.tenant_support.utils import run_on_all_tenants
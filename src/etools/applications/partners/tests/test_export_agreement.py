@@ -64,7 +64,7 @@ class TestAgreementModelExport(BaseAgreementModelExportTestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        dataset = Dataset().load(response.content.decode('utf-8'), 'csv')
+        dataset = Dataset().load(b''.join(response.streaming_content).decode('utf-8'), 'csv')
         self.assertEqual(dataset.height, 1)
         self.assertEqual(dataset._get_headers(), [
             'Reference Number',
@@ -112,7 +112,7 @@ class TestAgreementModelExport(BaseAgreementModelExportTestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        dataset = Dataset().load(response.content.decode('utf-8'), 'csv')
+        dataset = Dataset().load(b''.join(response.streaming_content).decode('utf-8'), 'csv')
         self.assertEqual(dataset.height, 1)
         self.assertEqual(len(dataset._get_headers()), 27)
         self.assertEqual(len(dataset[0]), 27)
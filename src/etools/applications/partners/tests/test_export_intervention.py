@@ -111,7 +111,7 @@ class TestInterventionModelExport(BaseInterventionModelExportTestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        dataset = Dataset().load(response.content.decode('utf-8'), 'csv')
+        dataset = Dataset().load(b''.join(response.streaming_content).decode('utf-8'), 'csv')
         self.assertEqual(dataset.height, 1)
         self.assertEqual(dataset._get_headers(), [
             "Partner",
@@ -220,7 +220,7 @@ class TestInterventionModelExport(BaseInterventionModelExportTestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        dataset = Dataset().load(response.content.decode('utf-8'), 'csv')
+        dataset = Dataset().load(b''.join(response.streaming_content).decode('utf-8'), 'csv')
         self.assertEqual(dataset.height, 1)
         self.assertEqual(len(dataset._get_headers()), 67)
         self.assertEqual(len(dataset[0]), 67)
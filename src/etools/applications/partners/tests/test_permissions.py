@@ -0,0 +1,67 @@
+from mock import Mock
+
+from etools.applications.core.permissions import process_permissions
+from etools.applications.core.tests.cases import BaseTenantTestCase
+from etools.applications.partners.permissions import compile_permission_matrix, PMPPermissions
+from etools.applications.users.tests.factories import UserFactory
+
+PERMISSION_ROWS = [
+    {'Field Name': 'start', 'Group': 'Partnership Manager', 'Condition': '', 'Status': 'Draft',
+     'Action': 'Edit', 'Allowed': 'TRUE'},
+    {'Field Name': 'start', 'Group': 'Partnership Manager', 'Condition': 'is type PCA', 'Status': '*',
+     'Action': 'Edit', 'Allowed': 'TRUE'},
+    {'Field Name': 'end', 'Group': '', 'Condition': 'is type PCA', 'Status': '*',
+     'Action': 'View', 'Allowed': 'FALSE'},
+    {'Field Name': 'signed_by', 'Group': 'UNICEF User', 'Condition': '', 'Status': 'Signed',
+     'Action': 'Required', 'Allowed': 'TRUE'},
+]
+
+
+class AgreementTypePermissions(PMPPermissions):
+    MODEL_NAME = 'partners.Agreement'
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.condition_map = {
+            'is type PCA': self.instance.agreement_type == 'PCA',
+        }
+
+
+class TestPMPPermissions(BaseTenantTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.permission_structure = process_permissions(PERMISSION_ROWS)
+        cls.partnership_manager = UserFactory(groups__data=['UNICEF User', 'Partnership Manager'])
+        cls.unicef_user = UserFactory()
+
+    def get_permissions(self, user, **instance):
+        return AgreementTypePermissions(
+            user=user, instance=Mock(**instance), permission_structure=self.permission_structure,
+        ).get_permissions()
+
+    def test_permissions(self):
+        permissions = self.get_permissions(self.partnership_manager, status='draft', agreement_type='MOU')
+        self.assertTrue(permissions['edit']['start'])
+        self.assertTrue(permissions['view']['end'])
+        self.assertFalse(permissions['required']['signed_by'])
+        # actions missing in the matrix are not allowed
+        self.assertFalse(permissions['edit']['end'])
+        # fields missing in the matrix get the defaults of the actions
+        self.assertTrue(permissions['edit']['agreement_number'])
+        self.assertFalse(permissions['required']['agreement_number'])
+
+        permissions = self.get_permissions(self.partnership_manager, status='signed', agreement_type='PCA')
+        self.assertTrue(permissions['edit']['start'])
+        self.assertFalse(permissions['view']['end'])
+        self.assertTrue(permissions['required']['signed_by'])
+
+        permissions = self.get_permissions(self.unicef_user, status='draft', agreement_type='PCA')
+        self.assertFalse(permissions['edit']['start'])
+        self.assertFalse(permissions['required']['signed_by'])
+
+    def test_compiled_once(self):
+        matrix = compile_permission_matrix(self.permission_structure, PMPPermissions.possible_actions)
+        self.assertIs(
+            compile_permission_matrix(self.permission_structure, PMPPermissions.possible_actions), matrix,
+        )
+        self.assertEqual(matrix.all_groups, 0b1111)
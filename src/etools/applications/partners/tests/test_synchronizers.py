@@ -1,10 +1,14 @@
 import datetime
+from decimal import Decimal
+
+import mock
 
 from etools.applications.core.tests.cases import BaseTenantTestCase
 from etools.applications.partners import synchronizers
-from etools.applications.partners.models import PartnerOrganization
-from etools.applications.partners.tests.factories import PartnerFactory
+from etools.applications.partners.models import CoreValuesAssessment, PartnerOrganization, PlannedEngagement
+from etools.applications.partners.tests.factories import CoreValuesAssessmentFactory, PartnerFactory
 from etools.applications.users.models import Country
+from etools.applications.vision.models import VisionRecordHash
 
 
 class TestPartnerSynchronizer(BaseTenantTestCase):
@@ -168,6 +172,67 @@ class TestPartnerSynchronizer(BaseTenantTestCase):
         response = self.adapter._save_records([self.data])
         self.assertEqual(response, 1)
 
+    def test_save_records_batch(self):
+        """Check that a batch creates and updates partners with their
+        planned engagement and core values assessment
+        """
+        partner = PartnerFactory(name="Old", vendor_number=self.data["VENDOR_CODE"])
+        CoreValuesAssessmentFactory(partner=partner, date=datetime.date(2019, 1, 1), archived=False)
+        new_data = dict(self.data, VENDOR_CODE="125", VENDOR_NAME="New Inc.")
+        response = self.adapter._save_records([self.data, new_data])
+        self.assertEqual(response, 2)
+        partner.refresh_from_db()
+        self.assertEqual(partner.name, self.data["VENDOR_NAME"])
+        new_partner = PartnerOrganization.objects.get(vendor_number="125")
+        self.assertEqual(new_partner.name, "New Inc.")
+        self.assertTrue(PlannedEngagement.objects.filter(partner=new_partner).exists())
+        self.assertEqual(
+            list(CoreValuesAssessment.objects.filter(partner=partner, archived=False).values_list('date', flat=True)),
+            [datetime.date(2020, 1, 10)],
+        )
+        self.assertTrue(CoreValuesAssessment.objects.filter(partner=partner, archived=True).exists())
+
+    def test_save_records_unchanged(self):
+        """Check that records are skipped if not changed since the last sync,
+        unless running a full sync
+        """
+        self.assertEqual(self.adapter._save_records([self.data]), 1)
+        self.assertEqual(self.adapter._save_records([self.data]), 0)
+        self.data["VENDOR_NAME"] = "ACME Ltd."
+        self.assertEqual(self.adapter._save_records([self.data]), 1)
+        full_adapter = synchronizers.PartnerSynchronizer(business_area_code=self.country.business_area_code, full=True)
+        self.assertEqual(full_adapter._save_records([self.data]), 1)
+
+    def test_save_records_bad_record(self):
+        """Check that a record failing in the database doesn't prevent the others from being saved
+        and is retried on the next sync
+        """
+        partner = PartnerFactory(name="Old", vendor_number=self.data["VENDOR_CODE"])
+        new_data = dict(self.data, VENDOR_CODE="125", VENDOR_NAME="New Inc.")
+        bad_data = dict(self.data, VENDOR_CODE="126", VENDOR_NAME="Bad Inc.", SEARCH_TERM1="x" * 60)
+        response = self.adapter._save_records([self.data, bad_data, new_data])
+        self.assertEqual(response, 2)
+        partner.refresh_from_db()
+        self.assertEqual(partner.name, self.data["VENDOR_NAME"])
+        new_partner = PartnerOrganization.objects.get(vendor_number="125")
+        self.assertTrue(PlannedEngagement.objects.filter(partner=new_partner).exists())
+        self.assertFalse(PartnerOrganization.objects.filter(vendor_number="126").exists())
+        self.assertCountEqual(
+            VisionRecordHash.objects.filter(handler_name='PartnerSynchronizer').values_list('key', flat=True),
+            [self.data["VENDOR_CODE"], "125"],
+        )
+
+    def test_save_records_blocked(self):
+        """Check that partners blocked by the sync are notified"""
+        partner = PartnerFactory(vendor_number=self.data["VENDOR_CODE"], blocked=False)
+        self.data["POSTING_BLOCK"] = "X"
+        with mock.patch.object(synchronizers.notify_partner_hidden, 'delay') as notify:
+            self.adapter._save_records([self.data])
+        notify.assert_called_once_with(partner.pk, mock.ANY)
+        partner.refresh_from_db()
+        self.assertTrue(partner.blocked)
+        self.assertTrue(partner.hidden)
+
 
 class TestDCTSynchronizer(BaseTenantTestCase):
     @classmethod
@@ -256,3 +321,29 @@ class TestDCTSynchronizer(BaseTenantTestCase):
         partner = PartnerOrganization.objects.get(vendor_number=self.vendor_key)
         self.assertEqual(partner.outstanding_dct_amount_6_to_9_months_usd, 660)
         self.assertEqual(partner.outstanding_dct_amount_more_than_9_months_usd, 990)
+
+    def test_create_dict_decimal(self):
+        records = [
+            {'VENDOR_CODE': 'V1', 'AMT_6TO9_MONTHS_USD': 0.1, 'AMT_MORE9_MONTHS_USD': '0.7'},
+            {'VENDOR_CODE': 'V1', 'AMT_6TO9_MONTHS_USD': 0.2, 'AMT_MORE9_MONTHS_USD': '0.1'},
+        ]
+        dcts = self.synchronizer.create_dict(records)
+        self.assertEqual(dcts['V1']['outstanding_dct_amount_6_to_9_months_usd'], Decimal('0.3'))
+        self.assertEqual(dcts['V1']['outstanding_dct_amount_more_than_9_months_usd'], Decimal('0.8'))
+
+    def test_save_unchanged(self):
+        self.synchronizer._save_records(self.api_response)
+        modified = PartnerOrganization.objects.get(vendor_number=self.vendor_key).modified
+
+        with mock.patch.object(PartnerOrganization.objects, 'bulk_update') as mock_bulk_update:
+            processed = self.synchronizer._save_records(self.api_response)
+        self.assertEqual(processed, 1)
+        self.assertFalse(mock_bulk_update.called)
+        self.assertEqual(PartnerOrganization.objects.get(vendor_number=self.vendor_key).modified, modified)
+
+    def test_save_batches(self):
+        batches = [self.api_response[:1], self.api_response[1:]]
+        self.synchronizer._save_batches(batches)
+        partner = PartnerOrganization.objects.get(vendor_number=self.vendor_key)
+        self.assertEqual(partner.outstanding_dct_amount_6_to_9_months_usd, 660)
+        self.assertEqual(partner.outstanding_dct_amount_more_than_9_months_usd, 990)
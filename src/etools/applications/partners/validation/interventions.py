@@ -15,7 +15,7 @@ logger = logging.getLogger('partners.interventions.validation')
 
 def partnership_manager_only(i, user):
     # Transition cannot happen by a user that's not a Partnership Manager
-    if not user.groups.filter(name__in=['Partnership Manager']).count():
+    if 'Partnership Manager' not in user.group_names:
         raise TransitionError(['Only Partnership Managers can execute this transition'])
     return True
 
@@ -13,7 +13,8 @@ from rest_framework.serializers import ValidationError
 from rest_framework_csv import renderers as r
 from unicef_restlib.views import QueryStringFilterMixin
 
-from etools.applications.core.mixins import ExportModelMixin
+from etools.applications.core.mixins import ExportModelMixin, StreamingListExportMixin
+from etools.applications.core.query_budget import query_budget
 from etools.applications.core.renderers import CSVFlatRenderer
 from etools.applications.partners.exports_v2 import AgreementCSVRenderer
 from etools.applications.partners.filters import PartnerScopeFilter
@@ -36,7 +37,9 @@ from etools.applications.partners.utils import send_agreement_suspended_notifica
 from etools.applications.partners.validation.agreements import AgreementValid
 
 
-class AgreementListAPIView(QueryStringFilterMixin, ExportModelMixin, ValidatorViewMixin, ListCreateAPIView):
+@query_budget(max_queries=10, max_duplicates=2)
+class AgreementListAPIView(QueryStringFilterMixin, ExportModelMixin, StreamingListExportMixin, ValidatorViewMixin,
+                           ListCreateAPIView):
     """
     Create new Agreements.
     Returns a list of Agreements.
@@ -133,6 +136,7 @@ class AgreementListAPIView(QueryStringFilterMixin, ExportModelMixin, ValidatorVi
             headers=headers)
 
 
+@query_budget(max_queries=30, max_duplicates=4)
 class AgreementDetailAPIView(ValidatorViewMixin, RetrieveUpdateDestroyAPIView):
     """
     Retrieve and Update Agreement.
@@ -21,7 +21,8 @@ from rest_framework_csv import renderers as r
 from unicef_restlib.views import QueryStringFilterMixin
 from unicef_snapshot.models import Activity
 
-from etools.applications.core.mixins import ExportModelMixin
+from etools.applications.core.mixins import ExportModelMixin, StreamingListExportMixin
+from etools.applications.core.query_budget import query_budget
 from etools.applications.core.renderers import CSVFlatRenderer
 from etools.applications.environment.helpers import tenant_switch_is_active
 from etools.applications.partners.exports_v2 import InterventionCSVRenderer, InterventionLocationCSVRenderer
@@ -85,7 +86,9 @@ class InterventionListBaseView(ValidatorViewMixin, ListCreateAPIView):
         return qs
 
 
-class InterventionListAPIView(QueryStringFilterMixin, ExportModelMixin, InterventionListBaseView):
+@query_budget(max_queries=15, max_duplicates=2)
+class InterventionListAPIView(QueryStringFilterMixin, ExportModelMixin, StreamingListExportMixin,
+                              InterventionListBaseView):
     """
     Create new Interventions.
     Returns a list of Interventions.
@@ -259,7 +262,7 @@ class InterventionListDashView(InterventionListBaseView):
     def get_queryset(self):
         q = super().get_queryset()
         # if Partnership Manager get all
-        if self.request.user.groups.filter(name='Partnership Manager').exists():
+        if 'Partnership Manager' in self.request.user.group_names:
             return q.all()
 
         return q.filter(
@@ -504,8 +507,7 @@ class InterventionAmendmentDeleteView(DestroyAPIView):
             return Response(status=status.HTTP_404_NOT_FOUND)
         if intervention_amendment.intervention.status in [Intervention.DRAFT] or \
             request.user in intervention_amendment.intervention.unicef_focal_points.all() or \
-            request.user.groups.filter(name__in=['Partnership Manager',
-                                                 'Senior Management Team']).exists():
+                {'Partnership Manager', 'Senior Management Team'}.intersection(request.user.group_names):
             intervention_amendment.delete()
             return Response(status=status.HTTP_204_NO_CONTENT)
         else:
@@ -20,10 +20,10 @@ from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_csv import renderers as r
 from unicef_restlib.views import QueryStringFilterMixin
-from unicef_vision.utils import get_data_from_insight
 
 from etools.applications.action_points.models import ActionPoint
-from etools.applications.core.mixins import ExportModelMixin
+from etools.applications.core.mixins import ExportModelMixin, StreamingListExportMixin
+from etools.applications.core.query_budget import query_budget
 from etools.applications.core.renderers import CSVFlatRenderer
 from etools.applications.partners.exports_v2 import (
     PartnerOrganizationCSVRenderer,
@@ -74,12 +74,14 @@ from etools.applications.partners.synchronizers import PartnerSynchronizer
 from etools.applications.partners.views.helpers import set_tenant_or_fail
 from etools.applications.t2f.models import Travel, TravelActivity, TravelType
 from etools.applications.utils.pagination import AppendablePageNumberPagination
+from etools.applications.vision.client import get_data_from_insight
 from etools.libraries.djangolib.models import StringConcat
 from etools.libraries.djangolib.views import ExternalModuleFilterMixin
 
 
+@query_budget(max_queries=10, max_duplicates=2)
 class PartnerOrganizationListAPIView(ExternalModuleFilterMixin, QueryStringFilterMixin, ExportModelMixin,
-                                     ListCreateAPIView):
+                                     StreamingListExportMixin, ListCreateAPIView):
     """
     Create new Partners.
     Returns a list of Partners.
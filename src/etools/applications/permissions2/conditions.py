@@ -45,7 +45,7 @@ class GroupCondition(TemplateCondition):
         self.user = user
 
     def get_groups(self):
-        return self.user.groups.values_list('name', flat=True)
+        return sorted(self.user.group_names)
 
     def to_internal_value(self):
         return [
@@ -1,5 +1,6 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+from etools.applications.permissions2.index import permission_index
 from etools.applications.permissions2.models import Permission
 
 
@@ -16,7 +17,7 @@ class HasTargetsPermission(BasePermission):
         targets = self.get_targets(request, view)
         context = view._collect_permission_context()
 
-        permissions = Permission.objects.filter_by_context(context).filter_by_targets(targets)
+        permissions = permission_index.filter(targets, context)
 
         if request.method in SAFE_METHODS:
             permission_kind = Permission.PERMISSIONS.view
@@ -0,0 +1,73 @@
+import threading
+
+from django.core.signals import request_finished, request_started
+
+from etools.applications.permissions2.models import expand_targets, flatten_context, Permission, PermissionVersion
+
+NOT_LOADED = object()
+
+
+class PermissionIndex:
+    """
+    In-process index of all the permissions, grouped by target and then by condition set,
+    which answers the same lookups as Permission.objects.filter_by_targets(targets).filter_by_context(context)
+    without queries.
+
+    The permissions are loaded once per worker and reloaded when the version of the permissions changes.
+    The version is checked once per request, or before every lookup outside of requests.
+    """
+
+    def __init__(self):
+        # version and rules, replaced at once so that the other threads always see a complete index
+        self.state = (NOT_LOADED, {})
+        self.local = threading.local()
+
+    def load(self, version):
+        rules = {}
+        for permission in Permission.objects.order_by('pk'):
+            conditions = rules.setdefault(permission.target, {})
+            conditions.setdefault(frozenset(permission.condition), []).append(permission)
+
+        self.state = (version, rules)
+        return rules
+
+    def get_rules(self):
+        loaded_version, rules = self.state
+        if getattr(self.local, 'in_request', False) and getattr(self.local, 'checked', False):
+            return rules
+
+        version = PermissionVersion.get_current()
+        if version != loaded_version:
+            rules = self.load(version)
+        self.local.checked = True
+        return rules
+
+    def invalidate(self):
+        """Changes of the current thread are seen within the same request"""
+        self.local.checked = False
+
+    def start_request(self, **kwargs):
+        self.local.in_request = True
+        self.local.checked = False
+
+    def finish_request(self, **kwargs):
+        self.local.in_request = False
+
+    def filter(self, targets, context):
+        """Permissions of targets applicable in context, in the order of the queryset"""
+        rules = self.get_rules()
+
+        context = set(flatten_context(context))
+        permissions = []
+        for target in set(expand_targets(targets)):
+            for condition, target_permissions in rules.get(target, {}).items():
+                if condition <= context:
+                    permissions.extend(target_permissions)
+
+        return sorted(permissions, key=lambda permission: permission.pk)
+
+
+permission_index = PermissionIndex()
+
+request_started.connect(permission_index.start_request)
+request_finished.connect(permission_index.finish_request)
@@ -1,3 +1,5 @@
+import uuid
+
 from django.apps import apps
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
@@ -8,45 +10,70 @@ from .conditions import BaseCondition
 from .utils import collect_child_models, collect_parent_models
 
 
-class PermissionQuerySet(models.QuerySet):
-    def filter_by_context(self, context):
-        context = list(context)
-        i = 0
-        while i < len(context):
-            if isinstance(context[i], BaseCondition):
-                context[i] = context[i].to_internal_value()
+def flatten_context(context):
+    """Internal values of the context conditions, as a flat list"""
+    context = list(context)
+    i = 0
+    while i < len(context):
+        if isinstance(context[i], BaseCondition):
+            context[i] = context[i].to_internal_value()
 
-            if isinstance(context[i], (list, tuple)):
-                context.extend(context[i])
-                context.pop(i)
-            else:
-                i += 1
+        if isinstance(context[i], (list, tuple)):
+            context.extend(context[i])
+            context.pop(i)
+        else:
+            i += 1
 
-        return self.filter(condition__contained_by=context)
+    return context
 
-    def filter_by_targets(self, targets):
-        targets = list(targets)
 
-        i = 0
-        parent_map = dict()
-        while i < len(targets):
-            target = targets[i]
+def expand_targets(targets):
+    """Targets completed with the same fields of the parent models and with the wildcards of the models"""
+    targets = list(targets)
 
-            model, field_name = Permission.parse_target(target)
-            if model in parent_map:
-                parents = parent_map[model]
-            else:
-                parents = collect_parent_models(model, levels=1)
-                parent_map[model] = parents
+    i = 0
+    parent_map = dict()
+    while i < len(targets):
+        target = targets[i]
 
-            targets.extend([Permission.get_target(parent, field_name) for parent in parents])
+        model, field_name = Permission.parse_target(target)
+        if model in parent_map:
+            parents = parent_map[model]
+        else:
+            parents = collect_parent_models(model, levels=1)
+            parent_map[model] = parents
 
-            i += 1
+        targets.extend([Permission.get_target(parent, field_name) for parent in parents])
+
+        i += 1
+
+    wildcards = list(set(map(lambda target: target.rsplit('.', 1)[0] + '.*', targets)))
+    return targets + wildcards
 
-        wildcards = list(set(map(lambda target: target.rsplit('.', 1)[0] + '.*', targets)))
-        targets = targets + wildcards
 
-        return self.filter(target__in=targets)
+class PermissionQuerySet(models.QuerySet):
+    def filter_by_context(self, context):
+        return self.filter(condition__contained_by=flatten_context(context))
+
+    def filter_by_targets(self, targets):
+        return self.filter(target__in=expand_targets(targets))
+
+    # the update_*_permissions commands replace the permissions in bulk,
+    # every change outdates the compiled permission index of the workers
+    def bulk_create(self, *args, **kwargs):
+        result = super().bulk_create(*args, **kwargs)
+        PermissionVersion.bump()
+        return result
+
+    def update(self, *args, **kwargs):
+        result = super().update(*args, **kwargs)
+        PermissionVersion.bump()
+        return result
+
+    def delete(self):
+        result = super().delete()
+        PermissionVersion.bump()
+        return result
 
 
 class Permission(models.Model):
@@ -83,6 +110,15 @@ class Permission(models.Model):
             self.condition,
         )
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        PermissionVersion.bump()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        PermissionVersion.bump()
+        return result
+
     @staticmethod
     def get_target(model, field):
         if hasattr(field, 'name'):
@@ -165,3 +201,26 @@ class Permission(models.Model):
             targets -= affected_targets
 
         return allowed_targets
+
+
+class PermissionVersion(models.Model):
+    """
+    Version of the permissions, changed along with them. A single row which is cheap to read,
+    so that the workers know when their compiled permission index has to be reloaded.
+
+    The version is random rather than incremented, so that a change rolled back
+    can't be confused with the next one.
+    """
+    version = models.UUIDField(default=uuid.uuid4)
+
+    @classmethod
+    def get_current(cls):
+        return cls.objects.values_list('version', flat=True).first()
+
+    @classmethod
+    def bump(cls):
+        if not cls.objects.update(version=uuid.uuid4()):
+            cls.objects.create()
+
+        from etools.applications.permissions2.index import permission_index
+        permission_index.invalidate()
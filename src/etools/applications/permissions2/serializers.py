@@ -3,6 +3,7 @@ from rest_framework.utils import model_meta
 from rest_framework_recursive.fields import RecursiveField
 from unicef_restlib.fields import SeparatedReadWriteField
 
+from etools.applications.permissions2.index import permission_index
 from etools.applications.permissions2.models import Permission
 
 
@@ -50,13 +51,8 @@ class PermissionsBasedSerializerMixin:
         :return:
         """
         targets = self._collect_permissions_targets()
-        perms = self._get_permissions_queryset(targets)
         context = self._get_permission_context()
-        perms = perms.filter_by_context(context)
-        return perms
-
-    def _get_permissions_queryset(self, targets):
-        return Permission.objects.filter_by_targets(targets)
+        return permission_index.filter(targets, context)
 
     def _get_permission_context(self):
         return self.context.get('permission_context', [])
@@ -1,8 +1,13 @@
+from unittest.mock import Mock
+
 from django.db import connection
 from django.test import TestCase
 
 from rest_framework import serializers
 
+from etools.libraries.fsm.views import has_action_permission
+
+from ..index import permission_index, PermissionIndex
 from ..models import Permission
 from ..serializers import PermissionsBasedSerializerMixin
 from .models import Parent, Parent2
@@ -123,3 +128,74 @@ class TestInheritedModel(TestCase):
 
         serializer = Parent2Serializer(instance=parent)
         self.assertDictEqual(serializer.data, {})
+
+
+class TestPermissionIndex(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.index = PermissionIndex()
+
+    def test_filter_same_as_queryset(self):
+        Permission.objects.bulk_create([
+            Permission(permission='view', target='permissions2.parent.*'),
+            Permission(permission='view', target='permissions2.parent.field1', condition=['condition1']),
+            Permission(permission='edit', target='permissions2.parent2.field3', condition=['condition1', 'condition2']),
+            Permission(permission='edit', target='permissions2.parent2.field1', permission_type='disallow',
+                       condition=['condition2']),
+            Permission(permission='view', target='permissions2.child1.field1'),
+        ])
+
+        targets = ['permissions2.parent2.field1', 'permissions2.parent2.field3']
+        for context in [[], ['condition1'], [['condition1', 'condition2']], ['condition2', 'condition3']]:
+            self.assertEqual(
+                self.index.filter(targets, context),
+                list(Permission.objects.filter_by_targets(targets).filter_by_context(context).order_by('pk')),
+            )
+
+    def test_reload_on_change(self):
+        targets = ['permissions2.parent.field1']
+        self.assertEqual(self.index.filter(targets, []), [])
+
+        permission = Permission.objects.create(permission='view', target='permissions2.parent.field1')
+        self.assertEqual(self.index.filter(targets, []), [permission])
+
+        Permission.objects.filter(pk=permission.pk).update(condition=['condition1'])
+        self.assertEqual(self.index.filter(targets, []), [])
+
+        Permission.objects.filter(pk=permission.pk).delete()
+        self.assertEqual(self.index.filter(targets, ['condition1']), [])
+
+    def test_queries(self):
+        Permission.objects.create(permission='view', target='permissions2.parent.field1')
+        targets = ['permissions2.parent.field1']
+
+        with self.assertNumQueries(2):
+            self.index.filter(targets, [])
+
+        # the version is checked before every lookup outside of requests
+        with self.assertNumQueries(1):
+            self.index.filter(targets, [])
+
+        # and once per request
+        self.index.start_request()
+        with self.assertNumQueries(1):
+            self.index.filter(targets, [])
+            self.index.filter(targets, [])
+        self.index.finish_request()
+
+    def test_fsm_action_permission_queries(self):
+        Permission.objects.bulk_create([
+            Permission(permission='action', target='permissions2.parent.approve', condition=['condition1']),
+            Permission(permission='view', target='permissions2.parent.reject', condition=['condition1']),
+        ])
+        parent = Parent(field1=1)
+        user = Mock(_permission_context=['condition1'])
+
+        permission_index.start_request()
+        self.addCleanup(permission_index.finish_request)
+        permission_index.filter([], [])
+
+        with self.assertNumQueries(0):
+            self.assertTrue(has_action_permission('approve')(parent, user))
+            self.assertFalse(has_action_permission('reject')(parent, user))
+            self.assertFalse(has_action_permission('approve')(parent, Mock(_permission_context=[])))
@@ -133,9 +133,7 @@ class AssessmentSerializer(AttachmentSerializerMixin, BaseAssessmentSerializer):
         }
 
         user = self.context['request'].user
-        is_focal_group = user.groups.filter(
-            name__in=[UNICEFAuditFocalPoint.name],
-        ).exists()
+        is_focal_group = UNICEFAuditFocalPoint.name in user.group_names
         available_actions = []
         if is_focal_group:
             if obj.status in [obj.STATUS_DRAFT]:
@@ -107,7 +107,7 @@ def assessment_illegal_transition(assessment):
 
 
 def assessment_focal_point_user(assessment, user):
-    if not user.groups.filter(name__in=[UNICEFAuditFocalPoint.name]).count():
+    if UNICEFAuditFocalPoint.name not in user.group_names:
         raise TransitionError(
             ['Only Audit Focal Point can execute this transition']
         )
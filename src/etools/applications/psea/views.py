@@ -149,9 +149,7 @@ class AssessmentViewSet(
 
     @transaction.atomic
     def create(self, request, *args, **kwargs):
-        if not request.user.groups.filter(
-                name__in=[UNICEFAuditFocalPoint.name]
-        ).exists():
+        if UNICEFAuditFocalPoint.name not in request.user.group_names:
             return HttpResponseForbidden()
 
         related_fields = []
@@ -2,6 +2,7 @@ import datetime
 import logging
 
 from django.db import transaction
+from django.utils import timezone
 
 from unicef_vision.settings import INSIGHT_DATE_FORMAT
 
@@ -12,12 +13,19 @@ logger = logging.getLogger(__name__)
 
 
 class ResultStructureSynchronizer:
+    BATCH_SIZE = 500
+
     def __init__(self, data):
         self.data = data
         self.cps = {}
         self.outcomes = {}
         self.outputs = {}
         self.activities = {}
+        # existing results by type name and wbs, loaded in one query by update()
+        self.local_results = None
+        # mptt trees with new nodes, rebuilt once at the end of update()
+        self.touched_trees = set()
+        self.next_tree_id = None
 
     @staticmethod
     def _update_changes(local, remote):
@@ -40,6 +48,66 @@ class ResultStructureSynchronizer:
         wbs_length = parent_map[parent_type][0]
         return parent_group.get(wbs[:wbs_length], None)
 
+    def _load_local_results(self):
+        keys = {'outcomes': ResultType.OUTCOME, 'outputs': ResultType.OUTPUT, 'activities': ResultType.ACTIVITY}
+        wbs_list = [wbs for key in keys for wbs in self.data.get(key, {})]
+        self.local_results = {name: {} for name in keys.values()}
+        for result in Result.objects.filter(wbs__in=wbs_list, result_type__name__in=keys.values()):
+            self.local_results[result.result_type.name][result.wbs] = result
+
+    def _get_local_results(self, type_name, remote_results):
+        if self.local_results is not None:
+            return self.local_results[type_name]
+        return dict([(r.wbs, r) for r in Result.objects.filter(wbs__in=list(remote_results.keys()),
+                                                               result_type__name=type_name)])
+
+    def _get_next_tree_id(self):
+        if self.next_tree_id is None:
+            self.next_tree_id = Result._tree_manager._get_next_tree_id()
+        else:
+            self.next_tree_id += 1
+        return self.next_tree_id
+
+    def _save_results(self, local_results, remote_results, result_type, parent_type=None):
+        """
+        Update the changed local results and create the missing ones, in bulk.
+        The tree fields of the new results are placeholders until rebuild_trees() runs.
+        """
+        changed = []
+        fields = set()
+        for local_result in local_results.values():
+            remote_result = remote_results.pop(local_result.wbs)
+            if self._update_changes(local_result, remote_result):
+                logger.debug('Updated {}'.format(local_result))
+                changed.append(local_result)
+                fields.update(remote_result)
+        if changed:
+            # bulk_update does not go through save(), which sets modified
+            now = timezone.now()
+            for local_result in changed:
+                local_result.modified = now
+            Result.objects.bulk_update(changed, list(fields) + ['modified'], batch_size=self.BATCH_SIZE)
+
+        opts = Result._mptt_meta
+        new_results = {}
+        for remote_result in remote_results.values():
+            remote_result['country_programme'] = self._get_local_parent(remote_result['wbs'], 'cp')
+            if parent_type:
+                remote_result['parent'] = self._get_local_parent(remote_result['wbs'], parent_type)
+            remote_result['result_type'] = result_type
+            result = Result(**remote_result)
+
+            parent = remote_result.get('parent')
+            tree_id = getattr(parent, opts.tree_id_attr) if parent else self._get_next_tree_id()
+            setattr(result, opts.tree_id_attr, tree_id)
+            setattr(result, opts.left_attr, 0)
+            setattr(result, opts.right_attr, 0)
+            setattr(result, opts.level_attr, 0)
+            self.touched_trees.add(tree_id)
+            new_results[remote_result['wbs']] = result
+        Result.objects.bulk_create(new_results.values(), batch_size=self.BATCH_SIZE)
+        return len(changed), new_results
+
     def update_cps(self):
         remote_cps = self.data['cps']
         total_data = len(remote_cps)
@@ -69,27 +137,11 @@ class ResultStructureSynchronizer:
         remote_outcomes = self.data['outcomes']
         outcome_type = ResultType.objects.get(name=ResultType.OUTCOME)
         total_data = len(remote_outcomes)
-        total_updated = 0
-
-        local_outcomes = dict([(r.wbs, r) for r in Result.objects.filter(wbs__in=list(remote_outcomes.keys()),
-                                                                         result_type__name=ResultType.OUTCOME
-                                                                         )])
-
-        for local_outcome in local_outcomes.values():
-            if self._update_changes(local_outcome, remote_outcomes[local_outcome.wbs]):
-                logger.debug('Updated {}'.format(local_outcome))
-                local_outcome.save()
-                total_updated += 1
-            del remote_outcomes[local_outcome.wbs]
-
-        new_outcomes = {}
-        for remote_outcome in remote_outcomes.values():
-            remote_outcome['country_programme'] = self._get_local_parent(remote_outcome['wbs'], 'cp')
-            remote_outcome['result_type'] = outcome_type
 
-            new_outcomes[remote_outcome['wbs']], _ = Result.objects.get_or_create(**remote_outcome)
+        local_outcomes = self._get_local_results(ResultType.OUTCOME, remote_outcomes)
+        total_updated, new_outcomes = self._save_results(local_outcomes, remote_outcomes, outcome_type)
 
-        # add the newly created cps
+        # add the newly created outcomes
         local_outcomes.update(new_outcomes)
         self.outcomes = local_outcomes
         return total_data, total_updated, len(new_outcomes)
@@ -98,27 +150,11 @@ class ResultStructureSynchronizer:
         rem_outputs = self.data['outputs']
         output_type = ResultType.objects.get(name=ResultType.OUTPUT)
         total_data = len(rem_outputs)
-        total_updated = 0
 
-        loc_outputs = dict([(r.wbs, r) for r in Result.objects.filter(wbs__in=list(rem_outputs.keys()),
-                                                                      result_type__name=ResultType.OUTPUT)])
-
-        for loc_output in loc_outputs.values():
-            if self._update_changes(loc_output, rem_outputs[loc_output.wbs]):
-                logger.debug('Updated {}'.format(loc_output))
-                loc_output.save()
-                total_updated += 1
-            del rem_outputs[loc_output.wbs]
+        loc_outputs = self._get_local_results(ResultType.OUTPUT, rem_outputs)
+        total_updated, new_outputs = self._save_results(loc_outputs, rem_outputs, output_type, 'outcome')
 
-        new_outputs = {}
-        for rem_output in rem_outputs.values():
-            rem_output['country_programme'] = self._get_local_parent(rem_output['wbs'], 'cp')
-            rem_output['parent'] = self._get_local_parent(rem_output['wbs'], 'outcome')
-            rem_output['result_type'] = output_type
-
-            new_outputs[rem_output['wbs']], _ = Result.objects.get_or_create(**rem_output)
-
-        # add the newly created cps
+        # add the newly created outputs
         loc_outputs.update(new_outputs)
         self.outputs = loc_outputs
         return total_data, total_updated, len(new_outputs)
@@ -127,48 +163,47 @@ class ResultStructureSynchronizer:
         rem_activities = self.data['activities']
         activity_type = ResultType.objects.get(name=ResultType.ACTIVITY)
         total_data = len(rem_activities)
-        total_updated = 0
-
-        loc_activities = dict([(r.wbs, r) for r in Result.objects.filter(wbs__in=list(rem_activities.keys()),
-                                                                         result_type__name=ResultType.ACTIVITY)])
-
-        for loc_activity in loc_activities.values():
-            if self._update_changes(loc_activity, rem_activities[loc_activity.wbs]):
-                logger.debug('Updated {}'.format(loc_activity))
-                loc_activity.save()
-                total_updated += 1
-            del rem_activities[loc_activity.wbs]
 
-        new_activities = {}
-        for rem_activity in rem_activities.values():
-            rem_activity['country_programme'] = self._get_local_parent(rem_activity['wbs'], 'cp')
-            rem_activity['parent'] = self._get_local_parent(rem_activity['wbs'], 'output')
-            rem_activity['result_type'] = activity_type
+        loc_activities = self._get_local_results(ResultType.ACTIVITY, rem_activities)
+        total_updated, new_activities = self._save_results(loc_activities, rem_activities, activity_type, 'output')
 
-            new_activities[rem_activity['wbs']], _ = Result.objects.get_or_create(**rem_activity)
-
-        # add the newly created cps
+        # add the newly created activities
         loc_activities.update(new_activities)
-        self.outputs = loc_activities
+        self.activities = loc_activities
         return total_data, total_updated, len(new_activities)
 
+    def rebuild_trees(self):
+        """Compute the mptt fields of the trees that got new results, once per tree"""
+        for tree_id in sorted(self.touched_trees):
+            Result._tree_manager.partial_rebuild(tree_id)
+        total = len(self.touched_trees)
+        self.touched_trees = set()
+        return total
+
     @transaction.atomic
     def update(self):
+        self._load_local_results()
+
         # update / add new cps
         total_cps = self.update_cps()
         cps = 'CPs updated: Total {}, Updated {}, New {}'.format(*total_cps)
 
-        # update / add new Outcomes
-        total_outcomes = self.update_outcomes()
-        outcomes = 'Outcomes updated: Total {}, Updated {}, New {}'.format(*total_outcomes)
+        # results are created in bulk, so mptt is only updated once all of them are saved
+        with Result._tree_manager.disable_mptt_updates():
+            # update / add new Outcomes
+            total_outcomes = self.update_outcomes()
+            outcomes = 'Outcomes updated: Total {}, Updated {}, New {}'.format(*total_outcomes)
+
+            # update / add new Outputs
+            total_outputs = self.update_outputs()
+            outputs = 'Outputs updated: Total {}, Updated {}, New {}'.format(*total_outputs)
 
-        # update / add new Outputs
-        total_outputs = self.update_outputs()
-        outputs = 'Outputs updated: Total {}, Updated {}, New {}'.format(*total_outputs)
+            # update / add new Activities
+            total_activities = self.update_activities()
+            activities = 'Activities updated: Total {}, Updated {}, New {}'.format(*total_activities)
 
-        # update / add new Activities
-        total_activities = self.update_activities()
-        activities = 'Activities updated: Total {}, Updated {}, New {}'.format(*total_activities)
+        trees = self.rebuild_trees()
+        logger.info('{} result trees rebuilt'.format(trees))
 
         return {
             'details': '\n'.join([cps, outcomes, outputs, activities]),
@@ -179,6 +214,7 @@ class ResultStructureSynchronizer:
 
 class ProgrammeSynchronizer(VisionDataTenantSynchronizer):
     ENDPOINT = 'wbsstructures'
+    STREAMING = True
     REQUIRED_KEYS = (
         "COUNTRY_PROGRAMME_NAME",
         "COUNTRY_PROGRAMME_WBS",
@@ -297,8 +333,7 @@ class ProgrammeSynchronizer(VisionDataTenantSynchronizer):
                     activities[r['ACTIVITY_WBS']] = dict([(i[1], r[i[0]]) for i in self.ACTIVITY_MAP])
         return {'cps': cps, 'outcomes': outcomes, 'outputs': outputs, 'activities': activities}
 
-    def _convert_records(self, records):
-        records = records['ROWSET']['ROW']
+    def _convert_rows(self, records):
         for r in records:
             for k in self.DATES:
                 r[k] = datetime.datetime.strptime(r[k], INSIGHT_DATE_FORMAT).date() if r[k] else None
@@ -306,10 +341,25 @@ class ProgrammeSynchronizer(VisionDataTenantSynchronizer):
 
         return self._clean_records(records)
 
+    def _convert_records(self, records):
+        return self._convert_rows(records['ROWSET']['ROW'])
+
+    def _convert_batch(self, records):
+        return self._convert_rows(records)
+
     def _save_records(self, records):
         synchronizer = ResultStructureSynchronizer(records)
         return synchronizer.update()
 
+    def _save_batches(self, batches):
+        # the tree is saved in one go, keeping the first occurrence of every wbs like _clean_records does
+        data = {'cps': {}, 'outcomes': {}, 'outputs': {}, 'activities': {}}
+        for batch in batches:
+            for key, values in batch.items():
+                for wbs, value in values.items():
+                    data[key].setdefault(wbs, value)
+        return self._save_records(data)
+
 
 class RAMSynchronizer(VisionDataTenantSynchronizer):
     ENDPOINT = 'ramindicators'
@@ -345,6 +345,53 @@ class TestResultStructureSynchronizer(BaseTenantTestCase):
         self.assertEqual(result["total_records"], 4)
         self.assertEqual(result["processed"], 0)
 
+    def test_update_create_tree(self):
+        """New results are created in bulk and their mptt trees rebuilt,
+        including the ones attached to existing results
+        """
+        cp = CountryProgrammeFactory(name="CP", wbs="0000/A0/01")
+        outcome = ResultFactory(
+            name="Outcome",
+            wbs="0000/A0/01/001",
+            result_type=self.result_type_outcome,
+            country_programme=cp,
+        )
+        today = datetime.date.today()
+        dates = {"from_date": today, "to_date": today + datetime.timedelta(days=30)}
+        self.adapter.data = {
+            "cps": {"0000/A0/01": {"name": "CP", "wbs": "0000/A0/01"}},
+            "outcomes": {
+                "0000/A0/01/001": {"name": "Outcome", "wbs": "0000/A0/01/001"},
+                "0000/A0/01/002": dict(name="New Outcome", wbs="0000/A0/01/002", code="OC2", **dates),
+            },
+            "outputs": {
+                "0000/A0/01/001/001": dict(name="Output 1", wbs="0000/A0/01/001/001", **dates),
+                "0000/A0/01/002/001": dict(name="Output 2", wbs="0000/A0/01/002/001", **dates),
+            },
+            "activities": {
+                "0000/A0/01/002/001/001": dict(name="Activity", wbs="0000/A0/01/002/001/001", **dates),
+            },
+        }
+        result = self.adapter.update()
+        self.assertEqual(result["processed"], 4)
+
+        outcome.refresh_from_db()
+        output = Result.objects.get(wbs="0000/A0/01/001/001")
+        self.assertEqual(output.parent, outcome)
+        self.assertEqual(output.country_programme, cp)
+        self.assertEqual(list(outcome.get_descendants()), [output])
+        self.assertEqual(output.level, 1)
+
+        activity = Result.objects.get(wbs="0000/A0/01/002/001/001")
+        new_outcome = Result.objects.get(wbs="0000/A0/01/002")
+        self.assertNotEqual(new_outcome.tree_id, outcome.tree_id)
+        self.assertEqual(
+            [r.wbs for r in activity.get_ancestors()],
+            ["0000/A0/01/002", "0000/A0/01/002/001"],
+        )
+        self.assertEqual(activity.level, 2)
+        self.assertEqual(new_outcome.get_descendant_count(), 2)
+
 
 class TestProgrammeSynchronizer(BaseTenantTestCase):
     @classmethod
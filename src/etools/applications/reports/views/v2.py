@@ -26,6 +26,7 @@ from unicef_rest_export.views import ExportView
 from unicef_restlib.views import QueryStringFilterMixin
 
 from etools.applications.core.mixins import ExportModelMixin
+from etools.applications.core.query_budget import query_budget
 from etools.applications.core.renderers import CSVFlatRenderer
 from etools.applications.partners.filters import PartnerScopeFilter
 from etools.applications.partners.models import Intervention, InterventionResultLink
@@ -66,6 +67,7 @@ from etools.applications.reports.serializers.v2 import (
 from etools.libraries.djangolib.views import ExternalModuleFilterMixin
 
 
+@query_budget(max_queries=10, max_duplicates=2)
 class OutputListAPIView(ListAPIView):
     serializer_class = OutputListSerializer
     permission_classes = (IsAdminUser,)
@@ -141,6 +143,7 @@ class OutputListAPIView(ListAPIView):
         )
 
 
+@query_budget(max_queries=10, max_duplicates=2)
 class OutputDetailAPIView(RetrieveAPIView):
     queryset = Result.outputs.all()
     serializer_class = OutputListSerializer
@@ -216,8 +219,7 @@ class LowerResultsDeleteView(DestroyAPIView):
             return Response(status=status.HTTP_404_NOT_FOUND)
         if lower_result.result_link.intervention.status in [Intervention.DRAFT] or \
             request.user in lower_result.result_link.intervention.unicef_focal_points.all() or \
-            request.user.groups.filter(name__in=['Partnership Manager',
-                                                 'Senior Management Team']).exists():
+                {'Partnership Manager', 'Senior Management Team'}.intersection(request.user.group_names):
             lower_result.delete()
             return Response(status=status.HTTP_204_NO_CONTENT)
         else:
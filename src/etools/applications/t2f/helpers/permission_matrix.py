@@ -1,12 +1,16 @@
+import codecs
+import csv
 from collections import defaultdict
+from functools import lru_cache
 
+from django.conf import settings
 from django.core.cache import cache
 from django.utils.translation import gettext_lazy as _
 
 from etools.applications.t2f.permission_action_points import action_points
-from etools.applications.t2f.permissions import permissions
 
 PERMISSION_MATRIX_CACHE_KEY = 't2f_permission_matrix'
+PERMISSION_MATRIX_FILE = settings.PACKAGE_ROOT + '/applications/t2f/permission_matrix/travel_permissions.csv'
 
 REPORT_PERMISSIONS = {
     'Supervisor': {
@@ -96,29 +100,59 @@ class UserTypes:
     )
 
 
+GROUP_ROLES = [
+    ('Finance Focal Point', UserTypes.FINANCE_FOCAL_POINT),
+    ('Travel Focal Point', UserTypes.TRAVEL_FOCAL_POINT),
+    ('Travel Administrator', UserTypes.TRAVEL_ADMINISTRATOR),
+    ('Representative Office', UserTypes.REPRESENTATIVE),
+]
+
+
 def get_user_role_list(user, travel=None):
     roles = [UserTypes.ANYONE]
 
     if travel:
-        if user == travel.traveler:
+        if user.pk == travel.traveler_id:
             roles.append(UserTypes.TRAVELER)
 
-        if user == travel.supervisor:
+        if user.pk == travel.supervisor_id:
             roles.append(UserTypes.SUPERVISOR)
 
-    if user.groups.filter(name='Finance Focal Point').exists():
-        roles.append(UserTypes.FINANCE_FOCAL_POINT)
+    for group_name, role in GROUP_ROLES:
+        if group_name in user.group_names:
+            roles.append(role)
+
+    return roles
+
 
-    if user.groups.filter(name='Travel Focal Point').exists():
-        roles.append(UserTypes.TRAVEL_FOCAL_POINT)
+@lru_cache(maxsize=None)
+def get_travel_permissions():
+    """
+    Load the travel permissions from the data file on first use, once per process.
+    The file has a row per (edit/view, model, field) and a column per role and status.
+    :return: {(role, status): {(edit/view, model, field): permission}}
+    """
+    permissions = defaultdict(dict)
+    with codecs.open(PERMISSION_MATRIX_FILE, 'r', encoding='ascii') as csvfile:
+        sheet = csv.reader(csvfile)
+        columns = [tuple(column.split(':')) for column in next(sheet)[3:]]
+        for row in sheet:
+            key = tuple(row[:3])
+            for column, allowed in zip(columns, row[3:]):
+                permissions[column][key] = allowed == 'TRUE'
+    return dict(permissions)
 
-    if user.groups.filter(name='Travel Administrator').exists():
-        roles.append(UserTypes.TRAVEL_ADMINISTRATOR)
 
-    if user.groups.filter(name='Representative Office').exists():
-        roles.append(UserTypes.REPRESENTATIVE)
+@lru_cache(maxsize=256)
+def get_role_permissions(roles, status):
+    """Travel permissions of the status granted by any of the roles, roles being a frozenset"""
+    travel_permissions = get_travel_permissions()
 
-    return roles
+    perms = {}
+    for role in roles:
+        for key, allowed in travel_permissions.get((role, status), {}).items():
+            perms[key] = perms.get(key, False) or allowed
+    return perms
 
 
 def convert_permissions_structure():
@@ -128,29 +162,28 @@ def convert_permissions_structure():
     model | field | edit/view | permission
     """
     to_format = {}
-    for user, states in permissions.items():
-        to_format[user] = {}
-        for state, actions in states.items():
-            data = defaultdict(dict)
-            for key, perm in actions.items():
-                action, model, field = key
-                model = "baseDetails" if model == "travel" else model
-                if model not in data:
-                    data[model] = {
-                        field: {action: perm},
-                        action: perm,
-                        "edit" if action == "view" else "view": False,
-                    }
+    for (user, state), actions in get_travel_permissions().items():
+        to_format.setdefault(user, {})
+        data = defaultdict(dict)
+        for key, perm in actions.items():
+            action, model, field = key
+            model = "baseDetails" if model == "travel" else model
+            if model not in data:
+                data[model] = {
+                    field: {action: perm},
+                    action: perm,
+                    "edit" if action == "view" else "view": False,
+                }
+            else:
+                if field not in data[model]:
+                    data[model][field] = {action: perm}
                 else:
-                    if field not in data[model]:
-                        data[model][field] = {action: perm}
-                    else:
-                        data[model][field][action] = perm
-                    if perm:
-                        data[model][action] = perm
-            to_format[user][state] = data
-            # add report model permissions
-            to_format[user][state]["report"] = REPORT_PERMISSIONS[user][state]
+                    data[model][field][action] = perm
+                if perm:
+                    data[model][action] = perm
+        to_format[user][state] = data
+        # add report model permissions
+        to_format[user][state]["report"] = REPORT_PERMISSIONS[user][state]
     return to_format
 
 
@@ -177,15 +210,7 @@ class PermissionMatrix:
         self._permission_dict = self.get_permission_dict()
 
     def get_permission_dict(self):
-        perms = defaultdict(bool)
-        for user_type in self._user_roles:
-            try:
-                for k, v in permissions[user_type][self.travel.status].items():
-                    perms[k] |= v
-            except KeyError:
-                pass
-
-        return perms
+        return get_role_permissions(frozenset(self._user_roles), self.travel.status)
 
     def has_permission(self, permission_type, model_name, field_name):
         return self._permission_dict.get((permission_type, model_name, field_name), True)
@@ -18,6 +18,7 @@ from unicef_notification.utils import send_notification
 
 from etools.applications.action_points.models import ActionPoint
 from etools.applications.core.urlresolvers import build_frontend_url
+from etools.applications.hact.tracker import mark_partners_dirty
 from etools.applications.t2f.serializers.mailing import TravelMailSerializer
 from etools.applications.users.models import WorkspaceCounter
 
@@ -300,6 +301,11 @@ class Travel(models.Model):
         except Exception:
             logger.exception('Exception while trying to update hact values.')
 
+        mark_partners_dirty(self.activities.filter(
+            primary_traveler=self.traveler,
+            travel_type__in=[TravelType.PROGRAMME_MONITORING, TravelType.SPOT_CHECK],
+        ).values_list('partner_id', flat=True))
+
     @transition(status, target=PLANNED)
     def reset_status(self):
         pass
@@ -1,7248 +0,0 @@
-permissions = {'Anyone': {'approved':
-                          {('edit', 'action_points', 'action_point_number'): False,
-                           ('edit', 'action_points', 'actions_taken'): False,
-                           ('edit', 'action_points', 'comments'): False,
-                           ('edit', 'action_points', 'completed_at'): False,
-                           ('edit', 'action_points', 'created_at'): False,
-                           ('edit', 'action_points', 'description'): False,
-                           ('edit', 'action_points', 'due_date'): False,
-                           ('edit', 'action_points', 'follow_up'): False,
-                           ('edit', 'action_points', 'id'): False,
-                           ('edit', 'action_points', 'person_responsible'): False,
-                           ('edit', 'action_points', 'status'): False,
-                           ('edit', 'action_points', 'trip_reference_number'): False,
-                           ('edit', 'activities', 'date'): False,
-                           ('edit', 'activities', 'id'): False,
-                           ('edit', 'activities', 'locations'): False,
-                           ('edit', 'activities', 'partner'): False,
-                           ('edit', 'activities', 'partnership'): False,
-                           ('edit', 'activities', 'primary_traveler'): False,
-                           ('edit', 'activities', 'result'): False,
-                           ('edit', 'activities', 'travel_type'): False,
-                           ('edit', 'clearances', 'id'): False,
-                           ('edit', 'clearances', 'medical_clearance'): False,
-                           ('edit', 'clearances', 'security_clearance'): False,
-                           ('edit', 'clearances', 'security_course'): False,
-                           ('edit', 'cost_assignments', 'business_area'): False,
-                           ('edit', 'cost_assignments', 'delegate'): False,
-                           ('edit', 'cost_assignments', 'fund'): False,
-                           ('edit', 'cost_assignments', 'grant'): False,
-                           ('edit', 'cost_assignments', 'id'): False,
-                           ('edit', 'cost_assignments', 'share'): False,
-                           ('edit', 'cost_assignments', 'wbs'): False,
-                           ('edit', 'deductions', 'accomodation'): False,
-                           ('edit', 'deductions', 'breakfast'): False,
-                           ('edit', 'deductions', 'date'): False,
-                           ('edit', 'deductions', 'day_of_the_week'): False,
-                           ('edit', 'deductions', 'dinner'): False,
-                           ('edit', 'deductions', 'id'): False,
-                           ('edit', 'deductions', 'lunch'): False,
-                           ('edit', 'deductions', 'no_dsa'): False,
-                           ('edit', 'expenses', 'account_currency'): False,
-                           ('edit', 'expenses', 'amount'): False,
-                           ('edit', 'expenses', 'document_currency'): False,
-                           ('edit', 'expenses', 'id'): False,
-                           ('edit', 'expenses', 'type'): False,
-                           ('edit', 'itinerary', 'airlines'): False,
-                           ('edit', 'itinerary', 'arrival_date'): False,
-                           ('edit', 'itinerary', 'departure_date'): False,
-                           ('edit', 'itinerary', 'destination'): False,
-                           ('edit', 'itinerary', 'dsa_region'): False,
-                           ('edit', 'itinerary', 'id'): False,
-                           ('edit', 'itinerary', 'mode_of_travel'): False,
-                           ('edit', 'itinerary', 'origin'): False,
-                           ('edit', 'itinerary', 'overnight_travel'): False,
-                           ('edit', 'travel', 'action_points'): False,
-                           ('edit', 'travel', 'activities'): False,
-                           ('edit', 'travel', 'clearances'): False,
-                           ('edit', 'travel', 'cost_assignments'): False,
-                           ('edit', 'travel', 'cost_summary'): False,
-                           ('edit', 'travel', 'currency'): False,
-                           ('edit', 'travel', 'deductions'): False,
-                           ('edit', 'travel', 'end_date'): False,
-                           ('edit', 'travel', 'expenses'): False,
-                           ('edit', 'travel', 'id'): False,
-                           ('edit', 'travel', 'international_travel'): False,
-                           ('edit', 'travel', 'itinerary'): False,
-                           ('edit', 'travel', 'office'): False,
-                           ('edit', 'travel', 'purpose'): False,
-                           ('edit', 'travel', 'reference_number'): False,
-                           ('edit', 'travel', 'report'): False,
-                           ('edit', 'travel', 'section'): False,
-                           ('edit', 'travel', 'start_date'): False,
-                           ('edit', 'travel', 'status'): False,
-                           ('edit', 'travel', 'supervisor'): False,
-                           ('edit', 'travel', 'ta_required'): False,
-                           ('edit', 'travel', 'traveler'): False,
-                           ('view', 'action_points', 'action_point_number'): True,
-                           ('view', 'action_points', 'actions_taken'): True,
-                           ('view', 'action_points', 'comments'): True,
-                           ('view', 'action_points', 'completed_at'): True,
-                           ('view', 'action_points', 'created_at'): True,
-                           ('view', 'action_points', 'description'): True,
-                           ('view', 'action_points', 'due_date'): True,
-                           ('view', 'action_points', 'follow_up'): True,
-                           ('view', 'action_points', 'id'): True,
-                           ('view', 'action_points', 'person_responsible'): True,
-                           ('view', 'action_points', 'status'): True,
-                           ('view', 'action_points', 'trip_reference_number'): True,
-                           ('view', 'activities', 'date'): True,
-                           ('view', 'activities', 'id'): True,
-                           ('view', 'activities', 'locations'): True,
-                           ('view', 'activities', 'partner'): True,
-                           ('view', 'activities', 'partnership'): True,
-                           ('view', 'activities', 'primary_traveler'): True,
-                           ('view', 'activities', 'result'): True,
-                           ('view', 'activities', 'travel_type'): True,
-                           ('view', 'clearances', 'id'): True,
-                           ('view', 'clearances', 'medical_clearance'): True,
-                           ('view', 'clearances', 'security_clearance'): True,
-                           ('view', 'clearances', 'security_course'): True,
-                           ('view', 'cost_assignments', 'business_area'): False,
-                           ('view', 'cost_assignments', 'delegate'): False,
-                           ('view', 'cost_assignments', 'fund'): False,
-                           ('view', 'cost_assignments', 'grant'): False,
-                           ('view', 'cost_assignments', 'id'): False,
-                           ('view', 'cost_assignments', 'share'): False,
-                           ('view', 'cost_assignments', 'wbs'): False,
-                           ('view', 'deductions', 'accomodation'): False,
-                           ('view', 'deductions', 'breakfast'): False,
-                           ('view', 'deductions', 'date'): False,
-                           ('view', 'deductions', 'day_of_the_week'): False,
-                           ('view', 'deductions', 'dinner'): False,
-                           ('view', 'deductions', 'id'): False,
-                           ('view', 'deductions', 'lunch'): False,
-                           ('view', 'deductions', 'no_dsa'): False,
-                           ('view', 'expenses', 'account_currency'): False,
-                           ('view', 'expenses', 'amount'): False,
-                           ('view', 'expenses', 'document_currency'): False,
-                           ('view', 'expenses', 'id'): False,
-                           ('view', 'expenses', 'type'): False,
-                           ('view', 'itinerary', 'airlines'): True,
-                           ('view', 'itinerary', 'arrival_date'): True,
-                           ('view', 'itinerary', 'departure_date'): True,
-                           ('view', 'itinerary', 'destination'): True,
-                           ('view', 'itinerary', 'dsa_region'): True,
-                           ('view', 'itinerary', 'id'): True,
-                           ('view', 'itinerary', 'mode_of_travel'): True,
-                           ('view', 'itinerary', 'origin'): True,
-                           ('view', 'itinerary', 'overnight_travel'): True,
-                           ('view', 'travel', 'action_points'): True,
-                           ('view', 'travel', 'activities'): True,
-                           ('view', 'travel', 'clearances'): True,
-                           ('view', 'travel', 'cost_assignments'): False,
-                           ('view', 'travel', 'cost_summary'): False,
-                           ('view', 'travel', 'currency'): False,
-                           ('view', 'travel', 'deductions'): False,
-                           ('view', 'travel', 'end_date'): True,
-                           ('view', 'travel', 'expenses'): False,
-                           ('view', 'travel', 'id'): True,
-                           ('view', 'travel', 'international_travel'): True,
-                           ('view', 'travel', 'itinerary'): True,
-                           ('view', 'travel', 'office'): True,
-                           ('view', 'travel', 'purpose'): True,
-                           ('view', 'travel', 'reference_number'): True,
-                           ('view', 'travel', 'report'): True,
-                           ('view', 'travel', 'section'): True,
-                           ('view', 'travel', 'start_date'): True,
-                           ('view', 'travel', 'status'): True,
-                           ('view', 'travel', 'supervisor'): True,
-                           ('view', 'travel', 'ta_required'): True,
-                           ('view', 'travel', 'traveler'): True},
-                          'cancelled':
-                          {('edit', 'action_points', 'action_point_number'): False,
-                           ('edit', 'action_points', 'actions_taken'): False,
-                           ('edit', 'action_points', 'comments'): False,
-                           ('edit', 'action_points', 'completed_at'): False,
-                           ('edit', 'action_points', 'created_at'): False,
-                           ('edit', 'action_points', 'description'): False,
-                           ('edit', 'action_points', 'due_date'): False,
-                           ('edit', 'action_points', 'follow_up'): False,
-                           ('edit', 'action_points', 'id'): False,
-                           ('edit', 'action_points', 'person_responsible'): False,
-                           ('edit', 'action_points', 'status'): False,
-                           ('edit', 'action_points', 'trip_reference_number'): False,
-                           ('edit', 'activities', 'date'): False,
-                           ('edit', 'activities', 'id'): False,
-                           ('edit', 'activities', 'locations'): False,
-                           ('edit', 'activities', 'partner'): False,
-                           ('edit', 'activities', 'partnership'): False,
-                           ('edit', 'activities', 'primary_traveler'): False,
-                           ('edit', 'activities', 'result'): False,
-                           ('edit', 'activities', 'travel_type'): False,
-                           ('edit', 'clearances', 'id'): False,
-                           ('edit', 'clearances', 'medical_clearance'): False,
-                           ('edit', 'clearances', 'security_clearance'): False,
-                           ('edit', 'clearances', 'security_course'): False,
-                           ('edit', 'cost_assignments', 'business_area'): False,
-                           ('edit', 'cost_assignments', 'delegate'): False,
-                           ('edit', 'cost_assignments', 'fund'): False,
-                           ('edit', 'cost_assignments', 'grant'): False,
-                           ('edit', 'cost_assignments', 'id'): False,
-                           ('edit', 'cost_assignments', 'share'): False,
-                           ('edit', 'cost_assignments', 'wbs'): False,
-                           ('edit', 'deductions', 'accomodation'): False,
-                           ('edit', 'deductions', 'breakfast'): False,
-                           ('edit', 'deductions', 'date'): False,
-                           ('edit', 'deductions', 'day_of_the_week'): False,
-                           ('edit', 'deductions', 'dinner'): False,
-                           ('edit', 'deductions', 'id'): False,
-                           ('edit', 'deductions', 'lunch'): False,
-                           ('edit', 'deductions', 'no_dsa'): False,
-                           ('edit', 'expenses', 'account_currency'): False,
-                           ('edit', 'expenses', 'amount'): False,
-                           ('edit', 'expenses', 'document_currency'): False,
-                           ('edit', 'expenses', 'id'): False,
-                           ('edit', 'expenses', 'type'): False,
-                           ('edit', 'itinerary', 'airlines'): False,
-                           ('edit', 'itinerary', 'arrival_date'): False,
-                           ('edit', 'itinerary', 'departure_date'): False,
-                           ('edit', 'itinerary', 'destination'): False,
-                           ('edit', 'itinerary', 'dsa_region'): False,
-                           ('edit', 'itinerary', 'id'): False,
-                           ('edit', 'itinerary', 'mode_of_travel'): False,
-                           ('edit', 'itinerary', 'origin'): False,
-                           ('edit', 'itinerary', 'overnight_travel'): False,
-                           ('edit', 'travel', 'action_points'): False,
-                           ('edit', 'travel', 'activities'): False,
-                           ('edit', 'travel', 'clearances'): False,
-                           ('edit', 'travel', 'cost_assignments'): False,
-                           ('edit', 'travel', 'cost_summary'): False,
-                           ('edit', 'travel', 'currency'): False,
-                           ('edit', 'travel', 'deductions'): False,
-                           ('edit', 'travel', 'end_date'): False,
-                           ('edit', 'travel', 'expenses'): False,
-                           ('edit', 'travel', 'id'): False,
-                           ('edit', 'travel', 'international_travel'): False,
-                           ('edit', 'travel', 'itinerary'): False,
-                           ('edit', 'travel', 'office'): False,
-                           ('edit', 'travel', 'purpose'): False,
-                           ('edit', 'travel', 'reference_number'): False,
-                           ('edit', 'travel', 'report'): False,
-                           ('edit', 'travel', 'section'): False,
-                           ('edit', 'travel', 'start_date'): False,
-                           ('edit', 'travel', 'status'): False,
-                           ('edit', 'travel', 'supervisor'): False,
-                           ('edit', 'travel', 'ta_required'): False,
-                           ('edit', 'travel', 'traveler'): False,
-                           ('view', 'action_points', 'action_point_number'): True,
-                           ('view', 'action_points', 'actions_taken'): True,
-                           ('view', 'action_points', 'comments'): True,
-                           ('view', 'action_points', 'completed_at'): True,
-                           ('view', 'action_points', 'created_at'): True,
-                           ('view', 'action_points', 'description'): True,
-                           ('view', 'action_points', 'due_date'): True,
-                           ('view', 'action_points', 'follow_up'): True,
-                           ('view', 'action_points', 'id'): True,
-                           ('view', 'action_points', 'person_responsible'): True,
-                           ('view', 'action_points', 'status'): True,
-                           ('view', 'action_points', 'trip_reference_number'): True,
-                           ('view', 'activities', 'date'): True,
-                           ('view', 'activities', 'id'): True,
-                           ('view', 'activities', 'locations'): True,
-                           ('view', 'activities', 'partner'): True,
-                           ('view', 'activities', 'partnership'): True,
-                           ('view', 'activities', 'primary_traveler'): True,
-                           ('view', 'activities', 'result'): True,
-                           ('view', 'activities', 'travel_type'): True,
-                           ('view', 'clearances', 'id'): True,
-                           ('view', 'clearances', 'medical_clearance'): True,
-                           ('view', 'clearances', 'security_clearance'): True,
-                           ('view', 'clearances', 'security_course'): True,
-                           ('view', 'cost_assignments', 'business_area'): False,
-                           ('view', 'cost_assignments', 'delegate'): False,
-                           ('view', 'cost_assignments', 'fund'): False,
-                           ('view', 'cost_assignments', 'grant'): False,
-                           ('view', 'cost_assignments', 'id'): False,
-                           ('view', 'cost_assignments', 'share'): False,
-                           ('view', 'cost_assignments', 'wbs'): False,
-                           ('view', 'deductions', 'accomodation'): False,
-                           ('view', 'deductions', 'breakfast'): False,
-                           ('view', 'deductions', 'date'): False,
-                           ('view', 'deductions', 'day_of_the_week'): False,
-                           ('view', 'deductions', 'dinner'): False,
-                           ('view', 'deductions', 'id'): False,
-                           ('view', 'deductions', 'lunch'): False,
-                           ('view', 'deductions', 'no_dsa'): False,
-                           ('view', 'expenses', 'account_currency'): False,
-                           ('view', 'expenses', 'amount'): False,
-                           ('view', 'expenses', 'document_currency'): False,
-                           ('view', 'expenses', 'id'): False,
-                           ('view', 'expenses', 'type'): False,
-                           ('view', 'itinerary', 'airlines'): True,
-                           ('view', 'itinerary', 'arrival_date'): True,
-                           ('view', 'itinerary', 'departure_date'): True,
-                           ('view', 'itinerary', 'destination'): True,
-                           ('view', 'itinerary', 'dsa_region'): True,
-                           ('view', 'itinerary', 'id'): True,
-                           ('view', 'itinerary', 'mode_of_travel'): True,
-                           ('view', 'itinerary', 'origin'): True,
-                           ('view', 'itinerary', 'overnight_travel'): True,
-                           ('view', 'travel', 'action_points'): True,
-                           ('view', 'travel', 'activities'): True,
-                           ('view', 'travel', 'clearances'): True,
-                           ('view', 'travel', 'cost_assignments'): False,
-                           ('view', 'travel', 'cost_summary'): False,
-                           ('view', 'travel', 'currency'): False,
-                           ('view', 'travel', 'deductions'): False,
-                           ('view', 'travel', 'end_date'): True,
-                           ('view', 'travel', 'expenses'): False,
-                           ('view', 'travel', 'id'): True,
-                           ('view', 'travel', 'international_travel'): True,
-                           ('view', 'travel', 'itinerary'): True,
-                           ('view', 'travel', 'office'): True,
-                           ('view', 'travel', 'purpose'): True,
-                           ('view', 'travel', 'reference_number'): True,
-                           ('view', 'travel', 'report'): True,
-                           ('view', 'travel', 'section'): True,
-                           ('view', 'travel', 'start_date'): True,
-                           ('view', 'travel', 'status'): True,
-                           ('view', 'travel', 'supervisor'): True,
-                           ('view', 'travel', 'ta_required'): True,
-                           ('view', 'travel', 'traveler'): True},
-                          'completed':
-                          {('edit', 'action_points', 'action_point_number'): False,
-                           ('edit', 'action_points', 'actions_taken'): False,
-                           ('edit', 'action_points', 'comments'): False,
-                           ('edit', 'action_points', 'completed_at'): False,
-                           ('edit', 'action_points', 'created_at'): False,
-                           ('edit', 'action_points', 'description'): False,
-                           ('edit', 'action_points', 'due_date'): False,
-                           ('edit', 'action_points', 'follow_up'): False,
-                           ('edit', 'action_points', 'id'): False,
-                           ('edit', 'action_points', 'person_responsible'): False,
-                           ('edit', 'action_points', 'status'): False,
-                           ('edit', 'action_points', 'trip_reference_number'): False,
-                           ('edit', 'activities', 'date'): False,
-                           ('edit', 'activities', 'id'): False,
-                           ('edit', 'activities', 'locations'): False,
-                           ('edit', 'activities', 'partner'): False,
-                           ('edit', 'activities', 'partnership'): False,
-                           ('edit', 'activities', 'primary_traveler'): False,
-                           ('edit', 'activities', 'result'): False,
-                           ('edit', 'activities', 'travel_type'): False,
-                           ('edit', 'clearances', 'id'): False,
-                           ('edit', 'clearances', 'medical_clearance'): False,
-                           ('edit', 'clearances', 'security_clearance'): False,
-                           ('edit', 'clearances', 'security_course'): False,
-                           ('edit', 'cost_assignments', 'business_area'): False,
-                           ('edit', 'cost_assignments', 'delegate'): False,
-                           ('edit', 'cost_assignments', 'fund'): False,
-                           ('edit', 'cost_assignments', 'grant'): False,
-                           ('edit', 'cost_assignments', 'id'): False,
-                           ('edit', 'cost_assignments', 'share'): False,
-                           ('edit', 'cost_assignments', 'wbs'): False,
-                           ('edit', 'deductions', 'accomodation'): False,
-                           ('edit', 'deductions', 'breakfast'): False,
-                           ('edit', 'deductions', 'date'): False,
-                           ('edit', 'deductions', 'day_of_the_week'): False,
-                           ('edit', 'deductions', 'dinner'): False,
-                           ('edit', 'deductions', 'id'): False,
-                           ('edit', 'deductions', 'lunch'): False,
-                           ('edit', 'deductions', 'no_dsa'): False,
-                           ('edit', 'expenses', 'account_currency'): False,
-                           ('edit', 'expenses', 'amount'): False,
-                           ('edit', 'expenses', 'document_currency'): False,
-                           ('edit', 'expenses', 'id'): False,
-                           ('edit', 'expenses', 'type'): False,
-                           ('edit', 'itinerary', 'airlines'): False,
-                           ('edit', 'itinerary', 'arrival_date'): False,
-                           ('edit', 'itinerary', 'departure_date'): False,
-                           ('edit', 'itinerary', 'destination'): False,
-                           ('edit', 'itinerary', 'dsa_region'): False,
-                           ('edit', 'itinerary', 'id'): False,
-                           ('edit', 'itinerary', 'mode_of_travel'): False,
-                           ('edit', 'itinerary', 'origin'): False,
-                           ('edit', 'itinerary', 'overnight_travel'): False,
-                           ('edit', 'travel', 'action_points'): False,
-                           ('edit', 'travel', 'activities'): False,
-                           ('edit', 'travel', 'clearances'): False,
-                           ('edit', 'travel', 'cost_assignments'): False,
-                           ('edit', 'travel', 'cost_summary'): False,
-                           ('edit', 'travel', 'currency'): False,
-                           ('edit', 'travel', 'deductions'): False,
-                           ('edit', 'travel', 'end_date'): False,
-                           ('edit', 'travel', 'expenses'): False,
-                           ('edit', 'travel', 'id'): False,
-                           ('edit', 'travel', 'international_travel'): False,
-                           ('edit', 'travel', 'itinerary'): False,
-                           ('edit', 'travel', 'office'): False,
-                           ('edit', 'travel', 'purpose'): False,
-                           ('edit', 'travel', 'reference_number'): False,
-                           ('edit', 'travel', 'report'): False,
-                           ('edit', 'travel', 'section'): False,
-                           ('edit', 'travel', 'start_date'): False,
-                           ('edit', 'travel', 'status'): False,
-                           ('edit', 'travel', 'supervisor'): False,
-                           ('edit', 'travel', 'ta_required'): False,
-                           ('edit', 'travel', 'traveler'): False,
-                           ('view', 'action_points', 'action_point_number'): True,
-                           ('view', 'action_points', 'actions_taken'): True,
-                           ('view', 'action_points', 'comments'): True,
-                           ('view', 'action_points', 'completed_at'): True,
-                           ('view', 'action_points', 'created_at'): True,
-                           ('view', 'action_points', 'description'): True,
-                           ('view', 'action_points', 'due_date'): True,
-                           ('view', 'action_points', 'follow_up'): True,
-                           ('view', 'action_points', 'id'): True,
-                           ('view', 'action_points', 'person_responsible'): True,
-                           ('view', 'action_points', 'status'): True,
-                           ('view', 'action_points', 'trip_reference_number'): True,
-                           ('view', 'activities', 'date'): True,
-                           ('view', 'activities', 'id'): True,
-                           ('view', 'activities', 'locations'): True,
-                           ('view', 'activities', 'partner'): True,
-                           ('view', 'activities', 'partnership'): True,
-                           ('view', 'activities', 'primary_traveler'): True,
-                           ('view', 'activities', 'result'): True,
-                           ('view', 'activities', 'travel_type'): True,
-                           ('view', 'clearances', 'id'): True,
-                           ('view', 'clearances', 'medical_clearance'): True,
-                           ('view', 'clearances', 'security_clearance'): True,
-                           ('view', 'clearances', 'security_course'): True,
-                           ('view', 'cost_assignments', 'business_area'): False,
-                           ('view', 'cost_assignments', 'delegate'): False,
-                           ('view', 'cost_assignments', 'fund'): False,
-                           ('view', 'cost_assignments', 'grant'): False,
-                           ('view', 'cost_assignments', 'id'): False,
-                           ('view', 'cost_assignments', 'share'): False,
-                           ('view', 'cost_assignments', 'wbs'): False,
-                           ('view', 'deductions', 'accomodation'): False,
-                           ('view', 'deductions', 'breakfast'): False,
-                           ('view', 'deductions', 'date'): False,
-                           ('view', 'deductions', 'day_of_the_week'): False,
-                           ('view', 'deductions', 'dinner'): False,
-                           ('view', 'deductions', 'id'): False,
-                           ('view', 'deductions', 'lunch'): False,
-                           ('view', 'deductions', 'no_dsa'): False,
-                           ('view', 'expenses', 'account_currency'): False,
-                           ('view', 'expenses', 'amount'): False,
-                           ('view', 'expenses', 'document_currency'): False,
-                           ('view', 'expenses', 'id'): False,
-                           ('view', 'expenses', 'type'): False,
-                           ('view', 'itinerary', 'airlines'): True,
-                           ('view', 'itinerary', 'arrival_date'): True,
-                           ('view', 'itinerary', 'departure_date'): True,
-                           ('view', 'itinerary', 'destination'): True,
-                           ('view', 'itinerary', 'dsa_region'): True,
-                           ('view', 'itinerary', 'id'): True,
-                           ('view', 'itinerary', 'mode_of_travel'): True,
-                           ('view', 'itinerary', 'origin'): True,
-                           ('view', 'itinerary', 'overnight_travel'): True,
-                           ('view', 'travel', 'action_points'): True,
-                           ('view', 'travel', 'activities'): True,
-                           ('view', 'travel', 'clearances'): True,
-                           ('view', 'travel', 'cost_assignments'): False,
-                           ('view', 'travel', 'cost_summary'): False,
-                           ('view', 'travel', 'currency'): False,
-                           ('view', 'travel', 'deductions'): False,
-                           ('view', 'travel', 'end_date'): True,
-                           ('view', 'travel', 'expenses'): False,
-                           ('view', 'travel', 'id'): True,
-                           ('view', 'travel', 'international_travel'): True,
-                           ('view', 'travel', 'itinerary'): True,
-                           ('view', 'travel', 'office'): True,
-                           ('view', 'travel', 'purpose'): True,
-                           ('view', 'travel', 'reference_number'): True,
-                           ('view', 'travel', 'report'): True,
-                           ('view', 'travel', 'section'): True,
-                           ('view', 'travel', 'start_date'): True,
-                           ('view', 'travel', 'status'): True,
-                           ('view', 'travel', 'supervisor'): True,
-                           ('view', 'travel', 'ta_required'): True,
-                           ('view', 'travel', 'traveler'): True},
-                          'planned':
-                          {('edit', 'action_points', 'action_point_number'): False,
-                           ('edit', 'action_points', 'actions_taken'): False,
-                           ('edit', 'action_points', 'comments'): False,
-                           ('edit', 'action_points', 'completed_at'): False,
-                           ('edit', 'action_points', 'created_at'): False,
-                           ('edit', 'action_points', 'description'): False,
-                           ('edit', 'action_points', 'due_date'): False,
-                           ('edit', 'action_points', 'follow_up'): False,
-                           ('edit', 'action_points', 'id'): False,
-                           ('edit', 'action_points', 'person_responsible'): False,
-                           ('edit', 'action_points', 'status'): False,
-                           ('edit', 'action_points', 'trip_reference_number'): False,
-                           ('edit', 'activities', 'date'): False,
-                           ('edit', 'activities', 'id'): False,
-                           ('edit', 'activities', 'locations'): False,
-                           ('edit', 'activities', 'partner'): False,
-                           ('edit', 'activities', 'partnership'): False,
-                           ('edit', 'activities', 'primary_traveler'): False,
-                           ('edit', 'activities', 'result'): False,
-                           ('edit', 'activities', 'travel_type'): False,
-                           ('edit', 'clearances', 'id'): False,
-                           ('edit', 'clearances', 'medical_clearance'): False,
-                           ('edit', 'clearances', 'security_clearance'): False,
-                           ('edit', 'clearances', 'security_course'): False,
-                           ('edit', 'cost_assignments', 'business_area'): False,
-                           ('edit', 'cost_assignments', 'delegate'): False,
-                           ('edit', 'cost_assignments', 'fund'): False,
-                           ('edit', 'cost_assignments', 'grant'): False,
-                           ('edit', 'cost_assignments', 'id'): False,
-                           ('edit', 'cost_assignments', 'share'): False,
-                           ('edit', 'cost_assignments', 'wbs'): False,
-                           ('edit', 'deductions', 'accomodation'): False,
-                           ('edit', 'deductions', 'breakfast'): False,
-                           ('edit', 'deductions', 'date'): False,
-                           ('edit', 'deductions', 'day_of_the_week'): False,
-                           ('edit', 'deductions', 'dinner'): False,
-                           ('edit', 'deductions', 'id'): False,
-                           ('edit', 'deductions', 'lunch'): False,
-                           ('edit', 'deductions', 'no_dsa'): False,
-                           ('edit', 'expenses', 'account_currency'): False,
-                           ('edit', 'expenses', 'amount'): False,
-                           ('edit', 'expenses', 'document_currency'): False,
-                           ('edit', 'expenses', 'id'): False,
-                           ('edit', 'expenses', 'type'): False,
-                           ('edit', 'itinerary', 'airlines'): False,
-                           ('edit', 'itinerary', 'arrival_date'): False,
-                           ('edit', 'itinerary', 'departure_date'): False,
-                           ('edit', 'itinerary', 'destination'): False,
-                           ('edit', 'itinerary', 'dsa_region'): False,
-                           ('edit', 'itinerary', 'id'): False,
-                           ('edit', 'itinerary', 'mode_of_travel'): False,
-                           ('edit', 'itinerary', 'origin'): False,
-                           ('edit', 'itinerary', 'overnight_travel'): False,
-                           ('edit', 'travel', 'action_points'): False,
-                           ('edit', 'travel', 'activities'): False,
-                           ('edit', 'travel', 'clearances'): False,
-                           ('edit', 'travel', 'cost_assignments'): False,
-                           ('edit', 'travel', 'cost_summary'): False,
-                           ('edit', 'travel', 'currency'): False,
-                           ('edit', 'travel', 'deductions'): False,
-                           ('edit', 'travel', 'end_date'): False,
-                           ('edit', 'travel', 'expenses'): False,
-                           ('edit', 'travel', 'id'): False,
-                           ('edit', 'travel', 'international_travel'): False,
-                           ('edit', 'travel', 'itinerary'): False,
-                           ('edit', 'travel', 'office'): False,
-                           ('edit', 'travel', 'purpose'): False,
-                           ('edit', 'travel', 'reference_number'): False,
-                           ('edit', 'travel', 'report'): False,
-                           ('edit', 'travel', 'section'): False,
-                           ('edit', 'travel', 'start_date'): False,
-                           ('edit', 'travel', 'status'): False,
-                           ('edit', 'travel', 'supervisor'): False,
-                           ('edit', 'travel', 'ta_required'): False,
-                           ('edit', 'travel', 'traveler'): False,
-                           ('view', 'action_points', 'action_point_number'): True,
-                           ('view', 'action_points', 'actions_taken'): True,
-                           ('view', 'action_points', 'comments'): True,
-                           ('view', 'action_points', 'completed_at'): True,
-                           ('view', 'action_points', 'created_at'): True,
-                           ('view', 'action_points', 'description'): True,
-                           ('view', 'action_points', 'due_date'): True,
-                           ('view', 'action_points', 'follow_up'): True,
-                           ('view', 'action_points', 'id'): True,
-                           ('view', 'action_points', 'person_responsible'): True,
-                           ('view', 'action_points', 'status'): True,
-                           ('view', 'action_points', 'trip_reference_number'): True,
-                           ('view', 'activities', 'date'): True,
-                           ('view', 'activities', 'id'): True,
-                           ('view', 'activities', 'locations'): True,
-                           ('view', 'activities', 'partner'): True,
-                           ('view', 'activities', 'partnership'): True,
-                           ('view', 'activities', 'primary_traveler'): True,
-                           ('view', 'activities', 'result'): True,
-                           ('view', 'activities', 'travel_type'): True,
-                           ('view', 'clearances', 'id'): True,
-                           ('view', 'clearances', 'medical_clearance'): True,
-                           ('view', 'clearances', 'security_clearance'): True,
-                           ('view', 'clearances', 'security_course'): True,
-                           ('view', 'cost_assignments', 'business_area'): False,
-                           ('view', 'cost_assignments', 'delegate'): False,
-                           ('view', 'cost_assignments', 'fund'): False,
-                           ('view', 'cost_assignments', 'grant'): False,
-                           ('view', 'cost_assignments', 'id'): False,
-                           ('view', 'cost_assignments', 'share'): False,
-                           ('view', 'cost_assignments', 'wbs'): False,
-                           ('view', 'deductions', 'accomodation'): False,
-                           ('view', 'deductions', 'breakfast'): False,
-                           ('view', 'deductions', 'date'): False,
-                           ('view', 'deductions', 'day_of_the_week'): False,
-                           ('view', 'deductions', 'dinner'): False,
-                           ('view', 'deductions', 'id'): False,
-                           ('view', 'deductions', 'lunch'): False,
-                           ('view', 'deductions', 'no_dsa'): False,
-                           ('view', 'expenses', 'account_currency'): False,
-                           ('view', 'expenses', 'amount'): False,
-                           ('view', 'expenses', 'document_currency'): False,
-                           ('view', 'expenses', 'id'): False,
-                           ('view', 'expenses', 'type'): False,
-                           ('view', 'itinerary', 'airlines'): True,
-                           ('view', 'itinerary', 'arrival_date'): True,
-                           ('view', 'itinerary', 'departure_date'): True,
-                           ('view', 'itinerary', 'destination'): True,
-                           ('view', 'itinerary', 'dsa_region'): True,
-                           ('view', 'itinerary', 'id'): True,
-                           ('view', 'itinerary', 'mode_of_travel'): True,
-                           ('view', 'itinerary', 'origin'): True,
-                           ('view', 'itinerary', 'overnight_travel'): True,
-                           ('view', 'travel', 'action_points'): True,
-                           ('view', 'travel', 'activities'): True,
-                           ('view', 'travel', 'clearances'): True,
-                           ('view', 'travel', 'cost_assignments'): False,
-                           ('view', 'travel', 'cost_summary'): False,
-                           ('view', 'travel', 'currency'): False,
-                           ('view', 'travel', 'deductions'): False,
-                           ('view', 'travel', 'end_date'): True,
-                           ('view', 'travel', 'expenses'): False,
-                           ('view', 'travel', 'id'): True,
-                           ('view', 'travel', 'international_travel'): True,
-                           ('view', 'travel', 'itinerary'): True,
-                           ('view', 'travel', 'office'): True,
-                           ('view', 'travel', 'purpose'): True,
-                           ('view', 'travel', 'reference_number'): True,
-                           ('view', 'travel', 'report'): True,
-                           ('view', 'travel', 'section'): True,
-                           ('view', 'travel', 'start_date'): True,
-                           ('view', 'travel', 'status'): True,
-                           ('view', 'travel', 'supervisor'): True,
-                           ('view', 'travel', 'ta_required'): True,
-                           ('view', 'travel', 'traveler'): True},
-                          'rejected':
-                          {('edit', 'action_points', 'action_point_number'): False,
-                           ('edit', 'action_points', 'actions_taken'): False,
-                           ('edit', 'action_points', 'comments'): False,
-                           ('edit', 'action_points', 'completed_at'): False,
-                           ('edit', 'action_points', 'created_at'): False,
-                           ('edit', 'action_points', 'description'): False,
-                           ('edit', 'action_points', 'due_date'): False,
-                           ('edit', 'action_points', 'follow_up'): False,
-                           ('edit', 'action_points', 'id'): False,
-                           ('edit', 'action_points', 'person_responsible'): False,
-                           ('edit', 'action_points', 'status'): False,
-                           ('edit', 'action_points', 'trip_reference_number'): False,
-                           ('edit', 'activities', 'date'): False,
-                           ('edit', 'activities', 'id'): False,
-                           ('edit', 'activities', 'locations'): False,
-                           ('edit', 'activities', 'partner'): False,
-                           ('edit', 'activities', 'partnership'): False,
-                           ('edit', 'activities', 'primary_traveler'): False,
-                           ('edit', 'activities', 'result'): False,
-                           ('edit', 'activities', 'travel_type'): False,
-                           ('edit', 'clearances', 'id'): False,
-                           ('edit', 'clearances', 'medical_clearance'): False,
-                           ('edit', 'clearances', 'security_clearance'): False,
-                           ('edit', 'clearances', 'security_course'): False,
-                           ('edit', 'cost_assignments', 'business_area'): False,
-                           ('edit', 'cost_assignments', 'delegate'): False,
-                           ('edit', 'cost_assignments', 'fund'): False,
-                           ('edit', 'cost_assignments', 'grant'): False,
-                           ('edit', 'cost_assignments', 'id'): False,
-                           ('edit', 'cost_assignments', 'share'): False,
-                           ('edit', 'cost_assignments', 'wbs'): False,
-                           ('edit', 'deductions', 'accomodation'): False,
-                           ('edit', 'deductions', 'breakfast'): False,
-                           ('edit', 'deductions', 'date'): False,
-                           ('edit', 'deductions', 'day_of_the_week'): False,
-                           ('edit', 'deductions', 'dinner'): False,
-                           ('edit', 'deductions', 'id'): False,
-                           ('edit', 'deductions', 'lunch'): False,
-                           ('edit', 'deductions', 'no_dsa'): False,
-                           ('edit', 'expenses', 'account_currency'): False,
-                           ('edit', 'expenses', 'amount'): False,
-                           ('edit', 'expenses', 'document_currency'): False,
-                           ('edit', 'expenses', 'id'): False,
-                           ('edit', 'expenses', 'type'): False,
-                           ('edit', 'itinerary', 'airlines'): False,
-                           ('edit', 'itinerary', 'arrival_date'): False,
-                           ('edit', 'itinerary', 'departure_date'): False,
-                           ('edit', 'itinerary', 'destination'): False,
-                           ('edit', 'itinerary', 'dsa_region'): False,
-                           ('edit', 'itinerary', 'id'): False,
-                           ('edit', 'itinerary', 'mode_of_travel'): False,
-                           ('edit', 'itinerary', 'origin'): False,
-                           ('edit', 'itinerary', 'overnight_travel'): False,
-                           ('edit', 'travel', 'action_points'): False,
-                           ('edit', 'travel', 'activities'): False,
-                           ('edit', 'travel', 'clearances'): False,
-                           ('edit', 'travel', 'cost_assignments'): False,
-                           ('edit', 'travel', 'cost_summary'): False,
-                           ('edit', 'travel', 'currency'): False,
-                           ('edit', 'travel', 'deductions'): False,
-                           ('edit', 'travel', 'end_date'): False,
-                           ('edit', 'travel', 'expenses'): False,
-                           ('edit', 'travel', 'id'): False,
-                           ('edit', 'travel', 'international_travel'): False,
-                           ('edit', 'travel', 'itinerary'): False,
-                           ('edit', 'travel', 'office'): False,
-                           ('edit', 'travel', 'purpose'): False,
-                           ('edit', 'travel', 'reference_number'): False,
-                           ('edit', 'travel', 'report'): False,
-                           ('edit', 'travel', 'section'): False,
-                           ('edit', 'travel', 'start_date'): False,
-                           ('edit', 'travel', 'status'): False,
-                           ('edit', 'travel', 'supervisor'): False,
-                           ('edit', 'travel', 'ta_required'): False,
-                           ('edit', 'travel', 'traveler'): False,
-                           ('view', 'action_points', 'action_point_number'): True,
-                           ('view', 'action_points', 'actions_taken'): True,
-                           ('view', 'action_points', 'comments'): True,
-                           ('view', 'action_points', 'completed_at'): True,
-                           ('view', 'action_points', 'created_at'): True,
-                           ('view', 'action_points', 'description'): True,
-                           ('view', 'action_points', 'due_date'): True,
-                           ('view', 'action_points', 'follow_up'): True,
-                           ('view', 'action_points', 'id'): True,
-                           ('view', 'action_points', 'person_responsible'): True,
-                           ('view', 'action_points', 'status'): True,
-                           ('view', 'action_points', 'trip_reference_number'): True,
-                           ('view', 'activities', 'date'): True,
-                           ('view', 'activities', 'id'): True,
-                           ('view', 'activities', 'locations'): True,
-                           ('view', 'activities', 'partner'): True,
-                           ('view', 'activities', 'partnership'): True,
-                           ('view', 'activities', 'primary_traveler'): True,
-                           ('view', 'activities', 'result'): True,
-                           ('view', 'activities', 'travel_type'): True,
-                           ('view', 'clearances', 'id'): True,
-                           ('view', 'clearances', 'medical_clearance'): True,
-                           ('view', 'clearances', 'security_clearance'): True,
-                           ('view', 'clearances', 'security_course'): True,
-                           ('view', 'cost_assignments', 'business_area'): False,
-                           ('view', 'cost_assignments', 'delegate'): False,
-                           ('view', 'cost_assignments', 'fund'): False,
-                           ('view', 'cost_assignments', 'grant'): False,
-                           ('view', 'cost_assignments', 'id'): False,
-                           ('view', 'cost_assignments', 'share'): False,
-                           ('view', 'cost_assignments', 'wbs'): False,
-                           ('view', 'deductions', 'accomodation'): False,
-                           ('view', 'deductions', 'breakfast'): False,
-                           ('view', 'deductions', 'date'): False,
-                           ('view', 'deductions', 'day_of_the_week'): False,
-                           ('view', 'deductions', 'dinner'): False,
-                           ('view', 'deductions', 'id'): False,
-                           ('view', 'deductions', 'lunch'): False,
-                           ('view', 'deductions', 'no_dsa'): False,
-                           ('view', 'expenses', 'account_currency'): False,
-                           ('view', 'expenses', 'amount'): False,
-                           ('view', 'expenses', 'document_currency'): False,
-                           ('view', 'expenses', 'id'): False,
-                           ('view', 'expenses', 'type'): False,
-                           ('view', 'itinerary', 'airlines'): True,
-                           ('view', 'itinerary', 'arrival_date'): True,
-                           ('view', 'itinerary', 'departure_date'): True,
-                           ('view', 'itinerary', 'destination'): True,
-                           ('view', 'itinerary', 'dsa_region'): True,
-                           ('view', 'itinerary', 'id'): True,
-                           ('view', 'itinerary', 'mode_of_travel'): True,
-                           ('view', 'itinerary', 'origin'): True,
-                           ('view', 'itinerary', 'overnight_travel'): True,
-                           ('view', 'travel', 'action_points'): True,
-                           ('view', 'travel', 'activities'): True,
-                           ('view', 'travel', 'clearances'): True,
-                           ('view', 'travel', 'cost_assignments'): False,
-                           ('view', 'travel', 'cost_summary'): False,
-                           ('view', 'travel', 'currency'): False,
-                           ('view', 'travel', 'deductions'): False,
-                           ('view', 'travel', 'end_date'): True,
-                           ('view', 'travel', 'expenses'): False,
-                           ('view', 'travel', 'id'): True,
-                           ('view', 'travel', 'international_travel'): True,
-                           ('view', 'travel', 'itinerary'): True,
-                           ('view', 'travel', 'office'): True,
-                           ('view', 'travel', 'purpose'): True,
-                           ('view', 'travel', 'reference_number'): True,
-                           ('view', 'travel', 'report'): True,
-                           ('view', 'travel', 'section'): True,
-                           ('view', 'travel', 'start_date'): True,
-                           ('view', 'travel', 'status'): True,
-                           ('view', 'travel', 'supervisor'): True,
-                           ('view', 'travel', 'ta_required'): True,
-                           ('view', 'travel', 'traveler'): True},
-                          'submitted':
-                          {('edit', 'action_points', 'action_point_number'): False,
-                           ('edit', 'action_points', 'actions_taken'): False,
-                           ('edit', 'action_points', 'comments'): False,
-                           ('edit', 'action_points', 'completed_at'): False,
-                           ('edit', 'action_points', 'created_at'): False,
-                           ('edit', 'action_points', 'description'): False,
-                           ('edit', 'action_points', 'due_date'): False,
-                           ('edit', 'action_points', 'follow_up'): False,
-                           ('edit', 'action_points', 'id'): False,
-                           ('edit', 'action_points', 'person_responsible'): False,
-                           ('edit', 'action_points', 'status'): False,
-                           ('edit', 'action_points', 'trip_reference_number'): False,
-                           ('edit', 'activities', 'date'): False,
-                           ('edit', 'activities', 'id'): False,
-                           ('edit', 'activities', 'locations'): False,
-                           ('edit', 'activities', 'partner'): False,
-                           ('edit', 'activities', 'partnership'): False,
-                           ('edit', 'activities', 'primary_traveler'): False,
-                           ('edit', 'activities', 'result'): False,
-                           ('edit', 'activities', 'travel_type'): False,
-                           ('edit', 'clearances', 'id'): False,
-                           ('edit', 'clearances', 'medical_clearance'): False,
-                           ('edit', 'clearances', 'security_clearance'): False,
-                           ('edit', 'clearances', 'security_course'): False,
-                           ('edit', 'cost_assignments', 'business_area'): False,
-                           ('edit', 'cost_assignments', 'delegate'): False,
-                           ('edit', 'cost_assignments', 'fund'): False,
-                           ('edit', 'cost_assignments', 'grant'): False,
-                           ('edit', 'cost_assignments', 'id'): False,
-                           ('edit', 'cost_assignments', 'share'): False,
-                           ('edit', 'cost_assignments', 'wbs'): False,
-                           ('edit', 'deductions', 'accomodation'): False,
-                           ('edit', 'deductions', 'breakfast'): False,
-                           ('edit', 'deductions', 'date'): False,
-                           ('edit', 'deductions', 'day_of_the_week'): False,
-                           ('edit', 'deductions', 'dinner'): False,
-                           ('edit', 'deductions', 'id'): False,
-                           ('edit', 'deductions', 'lunch'): False,
-                           ('edit', 'deductions', 'no_dsa'): False,
-                           ('edit', 'expenses', 'account_currency'): False,
-                           ('edit', 'expenses', 'amount'): False,
-                           ('edit', 'expenses', 'document_currency'): False,
-                           ('edit', 'expenses', 'id'): False,
-                           ('edit', 'expenses', 'type'): False,
-                           ('edit', 'itinerary', 'airlines'): False,
-                           ('edit', 'itinerary', 'arrival_date'): False,
-                           ('edit', 'itinerary', 'departure_date'): False,
-                           ('edit', 'itinerary', 'destination'): False,
-                           ('edit', 'itinerary', 'dsa_region'): False,
-                           ('edit', 'itinerary', 'id'): False,
-                           ('edit', 'itinerary', 'mode_of_travel'): False,
-                           ('edit', 'itinerary', 'origin'): False,
-                           ('edit', 'itinerary', 'overnight_travel'): False,
-                           ('edit', 'travel', 'action_points'): False,
-                           ('edit', 'travel', 'activities'): False,
-                           ('edit', 'travel', 'clearances'): False,
-                           ('edit', 'travel', 'cost_assignments'): False,
-                           ('edit', 'travel', 'cost_summary'): False,
-                           ('edit', 'travel', 'currency'): False,
-                           ('edit', 'travel', 'deductions'): False,
-                           ('edit', 'travel', 'end_date'): False,
-                           ('edit', 'travel', 'expenses'): False,
-                           ('edit', 'travel', 'id'): False,
-                           ('edit', 'travel', 'international_travel'): False,
-                           ('edit', 'travel', 'itinerary'): False,
-                           ('edit', 'travel', 'office'): False,
-                           ('edit', 'travel', 'purpose'): False,
-                           ('edit', 'travel', 'reference_number'): False,
-                           ('edit', 'travel', 'report'): False,
-                           ('edit', 'travel', 'section'): False,
-                           ('edit', 'travel', 'start_date'): False,
-                           ('edit', 'travel', 'status'): False,
-                           ('edit', 'travel', 'supervisor'): False,
-                           ('edit', 'travel', 'ta_required'): False,
-                           ('edit', 'travel', 'traveler'): False,
-                           ('view', 'action_points', 'action_point_number'): True,
-                           ('view', 'action_points', 'actions_taken'): True,
-                           ('view', 'action_points', 'comments'): True,
-                           ('view', 'action_points', 'completed_at'): True,
-                           ('view', 'action_points', 'created_at'): True,
-                           ('view', 'action_points', 'description'): True,
-                           ('view', 'action_points', 'due_date'): True,
-                           ('view', 'action_points', 'follow_up'): True,
-                           ('view', 'action_points', 'id'): True,
-                           ('view', 'action_points', 'person_responsible'): True,
-                           ('view', 'action_points', 'status'): True,
-                           ('view', 'action_points', 'trip_reference_number'): True,
-                           ('view', 'activities', 'date'): True,
-                           ('view', 'activities', 'id'): True,
-                           ('view', 'activities', 'locations'): True,
-                           ('view', 'activities', 'partner'): True,
-                           ('view', 'activities', 'partnership'): True,
-                           ('view', 'activities', 'primary_traveler'): True,
-                           ('view', 'activities', 'result'): True,
-                           ('view', 'activities', 'travel_type'): True,
-                           ('view', 'clearances', 'id'): True,
-                           ('view', 'clearances', 'medical_clearance'): True,
-                           ('view', 'clearances', 'security_clearance'): True,
-                           ('view', 'clearances', 'security_course'): True,
-                           ('view', 'cost_assignments', 'business_area'): False,
-                           ('view', 'cost_assignments', 'delegate'): False,
-                           ('view', 'cost_assignments', 'fund'): False,
-                           ('view', 'cost_assignments', 'grant'): False,
-                           ('view', 'cost_assignments', 'id'): False,
-                           ('view', 'cost_assignments', 'share'): False,
-                           ('view', 'cost_assignments', 'wbs'): False,
-                           ('view', 'deductions', 'accomodation'): False,
-                           ('view', 'deductions', 'breakfast'): False,
-                           ('view', 'deductions', 'date'): False,
-                           ('view', 'deductions', 'day_of_the_week'): False,
-                           ('view', 'deductions', 'dinner'): False,
-                           ('view', 'deductions', 'id'): False,
-                           ('view', 'deductions', 'lunch'): False,
-                           ('view', 'deductions', 'no_dsa'): False,
-                           ('view', 'expenses', 'account_currency'): False,
-                           ('view', 'expenses', 'amount'): False,
-                           ('view', 'expenses', 'document_currency'): False,
-                           ('view', 'expenses', 'id'): False,
-                           ('view', 'expenses', 'type'): False,
-                           ('view', 'itinerary', 'airlines'): True,
-                           ('view', 'itinerary', 'arrival_date'): True,
-                           ('view', 'itinerary', 'departure_date'): True,
-                           ('view', 'itinerary', 'destination'): True,
-                           ('view', 'itinerary', 'dsa_region'): True,
-                           ('view', 'itinerary', 'id'): True,
-                           ('view', 'itinerary', 'mode_of_travel'): True,
-                           ('view', 'itinerary', 'origin'): True,
-                           ('view', 'itinerary', 'overnight_travel'): True,
-                           ('view', 'travel', 'action_points'): True,
-                           ('view', 'travel', 'activities'): True,
-                           ('view', 'travel', 'clearances'): True,
-                           ('view', 'travel', 'cost_assignments'): False,
-                           ('view', 'travel', 'cost_summary'): False,
-                           ('view', 'travel', 'currency'): False,
-                           ('view', 'travel', 'deductions'): False,
-                           ('view', 'travel', 'end_date'): True,
-                           ('view', 'travel', 'expenses'): False,
-                           ('view', 'travel', 'id'): True,
-                           ('view', 'travel', 'international_travel'): True,
-                           ('view', 'travel', 'itinerary'): True,
-                           ('view', 'travel', 'office'): True,
-                           ('view', 'travel', 'purpose'): True,
-                           ('view', 'travel', 'reference_number'): True,
-                           ('view', 'travel', 'report'): True,
-                           ('view', 'travel', 'section'): True,
-                           ('view', 'travel', 'start_date'): True,
-                           ('view', 'travel', 'status'): True,
-                           ('view', 'travel', 'supervisor'): True,
-                           ('view', 'travel', 'ta_required'): True,
-                           ('view', 'travel', 'traveler'): True}},
-               'Finance Focal Point': {'approved':
-                                       {('edit', 'action_points', 'action_point_number'): True,
-                                        ('edit', 'action_points', 'actions_taken'): True,
-                                        ('edit', 'action_points', 'comments'): True,
-                                        ('edit', 'action_points', 'completed_at'): True,
-                                        ('edit', 'action_points', 'created_at'): True,
-                                        ('edit', 'action_points', 'description'): True,
-                                        ('edit', 'action_points', 'due_date'): True,
-                                        ('edit', 'action_points', 'follow_up'): True,
-                                        ('edit', 'action_points', 'id'): True,
-                                        ('edit', 'action_points', 'person_responsible'): True,
-                                        ('edit', 'action_points', 'status'): True,
-                                        ('edit', 'action_points', 'trip_reference_number'): True,
-                                        ('edit', 'activities', 'date'): False,
-                                        ('edit', 'activities', 'id'): False,
-                                        ('edit', 'activities', 'locations'): False,
-                                        ('edit', 'activities', 'partner'): False,
-                                        ('edit', 'activities', 'partnership'): False,
-                                        ('edit', 'activities', 'primary_traveler'): False,
-                                        ('edit', 'activities', 'result'): False,
-                                        ('edit', 'activities', 'travel_type'): False,
-                                        ('edit', 'clearances', 'id'): False,
-                                        ('edit', 'clearances', 'medical_clearance'): False,
-                                        ('edit', 'clearances', 'security_clearance'): False,
-                                        ('edit', 'clearances', 'security_course'): False,
-                                        ('edit', 'cost_assignments', 'business_area'): True,
-                                        ('edit', 'cost_assignments', 'delegate'): True,
-                                        ('edit', 'cost_assignments', 'fund'): True,
-                                        ('edit', 'cost_assignments', 'grant'): True,
-                                        ('edit', 'cost_assignments', 'id'): True,
-                                        ('edit', 'cost_assignments', 'share'): True,
-                                        ('edit', 'cost_assignments', 'wbs'): True,
-                                        ('edit', 'deductions', 'accomodation'): True,
-                                        ('edit', 'deductions', 'breakfast'): True,
-                                        ('edit', 'deductions', 'date'): True,
-                                        ('edit', 'deductions', 'day_of_the_week'): True,
-                                        ('edit', 'deductions', 'dinner'): True,
-                                        ('edit', 'deductions', 'id'): True,
-                                        ('edit', 'deductions', 'lunch'): True,
-                                        ('edit', 'deductions', 'no_dsa'): True,
-                                        ('edit', 'expenses', 'account_currency'): True,
-                                        ('edit', 'expenses', 'amount'): True,
-                                        ('edit', 'expenses', 'document_currency'): True,
-                                        ('edit', 'expenses', 'id'): True,
-                                        ('edit', 'expenses', 'type'): True,
-                                        ('edit', 'itinerary', 'airlines'): True,
-                                        ('edit', 'itinerary', 'arrival_date'): True,
-                                        ('edit', 'itinerary', 'departure_date'): True,
-                                        ('edit', 'itinerary', 'destination'): True,
-                                        ('edit', 'itinerary', 'dsa_region'): True,
-                                        ('edit', 'itinerary', 'id'): True,
-                                        ('edit', 'itinerary', 'mode_of_travel'): True,
-                                        ('edit', 'itinerary', 'origin'): True,
-                                        ('edit', 'itinerary', 'overnight_travel'): True,
-                                        ('edit', 'travel', 'action_points'): True,
-                                        ('edit', 'travel', 'activities'): False,
-                                        ('edit', 'travel', 'clearances'): False,
-                                        ('edit', 'travel', 'cost_assignments'): True,
-                                        ('edit', 'travel', 'cost_summary'): False,
-                                        ('edit', 'travel', 'currency'): True,
-                                        ('edit', 'travel', 'deductions'): True,
-                                        ('edit', 'travel', 'end_date'): True,
-                                        ('edit', 'travel', 'expenses'): True,
-                                        ('edit', 'travel', 'id'): False,
-                                        ('edit', 'travel', 'international_travel'): False,
-                                        ('edit', 'travel', 'itinerary'): True,
-                                        ('edit', 'travel', 'office'): False,
-                                        ('edit', 'travel', 'purpose'): False,
-                                        ('edit', 'travel', 'reference_number'): False,
-                                        ('edit', 'travel', 'report'): False,
-                                        ('edit', 'travel', 'section'): False,
-                                        ('edit', 'travel', 'start_date'): True,
-                                        ('edit', 'travel', 'status'): False,
-                                        ('edit', 'travel', 'supervisor'): False,
-                                        ('edit', 'travel', 'ta_required'): False,
-                                        ('edit', 'travel', 'traveler'): False,
-                                        ('view', 'action_points', 'action_point_number'): True,
-                                        ('view', 'action_points', 'actions_taken'): True,
-                                        ('view', 'action_points', 'comments'): True,
-                                        ('view', 'action_points', 'completed_at'): True,
-                                        ('view', 'action_points', 'created_at'): True,
-                                        ('view', 'action_points', 'description'): True,
-                                        ('view', 'action_points', 'due_date'): True,
-                                        ('view', 'action_points', 'follow_up'): True,
-                                        ('view', 'action_points', 'id'): True,
-                                        ('view', 'action_points', 'person_responsible'): True,
-                                        ('view', 'action_points', 'status'): True,
-                                        ('view', 'action_points', 'trip_reference_number'): True,
-                                        ('view', 'activities', 'date'): True,
-                                        ('view', 'activities', 'id'): True,
-                                        ('view', 'activities', 'locations'): True,
-                                        ('view', 'activities', 'partner'): True,
-                                        ('view', 'activities', 'partnership'): True,
-                                        ('view', 'activities', 'primary_traveler'): True,
-                                        ('view', 'activities', 'result'): True,
-                                        ('view', 'activities', 'travel_type'): True,
-                                        ('view', 'clearances', 'id'): True,
-                                        ('view', 'clearances', 'medical_clearance'): True,
-                                        ('view', 'clearances', 'security_clearance'): True,
-                                        ('view', 'clearances', 'security_course'): True,
-                                        ('view', 'cost_assignments', 'business_area'): True,
-                                        ('view', 'cost_assignments', 'delegate'): True,
-                                        ('view', 'cost_assignments', 'fund'): True,
-                                        ('view', 'cost_assignments', 'grant'): True,
-                                        ('view', 'cost_assignments', 'id'): True,
-                                        ('view', 'cost_assignments', 'share'): True,
-                                        ('view', 'cost_assignments', 'wbs'): True,
-                                        ('view', 'deductions', 'accomodation'): True,
-                                        ('view', 'deductions', 'breakfast'): True,
-                                        ('view', 'deductions', 'date'): True,
-                                        ('view', 'deductions', 'day_of_the_week'): True,
-                                        ('view', 'deductions', 'dinner'): True,
-                                        ('view', 'deductions', 'id'): True,
-                                        ('view', 'deductions', 'lunch'): True,
-                                        ('view', 'deductions', 'no_dsa'): True,
-                                        ('view', 'expenses', 'account_currency'): True,
-                                        ('view', 'expenses', 'amount'): True,
-                                        ('view', 'expenses', 'document_currency'): True,
-                                        ('view', 'expenses', 'id'): True,
-                                        ('view', 'expenses', 'type'): True,
-                                        ('view', 'itinerary', 'airlines'): True,
-                                        ('view', 'itinerary', 'arrival_date'): True,
-                                        ('view', 'itinerary', 'departure_date'): True,
-                                        ('view', 'itinerary', 'destination'): True,
-                                        ('view', 'itinerary', 'dsa_region'): True,
-                                        ('view', 'itinerary', 'id'): True,
-                                        ('view', 'itinerary', 'mode_of_travel'): True,
-                                        ('view', 'itinerary', 'origin'): True,
-                                        ('view', 'itinerary', 'overnight_travel'): True,
-                                        ('view', 'travel', 'action_points'): True,
-                                        ('view', 'travel', 'activities'): True,
-                                        ('view', 'travel', 'clearances'): True,
-                                        ('view', 'travel', 'cost_assignments'): True,
-                                        ('view', 'travel', 'cost_summary'): True,
-                                        ('view', 'travel', 'currency'): True,
-                                        ('view', 'travel', 'deductions'): True,
-                                        ('view', 'travel', 'end_date'): True,
-                                        ('view', 'travel', 'expenses'): True,
-                                        ('view', 'travel', 'id'): True,
-                                        ('view', 'travel', 'international_travel'): True,
-                                        ('view', 'travel', 'itinerary'): True,
-                                        ('view', 'travel', 'office'): True,
-                                        ('view', 'travel', 'purpose'): True,
-                                        ('view', 'travel', 'reference_number'): True,
-                                        ('view', 'travel', 'report'): True,
-                                        ('view', 'travel', 'section'): True,
-                                        ('view', 'travel', 'start_date'): True,
-                                        ('view', 'travel', 'status'): True,
-                                        ('view', 'travel', 'supervisor'): True,
-                                        ('view', 'travel', 'ta_required'): True,
-                                        ('view', 'travel', 'traveler'): True},
-                                       'cancelled':
-                                       {('edit', 'action_points', 'action_point_number'): True,
-                                        ('edit', 'action_points', 'actions_taken'): True,
-                                        ('edit', 'action_points', 'comments'): True,
-                                        ('edit', 'action_points', 'completed_at'): True,
-                                        ('edit', 'action_points', 'created_at'): True,
-                                        ('edit', 'action_points', 'description'): True,
-                                        ('edit', 'action_points', 'due_date'): True,
-                                        ('edit', 'action_points', 'follow_up'): True,
-                                        ('edit', 'action_points', 'id'): True,
-                                        ('edit', 'action_points', 'person_responsible'): True,
-                                        ('edit', 'action_points', 'status'): True,
-                                        ('edit', 'action_points', 'trip_reference_number'): True,
-                                        ('edit', 'activities', 'date'): False,
-                                        ('edit', 'activities', 'id'): False,
-                                        ('edit', 'activities', 'locations'): False,
-                                        ('edit', 'activities', 'partner'): False,
-                                        ('edit', 'activities', 'partnership'): False,
-                                        ('edit', 'activities', 'primary_traveler'): False,
-                                        ('edit', 'activities', 'result'): False,
-                                        ('edit', 'activities', 'travel_type'): False,
-                                        ('edit', 'clearances', 'id'): False,
-                                        ('edit', 'clearances', 'medical_clearance'): False,
-                                        ('edit', 'clearances', 'security_clearance'): False,
-                                        ('edit', 'clearances', 'security_course'): False,
-                                        ('edit', 'cost_assignments', 'business_area'): True,
-                                        ('edit', 'cost_assignments', 'delegate'): True,
-                                        ('edit', 'cost_assignments', 'fund'): True,
-                                        ('edit', 'cost_assignments', 'grant'): True,
-                                        ('edit', 'cost_assignments', 'id'): True,
-                                        ('edit', 'cost_assignments', 'share'): True,
-                                        ('edit', 'cost_assignments', 'wbs'): True,
-                                        ('edit', 'deductions', 'accomodation'): True,
-                                        ('edit', 'deductions', 'breakfast'): True,
-                                        ('edit', 'deductions', 'date'): True,
-                                        ('edit', 'deductions', 'day_of_the_week'): True,
-                                        ('edit', 'deductions', 'dinner'): True,
-                                        ('edit', 'deductions', 'id'): True,
-                                        ('edit', 'deductions', 'lunch'): True,
-                                        ('edit', 'deductions', 'no_dsa'): True,
-                                        ('edit', 'expenses', 'account_currency'): True,
-                                        ('edit', 'expenses', 'amount'): True,
-                                        ('edit', 'expenses', 'document_currency'): True,
-                                        ('edit', 'expenses', 'id'): True,
-                                        ('edit', 'expenses', 'type'): True,
-                                        ('edit', 'itinerary', 'airlines'): True,
-                                        ('edit', 'itinerary', 'arrival_date'): True,
-                                        ('edit', 'itinerary', 'departure_date'): True,
-                                        ('edit', 'itinerary', 'destination'): True,
-                                        ('edit', 'itinerary', 'dsa_region'): True,
-                                        ('edit', 'itinerary', 'id'): True,
-                                        ('edit', 'itinerary', 'mode_of_travel'): True,
-                                        ('edit', 'itinerary', 'origin'): True,
-                                        ('edit', 'itinerary', 'overnight_travel'): True,
-                                        ('edit', 'travel', 'action_points'): True,
-                                        ('edit', 'travel', 'activities'): False,
-                                        ('edit', 'travel', 'clearances'): False,
-                                        ('edit', 'travel', 'cost_assignments'): True,
-                                        ('edit', 'travel', 'cost_summary'): False,
-                                        ('edit', 'travel', 'currency'): True,
-                                        ('edit', 'travel', 'deductions'): True,
-                                        ('edit', 'travel', 'end_date'): True,
-                                        ('edit', 'travel', 'expenses'): True,
-                                        ('edit', 'travel', 'id'): False,
-                                        ('edit', 'travel', 'international_travel'): False,
-                                        ('edit', 'travel', 'itinerary'): True,
-                                        ('edit', 'travel', 'office'): False,
-                                        ('edit', 'travel', 'purpose'): False,
-                                        ('edit', 'travel', 'reference_number'): False,
-                                        ('edit', 'travel', 'report'): False,
-                                        ('edit', 'travel', 'section'): False,
-                                        ('edit', 'travel', 'start_date'): True,
-                                        ('edit', 'travel', 'status'): False,
-                                        ('edit', 'travel', 'supervisor'): False,
-                                        ('edit', 'travel', 'ta_required'): False,
-                                        ('edit', 'travel', 'traveler'): False,
-                                        ('view', 'action_points', 'action_point_number'): True,
-                                        ('view', 'action_points', 'actions_taken'): True,
-                                        ('view', 'action_points', 'comments'): True,
-                                        ('view', 'action_points', 'completed_at'): True,
-                                        ('view', 'action_points', 'created_at'): True,
-                                        ('view', 'action_points', 'description'): True,
-                                        ('view', 'action_points', 'due_date'): True,
-                                        ('view', 'action_points', 'follow_up'): True,
-                                        ('view', 'action_points', 'id'): True,
-                                        ('view', 'action_points', 'person_responsible'): True,
-                                        ('view', 'action_points', 'status'): True,
-                                        ('view', 'action_points', 'trip_reference_number'): True,
-                                        ('view', 'activities', 'date'): True,
-                                        ('view', 'activities', 'id'): True,
-                                        ('view', 'activities', 'locations'): True,
-                                        ('view', 'activities', 'partner'): True,
-                                        ('view', 'activities', 'partnership'): True,
-                                        ('view', 'activities', 'primary_traveler'): True,
-                                        ('view', 'activities', 'result'): True,
-                                        ('view', 'activities', 'travel_type'): True,
-                                        ('view', 'clearances', 'id'): True,
-                                        ('view', 'clearances', 'medical_clearance'): True,
-                                        ('view', 'clearances', 'security_clearance'): True,
-                                        ('view', 'clearances', 'security_course'): True,
-                                        ('view', 'cost_assignments', 'business_area'): True,
-                                        ('view', 'cost_assignments', 'delegate'): True,
-                                        ('view', 'cost_assignments', 'fund'): True,
-                                        ('view', 'cost_assignments', 'grant'): True,
-                                        ('view', 'cost_assignments', 'id'): True,
-                                        ('view', 'cost_assignments', 'share'): True,
-                                        ('view', 'cost_assignments', 'wbs'): True,
-                                        ('view', 'deductions', 'accomodation'): True,
-                                        ('view', 'deductions', 'breakfast'): True,
-                                        ('view', 'deductions', 'date'): True,
-                                        ('view', 'deductions', 'day_of_the_week'): True,
-                                        ('view', 'deductions', 'dinner'): True,
-                                        ('view', 'deductions', 'id'): True,
-                                        ('view', 'deductions', 'lunch'): True,
-                                        ('view', 'deductions', 'no_dsa'): True,
-                                        ('view', 'expenses', 'account_currency'): True,
-                                        ('view', 'expenses', 'amount'): True,
-                                        ('view', 'expenses', 'document_currency'): True,
-                                        ('view', 'expenses', 'id'): True,
-                                        ('view', 'expenses', 'type'): True,
-                                        ('view', 'itinerary', 'airlines'): True,
-                                        ('view', 'itinerary', 'arrival_date'): True,
-                                        ('view', 'itinerary', 'departure_date'): True,
-                                        ('view', 'itinerary', 'destination'): True,
-                                        ('view', 'itinerary', 'dsa_region'): True,
-                                        ('view', 'itinerary', 'id'): True,
-                                        ('view', 'itinerary', 'mode_of_travel'): True,
-                                        ('view', 'itinerary', 'origin'): True,
-                                        ('view', 'itinerary', 'overnight_travel'): True,
-                                        ('view', 'travel', 'action_points'): True,
-                                        ('view', 'travel', 'activities'): True,
-                                        ('view', 'travel', 'clearances'): True,
-                                        ('view', 'travel', 'cost_assignments'): True,
-                                        ('view', 'travel', 'cost_summary'): True,
-                                        ('view', 'travel', 'currency'): True,
-                                        ('view', 'travel', 'deductions'): True,
-                                        ('view', 'travel', 'end_date'): True,
-                                        ('view', 'travel', 'expenses'): True,
-                                        ('view', 'travel', 'id'): True,
-                                        ('view', 'travel', 'international_travel'): True,
-                                        ('view', 'travel', 'itinerary'): True,
-                                        ('view', 'travel', 'office'): True,
-                                        ('view', 'travel', 'purpose'): True,
-                                        ('view', 'travel', 'reference_number'): True,
-                                        ('view', 'travel', 'report'): True,
-                                        ('view', 'travel', 'section'): True,
-                                        ('view', 'travel', 'start_date'): True,
-                                        ('view', 'travel', 'status'): True,
-                                        ('view', 'travel', 'supervisor'): True,
-                                        ('view', 'travel', 'ta_required'): True,
-                                        ('view', 'travel', 'traveler'): True},
-                                       'completed':
-                                       {('edit', 'action_points', 'action_point_number'): True,
-                                        ('edit', 'action_points', 'actions_taken'): True,
-                                        ('edit', 'action_points', 'comments'): True,
-                                        ('edit', 'action_points', 'completed_at'): True,
-                                        ('edit', 'action_points', 'created_at'): True,
-                                        ('edit', 'action_points', 'description'): True,
-                                        ('edit', 'action_points', 'due_date'): True,
-                                        ('edit', 'action_points', 'follow_up'): True,
-                                        ('edit', 'action_points', 'id'): True,
-                                        ('edit', 'action_points', 'person_responsible'): True,
-                                        ('edit', 'action_points', 'status'): True,
-                                        ('edit', 'action_points', 'trip_reference_number'): True,
-                                        ('edit', 'activities', 'date'): False,
-                                        ('edit', 'activities', 'id'): False,
-                                        ('edit', 'activities', 'locations'): False,
-                                        ('edit', 'activities', 'partner'): False,
-                                        ('edit', 'activities', 'partnership'): False,
-                                        ('edit', 'activities', 'primary_traveler'): False,
-                                        ('edit', 'activities', 'result'): False,
-                                        ('edit', 'activities', 'travel_type'): False,
-                                        ('edit', 'clearances', 'id'): False,
-                                        ('edit', 'clearances', 'medical_clearance'): False,
-                                        ('edit', 'clearances', 'security_clearance'): False,
-                                        ('edit', 'clearances', 'security_course'): False,
-                                        ('edit', 'cost_assignments', 'business_area'): False,
-                                        ('edit', 'cost_assignments', 'delegate'): False,
-                                        ('edit', 'cost_assignments', 'fund'): False,
-                                        ('edit', 'cost_assignments', 'grant'): False,
-                                        ('edit', 'cost_assignments', 'id'): False,
-                                        ('edit', 'cost_assignments', 'share'): False,
-                                        ('edit', 'cost_assignments', 'wbs'): False,
-                                        ('edit', 'deductions', 'accomodation'): False,
-                                        ('edit', 'deductions', 'breakfast'): False,
-                                        ('edit', 'deductions', 'date'): False,
-                                        ('edit', 'deductions', 'day_of_the_week'): False,
-                                        ('edit', 'deductions', 'dinner'): False,
-                                        ('edit', 'deductions', 'id'): False,
-                                        ('edit', 'deductions', 'lunch'): False,
-                                        ('edit', 'deductions', 'no_dsa'): False,
-                                        ('edit', 'expenses', 'account_currency'): False,
-                                        ('edit', 'expenses', 'amount'): False,
-                                        ('edit', 'expenses', 'document_currency'): False,
-                                        ('edit', 'expenses', 'id'): False,
-                                        ('edit', 'expenses', 'type'): False,
-                                        ('edit', 'itinerary', 'airlines'): False,
-                                        ('edit', 'itinerary', 'arrival_date'): False,
-                                        ('edit', 'itinerary', 'departure_date'): False,
-                                        ('edit', 'itinerary', 'destination'): False,
-                                        ('edit', 'itinerary', 'dsa_region'): False,
-                                        ('edit', 'itinerary', 'id'): False,
-                                        ('edit', 'itinerary', 'mode_of_travel'): False,
-                                        ('edit', 'itinerary', 'origin'): False,
-                                        ('edit', 'itinerary', 'overnight_travel'): False,
-                                        ('edit', 'travel', 'action_points'): True,
-                                        ('edit', 'travel', 'activities'): False,
-                                        ('edit', 'travel', 'clearances'): False,
-                                        ('edit', 'travel', 'cost_assignments'): False,
-                                        ('edit', 'travel', 'cost_summary'): False,
-                                        ('edit', 'travel', 'currency'): True,
-                                        ('edit', 'travel', 'deductions'): False,
-                                        ('edit', 'travel', 'end_date'): True,
-                                        ('edit', 'travel', 'expenses'): False,
-                                        ('edit', 'travel', 'id'): False,
-                                        ('edit', 'travel', 'international_travel'): False,
-                                        ('edit', 'travel', 'itinerary'): False,
-                                        ('edit', 'travel', 'office'): False,
-                                        ('edit', 'travel', 'purpose'): False,
-                                        ('edit', 'travel', 'reference_number'): False,
-                                        ('edit', 'travel', 'report'): False,
-                                        ('edit', 'travel', 'section'): False,
-                                        ('edit', 'travel', 'start_date'): True,
-                                        ('edit', 'travel', 'status'): False,
-                                        ('edit', 'travel', 'supervisor'): False,
-                                        ('edit', 'travel', 'ta_required'): False,
-                                        ('edit', 'travel', 'traveler'): False,
-                                        ('view', 'action_points', 'action_point_number'): True,
-                                        ('view', 'action_points', 'actions_taken'): True,
-                                        ('view', 'action_points', 'comments'): True,
-                                        ('view', 'action_points', 'completed_at'): True,
-                                        ('view', 'action_points', 'created_at'): True,
-                                        ('view', 'action_points', 'description'): True,
-                                        ('view', 'action_points', 'due_date'): True,
-                                        ('view', 'action_points', 'follow_up'): True,
-                                        ('view', 'action_points', 'id'): True,
-                                        ('view', 'action_points', 'person_responsible'): True,
-                                        ('view', 'action_points', 'status'): True,
-                                        ('view', 'action_points', 'trip_reference_number'): True,
-                                        ('view', 'activities', 'date'): True,
-                                        ('view', 'activities', 'id'): True,
-                                        ('view', 'activities', 'locations'): True,
-                                        ('view', 'activities', 'partner'): True,
-                                        ('view', 'activities', 'partnership'): True,
-                                        ('view', 'activities', 'primary_traveler'): True,
-                                        ('view', 'activities', 'result'): True,
-                                        ('view', 'activities', 'travel_type'): True,
-                                        ('view', 'clearances', 'id'): True,
-                                        ('view', 'clearances', 'medical_clearance'): True,
-                                        ('view', 'clearances', 'security_clearance'): True,
-                                        ('view', 'clearances', 'security_course'): True,
-                                        ('view', 'cost_assignments', 'business_area'): True,
-                                        ('view', 'cost_assignments', 'delegate'): True,
-                                        ('view', 'cost_assignments', 'fund'): True,
-                                        ('view', 'cost_assignments', 'grant'): True,
-                                        ('view', 'cost_assignments', 'id'): True,
-                                        ('view', 'cost_assignments', 'share'): True,
-                                        ('view', 'cost_assignments', 'wbs'): True,
-                                        ('view', 'deductions', 'accomodation'): True,
-                                        ('view', 'deductions', 'breakfast'): True,
-                                        ('view', 'deductions', 'date'): True,
-                                        ('view', 'deductions', 'day_of_the_week'): True,
-                                        ('view', 'deductions', 'dinner'): True,
-                                        ('view', 'deductions', 'id'): True,
-                                        ('view', 'deductions', 'lunch'): True,
-                                        ('view', 'deductions', 'no_dsa'): True,
-                                        ('view', 'expenses', 'account_currency'): True,
-                                        ('view', 'expenses', 'amount'): True,
-                                        ('view', 'expenses', 'document_currency'): True,
-                                        ('view', 'expenses', 'id'): True,
-                                        ('view', 'expenses', 'type'): True,
-                                        ('view', 'itinerary', 'airlines'): True,
-                                        ('view', 'itinerary', 'arrival_date'): True,
-                                        ('view', 'itinerary', 'departure_date'): True,
-                                        ('view', 'itinerary', 'destination'): True,
-                                        ('view', 'itinerary', 'dsa_region'): True,
-                                        ('view', 'itinerary', 'id'): True,
-                                        ('view', 'itinerary', 'mode_of_travel'): True,
-                                        ('view', 'itinerary', 'origin'): True,
-                                        ('view', 'itinerary', 'overnight_travel'): True,
-                                        ('view', 'travel', 'action_points'): True,
-                                        ('view', 'travel', 'activities'): True,
-                                        ('view', 'travel', 'clearances'): True,
-                                        ('view', 'travel', 'cost_assignments'): True,
-                                        ('view', 'travel', 'cost_summary'): True,
-                                        ('view', 'travel', 'currency'): True,
-                                        ('view', 'travel', 'deductions'): True,
-                                        ('view', 'travel', 'end_date'): True,
-                                        ('view', 'travel', 'expenses'): True,
-                                        ('view', 'travel', 'id'): True,
-                                        ('view', 'travel', 'international_travel'): True,
-                                        ('view', 'travel', 'itinerary'): True,
-                                        ('view', 'travel', 'office'): True,
-                                        ('view', 'travel', 'purpose'): True,
-                                        ('view', 'travel', 'reference_number'): True,
-                                        ('view', 'travel', 'report'): True,
-                                        ('view', 'travel', 'section'): True,
-                                        ('view', 'travel', 'start_date'): True,
-                                        ('view', 'travel', 'status'): True,
-                                        ('view', 'travel', 'supervisor'): True,
-                                        ('view', 'travel', 'ta_required'): True,
-                                        ('view', 'travel', 'traveler'): True},
-                                       'planned':
-                                       {('edit', 'action_points', 'action_point_number'): True,
-                                        ('edit', 'action_points', 'actions_taken'): True,
-                                        ('edit', 'action_points', 'comments'): True,
-                                        ('edit', 'action_points', 'completed_at'): True,
-                                        ('edit', 'action_points', 'created_at'): True,
-                                        ('edit', 'action_points', 'description'): True,
-                                        ('edit', 'action_points', 'due_date'): True,
-                                        ('edit', 'action_points', 'follow_up'): True,
-                                        ('edit', 'action_points', 'id'): True,
-                                        ('edit', 'action_points', 'person_responsible'): True,
-                                        ('edit', 'action_points', 'status'): True,
-                                        ('edit', 'action_points', 'trip_reference_number'): True,
-                                        ('edit', 'activities', 'date'): False,
-                                        ('edit', 'activities', 'id'): False,
-                                        ('edit', 'activities', 'locations'): False,
-                                        ('edit', 'activities', 'partner'): False,
-                                        ('edit', 'activities', 'partnership'): False,
-                                        ('edit', 'activities', 'primary_traveler'): False,
-                                        ('edit', 'activities', 'result'): False,
-                                        ('edit', 'activities', 'travel_type'): False,
-                                        ('edit', 'clearances', 'id'): False,
-                                        ('edit', 'clearances', 'medical_clearance'): False,
-                                        ('edit', 'clearances', 'security_clearance'): False,
-                                        ('edit', 'clearances', 'security_course'): False,
-                                        ('edit', 'cost_assignments', 'business_area'): True,
-                                        ('edit', 'cost_assignments', 'delegate'): True,
-                                        ('edit', 'cost_assignments', 'fund'): True,
-                                        ('edit', 'cost_assignments', 'grant'): True,
-                                        ('edit', 'cost_assignments', 'id'): True,
-                                        ('edit', 'cost_assignments', 'share'): True,
-                                        ('edit', 'cost_assignments', 'wbs'): True,
-                                        ('edit', 'deductions', 'accomodation'): True,
-                                        ('edit', 'deductions', 'breakfast'): True,
-                                        ('edit', 'deductions', 'date'): True,
-                                        ('edit', 'deductions', 'day_of_the_week'): True,
-                                        ('edit', 'deductions', 'dinner'): True,
-                                        ('edit', 'deductions', 'id'): True,
-                                        ('edit', 'deductions', 'lunch'): True,
-                                        ('edit', 'deductions', 'no_dsa'): True,
-                                        ('edit', 'expenses', 'account_currency'): True,
-                                        ('edit', 'expenses', 'amount'): True,
-                                        ('edit', 'expenses', 'document_currency'): True,
-                                        ('edit', 'expenses', 'id'): True,
-                                        ('edit', 'expenses', 'type'): True,
-                                        ('edit', 'itinerary', 'airlines'): True,
-                                        ('edit', 'itinerary', 'arrival_date'): True,
-                                        ('edit', 'itinerary', 'departure_date'): True,
-                                        ('edit', 'itinerary', 'destination'): True,
-                                        ('edit', 'itinerary', 'dsa_region'): True,
-                                        ('edit', 'itinerary', 'id'): True,
-                                        ('edit', 'itinerary', 'mode_of_travel'): True,
-                                        ('edit', 'itinerary', 'origin'): True,
-                                        ('edit', 'itinerary', 'overnight_travel'): True,
-                                        ('edit', 'travel', 'action_points'): True,
-                                        ('edit', 'travel', 'activities'): False,
-                                        ('edit', 'travel', 'clearances'): False,
-                                        ('edit', 'travel', 'cost_assignments'): True,
-                                        ('edit', 'travel', 'cost_summary'): False,
-                                        ('edit', 'travel', 'currency'): True,
-                                        ('edit', 'travel', 'deductions'): True,
-                                        ('edit', 'travel', 'end_date'): True,
-                                        ('edit', 'travel', 'expenses'): True,
-                                        ('edit', 'travel', 'id'): False,
-                                        ('edit', 'travel', 'international_travel'): False,
-                                        ('edit', 'travel', 'itinerary'): True,
-                                        ('edit', 'travel', 'office'): False,
-                                        ('edit', 'travel', 'purpose'): False,
-                                        ('edit', 'travel', 'reference_number'): False,
-                                        ('edit', 'travel', 'report'): False,
-                                        ('edit', 'travel', 'section'): False,
-                                        ('edit', 'travel', 'start_date'): True,
-                                        ('edit', 'travel', 'status'): False,
-                                        ('edit', 'travel', 'supervisor'): False,
-                                        ('edit', 'travel', 'ta_required'): False,
-                                        ('edit', 'travel', 'traveler'): False,
-                                        ('view', 'action_points', 'action_point_number'): True,
-                                        ('view', 'action_points', 'actions_taken'): True,
-                                        ('view', 'action_points', 'comments'): True,
-                                        ('view', 'action_points', 'completed_at'): True,
-                                        ('view', 'action_points', 'created_at'): True,
-                                        ('view', 'action_points', 'description'): True,
-                                        ('view', 'action_points', 'due_date'): True,
-                                        ('view', 'action_points', 'follow_up'): True,
-                                        ('view', 'action_points', 'id'): True,
-                                        ('view', 'action_points', 'person_responsible'): True,
-                                        ('view', 'action_points', 'status'): True,
-                                        ('view', 'action_points', 'trip_reference_number'): True,
-                                        ('view', 'activities', 'date'): True,
-                                        ('view', 'activities', 'id'): True,
-                                        ('view', 'activities', 'locations'): True,
-                                        ('view', 'activities', 'partner'): True,
-                                        ('view', 'activities', 'partnership'): True,
-                                        ('view', 'activities', 'primary_traveler'): True,
-                                        ('view', 'activities', 'result'): True,
-                                        ('view', 'activities', 'travel_type'): True,
-                                        ('view', 'clearances', 'id'): True,
-                                        ('view', 'clearances', 'medical_clearance'): True,
-                                        ('view', 'clearances', 'security_clearance'): True,
-                                        ('view', 'clearances', 'security_course'): True,
-                                        ('view', 'cost_assignments', 'business_area'): True,
-                                        ('view', 'cost_assignments', 'delegate'): True,
-                                        ('view', 'cost_assignments', 'fund'): True,
-                                        ('view', 'cost_assignments', 'grant'): True,
-                                        ('view', 'cost_assignments', 'id'): True,
-                                        ('view', 'cost_assignments', 'share'): True,
-                                        ('view', 'cost_assignments', 'wbs'): True,
-                                        ('view', 'deductions', 'accomodation'): True,
-                                        ('view', 'deductions', 'breakfast'): True,
-                                        ('view', 'deductions', 'date'): True,
-                                        ('view', 'deductions', 'day_of_the_week'): True,
-                                        ('view', 'deductions', 'dinner'): True,
-                                        ('view', 'deductions', 'id'): True,
-                                        ('view', 'deductions', 'lunch'): True,
-                                        ('view', 'deductions', 'no_dsa'): True,
-                                        ('view', 'expenses', 'account_currency'): True,
-                                        ('view', 'expenses', 'amount'): True,
-                                        ('view', 'expenses', 'document_currency'): True,
-                                        ('view', 'expenses', 'id'): True,
-                                        ('view', 'expenses', 'type'): True,
-                                        ('view', 'itinerary', 'airlines'): True,
-                                        ('view', 'itinerary', 'arrival_date'): True,
-                                        ('view', 'itinerary', 'departure_date'): True,
-                                        ('view', 'itinerary', 'destination'): True,
-                                        ('view', 'itinerary', 'dsa_region'): True,
-                                        ('view', 'itinerary', 'id'): True,
-                                        ('view', 'itinerary', 'mode_of_travel'): True,
-                                        ('view', 'itinerary', 'origin'): True,
-                                        ('view', 'itinerary', 'overnight_travel'): True,
-                                        ('view', 'travel', 'action_points'): True,
-                                        ('view', 'travel', 'activities'): True,
-                                        ('view', 'travel', 'clearances'): True,
-                                        ('view', 'travel', 'cost_assignments'): True,
-                                        ('view', 'travel', 'cost_summary'): True,
-                                        ('view', 'travel', 'currency'): True,
-                                        ('view', 'travel', 'deductions'): True,
-                                        ('view', 'travel', 'end_date'): True,
-                                        ('view', 'travel', 'expenses'): True,
-                                        ('view', 'travel', 'id'): True,
-                                        ('view', 'travel', 'international_travel'): True,
-                                        ('view', 'travel', 'itinerary'): True,
-                                        ('view', 'travel', 'office'): True,
-                                        ('view', 'travel', 'purpose'): True,
-                                        ('view', 'travel', 'reference_number'): True,
-                                        ('view', 'travel', 'report'): True,
-                                        ('view', 'travel', 'section'): True,
-                                        ('view', 'travel', 'start_date'): True,
-                                        ('view', 'travel', 'status'): True,
-                                        ('view', 'travel', 'supervisor'): True,
-                                        ('view', 'travel', 'ta_required'): True,
-                                        ('view', 'travel', 'traveler'): True},
-                                       'rejected':
-                                       {('edit', 'action_points', 'action_point_number'): True,
-                                        ('edit', 'action_points', 'actions_taken'): True,
-                                        ('edit', 'action_points', 'comments'): True,
-                                        ('edit', 'action_points', 'completed_at'): True,
-                                        ('edit', 'action_points', 'created_at'): True,
-                                        ('edit', 'action_points', 'description'): True,
-                                        ('edit', 'action_points', 'due_date'): True,
-                                        ('edit', 'action_points', 'follow_up'): True,
-                                        ('edit', 'action_points', 'id'): True,
-                                        ('edit', 'action_points', 'person_responsible'): True,
-                                        ('edit', 'action_points', 'status'): True,
-                                        ('edit', 'action_points', 'trip_reference_number'): True,
-                                        ('edit', 'activities', 'date'): False,
-                                        ('edit', 'activities', 'id'): False,
-                                        ('edit', 'activities', 'locations'): False,
-                                        ('edit', 'activities', 'partner'): False,
-                                        ('edit', 'activities', 'partnership'): False,
-                                        ('edit', 'activities', 'primary_traveler'): False,
-                                        ('edit', 'activities', 'result'): False,
-                                        ('edit', 'activities', 'travel_type'): False,
-                                        ('edit', 'clearances', 'id'): False,
-                                        ('edit', 'clearances', 'medical_clearance'): False,
-                                        ('edit', 'clearances', 'security_clearance'): False,
-                                        ('edit', 'clearances', 'security_course'): False,
-                                        ('edit', 'cost_assignments', 'business_area'): True,
-                                        ('edit', 'cost_assignments', 'delegate'): True,
-                                        ('edit', 'cost_assignments', 'fund'): True,
-                                        ('edit', 'cost_assignments', 'grant'): True,
-                                        ('edit', 'cost_assignments', 'id'): True,
-                                        ('edit', 'cost_assignments', 'share'): True,
-                                        ('edit', 'cost_assignments', 'wbs'): True,
-                                        ('edit', 'deductions', 'accomodation'): True,
-                                        ('edit', 'deductions', 'breakfast'): True,
-                                        ('edit', 'deductions', 'date'): True,
-                                        ('edit', 'deductions', 'day_of_the_week'): True,
-                                        ('edit', 'deductions', 'dinner'): True,
-                                        ('edit', 'deductions', 'id'): True,
-                                        ('edit', 'deductions', 'lunch'): True,
-                                        ('edit', 'deductions', 'no_dsa'): True,
-                                        ('edit', 'expenses', 'account_currency'): True,
-                                        ('edit', 'expenses', 'amount'): True,
-                                        ('edit', 'expenses', 'document_currency'): True,
-                                        ('edit', 'expenses', 'id'): True,
-                                        ('edit', 'expenses', 'type'): True,
-                                        ('edit', 'itinerary', 'airlines'): True,
-                                        ('edit', 'itinerary', 'arrival_date'): True,
-                                        ('edit', 'itinerary', 'departure_date'): True,
-                                        ('edit', 'itinerary', 'destination'): True,
-                                        ('edit', 'itinerary', 'dsa_region'): True,
-                                        ('edit', 'itinerary', 'id'): True,
-                                        ('edit', 'itinerary', 'mode_of_travel'): True,
-                                        ('edit', 'itinerary', 'origin'): True,
-                                        ('edit', 'itinerary', 'overnight_travel'): True,
-                                        ('edit', 'travel', 'action_points'): True,
-                                        ('edit', 'travel', 'activities'): False,
-                                        ('edit', 'travel', 'clearances'): False,
-                                        ('edit', 'travel', 'cost_assignments'): True,
-                                        ('edit', 'travel', 'cost_summary'): False,
-                                        ('edit', 'travel', 'currency'): True,
-                                        ('edit', 'travel', 'deductions'): True,
-                                        ('edit', 'travel', 'end_date'): True,
-                                        ('edit', 'travel', 'expenses'): True,
-                                        ('edit', 'travel', 'id'): False,
-                                        ('edit', 'travel', 'international_travel'): False,
-                                        ('edit', 'travel', 'itinerary'): True,
-                                        ('edit', 'travel', 'office'): False,
-                                        ('edit', 'travel', 'purpose'): False,
-                                        ('edit', 'travel', 'reference_number'): False,
-                                        ('edit', 'travel', 'report'): False,
-                                        ('edit', 'travel', 'section'): False,
-                                        ('edit', 'travel', 'start_date'): True,
-                                        ('edit', 'travel', 'status'): False,
-                                        ('edit', 'travel', 'supervisor'): False,
-                                        ('edit', 'travel', 'ta_required'): False,
-                                        ('edit', 'travel', 'traveler'): False,
-                                        ('view', 'action_points', 'action_point_number'): True,
-                                        ('view', 'action_points', 'actions_taken'): True,
-                                        ('view', 'action_points', 'comments'): True,
-                                        ('view', 'action_points', 'completed_at'): True,
-                                        ('view', 'action_points', 'created_at'): True,
-                                        ('view', 'action_points', 'description'): True,
-                                        ('view', 'action_points', 'due_date'): True,
-                                        ('view', 'action_points', 'follow_up'): True,
-                                        ('view', 'action_points', 'id'): True,
-                                        ('view', 'action_points', 'person_responsible'): True,
-                                        ('view', 'action_points', 'status'): True,
-                                        ('view', 'action_points', 'trip_reference_number'): True,
-                                        ('view', 'activities', 'date'): True,
-                                        ('view', 'activities', 'id'): True,
-                                        ('view', 'activities', 'locations'): True,
-                                        ('view', 'activities', 'partner'): True,
-                                        ('view', 'activities', 'partnership'): True,
-                                        ('view', 'activities', 'primary_traveler'): True,
-                                        ('view', 'activities', 'result'): True,
-                                        ('view', 'activities', 'travel_type'): True,
-                                        ('view', 'clearances', 'id'): True,
-                                        ('view', 'clearances', 'medical_clearance'): True,
-                                        ('view', 'clearances', 'security_clearance'): True,
-                                        ('view', 'clearances', 'security_course'): True,
-                                        ('view', 'cost_assignments', 'business_area'): True,
-                                        ('view', 'cost_assignments', 'delegate'): True,
-                                        ('view', 'cost_assignments', 'fund'): True,
-                                        ('view', 'cost_assignments', 'grant'): True,
-                                        ('view', 'cost_assignments', 'id'): True,
-                                        ('view', 'cost_assignments', 'share'): True,
-                                        ('view', 'cost_assignments', 'wbs'): True,
-                                        ('view', 'deductions', 'accomodation'): True,
-                                        ('view', 'deductions', 'breakfast'): True,
-                                        ('view', 'deductions', 'date'): True,
-                                        ('view', 'deductions', 'day_of_the_week'): True,
-                                        ('view', 'deductions', 'dinner'): True,
-                                        ('view', 'deductions', 'id'): True,
-                                        ('view', 'deductions', 'lunch'): True,
-                                        ('view', 'deductions', 'no_dsa'): True,
-                                        ('view', 'expenses', 'account_currency'): True,
-                                        ('view', 'expenses', 'amount'): True,
-                                        ('view', 'expenses', 'document_currency'): True,
-                                        ('view', 'expenses', 'id'): True,
-                                        ('view', 'expenses', 'type'): True,
-                                        ('view', 'itinerary', 'airlines'): True,
-                                        ('view', 'itinerary', 'arrival_date'): True,
-                                        ('view', 'itinerary', 'departure_date'): True,
-                                        ('view', 'itinerary', 'destination'): True,
-                                        ('view', 'itinerary', 'dsa_region'): True,
-                                        ('view', 'itinerary', 'id'): True,
-                                        ('view', 'itinerary', 'mode_of_travel'): True,
-                                        ('view', 'itinerary', 'origin'): True,
-                                        ('view', 'itinerary', 'overnight_travel'): True,
-                                        ('view', 'travel', 'action_points'): True,
-                                        ('view', 'travel', 'activities'): True,
-                                        ('view', 'travel', 'clearances'): True,
-                                        ('view', 'travel', 'cost_assignments'): True,
-                                        ('view', 'travel', 'cost_summary'): True,
-                                        ('view', 'travel', 'currency'): True,
-                                        ('view', 'travel', 'deductions'): True,
-                                        ('view', 'travel', 'end_date'): True,
-                                        ('view', 'travel', 'expenses'): True,
-                                        ('view', 'travel', 'id'): True,
-                                        ('view', 'travel', 'international_travel'): True,
-                                        ('view', 'travel', 'itinerary'): True,
-                                        ('view', 'travel', 'office'): True,
-                                        ('view', 'travel', 'purpose'): True,
-                                        ('view', 'travel', 'reference_number'): True,
-                                        ('view', 'travel', 'report'): True,
-                                        ('view', 'travel', 'section'): True,
-                                        ('view', 'travel', 'start_date'): True,
-                                        ('view', 'travel', 'status'): True,
-                                        ('view', 'travel', 'supervisor'): True,
-                                        ('view', 'travel', 'ta_required'): True,
-                                        ('view', 'travel', 'traveler'): True},
-                                       'submitted':
-                                       {('edit', 'action_points', 'action_point_number'): True,
-                                        ('edit', 'action_points', 'actions_taken'): True,
-                                        ('edit', 'action_points', 'comments'): True,
-                                        ('edit', 'action_points', 'completed_at'): True,
-                                        ('edit', 'action_points', 'created_at'): True,
-                                        ('edit', 'action_points', 'description'): True,
-                                        ('edit', 'action_points', 'due_date'): True,
-                                        ('edit', 'action_points', 'follow_up'): True,
-                                        ('edit', 'action_points', 'id'): True,
-                                        ('edit', 'action_points', 'person_responsible'): True,
-                                        ('edit', 'action_points', 'status'): True,
-                                        ('edit', 'action_points', 'trip_reference_number'): True,
-                                        ('edit', 'activities', 'date'): False,
-                                        ('edit', 'activities', 'id'): False,
-                                        ('edit', 'activities', 'locations'): False,
-                                        ('edit', 'activities', 'partner'): False,
-                                        ('edit', 'activities', 'partnership'): False,
-                                        ('edit', 'activities', 'primary_traveler'): False,
-                                        ('edit', 'activities', 'result'): False,
-                                        ('edit', 'activities', 'travel_type'): False,
-                                        ('edit', 'clearances', 'id'): False,
-                                        ('edit', 'clearances', 'medical_clearance'): False,
-                                        ('edit', 'clearances', 'security_clearance'): False,
-                                        ('edit', 'clearances', 'security_course'): False,
-                                        ('edit', 'cost_assignments', 'business_area'): True,
-                                        ('edit', 'cost_assignments', 'delegate'): True,
-                                        ('edit', 'cost_assignments', 'fund'): True,
-                                        ('edit', 'cost_assignments', 'grant'): True,
-                                        ('edit', 'cost_assignments', 'id'): True,
-                                        ('edit', 'cost_assignments', 'share'): True,
-                                        ('edit', 'cost_assignments', 'wbs'): True,
-                                        ('edit', 'deductions', 'accomodation'): True,
-                                        ('edit', 'deductions', 'breakfast'): True,
-                                        ('edit', 'deductions', 'date'): True,
-                                        ('edit', 'deductions', 'day_of_the_week'): True,
-                                        ('edit', 'deductions', 'dinner'): True,
-                                        ('edit', 'deductions', 'id'): True,
-                                        ('edit', 'deductions', 'lunch'): True,
-                                        ('edit', 'deductions', 'no_dsa'): True,
-                                        ('edit', 'expenses', 'account_currency'): True,
-                                        ('edit', 'expenses', 'amount'): True,
-                                        ('edit', 'expenses', 'document_currency'): True,
-                                        ('edit', 'expenses', 'id'): True,
-                                        ('edit', 'expenses', 'type'): True,
-                                        ('edit', 'itinerary', 'airlines'): True,
-                                        ('edit', 'itinerary', 'arrival_date'): True,
-                                        ('edit', 'itinerary', 'departure_date'): True,
-                                        ('edit', 'itinerary', 'destination'): True,
-                                        ('edit', 'itinerary', 'dsa_region'): True,
-                                        ('edit', 'itinerary', 'id'): True,
-                                        ('edit', 'itinerary', 'mode_of_travel'): True,
-                                        ('edit', 'itinerary', 'origin'): True,
-                                        ('edit', 'itinerary', 'overnight_travel'): True,
-                                        ('edit', 'travel', 'action_points'): True,
-                                        ('edit', 'travel', 'activities'): False,
-                                        ('edit', 'travel', 'clearances'): False,
-                                        ('edit', 'travel', 'cost_assignments'): True,
-                                        ('edit', 'travel', 'cost_summary'): False,
-                                        ('edit', 'travel', 'currency'): True,
-                                        ('edit', 'travel', 'deductions'): True,
-                                        ('edit', 'travel', 'end_date'): True,
-                                        ('edit', 'travel', 'expenses'): True,
-                                        ('edit', 'travel', 'id'): False,
-                                        ('edit', 'travel', 'international_travel'): False,
-                                        ('edit', 'travel', 'itinerary'): True,
-                                        ('edit', 'travel', 'office'): False,
-                                        ('edit', 'travel', 'purpose'): False,
-                                        ('edit', 'travel', 'reference_number'): False,
-                                        ('edit', 'travel', 'report'): False,
-                                        ('edit', 'travel', 'section'): False,
-                                        ('edit', 'travel', 'start_date'): True,
-                                        ('edit', 'travel', 'status'): False,
-                                        ('edit', 'travel', 'supervisor'): False,
-                                        ('edit', 'travel', 'ta_required'): False,
-                                        ('edit', 'travel', 'traveler'): False,
-                                        ('view', 'action_points', 'action_point_number'): True,
-                                        ('view', 'action_points', 'actions_taken'): True,
-                                        ('view', 'action_points', 'comments'): True,
-                                        ('view', 'action_points', 'completed_at'): True,
-                                        ('view', 'action_points', 'created_at'): True,
-                                        ('view', 'action_points', 'description'): True,
-                                        ('view', 'action_points', 'due_date'): True,
-                                        ('view', 'action_points', 'follow_up'): True,
-                                        ('view', 'action_points', 'id'): True,
-                                        ('view', 'action_points', 'person_responsible'): True,
-                                        ('view', 'action_points', 'status'): True,
-                                        ('view', 'action_points', 'trip_reference_number'): True,
-                                        ('view', 'activities', 'date'): True,
-                                        ('view', 'activities', 'id'): True,
-                                        ('view', 'activities', 'locations'): True,
-                                        ('view', 'activities', 'partner'): True,
-                                        ('view', 'activities', 'partnership'): True,
-                                        ('view', 'activities', 'primary_traveler'): True,
-                                        ('view', 'activities', 'result'): True,
-                                        ('view', 'activities', 'travel_type'): True,
-                                        ('view', 'clearances', 'id'): True,
-                                        ('view', 'clearances', 'medical_clearance'): True,
-                                        ('view', 'clearances', 'security_clearance'): True,
-                                        ('view', 'clearances', 'security_course'): True,
-                                        ('view', 'cost_assignments', 'business_area'): True,
-                                        ('view', 'cost_assignments', 'delegate'): True,
-                                        ('view', 'cost_assignments', 'fund'): True,
-                                        ('view', 'cost_assignments', 'grant'): True,
-                                        ('view', 'cost_assignments', 'id'): True,
-                                        ('view', 'cost_assignments', 'share'): True,
-                                        ('view', 'cost_assignments', 'wbs'): True,
-                                        ('view', 'deductions', 'accomodation'): True,
-                                        ('view', 'deductions', 'breakfast'): True,
-                                        ('view', 'deductions', 'date'): True,
-                                        ('view', 'deductions', 'day_of_the_week'): True,
-                                        ('view', 'deductions', 'dinner'): True,
-                                        ('view', 'deductions', 'id'): True,
-                                        ('view', 'deductions', 'lunch'): True,
-                                        ('view', 'deductions', 'no_dsa'): True,
-                                        ('view', 'expenses', 'account_currency'): True,
-                                        ('view', 'expenses', 'amount'): True,
-                                        ('view', 'expenses', 'document_currency'): True,
-                                        ('view', 'expenses', 'id'): True,
-                                        ('view', 'expenses', 'type'): True,
-                                        ('view', 'itinerary', 'airlines'): True,
-                                        ('view', 'itinerary', 'arrival_date'): True,
-                                        ('view', 'itinerary', 'departure_date'): True,
-                                        ('view', 'itinerary', 'destination'): True,
-                                        ('view', 'itinerary', 'dsa_region'): True,
-                                        ('view', 'itinerary', 'id'): True,
-                                        ('view', 'itinerary', 'mode_of_travel'): True,
-                                        ('view', 'itinerary', 'origin'): True,
-                                        ('view', 'itinerary', 'overnight_travel'): True,
-                                        ('view', 'travel', 'action_points'): True,
-                                        ('view', 'travel', 'activities'): True,
-                                        ('view', 'travel', 'clearances'): True,
-                                        ('view', 'travel', 'cost_assignments'): True,
-                                        ('view', 'travel', 'cost_summary'): True,
-                                        ('view', 'travel', 'currency'): True,
-                                        ('view', 'travel', 'deductions'): True,
-                                        ('view', 'travel', 'end_date'): True,
-                                        ('view', 'travel', 'expenses'): True,
-                                        ('view', 'travel', 'id'): True,
-                                        ('view', 'travel', 'international_travel'): True,
-                                        ('view', 'travel', 'itinerary'): True,
-                                        ('view', 'travel', 'office'): True,
-                                        ('view', 'travel', 'purpose'): True,
-                                        ('view', 'travel', 'reference_number'): True,
-                                        ('view', 'travel', 'report'): True,
-                                        ('view', 'travel', 'section'): True,
-                                        ('view', 'travel', 'start_date'): True,
-                                        ('view', 'travel', 'status'): True,
-                                        ('view', 'travel', 'supervisor'): True,
-                                        ('view', 'travel', 'ta_required'): True,
-                                        ('view', 'travel', 'traveler'): True}},
-               'God': {'approved':
-                       {('edit', 'action_points', 'action_point_number'): True,
-                        ('edit', 'action_points', 'actions_taken'): True,
-                        ('edit', 'action_points', 'comments'): True,
-                        ('edit', 'action_points', 'completed_at'): True,
-                        ('edit', 'action_points', 'created_at'): True,
-                        ('edit', 'action_points', 'description'): True,
-                        ('edit', 'action_points', 'due_date'): True,
-                        ('edit', 'action_points', 'follow_up'): True,
-                        ('edit', 'action_points', 'id'): True,
-                        ('edit', 'action_points', 'person_responsible'): True,
-                        ('edit', 'action_points', 'status'): True,
-                        ('edit', 'action_points', 'trip_reference_number'): True,
-                        ('edit', 'activities', 'date'): True,
-                        ('edit', 'activities', 'id'): True,
-                        ('edit', 'activities', 'locations'): True,
-                        ('edit', 'activities', 'partner'): True,
-                        ('edit', 'activities', 'partnership'): True,
-                        ('edit', 'activities', 'primary_traveler'): True,
-                        ('edit', 'activities', 'result'): True,
-                        ('edit', 'activities', 'travel_type'): True,
-                        ('edit', 'clearances', 'id'): True,
-                        ('edit', 'clearances', 'medical_clearance'): True,
-                        ('edit', 'clearances', 'security_clearance'): True,
-                        ('edit', 'clearances', 'security_course'): True,
-                        ('edit', 'cost_assignments', 'business_area'): True,
-                        ('edit', 'cost_assignments', 'delegate'): True,
-                        ('edit', 'cost_assignments', 'fund'): True,
-                        ('edit', 'cost_assignments', 'grant'): True,
-                        ('edit', 'cost_assignments', 'id'): True,
-                        ('edit', 'cost_assignments', 'share'): True,
-                        ('edit', 'cost_assignments', 'wbs'): True,
-                        ('edit', 'deductions', 'accomodation'): True,
-                        ('edit', 'deductions', 'breakfast'): True,
-                        ('edit', 'deductions', 'date'): True,
-                        ('edit', 'deductions', 'day_of_the_week'): True,
-                        ('edit', 'deductions', 'dinner'): True,
-                        ('edit', 'deductions', 'id'): True,
-                        ('edit', 'deductions', 'lunch'): True,
-                        ('edit', 'deductions', 'no_dsa'): True,
-                        ('edit', 'expenses', 'account_currency'): True,
-                        ('edit', 'expenses', 'amount'): True,
-                        ('edit', 'expenses', 'document_currency'): True,
-                        ('edit', 'expenses', 'id'): True,
-                        ('edit', 'expenses', 'type'): True,
-                        ('edit', 'itinerary', 'airlines'): True,
-                        ('edit', 'itinerary', 'arrival_date'): True,
-                        ('edit', 'itinerary', 'departure_date'): True,
-                        ('edit', 'itinerary', 'destination'): True,
-                        ('edit', 'itinerary', 'dsa_region'): True,
-                        ('edit', 'itinerary', 'id'): True,
-                        ('edit', 'itinerary', 'mode_of_travel'): True,
-                        ('edit', 'itinerary', 'origin'): True,
-                        ('edit', 'itinerary', 'overnight_travel'): True,
-                        ('edit', 'travel', 'action_points'): True,
-                        ('edit', 'travel', 'activities'): True,
-                        ('edit', 'travel', 'clearances'): True,
-                        ('edit', 'travel', 'cost_assignments'): True,
-                        ('edit', 'travel', 'cost_summary'): True,
-                        ('edit', 'travel', 'currency'): True,
-                        ('edit', 'travel', 'deductions'): True,
-                        ('edit', 'travel', 'end_date'): True,
-                        ('edit', 'travel', 'expenses'): True,
-                        ('edit', 'travel', 'id'): True,
-                        ('edit', 'travel', 'international_travel'): True,
-                        ('edit', 'travel', 'itinerary'): True,
-                        ('edit', 'travel', 'office'): True,
-                        ('edit', 'travel', 'purpose'): True,
-                        ('edit', 'travel', 'reference_number'): True,
-                        ('edit', 'travel', 'report'): True,
-                        ('edit', 'travel', 'section'): True,
-                        ('edit', 'travel', 'start_date'): True,
-                        ('edit', 'travel', 'status'): True,
-                        ('edit', 'travel', 'supervisor'): True,
-                        ('edit', 'travel', 'ta_required'): True,
-                        ('edit', 'travel', 'traveler'): True,
-                        ('view', 'action_points', 'action_point_number'): True,
-                        ('view', 'action_points', 'actions_taken'): True,
-                        ('view', 'action_points', 'comments'): True,
-                        ('view', 'action_points', 'completed_at'): True,
-                        ('view', 'action_points', 'created_at'): True,
-                        ('view', 'action_points', 'description'): True,
-                        ('view', 'action_points', 'due_date'): True,
-                        ('view', 'action_points', 'follow_up'): True,
-                        ('view', 'action_points', 'id'): True,
-                        ('view', 'action_points', 'person_responsible'): True,
-                        ('view', 'action_points', 'status'): True,
-                        ('view', 'action_points', 'trip_reference_number'): True,
-                        ('view', 'activities', 'date'): True,
-                        ('view', 'activities', 'id'): True,
-                        ('view', 'activities', 'locations'): True,
-                        ('view', 'activities', 'partner'): True,
-                        ('view', 'activities', 'partnership'): True,
-                        ('view', 'activities', 'primary_traveler'): True,
-                        ('view', 'activities', 'result'): True,
-                        ('view', 'activities', 'travel_type'): True,
-                        ('view', 'clearances', 'id'): True,
-                        ('view', 'clearances', 'medical_clearance'): True,
-                        ('view', 'clearances', 'security_clearance'): True,
-                        ('view', 'clearances', 'security_course'): True,
-                        ('view', 'cost_assignments', 'business_area'): True,
-                        ('view', 'cost_assignments', 'delegate'): True,
-                        ('view', 'cost_assignments', 'fund'): True,
-                        ('view', 'cost_assignments', 'grant'): True,
-                        ('view', 'cost_assignments', 'id'): True,
-                        ('view', 'cost_assignments', 'share'): True,
-                        ('view', 'cost_assignments', 'wbs'): True,
-                        ('view', 'deductions', 'accomodation'): True,
-                        ('view', 'deductions', 'breakfast'): True,
-                        ('view', 'deductions', 'date'): True,
-                        ('view', 'deductions', 'day_of_the_week'): True,
-                        ('view', 'deductions', 'dinner'): True,
-                        ('view', 'deductions', 'id'): True,
-                        ('view', 'deductions', 'lunch'): True,
-                        ('view', 'deductions', 'no_dsa'): True,
-                        ('view', 'expenses', 'account_currency'): True,
-                        ('view', 'expenses', 'amount'): True,
-                        ('view', 'expenses', 'document_currency'): True,
-                        ('view', 'expenses', 'id'): True,
-                        ('view', 'expenses', 'type'): True,
-                        ('view', 'itinerary', 'airlines'): True,
-                        ('view', 'itinerary', 'arrival_date'): True,
-                        ('view', 'itinerary', 'departure_date'): True,
-                        ('view', 'itinerary', 'destination'): True,
-                        ('view', 'itinerary', 'dsa_region'): True,
-                        ('view', 'itinerary', 'id'): True,
-                        ('view', 'itinerary', 'mode_of_travel'): True,
-                        ('view', 'itinerary', 'origin'): True,
-                        ('view', 'itinerary', 'overnight_travel'): True,
-                        ('view', 'travel', 'action_points'): True,
-                        ('view', 'travel', 'activities'): True,
-                        ('view', 'travel', 'clearances'): True,
-                        ('view', 'travel', 'cost_assignments'): True,
-                        ('view', 'travel', 'cost_summary'): True,
-                        ('view', 'travel', 'currency'): True,
-                        ('view', 'travel', 'deductions'): True,
-                        ('view', 'travel', 'end_date'): True,
-                        ('view', 'travel', 'expenses'): True,
-                        ('view', 'travel', 'id'): True,
-                        ('view', 'travel', 'international_travel'): True,
-                        ('view', 'travel', 'itinerary'): True,
-                        ('view', 'travel', 'office'): True,
-                        ('view', 'travel', 'purpose'): True,
-                        ('view', 'travel', 'reference_number'): True,
-                        ('view', 'travel', 'report'): True,
-                        ('view', 'travel', 'section'): True,
-                        ('view', 'travel', 'start_date'): True,
-                        ('view', 'travel', 'status'): True,
-                        ('view', 'travel', 'supervisor'): True,
-                        ('view', 'travel', 'ta_required'): True,
-                        ('view', 'travel', 'traveler'): True},
-                       'cancelled':
-                       {('edit', 'action_points', 'action_point_number'): True,
-                        ('edit', 'action_points', 'actions_taken'): True,
-                        ('edit', 'action_points', 'comments'): True,
-                        ('edit', 'action_points', 'completed_at'): True,
-                        ('edit', 'action_points', 'created_at'): True,
-                        ('edit', 'action_points', 'description'): True,
-                        ('edit', 'action_points', 'due_date'): True,
-                        ('edit', 'action_points', 'follow_up'): True,
-                        ('edit', 'action_points', 'id'): True,
-                        ('edit', 'action_points', 'person_responsible'): True,
-                        ('edit', 'action_points', 'status'): True,
-                        ('edit', 'action_points', 'trip_reference_number'): True,
-                        ('edit', 'activities', 'date'): True,
-                        ('edit', 'activities', 'id'): True,
-                        ('edit', 'activities', 'locations'): True,
-                        ('edit', 'activities', 'partner'): True,
-                        ('edit', 'activities', 'partnership'): True,
-                        ('edit', 'activities', 'primary_traveler'): True,
-                        ('edit', 'activities', 'result'): True,
-                        ('edit', 'activities', 'travel_type'): True,
-                        ('edit', 'clearances', 'id'): True,
-                        ('edit', 'clearances', 'medical_clearance'): True,
-                        ('edit', 'clearances', 'security_clearance'): True,
-                        ('edit', 'clearances', 'security_course'): True,
-                        ('edit', 'cost_assignments', 'business_area'): True,
-                        ('edit', 'cost_assignments', 'delegate'): True,
-                        ('edit', 'cost_assignments', 'fund'): True,
-                        ('edit', 'cost_assignments', 'grant'): True,
-                        ('edit', 'cost_assignments', 'id'): True,
-                        ('edit', 'cost_assignments', 'share'): True,
-                        ('edit', 'cost_assignments', 'wbs'): True,
-                        ('edit', 'deductions', 'accomodation'): True,
-                        ('edit', 'deductions', 'breakfast'): True,
-                        ('edit', 'deductions', 'date'): True,
-                        ('edit', 'deductions', 'day_of_the_week'): True,
-                        ('edit', 'deductions', 'dinner'): True,
-                        ('edit', 'deductions', 'id'): True,
-                        ('edit', 'deductions', 'lunch'): True,
-                        ('edit', 'deductions', 'no_dsa'): True,
-                        ('edit', 'expenses', 'account_currency'): True,
-                        ('edit', 'expenses', 'amount'): True,
-                        ('edit', 'expenses', 'document_currency'): True,
-                        ('edit', 'expenses', 'id'): True,
-                        ('edit', 'expenses', 'type'): True,
-                        ('edit', 'itinerary', 'airlines'): True,
-                        ('edit', 'itinerary', 'arrival_date'): True,
-                        ('edit', 'itinerary', 'departure_date'): True,
-                        ('edit', 'itinerary', 'destination'): True,
-                        ('edit', 'itinerary', 'dsa_region'): True,
-                        ('edit', 'itinerary', 'id'): True,
-                        ('edit', 'itinerary', 'mode_of_travel'): True,
-                        ('edit', 'itinerary', 'origin'): True,
-                        ('edit', 'itinerary', 'overnight_travel'): True,
-                        ('edit', 'travel', 'action_points'): True,
-                        ('edit', 'travel', 'activities'): True,
-                        ('edit', 'travel', 'clearances'): True,
-                        ('edit', 'travel', 'cost_assignments'): True,
-                        ('edit', 'travel', 'cost_summary'): True,
-                        ('edit', 'travel', 'currency'): True,
-                        ('edit', 'travel', 'deductions'): True,
-                        ('edit', 'travel', 'end_date'): True,
-                        ('edit', 'travel', 'expenses'): True,
-                        ('edit', 'travel', 'id'): True,
-                        ('edit', 'travel', 'international_travel'): True,
-                        ('edit', 'travel', 'itinerary'): True,
-                        ('edit', 'travel', 'office'): True,
-                        ('edit', 'travel', 'purpose'): True,
-                        ('edit', 'travel', 'reference_number'): True,
-                        ('edit', 'travel', 'report'): True,
-                        ('edit', 'travel', 'section'): True,
-                        ('edit', 'travel', 'start_date'): True,
-                        ('edit', 'travel', 'status'): True,
-                        ('edit', 'travel', 'supervisor'): True,
-                        ('edit', 'travel', 'ta_required'): True,
-                        ('edit', 'travel', 'traveler'): True,
-                        ('view', 'action_points', 'action_point_number'): True,
-                        ('view', 'action_points', 'actions_taken'): True,
-                        ('view', 'action_points', 'comments'): True,
-                        ('view', 'action_points', 'completed_at'): True,
-                        ('view', 'action_points', 'created_at'): True,
-                        ('view', 'action_points', 'description'): True,
-                        ('view', 'action_points', 'due_date'): True,
-                        ('view', 'action_points', 'follow_up'): True,
-                        ('view', 'action_points', 'id'): True,
-                        ('view', 'action_points', 'person_responsible'): True,
-                        ('view', 'action_points', 'status'): True,
-                        ('view', 'action_points', 'trip_reference_number'): True,
-                        ('view', 'activities', 'date'): True,
-                        ('view', 'activities', 'id'): True,
-                        ('view', 'activities', 'locations'): True,
-                        ('view', 'activities', 'partner'): True,
-                        ('view', 'activities', 'partnership'): True,
-                        ('view', 'activities', 'primary_traveler'): True,
-                        ('view', 'activities', 'result'): True,
-                        ('view', 'activities', 'travel_type'): True,
-                        ('view', 'clearances', 'id'): True,
-                        ('view', 'clearances', 'medical_clearance'): True,
-                        ('view', 'clearances', 'security_clearance'): True,
-                        ('view', 'clearances', 'security_course'): True,
-                        ('view', 'cost_assignments', 'business_area'): True,
-                        ('view', 'cost_assignments', 'delegate'): True,
-                        ('view', 'cost_assignments', 'fund'): True,
-                        ('view', 'cost_assignments', 'grant'): True,
-                        ('view', 'cost_assignments', 'id'): True,
-                        ('view', 'cost_assignments', 'share'): True,
-                        ('view', 'cost_assignments', 'wbs'): True,
-                        ('view', 'deductions', 'accomodation'): True,
-                        ('view', 'deductions', 'breakfast'): True,
-                        ('view', 'deductions', 'date'): True,
-                        ('view', 'deductions', 'day_of_the_week'): True,
-                        ('view', 'deductions', 'dinner'): True,
-                        ('view', 'deductions', 'id'): True,
-                        ('view', 'deductions', 'lunch'): True,
-                        ('view', 'deductions', 'no_dsa'): True,
-                        ('view', 'expenses', 'account_currency'): True,
-                        ('view', 'expenses', 'amount'): True,
-                        ('view', 'expenses', 'document_currency'): True,
-                        ('view', 'expenses', 'id'): True,
-                        ('view', 'expenses', 'type'): True,
-                        ('view', 'itinerary', 'airlines'): True,
-                        ('view', 'itinerary', 'arrival_date'): True,
-                        ('view', 'itinerary', 'departure_date'): True,
-                        ('view', 'itinerary', 'destination'): True,
-                        ('view', 'itinerary', 'dsa_region'): True,
-                        ('view', 'itinerary', 'id'): True,
-                        ('view', 'itinerary', 'mode_of_travel'): True,
-                        ('view', 'itinerary', 'origin'): True,
-                        ('view', 'itinerary', 'overnight_travel'): True,
-                        ('view', 'travel', 'action_points'): True,
-                        ('view', 'travel', 'activities'): True,
-                        ('view', 'travel', 'clearances'): True,
-                        ('view', 'travel', 'cost_assignments'): True,
-                        ('view', 'travel', 'cost_summary'): True,
-                        ('view', 'travel', 'currency'): True,
-                        ('view', 'travel', 'deductions'): True,
-                        ('view', 'travel', 'end_date'): True,
-                        ('view', 'travel', 'expenses'): True,
-                        ('view', 'travel', 'id'): True,
-                        ('view', 'travel', 'international_travel'): True,
-                        ('view', 'travel', 'itinerary'): True,
-                        ('view', 'travel', 'office'): True,
-                        ('view', 'travel', 'purpose'): True,
-                        ('view', 'travel', 'reference_number'): True,
-                        ('view', 'travel', 'report'): True,
-                        ('view', 'travel', 'section'): True,
-                        ('view', 'travel', 'start_date'): True,
-                        ('view', 'travel', 'status'): True,
-                        ('view', 'travel', 'supervisor'): True,
-                        ('view', 'travel', 'ta_required'): True,
-                        ('view', 'travel', 'traveler'): True},
-                       'completed':
-                       {('edit', 'action_points', 'action_point_number'): True,
-                        ('edit', 'action_points', 'actions_taken'): True,
-                        ('edit', 'action_points', 'comments'): True,
-                        ('edit', 'action_points', 'completed_at'): True,
-                        ('edit', 'action_points', 'created_at'): True,
-                        ('edit', 'action_points', 'description'): True,
-                        ('edit', 'action_points', 'due_date'): True,
-                        ('edit', 'action_points', 'follow_up'): True,
-                        ('edit', 'action_points', 'id'): True,
-                        ('edit', 'action_points', 'person_responsible'): True,
-                        ('edit', 'action_points', 'status'): True,
-                        ('edit', 'action_points', 'trip_reference_number'): True,
-                        ('edit', 'activities', 'date'): True,
-                        ('edit', 'activities', 'id'): True,
-                        ('edit', 'activities', 'locations'): True,
-                        ('edit', 'activities', 'partner'): True,
-                        ('edit', 'activities', 'partnership'): True,
-                        ('edit', 'activities', 'primary_traveler'): True,
-                        ('edit', 'activities', 'result'): True,
-                        ('edit', 'activities', 'travel_type'): True,
-                        ('edit', 'clearances', 'id'): True,
-                        ('edit', 'clearances', 'medical_clearance'): True,
-                        ('edit', 'clearances', 'security_clearance'): True,
-                        ('edit', 'clearances', 'security_course'): True,
-                        ('edit', 'cost_assignments', 'business_area'): True,
-                        ('edit', 'cost_assignments', 'delegate'): True,
-                        ('edit', 'cost_assignments', 'fund'): True,
-                        ('edit', 'cost_assignments', 'grant'): True,
-                        ('edit', 'cost_assignments', 'id'): True,
-                        ('edit', 'cost_assignments', 'share'): True,
-                        ('edit', 'cost_assignments', 'wbs'): True,
-                        ('edit', 'deductions', 'accomodation'): True,
-                        ('edit', 'deductions', 'breakfast'): True,
-                        ('edit', 'deductions', 'date'): True,
-                        ('edit', 'deductions', 'day_of_the_week'): True,
-                        ('edit', 'deductions', 'dinner'): True,
-                        ('edit', 'deductions', 'id'): True,
-                        ('edit', 'deductions', 'lunch'): True,
-                        ('edit', 'deductions', 'no_dsa'): True,
-                        ('edit', 'expenses', 'account_currency'): True,
-                        ('edit', 'expenses', 'amount'): True,
-                        ('edit', 'expenses', 'document_currency'): True,
-                        ('edit', 'expenses', 'id'): True,
-                        ('edit', 'expenses', 'type'): True,
-                        ('edit', 'itinerary', 'airlines'): True,
-                        ('edit', 'itinerary', 'arrival_date'): True,
-                        ('edit', 'itinerary', 'departure_date'): True,
-                        ('edit', 'itinerary', 'destination'): True,
-                        ('edit', 'itinerary', 'dsa_region'): True,
-                        ('edit', 'itinerary', 'id'): True,
-                        ('edit', 'itinerary', 'mode_of_travel'): True,
-                        ('edit', 'itinerary', 'origin'): True,
-                        ('edit', 'itinerary', 'overnight_travel'): True,
-                        ('edit', 'travel', 'action_points'): True,
-                        ('edit', 'travel', 'activities'): True,
-                        ('edit', 'travel', 'clearances'): True,
-                        ('edit', 'travel', 'cost_assignments'): True,
-                        ('edit', 'travel', 'cost_summary'): True,
-                        ('edit', 'travel', 'currency'): True,
-                        ('edit', 'travel', 'deductions'): True,
-                        ('edit', 'travel', 'end_date'): True,
-                        ('edit', 'travel', 'expenses'): True,
-                        ('edit', 'travel', 'id'): True,
-                        ('edit', 'travel', 'international_travel'): True,
-                        ('edit', 'travel', 'itinerary'): True,
-                        ('edit', 'travel', 'office'): True,
-                        ('edit', 'travel', 'purpose'): True,
-                        ('edit', 'travel', 'reference_number'): True,
-                        ('edit', 'travel', 'report'): True,
-                        ('edit', 'travel', 'section'): True,
-                        ('edit', 'travel', 'start_date'): True,
-                        ('edit', 'travel', 'status'): True,
-                        ('edit', 'travel', 'supervisor'): True,
-                        ('edit', 'travel', 'ta_required'): True,
-                        ('edit', 'travel', 'traveler'): True,
-                        ('view', 'action_points', 'action_point_number'): True,
-                        ('view', 'action_points', 'actions_taken'): True,
-                        ('view', 'action_points', 'comments'): True,
-                        ('view', 'action_points', 'completed_at'): True,
-                        ('view', 'action_points', 'created_at'): True,
-                        ('view', 'action_points', 'description'): True,
-                        ('view', 'action_points', 'due_date'): True,
-                        ('view', 'action_points', 'follow_up'): True,
-                        ('view', 'action_points', 'id'): True,
-                        ('view', 'action_points', 'person_responsible'): True,
-                        ('view', 'action_points', 'status'): True,
-                        ('view', 'action_points', 'trip_reference_number'): True,
-                        ('view', 'activities', 'date'): True,
-                        ('view', 'activities', 'id'): True,
-                        ('view', 'activities', 'locations'): True,
-                        ('view', 'activities', 'partner'): True,
-                        ('view', 'activities', 'partnership'): True,
-                        ('view', 'activities', 'primary_traveler'): True,
-                        ('view', 'activities', 'result'): True,
-                        ('view', 'activities', 'travel_type'): True,
-                        ('view', 'clearances', 'id'): True,
-                        ('view', 'clearances', 'medical_clearance'): True,
-                        ('view', 'clearances', 'security_clearance'): True,
-                        ('view', 'clearances', 'security_course'): True,
-                        ('view', 'cost_assignments', 'business_area'): True,
-                        ('view', 'cost_assignments', 'delegate'): True,
-                        ('view', 'cost_assignments', 'fund'): True,
-                        ('view', 'cost_assignments', 'grant'): True,
-                        ('view', 'cost_assignments', 'id'): True,
-                        ('view', 'cost_assignments', 'share'): True,
-                        ('view', 'cost_assignments', 'wbs'): True,
-                        ('view', 'deductions', 'accomodation'): True,
-                        ('view', 'deductions', 'breakfast'): True,
-                        ('view', 'deductions', 'date'): True,
-                        ('view', 'deductions', 'day_of_the_week'): True,
-                        ('view', 'deductions', 'dinner'): True,
-                        ('view', 'deductions', 'id'): True,
-                        ('view', 'deductions', 'lunch'): True,
-                        ('view', 'deductions', 'no_dsa'): True,
-                        ('view', 'expenses', 'account_currency'): True,
-                        ('view', 'expenses', 'amount'): True,
-                        ('view', 'expenses', 'document_currency'): True,
-                        ('view', 'expenses', 'id'): True,
-                        ('view', 'expenses', 'type'): True,
-                        ('view', 'itinerary', 'airlines'): True,
-                        ('view', 'itinerary', 'arrival_date'): True,
-                        ('view', 'itinerary', 'departure_date'): True,
-                        ('view', 'itinerary', 'destination'): True,
-                        ('view', 'itinerary', 'dsa_region'): True,
-                        ('view', 'itinerary', 'id'): True,
-                        ('view', 'itinerary', 'mode_of_travel'): True,
-                        ('view', 'itinerary', 'origin'): True,
-                        ('view', 'itinerary', 'overnight_travel'): True,
-                        ('view', 'travel', 'action_points'): True,
-                        ('view', 'travel', 'activities'): True,
-                        ('view', 'travel', 'clearances'): True,
-                        ('view', 'travel', 'cost_assignments'): True,
-                        ('view', 'travel', 'cost_summary'): True,
-                        ('view', 'travel', 'currency'): True,
-                        ('view', 'travel', 'deductions'): True,
-                        ('view', 'travel', 'end_date'): True,
-                        ('view', 'travel', 'expenses'): True,
-                        ('view', 'travel', 'id'): True,
-                        ('view', 'travel', 'international_travel'): True,
-                        ('view', 'travel', 'itinerary'): True,
-                        ('view', 'travel', 'office'): True,
-                        ('view', 'travel', 'purpose'): True,
-                        ('view', 'travel', 'reference_number'): True,
-                        ('view', 'travel', 'report'): True,
-                        ('view', 'travel', 'section'): True,
-                        ('view', 'travel', 'start_date'): True,
-                        ('view', 'travel', 'status'): True,
-                        ('view', 'travel', 'supervisor'): True,
-                        ('view', 'travel', 'ta_required'): True,
-                        ('view', 'travel', 'traveler'): True},
-                       'planned':
-                       {('edit', 'action_points', 'action_point_number'): True,
-                        ('edit', 'action_points', 'actions_taken'): True,
-                        ('edit', 'action_points', 'comments'): True,
-                        ('edit', 'action_points', 'completed_at'): True,
-                        ('edit', 'action_points', 'created_at'): True,
-                        ('edit', 'action_points', 'description'): True,
-                        ('edit', 'action_points', 'due_date'): True,
-                        ('edit', 'action_points', 'follow_up'): True,
-                        ('edit', 'action_points', 'id'): True,
-                        ('edit', 'action_points', 'person_responsible'): True,
-                        ('edit', 'action_points', 'status'): True,
-                        ('edit', 'action_points', 'trip_reference_number'): True,
-                        ('edit', 'activities', 'date'): True,
-                        ('edit', 'activities', 'id'): True,
-                        ('edit', 'activities', 'locations'): True,
-                        ('edit', 'activities', 'partner'): True,
-                        ('edit', 'activities', 'partnership'): True,
-                        ('edit', 'activities', 'primary_traveler'): True,
-                        ('edit', 'activities', 'result'): True,
-                        ('edit', 'activities', 'travel_type'): True,
-                        ('edit', 'clearances', 'id'): True,
-                        ('edit', 'clearances', 'medical_clearance'): True,
-                        ('edit', 'clearances', 'security_clearance'): True,
-                        ('edit', 'clearances', 'security_course'): True,
-                        ('edit', 'cost_assignments', 'business_area'): True,
-                        ('edit', 'cost_assignments', 'delegate'): True,
-                        ('edit', 'cost_assignments', 'fund'): True,
-                        ('edit', 'cost_assignments', 'grant'): True,
-                        ('edit', 'cost_assignments', 'id'): True,
-                        ('edit', 'cost_assignments', 'share'): True,
-                        ('edit', 'cost_assignments', 'wbs'): True,
-                        ('edit', 'deductions', 'accomodation'): True,
-                        ('edit', 'deductions', 'breakfast'): True,
-                        ('edit', 'deductions', 'date'): True,
-                        ('edit', 'deductions', 'day_of_the_week'): True,
-                        ('edit', 'deductions', 'dinner'): True,
-                        ('edit', 'deductions', 'id'): True,
-                        ('edit', 'deductions', 'lunch'): True,
-                        ('edit', 'deductions', 'no_dsa'): True,
-                        ('edit', 'expenses', 'account_currency'): True,
-                        ('edit', 'expenses', 'amount'): True,
-                        ('edit', 'expenses', 'document_currency'): True,
-                        ('edit', 'expenses', 'id'): True,
-                        ('edit', 'expenses', 'type'): True,
-                        ('edit', 'itinerary', 'airlines'): True,
-                        ('edit', 'itinerary', 'arrival_date'): True,
-                        ('edit', 'itinerary', 'departure_date'): True,
-                        ('edit', 'itinerary', 'destination'): True,
-                        ('edit', 'itinerary', 'dsa_region'): True,
-                        ('edit', 'itinerary', 'id'): True,
-                        ('edit', 'itinerary', 'mode_of_travel'): True,
-                        ('edit', 'itinerary', 'origin'): True,
-                        ('edit', 'itinerary', 'overnight_travel'): True,
-                        ('edit', 'travel', 'action_points'): True,
-                        ('edit', 'travel', 'activities'): True,
-                        ('edit', 'travel', 'clearances'): True,
-                        ('edit', 'travel', 'cost_assignments'): True,
-                        ('edit', 'travel', 'cost_summary'): True,
-                        ('edit', 'travel', 'currency'): True,
-                        ('edit', 'travel', 'deductions'): True,
-                        ('edit', 'travel', 'end_date'): True,
-                        ('edit', 'travel', 'expenses'): True,
-                        ('edit', 'travel', 'id'): True,
-                        ('edit', 'travel', 'international_travel'): True,
-                        ('edit', 'travel', 'itinerary'): True,
-                        ('edit', 'travel', 'office'): True,
-                        ('edit', 'travel', 'purpose'): True,
-                        ('edit', 'travel', 'reference_number'): True,
-                        ('edit', 'travel', 'report'): True,
-                        ('edit', 'travel', 'section'): True,
-                        ('edit', 'travel', 'start_date'): True,
-                        ('edit', 'travel', 'status'): True,
-                        ('edit', 'travel', 'supervisor'): True,
-                        ('edit', 'travel', 'ta_required'): True,
-                        ('edit', 'travel', 'traveler'): True,
-                        ('view', 'action_points', 'action_point_number'): True,
-                        ('view', 'action_points', 'actions_taken'): True,
-                        ('view', 'action_points', 'comments'): True,
-                        ('view', 'action_points', 'completed_at'): True,
-                        ('view', 'action_points', 'created_at'): True,
-                        ('view', 'action_points', 'description'): True,
-                        ('view', 'action_points', 'due_date'): True,
-                        ('view', 'action_points', 'follow_up'): True,
-                        ('view', 'action_points', 'id'): True,
-                        ('view', 'action_points', 'person_responsible'): True,
-                        ('view', 'action_points', 'status'): True,
-                        ('view', 'action_points', 'trip_reference_number'): True,
-                        ('view', 'activities', 'date'): True,
-                        ('view', 'activities', 'id'): True,
-                        ('view', 'activities', 'locations'): True,
-                        ('view', 'activities', 'partner'): True,
-                        ('view', 'activities', 'partnership'): True,
-                        ('view', 'activities', 'primary_traveler'): True,
-                        ('view', 'activities', 'result'): True,
-                        ('view', 'activities', 'travel_type'): True,
-                        ('view', 'clearances', 'id'): True,
-                        ('view', 'clearances', 'medical_clearance'): True,
-                        ('view', 'clearances', 'security_clearance'): True,
-                        ('view', 'clearances', 'security_course'): True,
-                        ('view', 'cost_assignments', 'business_area'): True,
-                        ('view', 'cost_assignments', 'delegate'): True,
-                        ('view', 'cost_assignments', 'fund'): True,
-                        ('view', 'cost_assignments', 'grant'): True,
-                        ('view', 'cost_assignments', 'id'): True,
-                        ('view', 'cost_assignments', 'share'): True,
-                        ('view', 'cost_assignments', 'wbs'): True,
-                        ('view', 'deductions', 'accomodation'): True,
-                        ('view', 'deductions', 'breakfast'): True,
-                        ('view', 'deductions', 'date'): True,
-                        ('view', 'deductions', 'day_of_the_week'): True,
-                        ('view', 'deductions', 'dinner'): True,
-                        ('view', 'deductions', 'id'): True,
-                        ('view', 'deductions', 'lunch'): True,
-                        ('view', 'deductions', 'no_dsa'): True,
-                        ('view', 'expenses', 'account_currency'): True,
-                        ('view', 'expenses', 'amount'): True,
-                        ('view', 'expenses', 'document_currency'): True,
-                        ('view', 'expenses', 'id'): True,
-                        ('view', 'expenses', 'type'): True,
-                        ('view', 'itinerary', 'airlines'): True,
-                        ('view', 'itinerary', 'arrival_date'): True,
-                        ('view', 'itinerary', 'departure_date'): True,
-                        ('view', 'itinerary', 'destination'): True,
-                        ('view', 'itinerary', 'dsa_region'): True,
-                        ('view', 'itinerary', 'id'): True,
-                        ('view', 'itinerary', 'mode_of_travel'): True,
-                        ('view', 'itinerary', 'origin'): True,
-                        ('view', 'itinerary', 'overnight_travel'): True,
-                        ('view', 'travel', 'action_points'): True,
-                        ('view', 'travel', 'activities'): True,
-                        ('view', 'travel', 'clearances'): True,
-                        ('view', 'travel', 'cost_assignments'): True,
-                        ('view', 'travel', 'cost_summary'): True,
-                        ('view', 'travel', 'currency'): True,
-                        ('view', 'travel', 'deductions'): True,
-                        ('view', 'travel', 'end_date'): True,
-                        ('view', 'travel', 'expenses'): True,
-                        ('view', 'travel', 'id'): True,
-                        ('view', 'travel', 'international_travel'): True,
-                        ('view', 'travel', 'itinerary'): True,
-                        ('view', 'travel', 'office'): True,
-                        ('view', 'travel', 'purpose'): True,
-                        ('view', 'travel', 'reference_number'): True,
-                        ('view', 'travel', 'report'): True,
-                        ('view', 'travel', 'section'): True,
-                        ('view', 'travel', 'start_date'): True,
-                        ('view', 'travel', 'status'): True,
-                        ('view', 'travel', 'supervisor'): True,
-                        ('view', 'travel', 'ta_required'): True,
-                        ('view', 'travel', 'traveler'): True},
-                       'rejected':
-                       {('edit', 'action_points', 'action_point_number'): True,
-                        ('edit', 'action_points', 'actions_taken'): True,
-                        ('edit', 'action_points', 'comments'): True,
-                        ('edit', 'action_points', 'completed_at'): True,
-                        ('edit', 'action_points', 'created_at'): True,
-                        ('edit', 'action_points', 'description'): True,
-                        ('edit', 'action_points', 'due_date'): True,
-                        ('edit', 'action_points', 'follow_up'): True,
-                        ('edit', 'action_points', 'id'): True,
-                        ('edit', 'action_points', 'person_responsible'): True,
-                        ('edit', 'action_points', 'status'): True,
-                        ('edit', 'action_points', 'trip_reference_number'): True,
-                        ('edit', 'activities', 'date'): True,
-                        ('edit', 'activities', 'id'): True,
-                        ('edit', 'activities', 'locations'): True,
-                        ('edit', 'activities', 'partner'): True,
-                        ('edit', 'activities', 'partnership'): True,
-                        ('edit', 'activities', 'primary_traveler'): True,
-                        ('edit', 'activities', 'result'): True,
-                        ('edit', 'activities', 'travel_type'): True,
-                        ('edit', 'clearances', 'id'): True,
-                        ('edit', 'clearances', 'medical_clearance'): True,
-                        ('edit', 'clearances', 'security_clearance'): True,
-                        ('edit', 'clearances', 'security_course'): True,
-                        ('edit', 'cost_assignments', 'business_area'): True,
-                        ('edit', 'cost_assignments', 'delegate'): True,
-                        ('edit', 'cost_assignments', 'fund'): True,
-                        ('edit', 'cost_assignments', 'grant'): True,
-                        ('edit', 'cost_assignments', 'id'): True,
-                        ('edit', 'cost_assignments', 'share'): True,
-                        ('edit', 'cost_assignments', 'wbs'): True,
-                        ('edit', 'deductions', 'accomodation'): True,
-                        ('edit', 'deductions', 'breakfast'): True,
-                        ('edit', 'deductions', 'date'): True,
-                        ('edit', 'deductions', 'day_of_the_week'): True,
-                        ('edit', 'deductions', 'dinner'): True,
-                        ('edit', 'deductions', 'id'): True,
-                        ('edit', 'deductions', 'lunch'): True,
-                        ('edit', 'deductions', 'no_dsa'): True,
-                        ('edit', 'expenses', 'account_currency'): True,
-                        ('edit', 'expenses', 'amount'): True,
-                        ('edit', 'expenses', 'document_currency'): True,
-                        ('edit', 'expenses', 'id'): True,
-                        ('edit', 'expenses', 'type'): True,
-                        ('edit', 'itinerary', 'airlines'): True,
-                        ('edit', 'itinerary', 'arrival_date'): True,
-                        ('edit', 'itinerary', 'departure_date'): True,
-                        ('edit', 'itinerary', 'destination'): True,
-                        ('edit', 'itinerary', 'dsa_region'): True,
-                        ('edit', 'itinerary', 'id'): True,
-                        ('edit', 'itinerary', 'mode_of_travel'): True,
-                        ('edit', 'itinerary', 'origin'): True,
-                        ('edit', 'itinerary', 'overnight_travel'): True,
-                        ('edit', 'travel', 'action_points'): True,
-                        ('edit', 'travel', 'activities'): True,
-                        ('edit', 'travel', 'clearances'): True,
-                        ('edit', 'travel', 'cost_assignments'): True,
-                        ('edit', 'travel', 'cost_summary'): True,
-                        ('edit', 'travel', 'currency'): True,
-                        ('edit', 'travel', 'deductions'): True,
-                        ('edit', 'travel', 'end_date'): True,
-                        ('edit', 'travel', 'expenses'): True,
-                        ('edit', 'travel', 'id'): True,
-                        ('edit', 'travel', 'international_travel'): True,
-                        ('edit', 'travel', 'itinerary'): True,
-                        ('edit', 'travel', 'office'): True,
-                        ('edit', 'travel', 'purpose'): True,
-                        ('edit', 'travel', 'reference_number'): True,
-                        ('edit', 'travel', 'report'): True,
-                        ('edit', 'travel', 'section'): True,
-                        ('edit', 'travel', 'start_date'): True,
-                        ('edit', 'travel', 'status'): True,
-                        ('edit', 'travel', 'supervisor'): True,
-                        ('edit', 'travel', 'ta_required'): True,
-                        ('edit', 'travel', 'traveler'): True,
-                        ('view', 'action_points', 'action_point_number'): True,
-                        ('view', 'action_points', 'actions_taken'): True,
-                        ('view', 'action_points', 'comments'): True,
-                        ('view', 'action_points', 'completed_at'): True,
-                        ('view', 'action_points', 'created_at'): True,
-                        ('view', 'action_points', 'description'): True,
-                        ('view', 'action_points', 'due_date'): True,
-                        ('view', 'action_points', 'follow_up'): True,
-                        ('view', 'action_points', 'id'): True,
-                        ('view', 'action_points', 'person_responsible'): True,
-                        ('view', 'action_points', 'status'): True,
-                        ('view', 'action_points', 'trip_reference_number'): True,
-                        ('view', 'activities', 'date'): True,
-                        ('view', 'activities', 'id'): True,
-                        ('view', 'activities', 'locations'): True,
-                        ('view', 'activities', 'partner'): True,
-                        ('view', 'activities', 'partnership'): True,
-                        ('view', 'activities', 'primary_traveler'): True,
-                        ('view', 'activities', 'result'): True,
-                        ('view', 'activities', 'travel_type'): True,
-                        ('view', 'clearances', 'id'): True,
-                        ('view', 'clearances', 'medical_clearance'): True,
-                        ('view', 'clearances', 'security_clearance'): True,
-                        ('view', 'clearances', 'security_course'): True,
-                        ('view', 'cost_assignments', 'business_area'): True,
-                        ('view', 'cost_assignments', 'delegate'): True,
-                        ('view', 'cost_assignments', 'fund'): True,
-                        ('view', 'cost_assignments', 'grant'): True,
-                        ('view', 'cost_assignments', 'id'): True,
-                        ('view', 'cost_assignments', 'share'): True,
-                        ('view', 'cost_assignments', 'wbs'): True,
-                        ('view', 'deductions', 'accomodation'): True,
-                        ('view', 'deductions', 'breakfast'): True,
-                        ('view', 'deductions', 'date'): True,
-                        ('view', 'deductions', 'day_of_the_week'): True,
-                        ('view', 'deductions', 'dinner'): True,
-                        ('view', 'deductions', 'id'): True,
-                        ('view', 'deductions', 'lunch'): True,
-                        ('view', 'deductions', 'no_dsa'): True,
-                        ('view', 'expenses', 'account_currency'): True,
-                        ('view', 'expenses', 'amount'): True,
-                        ('view', 'expenses', 'document_currency'): True,
-                        ('view', 'expenses', 'id'): True,
-                        ('view', 'expenses', 'type'): True,
-                        ('view', 'itinerary', 'airlines'): True,
-                        ('view', 'itinerary', 'arrival_date'): True,
-                        ('view', 'itinerary', 'departure_date'): True,
-                        ('view', 'itinerary', 'destination'): True,
-                        ('view', 'itinerary', 'dsa_region'): True,
-                        ('view', 'itinerary', 'id'): True,
-                        ('view', 'itinerary', 'mode_of_travel'): True,
-                        ('view', 'itinerary', 'origin'): True,
-                        ('view', 'itinerary', 'overnight_travel'): True,
-                        ('view', 'travel', 'action_points'): True,
-                        ('view', 'travel', 'activities'): True,
-                        ('view', 'travel', 'clearances'): True,
-                        ('view', 'travel', 'cost_assignments'): True,
-                        ('view', 'travel', 'cost_summary'): True,
-                        ('view', 'travel', 'currency'): True,
-                        ('view', 'travel', 'deductions'): True,
-                        ('view', 'travel', 'end_date'): True,
-                        ('view', 'travel', 'expenses'): True,
-                        ('view', 'travel', 'id'): True,
-                        ('view', 'travel', 'international_travel'): True,
-                        ('view', 'travel', 'itinerary'): True,
-                        ('view', 'travel', 'office'): True,
-                        ('view', 'travel', 'purpose'): True,
-                        ('view', 'travel', 'reference_number'): True,
-                        ('view', 'travel', 'report'): True,
-                        ('view', 'travel', 'section'): True,
-                        ('view', 'travel', 'start_date'): True,
-                        ('view', 'travel', 'status'): True,
-                        ('view', 'travel', 'supervisor'): True,
-                        ('view', 'travel', 'ta_required'): True,
-                        ('view', 'travel', 'traveler'): True},
-                       'submitted':
-                       {('edit', 'action_points', 'action_point_number'): True,
-                        ('edit', 'action_points', 'actions_taken'): True,
-                        ('edit', 'action_points', 'comments'): True,
-                        ('edit', 'action_points', 'completed_at'): True,
-                        ('edit', 'action_points', 'created_at'): True,
-                        ('edit', 'action_points', 'description'): True,
-                        ('edit', 'action_points', 'due_date'): True,
-                        ('edit', 'action_points', 'follow_up'): True,
-                        ('edit', 'action_points', 'id'): True,
-                        ('edit', 'action_points', 'person_responsible'): True,
-                        ('edit', 'action_points', 'status'): True,
-                        ('edit', 'action_points', 'trip_reference_number'): True,
-                        ('edit', 'activities', 'date'): True,
-                        ('edit', 'activities', 'id'): True,
-                        ('edit', 'activities', 'locations'): True,
-                        ('edit', 'activities', 'partner'): True,
-                        ('edit', 'activities', 'partnership'): True,
-                        ('edit', 'activities', 'primary_traveler'): True,
-                        ('edit', 'activities', 'result'): True,
-                        ('edit', 'activities', 'travel_type'): True,
-                        ('edit', 'clearances', 'id'): True,
-                        ('edit', 'clearances', 'medical_clearance'): True,
-                        ('edit', 'clearances', 'security_clearance'): True,
-                        ('edit', 'clearances', 'security_course'): True,
-                        ('edit', 'cost_assignments', 'business_area'): True,
-                        ('edit', 'cost_assignments', 'delegate'): True,
-                        ('edit', 'cost_assignments', 'fund'): True,
-                        ('edit', 'cost_assignments', 'grant'): True,
-                        ('edit', 'cost_assignments', 'id'): True,
-                        ('edit', 'cost_assignments', 'share'): True,
-                        ('edit', 'cost_assignments', 'wbs'): True,
-                        ('edit', 'deductions', 'accomodation'): True,
-                        ('edit', 'deductions', 'breakfast'): True,
-                        ('edit', 'deductions', 'date'): True,
-                        ('edit', 'deductions', 'day_of_the_week'): True,
-                        ('edit', 'deductions', 'dinner'): True,
-                        ('edit', 'deductions', 'id'): True,
-                        ('edit', 'deductions', 'lunch'): True,
-                        ('edit', 'deductions', 'no_dsa'): True,
-                        ('edit', 'expenses', 'account_currency'): True,
-                        ('edit', 'expenses', 'amount'): True,
-                        ('edit', 'expenses', 'document_currency'): True,
-                        ('edit', 'expenses', 'id'): True,
-                        ('edit', 'expenses', 'type'): True,
-                        ('edit', 'itinerary', 'airlines'): True,
-                        ('edit', 'itinerary', 'arrival_date'): True,
-                        ('edit', 'itinerary', 'departure_date'): True,
-                        ('edit', 'itinerary', 'destination'): True,
-                        ('edit', 'itinerary', 'dsa_region'): True,
-                        ('edit', 'itinerary', 'id'): True,
-                        ('edit', 'itinerary', 'mode_of_travel'): True,
-                        ('edit', 'itinerary', 'origin'): True,
-                        ('edit', 'itinerary', 'overnight_travel'): True,
-                        ('edit', 'travel', 'action_points'): True,
-                        ('edit', 'travel', 'activities'): True,
-                        ('edit', 'travel', 'clearances'): True,
-                        ('edit', 'travel', 'cost_assignments'): True,
-                        ('edit', 'travel', 'cost_summary'): True,
-                        ('edit', 'travel', 'currency'): True,
-                        ('edit', 'travel', 'deductions'): True,
-                        ('edit', 'travel', 'end_date'): True,
-                        ('edit', 'travel', 'expenses'): True,
-                        ('edit', 'travel', 'id'): True,
-                        ('edit', 'travel', 'international_travel'): True,
-                        ('edit', 'travel', 'itinerary'): True,
-                        ('edit', 'travel', 'office'): True,
-                        ('edit', 'travel', 'purpose'): True,
-                        ('edit', 'travel', 'reference_number'): True,
-                        ('edit', 'travel', 'report'): True,
-                        ('edit', 'travel', 'section'): True,
-                        ('edit', 'travel', 'start_date'): True,
-                        ('edit', 'travel', 'status'): True,
-                        ('edit', 'travel', 'supervisor'): True,
-                        ('edit', 'travel', 'ta_required'): True,
-                        ('edit', 'travel', 'traveler'): True,
-                        ('view', 'action_points', 'action_point_number'): True,
-                        ('view', 'action_points', 'actions_taken'): True,
-                        ('view', 'action_points', 'comments'): True,
-                        ('view', 'action_points', 'completed_at'): True,
-                        ('view', 'action_points', 'created_at'): True,
-                        ('view', 'action_points', 'description'): True,
-                        ('view', 'action_points', 'due_date'): True,
-                        ('view', 'action_points', 'follow_up'): True,
-                        ('view', 'action_points', 'id'): True,
-                        ('view', 'action_points', 'person_responsible'): True,
-                        ('view', 'action_points', 'status'): True,
-                        ('view', 'action_points', 'trip_reference_number'): True,
-                        ('view', 'activities', 'date'): True,
-                        ('view', 'activities', 'id'): True,
-                        ('view', 'activities', 'locations'): True,
-                        ('view', 'activities', 'partner'): True,
-                        ('view', 'activities', 'partnership'): True,
-                        ('view', 'activities', 'primary_traveler'): True,
-                        ('view', 'activities', 'result'): True,
-                        ('view', 'activities', 'travel_type'): True,
-                        ('view', 'clearances', 'id'): True,
-                        ('view', 'clearances', 'medical_clearance'): True,
-                        ('view', 'clearances', 'security_clearance'): True,
-                        ('view', 'clearances', 'security_course'): True,
-                        ('view', 'cost_assignments', 'business_area'): True,
-                        ('view', 'cost_assignments', 'delegate'): True,
-                        ('view', 'cost_assignments', 'fund'): True,
-                        ('view', 'cost_assignments', 'grant'): True,
-                        ('view', 'cost_assignments', 'id'): True,
-                        ('view', 'cost_assignments', 'share'): True,
-                        ('view', 'cost_assignments', 'wbs'): True,
-                        ('view', 'deductions', 'accomodation'): True,
-                        ('view', 'deductions', 'breakfast'): True,
-                        ('view', 'deductions', 'date'): True,
-                        ('view', 'deductions', 'day_of_the_week'): True,
-                        ('view', 'deductions', 'dinner'): True,
-                        ('view', 'deductions', 'id'): True,
-                        ('view', 'deductions', 'lunch'): True,
-                        ('view', 'deductions', 'no_dsa'): True,
-                        ('view', 'expenses', 'account_currency'): True,
-                        ('view', 'expenses', 'amount'): True,
-                        ('view', 'expenses', 'document_currency'): True,
-                        ('view', 'expenses', 'id'): True,
-                        ('view', 'expenses', 'type'): True,
-                        ('view', 'itinerary', 'airlines'): True,
-                        ('view', 'itinerary', 'arrival_date'): True,
-                        ('view', 'itinerary', 'departure_date'): True,
-                        ('view', 'itinerary', 'destination'): True,
-                        ('view', 'itinerary', 'dsa_region'): True,
-                        ('view', 'itinerary', 'id'): True,
-                        ('view', 'itinerary', 'mode_of_travel'): True,
-                        ('view', 'itinerary', 'origin'): True,
-                        ('view', 'itinerary', 'overnight_travel'): True,
-                        ('view', 'travel', 'action_points'): True,
-                        ('view', 'travel', 'activities'): True,
-                        ('view', 'travel', 'clearances'): True,
-                        ('view', 'travel', 'cost_assignments'): True,
-                        ('view', 'travel', 'cost_summary'): True,
-                        ('view', 'travel', 'currency'): True,
-                        ('view', 'travel', 'deductions'): True,
-                        ('view', 'travel', 'end_date'): True,
-                        ('view', 'travel', 'expenses'): True,
-                        ('view', 'travel', 'id'): True,
-                        ('view', 'travel', 'international_travel'): True,
-                        ('view', 'travel', 'itinerary'): True,
-                        ('view', 'travel', 'office'): True,
-                        ('view', 'travel', 'purpose'): True,
-                        ('view', 'travel', 'reference_number'): True,
-                        ('view', 'travel', 'report'): True,
-                        ('view', 'travel', 'section'): True,
-                        ('view', 'travel', 'start_date'): True,
-                        ('view', 'travel', 'status'): True,
-                        ('view', 'travel', 'supervisor'): True,
-                        ('view', 'travel', 'ta_required'): True,
-                        ('view', 'travel', 'traveler'): True}},
-               'Representative': {'approved':
-                                  {('edit', 'action_points', 'action_point_number'): False,
-                                   ('edit', 'action_points', 'actions_taken'): False,
-                                   ('edit', 'action_points', 'comments'): False,
-                                   ('edit', 'action_points', 'completed_at'): False,
-                                   ('edit', 'action_points', 'created_at'): False,
-                                   ('edit', 'action_points', 'description'): False,
-                                   ('edit', 'action_points', 'due_date'): False,
-                                   ('edit', 'action_points', 'follow_up'): False,
-                                   ('edit', 'action_points', 'id'): False,
-                                   ('edit', 'action_points', 'person_responsible'): False,
-                                   ('edit', 'action_points', 'status'): False,
-                                   ('edit', 'action_points', 'trip_reference_number'): False,
-                                   ('edit', 'activities', 'date'): False,
-                                   ('edit', 'activities', 'id'): False,
-                                   ('edit', 'activities', 'locations'): False,
-                                   ('edit', 'activities', 'partner'): False,
-                                   ('edit', 'activities', 'partnership'): False,
-                                   ('edit', 'activities', 'primary_traveler'): False,
-                                   ('edit', 'activities', 'result'): False,
-                                   ('edit', 'activities', 'travel_type'): False,
-                                   ('edit', 'clearances', 'id'): False,
-                                   ('edit', 'clearances', 'medical_clearance'): False,
-                                   ('edit', 'clearances', 'security_clearance'): False,
-                                   ('edit', 'clearances', 'security_course'): False,
-                                   ('edit', 'cost_assignments', 'business_area'): False,
-                                   ('edit', 'cost_assignments', 'delegate'): False,
-                                   ('edit', 'cost_assignments', 'fund'): False,
-                                   ('edit', 'cost_assignments', 'grant'): False,
-                                   ('edit', 'cost_assignments', 'id'): False,
-                                   ('edit', 'cost_assignments', 'share'): False,
-                                   ('edit', 'cost_assignments', 'wbs'): False,
-                                   ('edit', 'deductions', 'accomodation'): False,
-                                   ('edit', 'deductions', 'breakfast'): False,
-                                   ('edit', 'deductions', 'date'): False,
-                                   ('edit', 'deductions', 'day_of_the_week'): False,
-                                   ('edit', 'deductions', 'dinner'): False,
-                                   ('edit', 'deductions', 'id'): False,
-                                   ('edit', 'deductions', 'lunch'): False,
-                                   ('edit', 'deductions', 'no_dsa'): False,
-                                   ('edit', 'expenses', 'account_currency'): False,
-                                   ('edit', 'expenses', 'amount'): False,
-                                   ('edit', 'expenses', 'document_currency'): False,
-                                   ('edit', 'expenses', 'id'): False,
-                                   ('edit', 'expenses', 'type'): False,
-                                   ('edit', 'itinerary', 'airlines'): False,
-                                   ('edit', 'itinerary', 'arrival_date'): False,
-                                   ('edit', 'itinerary', 'departure_date'): False,
-                                   ('edit', 'itinerary', 'destination'): False,
-                                   ('edit', 'itinerary', 'dsa_region'): False,
-                                   ('edit', 'itinerary', 'id'): False,
-                                   ('edit', 'itinerary', 'mode_of_travel'): False,
-                                   ('edit', 'itinerary', 'origin'): False,
-                                   ('edit', 'itinerary', 'overnight_travel'): False,
-                                   ('edit', 'travel', 'action_points'): False,
-                                   ('edit', 'travel', 'activities'): False,
-                                   ('edit', 'travel', 'clearances'): False,
-                                   ('edit', 'travel', 'cost_assignments'): False,
-                                   ('edit', 'travel', 'cost_summary'): False,
-                                   ('edit', 'travel', 'currency'): False,
-                                   ('edit', 'travel', 'deductions'): False,
-                                   ('edit', 'travel', 'end_date'): False,
-                                   ('edit', 'travel', 'expenses'): False,
-                                   ('edit', 'travel', 'id'): False,
-                                   ('edit', 'travel', 'international_travel'): False,
-                                   ('edit', 'travel', 'itinerary'): False,
-                                   ('edit', 'travel', 'office'): False,
-                                   ('edit', 'travel', 'purpose'): False,
-                                   ('edit', 'travel', 'reference_number'): False,
-                                   ('edit', 'travel', 'report'): False,
-                                   ('edit', 'travel', 'section'): False,
-                                   ('edit', 'travel', 'start_date'): False,
-                                   ('edit', 'travel', 'status'): False,
-                                   ('edit', 'travel', 'supervisor'): False,
-                                   ('edit', 'travel', 'ta_required'): False,
-                                   ('edit', 'travel', 'traveler'): False,
-                                   ('view', 'action_points', 'action_point_number'): True,
-                                   ('view', 'action_points', 'actions_taken'): True,
-                                   ('view', 'action_points', 'comments'): True,
-                                   ('view', 'action_points', 'completed_at'): True,
-                                   ('view', 'action_points', 'created_at'): True,
-                                   ('view', 'action_points', 'description'): True,
-                                   ('view', 'action_points', 'due_date'): True,
-                                   ('view', 'action_points', 'follow_up'): True,
-                                   ('view', 'action_points', 'id'): True,
-                                   ('view', 'action_points', 'person_responsible'): True,
-                                   ('view', 'action_points', 'status'): True,
-                                   ('view', 'action_points', 'trip_reference_number'): True,
-                                   ('view', 'activities', 'date'): True,
-                                   ('view', 'activities', 'id'): True,
-                                   ('view', 'activities', 'locations'): True,
-                                   ('view', 'activities', 'partner'): True,
-                                   ('view', 'activities', 'partnership'): True,
-                                   ('view', 'activities', 'primary_traveler'): True,
-                                   ('view', 'activities', 'result'): True,
-                                   ('view', 'activities', 'travel_type'): True,
-                                   ('view', 'clearances', 'id'): True,
-                                   ('view', 'clearances', 'medical_clearance'): True,
-                                   ('view', 'clearances', 'security_clearance'): True,
-                                   ('view', 'clearances', 'security_course'): True,
-                                   ('view', 'cost_assignments', 'business_area'): True,
-                                   ('view', 'cost_assignments', 'delegate'): True,
-                                   ('view', 'cost_assignments', 'fund'): True,
-                                   ('view', 'cost_assignments', 'grant'): True,
-                                   ('view', 'cost_assignments', 'id'): True,
-                                   ('view', 'cost_assignments', 'share'): True,
-                                   ('view', 'cost_assignments', 'wbs'): True,
-                                   ('view', 'deductions', 'accomodation'): True,
-                                   ('view', 'deductions', 'breakfast'): True,
-                                   ('view', 'deductions', 'date'): True,
-                                   ('view', 'deductions', 'day_of_the_week'): True,
-                                   ('view', 'deductions', 'dinner'): True,
-                                   ('view', 'deductions', 'id'): True,
-                                   ('view', 'deductions', 'lunch'): True,
-                                   ('view', 'deductions', 'no_dsa'): True,
-                                   ('view', 'expenses', 'account_currency'): True,
-                                   ('view', 'expenses', 'amount'): True,
-                                   ('view', 'expenses', 'document_currency'): True,
-                                   ('view', 'expenses', 'id'): True,
-                                   ('view', 'expenses', 'type'): True,
-                                   ('view', 'itinerary', 'airlines'): True,
-                                   ('view', 'itinerary', 'arrival_date'): True,
-                                   ('view', 'itinerary', 'departure_date'): True,
-                                   ('view', 'itinerary', 'destination'): True,
-                                   ('view', 'itinerary', 'dsa_region'): True,
-                                   ('view', 'itinerary', 'id'): True,
-                                   ('view', 'itinerary', 'mode_of_travel'): True,
-                                   ('view', 'itinerary', 'origin'): True,
-                                   ('view', 'itinerary', 'overnight_travel'): True,
-                                   ('view', 'travel', 'action_points'): True,
-                                   ('view', 'travel', 'activities'): True,
-                                   ('view', 'travel', 'clearances'): True,
-                                   ('view', 'travel', 'cost_assignments'): True,
-                                   ('view', 'travel', 'cost_summary'): True,
-                                   ('view', 'travel', 'currency'): True,
-                                   ('view', 'travel', 'deductions'): True,
-                                   ('view', 'travel', 'end_date'): True,
-                                   ('view', 'travel', 'expenses'): True,
-                                   ('view', 'travel', 'id'): True,
-                                   ('view', 'travel', 'international_travel'): True,
-                                   ('view', 'travel', 'itinerary'): True,
-                                   ('view', 'travel', 'office'): True,
-                                   ('view', 'travel', 'purpose'): True,
-                                   ('view', 'travel', 'reference_number'): True,
-                                   ('view', 'travel', 'report'): True,
-                                   ('view', 'travel', 'section'): True,
-                                   ('view', 'travel', 'start_date'): True,
-                                   ('view', 'travel', 'status'): True,
-                                   ('view', 'travel', 'supervisor'): True,
-                                   ('view', 'travel', 'ta_required'): True,
-                                   ('view', 'travel', 'traveler'): True},
-                                  'cancelled':
-                                  {('edit', 'action_points', 'action_point_number'): False,
-                                   ('edit', 'action_points', 'actions_taken'): False,
-                                   ('edit', 'action_points', 'comments'): False,
-                                   ('edit', 'action_points', 'completed_at'): False,
-                                   ('edit', 'action_points', 'created_at'): False,
-                                   ('edit', 'action_points', 'description'): False,
-                                   ('edit', 'action_points', 'due_date'): False,
-                                   ('edit', 'action_points', 'follow_up'): False,
-                                   ('edit', 'action_points', 'id'): False,
-                                   ('edit', 'action_points', 'person_responsible'): False,
-                                   ('edit', 'action_points', 'status'): False,
-                                   ('edit', 'action_points', 'trip_reference_number'): False,
-                                   ('edit', 'activities', 'date'): False,
-                                   ('edit', 'activities', 'id'): False,
-                                   ('edit', 'activities', 'locations'): False,
-                                   ('edit', 'activities', 'partner'): False,
-                                   ('edit', 'activities', 'partnership'): False,
-                                   ('edit', 'activities', 'primary_traveler'): False,
-                                   ('edit', 'activities', 'result'): False,
-                                   ('edit', 'activities', 'travel_type'): False,
-                                   ('edit', 'clearances', 'id'): False,
-                                   ('edit', 'clearances', 'medical_clearance'): False,
-                                   ('edit', 'clearances', 'security_clearance'): False,
-                                   ('edit', 'clearances', 'security_course'): False,
-                                   ('edit', 'cost_assignments', 'business_area'): False,
-                                   ('edit', 'cost_assignments', 'delegate'): False,
-                                   ('edit', 'cost_assignments', 'fund'): False,
-                                   ('edit', 'cost_assignments', 'grant'): False,
-                                   ('edit', 'cost_assignments', 'id'): False,
-                                   ('edit', 'cost_assignments', 'share'): False,
-                                   ('edit', 'cost_assignments', 'wbs'): False,
-                                   ('edit', 'deductions', 'accomodation'): False,
-                                   ('edit', 'deductions', 'breakfast'): False,
-                                   ('edit', 'deductions', 'date'): False,
-                                   ('edit', 'deductions', 'day_of_the_week'): False,
-                                   ('edit', 'deductions', 'dinner'): False,
-                                   ('edit', 'deductions', 'id'): False,
-                                   ('edit', 'deductions', 'lunch'): False,
-                                   ('edit', 'deductions', 'no_dsa'): False,
-                                   ('edit', 'expenses', 'account_currency'): False,
-                                   ('edit', 'expenses', 'amount'): False,
-                                   ('edit', 'expenses', 'document_currency'): False,
-                                   ('edit', 'expenses', 'id'): False,
-                                   ('edit', 'expenses', 'type'): False,
-                                   ('edit', 'itinerary', 'airlines'): False,
-                                   ('edit', 'itinerary', 'arrival_date'): False,
-                                   ('edit', 'itinerary', 'departure_date'): False,
-                                   ('edit', 'itinerary', 'destination'): False,
-                                   ('edit', 'itinerary', 'dsa_region'): False,
-                                   ('edit', 'itinerary', 'id'): False,
-                                   ('edit', 'itinerary', 'mode_of_travel'): False,
-                                   ('edit', 'itinerary', 'origin'): False,
-                                   ('edit', 'itinerary', 'overnight_travel'): False,
-                                   ('edit', 'travel', 'action_points'): False,
-                                   ('edit', 'travel', 'activities'): False,
-                                   ('edit', 'travel', 'clearances'): False,
-                                   ('edit', 'travel', 'cost_assignments'): False,
-                                   ('edit', 'travel', 'cost_summary'): False,
-                                   ('edit', 'travel', 'currency'): False,
-                                   ('edit', 'travel', 'deductions'): False,
-                                   ('edit', 'travel', 'end_date'): False,
-                                   ('edit', 'travel', 'expenses'): False,
-                                   ('edit', 'travel', 'id'): False,
-                                   ('edit', 'travel', 'international_travel'): False,
-                                   ('edit', 'travel', 'itinerary'): False,
-                                   ('edit', 'travel', 'office'): False,
-                                   ('edit', 'travel', 'purpose'): False,
-                                   ('edit', 'travel', 'reference_number'): False,
-                                   ('edit', 'travel', 'report'): False,
-                                   ('edit', 'travel', 'section'): False,
-                                   ('edit', 'travel', 'start_date'): False,
-                                   ('edit', 'travel', 'status'): False,
-                                   ('edit', 'travel', 'supervisor'): False,
-                                   ('edit', 'travel', 'ta_required'): False,
-                                   ('edit', 'travel', 'traveler'): False,
-                                   ('view', 'action_points', 'action_point_number'): True,
-                                   ('view', 'action_points', 'actions_taken'): True,
-                                   ('view', 'action_points', 'comments'): True,
-                                   ('view', 'action_points', 'completed_at'): True,
-                                   ('view', 'action_points', 'created_at'): True,
-                                   ('view', 'action_points', 'description'): True,
-                                   ('view', 'action_points', 'due_date'): True,
-                                   ('view', 'action_points', 'follow_up'): True,
-                                   ('view', 'action_points', 'id'): True,
-                                   ('view', 'action_points', 'person_responsible'): True,
-                                   ('view', 'action_points', 'status'): True,
-                                   ('view', 'action_points', 'trip_reference_number'): True,
-                                   ('view', 'activities', 'date'): True,
-                                   ('view', 'activities', 'id'): True,
-                                   ('view', 'activities', 'locations'): True,
-                                   ('view', 'activities', 'partner'): True,
-                                   ('view', 'activities', 'partnership'): True,
-                                   ('view', 'activities', 'primary_traveler'): True,
-                                   ('view', 'activities', 'result'): True,
-                                   ('view', 'activities', 'travel_type'): True,
-                                   ('view', 'clearances', 'id'): True,
-                                   ('view', 'clearances', 'medical_clearance'): True,
-                                   ('view', 'clearances', 'security_clearance'): True,
-                                   ('view', 'clearances', 'security_course'): True,
-                                   ('view', 'cost_assignments', 'business_area'): True,
-                                   ('view', 'cost_assignments', 'delegate'): True,
-                                   ('view', 'cost_assignments', 'fund'): True,
-                                   ('view', 'cost_assignments', 'grant'): True,
-                                   ('view', 'cost_assignments', 'id'): True,
-                                   ('view', 'cost_assignments', 'share'): True,
-                                   ('view', 'cost_assignments', 'wbs'): True,
-                                   ('view', 'deductions', 'accomodation'): True,
-                                   ('view', 'deductions', 'breakfast'): True,
-                                   ('view', 'deductions', 'date'): True,
-                                   ('view', 'deductions', 'day_of_the_week'): True,
-                                   ('view', 'deductions', 'dinner'): True,
-                                   ('view', 'deductions', 'id'): True,
-                                   ('view', 'deductions', 'lunch'): True,
-                                   ('view', 'deductions', 'no_dsa'): True,
-                                   ('view', 'expenses', 'account_currency'): True,
-                                   ('view', 'expenses', 'amount'): True,
-                                   ('view', 'expenses', 'document_currency'): True,
-                                   ('view', 'expenses', 'id'): True,
-                                   ('view', 'expenses', 'type'): True,
-                                   ('view', 'itinerary', 'airlines'): True,
-                                   ('view', 'itinerary', 'arrival_date'): True,
-                                   ('view', 'itinerary', 'departure_date'): True,
-                                   ('view', 'itinerary', 'destination'): True,
-                                   ('view', 'itinerary', 'dsa_region'): True,
-                                   ('view', 'itinerary', 'id'): True,
-                                   ('view', 'itinerary', 'mode_of_travel'): True,
-                                   ('view', 'itinerary', 'origin'): True,
-                                   ('view', 'itinerary', 'overnight_travel'): True,
-                                   ('view', 'travel', 'action_points'): True,
-                                   ('view', 'travel', 'activities'): True,
-                                   ('view', 'travel', 'clearances'): True,
-                                   ('view', 'travel', 'cost_assignments'): True,
-                                   ('view', 'travel', 'cost_summary'): True,
-                                   ('view', 'travel', 'currency'): True,
-                                   ('view', 'travel', 'deductions'): True,
-                                   ('view', 'travel', 'end_date'): True,
-                                   ('view', 'travel', 'expenses'): True,
-                                   ('view', 'travel', 'id'): True,
-                                   ('view', 'travel', 'international_travel'): True,
-                                   ('view', 'travel', 'itinerary'): True,
-                                   ('view', 'travel', 'office'): True,
-                                   ('view', 'travel', 'purpose'): True,
-                                   ('view', 'travel', 'reference_number'): True,
-                                   ('view', 'travel', 'report'): True,
-                                   ('view', 'travel', 'section'): True,
-                                   ('view', 'travel', 'start_date'): True,
-                                   ('view', 'travel', 'status'): True,
-                                   ('view', 'travel', 'supervisor'): True,
-                                   ('view', 'travel', 'ta_required'): True,
-                                   ('view', 'travel', 'traveler'): True},
-                                  'completed':
-                                  {('edit', 'action_points', 'action_point_number'): False,
-                                   ('edit', 'action_points', 'actions_taken'): False,
-                                   ('edit', 'action_points', 'comments'): False,
-                                   ('edit', 'action_points', 'completed_at'): False,
-                                   ('edit', 'action_points', 'created_at'): False,
-                                   ('edit', 'action_points', 'description'): False,
-                                   ('edit', 'action_points', 'due_date'): False,
-                                   ('edit', 'action_points', 'follow_up'): False,
-                                   ('edit', 'action_points', 'id'): False,
-                                   ('edit', 'action_points', 'person_responsible'): False,
-                                   ('edit', 'action_points', 'status'): False,
-                                   ('edit', 'action_points', 'trip_reference_number'): False,
-                                   ('edit', 'activities', 'date'): False,
-                                   ('edit', 'activities', 'id'): False,
-                                   ('edit', 'activities', 'locations'): False,
-                                   ('edit', 'activities', 'partner'): False,
-                                   ('edit', 'activities', 'partnership'): False,
-                                   ('edit', 'activities', 'primary_traveler'): False,
-                                   ('edit', 'activities', 'result'): False,
-                                   ('edit', 'activities', 'travel_type'): False,
-                                   ('edit', 'clearances', 'id'): False,
-                                   ('edit', 'clearances', 'medical_clearance'): False,
-                                   ('edit', 'clearances', 'security_clearance'): False,
-                                   ('edit', 'clearances', 'security_course'): False,
-                                   ('edit', 'cost_assignments', 'business_area'): False,
-                                   ('edit', 'cost_assignments', 'delegate'): False,
-                                   ('edit', 'cost_assignments', 'fund'): False,
-                                   ('edit', 'cost_assignments', 'grant'): False,
-                                   ('edit', 'cost_assignments', 'id'): False,
-                                   ('edit', 'cost_assignments', 'share'): False,
-                                   ('edit', 'cost_assignments', 'wbs'): False,
-                                   ('edit', 'deductions', 'accomodation'): False,
-                                   ('edit', 'deductions', 'breakfast'): False,
-                                   ('edit', 'deductions', 'date'): False,
-                                   ('edit', 'deductions', 'day_of_the_week'): False,
-                                   ('edit', 'deductions', 'dinner'): False,
-                                   ('edit', 'deductions', 'id'): False,
-                                   ('edit', 'deductions', 'lunch'): False,
-                                   ('edit', 'deductions', 'no_dsa'): False,
-                                   ('edit', 'expenses', 'account_currency'): False,
-                                   ('edit', 'expenses', 'amount'): False,
-                                   ('edit', 'expenses', 'document_currency'): False,
-                                   ('edit', 'expenses', 'id'): False,
-                                   ('edit', 'expenses', 'type'): False,
-                                   ('edit', 'itinerary', 'airlines'): False,
-                                   ('edit', 'itinerary', 'arrival_date'): False,
-                                   ('edit', 'itinerary', 'departure_date'): False,
-                                   ('edit', 'itinerary', 'destination'): False,
-                                   ('edit', 'itinerary', 'dsa_region'): False,
-                                   ('edit', 'itinerary', 'id'): False,
-                                   ('edit', 'itinerary', 'mode_of_travel'): False,
-                                   ('edit', 'itinerary', 'origin'): False,
-                                   ('edit', 'itinerary', 'overnight_travel'): False,
-                                   ('edit', 'travel', 'action_points'): False,
-                                   ('edit', 'travel', 'activities'): False,
-                                   ('edit', 'travel', 'clearances'): False,
-                                   ('edit', 'travel', 'cost_assignments'): False,
-                                   ('edit', 'travel', 'cost_summary'): False,
-                                   ('edit', 'travel', 'currency'): False,
-                                   ('edit', 'travel', 'deductions'): False,
-                                   ('edit', 'travel', 'end_date'): False,
-                                   ('edit', 'travel', 'expenses'): False,
-                                   ('edit', 'travel', 'id'): False,
-                                   ('edit', 'travel', 'international_travel'): False,
-                                   ('edit', 'travel', 'itinerary'): False,
-                                   ('edit', 'travel', 'office'): False,
-                                   ('edit', 'travel', 'purpose'): False,
-                                   ('edit', 'travel', 'reference_number'): False,
-                                   ('edit', 'travel', 'report'): False,
-                                   ('edit', 'travel', 'section'): False,
-                                   ('edit', 'travel', 'start_date'): False,
-                                   ('edit', 'travel', 'status'): False,
-                                   ('edit', 'travel', 'supervisor'): False,
-                                   ('edit', 'travel', 'ta_required'): False,
-                                   ('edit', 'travel', 'traveler'): False,
-                                   ('view', 'action_points', 'action_point_number'): True,
-                                   ('view', 'action_points', 'actions_taken'): True,
-                                   ('view', 'action_points', 'comments'): True,
-                                   ('view', 'action_points', 'completed_at'): True,
-                                   ('view', 'action_points', 'created_at'): True,
-                                   ('view', 'action_points', 'description'): True,
-                                   ('view', 'action_points', 'due_date'): True,
-                                   ('view', 'action_points', 'follow_up'): True,
-                                   ('view', 'action_points', 'id'): True,
-                                   ('view', 'action_points', 'person_responsible'): True,
-                                   ('view', 'action_points', 'status'): True,
-                                   ('view', 'action_points', 'trip_reference_number'): True,
-                                   ('view', 'activities', 'date'): True,
-                                   ('view', 'activities', 'id'): True,
-                                   ('view', 'activities', 'locations'): True,
-                                   ('view', 'activities', 'partner'): True,
-                                   ('view', 'activities', 'partnership'): True,
-                                   ('view', 'activities', 'primary_traveler'): True,
-                                   ('view', 'activities', 'result'): True,
-                                   ('view', 'activities', 'travel_type'): True,
-                                   ('view', 'clearances', 'id'): True,
-                                   ('view', 'clearances', 'medical_clearance'): True,
-                                   ('view', 'clearances', 'security_clearance'): True,
-                                   ('view', 'clearances', 'security_course'): True,
-                                   ('view', 'cost_assignments', 'business_area'): True,
-                                   ('view', 'cost_assignments', 'delegate'): True,
-                                   ('view', 'cost_assignments', 'fund'): True,
-                                   ('view', 'cost_assignments', 'grant'): True,
-                                   ('view', 'cost_assignments', 'id'): True,
-                                   ('view', 'cost_assignments', 'share'): True,
-                                   ('view', 'cost_assignments', 'wbs'): True,
-                                   ('view', 'deductions', 'accomodation'): True,
-                                   ('view', 'deductions', 'breakfast'): True,
-                                   ('view', 'deductions', 'date'): True,
-                                   ('view', 'deductions', 'day_of_the_week'): True,
-                                   ('view', 'deductions', 'dinner'): True,
-                                   ('view', 'deductions', 'id'): True,
-                                   ('view', 'deductions', 'lunch'): True,
-                                   ('view', 'deductions', 'no_dsa'): True,
-                                   ('view', 'expenses', 'account_currency'): True,
-                                   ('view', 'expenses', 'amount'): True,
-                                   ('view', 'expenses', 'document_currency'): True,
-                                   ('view', 'expenses', 'id'): True,
-                                   ('view', 'expenses', 'type'): True,
-                                   ('view', 'itinerary', 'airlines'): True,
-                                   ('view', 'itinerary', 'arrival_date'): True,
-                                   ('view', 'itinerary', 'departure_date'): True,
-                                   ('view', 'itinerary', 'destination'): True,
-                                   ('view', 'itinerary', 'dsa_region'): True,
-                                   ('view', 'itinerary', 'id'): True,
-                                   ('view', 'itinerary', 'mode_of_travel'): True,
-                                   ('view', 'itinerary', 'origin'): True,
-                                   ('view', 'itinerary', 'overnight_travel'): True,
-                                   ('view', 'travel', 'action_points'): True,
-                                   ('view', 'travel', 'activities'): True,
-                                   ('view', 'travel', 'clearances'): True,
-                                   ('view', 'travel', 'cost_assignments'): True,
-                                   ('view', 'travel', 'cost_summary'): True,
-                                   ('view', 'travel', 'currency'): True,
-                                   ('view', 'travel', 'deductions'): True,
-                                   ('view', 'travel', 'end_date'): True,
-                                   ('view', 'travel', 'expenses'): True,
-                                   ('view', 'travel', 'id'): True,
-                                   ('view', 'travel', 'international_travel'): True,
-                                   ('view', 'travel', 'itinerary'): True,
-                                   ('view', 'travel', 'office'): True,
-                                   ('view', 'travel', 'purpose'): True,
-                                   ('view', 'travel', 'reference_number'): True,
-                                   ('view', 'travel', 'report'): True,
-                                   ('view', 'travel', 'section'): True,
-                                   ('view', 'travel', 'start_date'): True,
-                                   ('view', 'travel', 'status'): True,
-                                   ('view', 'travel', 'supervisor'): True,
-                                   ('view', 'travel', 'ta_required'): True,
-                                   ('view', 'travel', 'traveler'): True},
-                                  'planned':
-                                  {('edit', 'action_points', 'action_point_number'): False,
-                                   ('edit', 'action_points', 'actions_taken'): False,
-                                   ('edit', 'action_points', 'comments'): False,
-                                   ('edit', 'action_points', 'completed_at'): False,
-                                   ('edit', 'action_points', 'created_at'): False,
-                                   ('edit', 'action_points', 'description'): False,
-                                   ('edit', 'action_points', 'due_date'): False,
-                                   ('edit', 'action_points', 'follow_up'): False,
-                                   ('edit', 'action_points', 'id'): False,
-                                   ('edit', 'action_points', 'person_responsible'): False,
-                                   ('edit', 'action_points', 'status'): False,
-                                   ('edit', 'action_points', 'trip_reference_number'): False,
-                                   ('edit', 'activities', 'date'): False,
-                                   ('edit', 'activities', 'id'): False,
-                                   ('edit', 'activities', 'locations'): False,
-                                   ('edit', 'activities', 'partner'): False,
-                                   ('edit', 'activities', 'partnership'): False,
-                                   ('edit', 'activities', 'primary_traveler'): False,
-                                   ('edit', 'activities', 'result'): False,
-                                   ('edit', 'activities', 'travel_type'): False,
-                                   ('edit', 'clearances', 'id'): False,
-                                   ('edit', 'clearances', 'medical_clearance'): False,
-                                   ('edit', 'clearances', 'security_clearance'): False,
-                                   ('edit', 'clearances', 'security_course'): False,
-                                   ('edit', 'cost_assignments', 'business_area'): False,
-                                   ('edit', 'cost_assignments', 'delegate'): False,
-                                   ('edit', 'cost_assignments', 'fund'): False,
-                                   ('edit', 'cost_assignments', 'grant'): False,
-                                   ('edit', 'cost_assignments', 'id'): False,
-                                   ('edit', 'cost_assignments', 'share'): False,
-                                   ('edit', 'cost_assignments', 'wbs'): False,
-                                   ('edit', 'deductions', 'accomodation'): False,
-                                   ('edit', 'deductions', 'breakfast'): False,
-                                   ('edit', 'deductions', 'date'): False,
-                                   ('edit', 'deductions', 'day_of_the_week'): False,
-                                   ('edit', 'deductions', 'dinner'): False,
-                                   ('edit', 'deductions', 'id'): False,
-                                   ('edit', 'deductions', 'lunch'): False,
-                                   ('edit', 'deductions', 'no_dsa'): False,
-                                   ('edit', 'expenses', 'account_currency'): False,
-                                   ('edit', 'expenses', 'amount'): False,
-                                   ('edit', 'expenses', 'document_currency'): False,
-                                   ('edit', 'expenses', 'id'): False,
-                                   ('edit', 'expenses', 'type'): False,
-                                   ('edit', 'itinerary', 'airlines'): False,
-                                   ('edit', 'itinerary', 'arrival_date'): False,
-                                   ('edit', 'itinerary', 'departure_date'): False,
-                                   ('edit', 'itinerary', 'destination'): False,
-                                   ('edit', 'itinerary', 'dsa_region'): False,
-                                   ('edit', 'itinerary', 'id'): False,
-                                   ('edit', 'itinerary', 'mode_of_travel'): False,
-                                   ('edit', 'itinerary', 'origin'): False,
-                                   ('edit', 'itinerary', 'overnight_travel'): False,
-                                   ('edit', 'travel', 'action_points'): False,
-                                   ('edit', 'travel', 'activities'): False,
-                                   ('edit', 'travel', 'clearances'): False,
-                                   ('edit', 'travel', 'cost_assignments'): False,
-                                   ('edit', 'travel', 'cost_summary'): False,
-                                   ('edit', 'travel', 'currency'): False,
-                                   ('edit', 'travel', 'deductions'): False,
-                                   ('edit', 'travel', 'end_date'): False,
-                                   ('edit', 'travel', 'expenses'): False,
-                                   ('edit', 'travel', 'id'): False,
-                                   ('edit', 'travel', 'international_travel'): False,
-                                   ('edit', 'travel', 'itinerary'): False,
-                                   ('edit', 'travel', 'office'): False,
-                                   ('edit', 'travel', 'purpose'): False,
-                                   ('edit', 'travel', 'reference_number'): False,
-                                   ('edit', 'travel', 'report'): False,
-                                   ('edit', 'travel', 'section'): False,
-                                   ('edit', 'travel', 'start_date'): False,
-                                   ('edit', 'travel', 'status'): False,
-                                   ('edit', 'travel', 'supervisor'): False,
-                                   ('edit', 'travel', 'ta_required'): False,
-                                   ('edit', 'travel', 'traveler'): False,
-                                   ('view', 'action_points', 'action_point_number'): True,
-                                   ('view', 'action_points', 'actions_taken'): True,
-                                   ('view', 'action_points', 'comments'): True,
-                                   ('view', 'action_points', 'completed_at'): True,
-                                   ('view', 'action_points', 'created_at'): True,
-                                   ('view', 'action_points', 'description'): True,
-                                   ('view', 'action_points', 'due_date'): True,
-                                   ('view', 'action_points', 'follow_up'): True,
-                                   ('view', 'action_points', 'id'): True,
-                                   ('view', 'action_points', 'person_responsible'): True,
-                                   ('view', 'action_points', 'status'): True,
-                                   ('view', 'action_points', 'trip_reference_number'): True,
-                                   ('view', 'activities', 'date'): True,
-                                   ('view', 'activities', 'id'): True,
-                                   ('view', 'activities', 'locations'): True,
-                                   ('view', 'activities', 'partner'): True,
-                                   ('view', 'activities', 'partnership'): True,
-                                   ('view', 'activities', 'primary_traveler'): True,
-                                   ('view', 'activities', 'result'): True,
-                                   ('view', 'activities', 'travel_type'): True,
-                                   ('view', 'clearances', 'id'): True,
-                                   ('view', 'clearances', 'medical_clearance'): True,
-                                   ('view', 'clearances', 'security_clearance'): True,
-                                   ('view', 'clearances', 'security_course'): True,
-                                   ('view', 'cost_assignments', 'business_area'): True,
-                                   ('view', 'cost_assignments', 'delegate'): True,
-                                   ('view', 'cost_assignments', 'fund'): True,
-                                   ('view', 'cost_assignments', 'grant'): True,
-                                   ('view', 'cost_assignments', 'id'): True,
-                                   ('view', 'cost_assignments', 'share'): True,
-                                   ('view', 'cost_assignments', 'wbs'): True,
-                                   ('view', 'deductions', 'accomodation'): True,
-                                   ('view', 'deductions', 'breakfast'): True,
-                                   ('view', 'deductions', 'date'): True,
-                                   ('view', 'deductions', 'day_of_the_week'): True,
-                                   ('view', 'deductions', 'dinner'): True,
-                                   ('view', 'deductions', 'id'): True,
-                                   ('view', 'deductions', 'lunch'): True,
-                                   ('view', 'deductions', 'no_dsa'): True,
-                                   ('view', 'expenses', 'account_currency'): True,
-                                   ('view', 'expenses', 'amount'): True,
-                                   ('view', 'expenses', 'document_currency'): True,
-                                   ('view', 'expenses', 'id'): True,
-                                   ('view', 'expenses', 'type'): True,
-                                   ('view', 'itinerary', 'airlines'): True,
-                                   ('view', 'itinerary', 'arrival_date'): True,
-                                   ('view', 'itinerary', 'departure_date'): True,
-                                   ('view', 'itinerary', 'destination'): True,
-                                   ('view', 'itinerary', 'dsa_region'): True,
-                                   ('view', 'itinerary', 'id'): True,
-                                   ('view', 'itinerary', 'mode_of_travel'): True,
-                                   ('view', 'itinerary', 'origin'): True,
-                                   ('view', 'itinerary', 'overnight_travel'): True,
-                                   ('view', 'travel', 'action_points'): True,
-                                   ('view', 'travel', 'activities'): True,
-                                   ('view', 'travel', 'clearances'): True,
-                                   ('view', 'travel', 'cost_assignments'): True,
-                                   ('view', 'travel', 'cost_summary'): True,
-                                   ('view', 'travel', 'currency'): True,
-                                   ('view', 'travel', 'deductions'): True,
-                                   ('view', 'travel', 'end_date'): True,
-                                   ('view', 'travel', 'expenses'): True,
-                                   ('view', 'travel', 'id'): True,
-                                   ('view', 'travel', 'international_travel'): True,
-                                   ('view', 'travel', 'itinerary'): True,
-                                   ('view', 'travel', 'office'): True,
-                                   ('view', 'travel', 'purpose'): True,
-                                   ('view', 'travel', 'reference_number'): True,
-                                   ('view', 'travel', 'report'): True,
-                                   ('view', 'travel', 'section'): True,
-                                   ('view', 'travel', 'start_date'): True,
-                                   ('view', 'travel', 'status'): True,
-                                   ('view', 'travel', 'supervisor'): True,
-                                   ('view', 'travel', 'ta_required'): True,
-                                   ('view', 'travel', 'traveler'): True},
-                                  'rejected':
-                                  {('edit', 'action_points', 'action_point_number'): False,
-                                   ('edit', 'action_points', 'actions_taken'): False,
-                                   ('edit', 'action_points', 'comments'): False,
-                                   ('edit', 'action_points', 'completed_at'): False,
-                                   ('edit', 'action_points', 'created_at'): False,
-                                   ('edit', 'action_points', 'description'): False,
-                                   ('edit', 'action_points', 'due_date'): False,
-                                   ('edit', 'action_points', 'follow_up'): False,
-                                   ('edit', 'action_points', 'id'): False,
-                                   ('edit', 'action_points', 'person_responsible'): False,
-                                   ('edit', 'action_points', 'status'): False,
-                                   ('edit', 'action_points', 'trip_reference_number'): False,
-                                   ('edit', 'activities', 'date'): False,
-                                   ('edit', 'activities', 'id'): False,
-                                   ('edit', 'activities', 'locations'): False,
-                                   ('edit', 'activities', 'partner'): False,
-                                   ('edit', 'activities', 'partnership'): False,
-                                   ('edit', 'activities', 'primary_traveler'): False,
-                                   ('edit', 'activities', 'result'): False,
-                                   ('edit', 'activities', 'travel_type'): False,
-                                   ('edit', 'clearances', 'id'): False,
-                                   ('edit', 'clearances', 'medical_clearance'): False,
-                                   ('edit', 'clearances', 'security_clearance'): False,
-                                   ('edit', 'clearances', 'security_course'): False,
-                                   ('edit', 'cost_assignments', 'business_area'): False,
-                                   ('edit', 'cost_assignments', 'delegate'): False,
-                                   ('edit', 'cost_assignments', 'fund'): False,
-                                   ('edit', 'cost_assignments', 'grant'): False,
-                                   ('edit', 'cost_assignments', 'id'): False,
-                                   ('edit', 'cost_assignments', 'share'): False,
-                                   ('edit', 'cost_assignments', 'wbs'): False,
-                                   ('edit', 'deductions', 'accomodation'): False,
-                                   ('edit', 'deductions', 'breakfast'): False,
-                                   ('edit', 'deductions', 'date'): False,
-                                   ('edit', 'deductions', 'day_of_the_week'): False,
-                                   ('edit', 'deductions', 'dinner'): False,
-                                   ('edit', 'deductions', 'id'): False,
-                                   ('edit', 'deductions', 'lunch'): False,
-                                   ('edit', 'deductions', 'no_dsa'): False,
-                                   ('edit', 'expenses', 'account_currency'): False,
-                                   ('edit', 'expenses', 'amount'): False,
-                                   ('edit', 'expenses', 'document_currency'): False,
-                                   ('edit', 'expenses', 'id'): False,
-                                   ('edit', 'expenses', 'type'): False,
-                                   ('edit', 'itinerary', 'airlines'): False,
-                                   ('edit', 'itinerary', 'arrival_date'): False,
-                                   ('edit', 'itinerary', 'departure_date'): False,
-                                   ('edit', 'itinerary', 'destination'): False,
-                                   ('edit', 'itinerary', 'dsa_region'): False,
-                                   ('edit', 'itinerary', 'id'): False,
-                                   ('edit', 'itinerary', 'mode_of_travel'): False,
-                                   ('edit', 'itinerary', 'origin'): False,
-                                   ('edit', 'itinerary', 'overnight_travel'): False,
-                                   ('edit', 'travel', 'action_points'): False,
-                                   ('edit', 'travel', 'activities'): False,
-                                   ('edit', 'travel', 'clearances'): False,
-                                   ('edit', 'travel', 'cost_assignments'): False,
-                                   ('edit', 'travel', 'cost_summary'): False,
-                                   ('edit', 'travel', 'currency'): False,
-                                   ('edit', 'travel', 'deductions'): False,
-                                   ('edit', 'travel', 'end_date'): False,
-                                   ('edit', 'travel', 'expenses'): False,
-                                   ('edit', 'travel', 'id'): False,
-                                   ('edit', 'travel', 'international_travel'): False,
-                                   ('edit', 'travel', 'itinerary'): False,
-                                   ('edit', 'travel', 'office'): False,
-                                   ('edit', 'travel', 'purpose'): False,
-                                   ('edit', 'travel', 'reference_number'): False,
-                                   ('edit', 'travel', 'report'): False,
-                                   ('edit', 'travel', 'section'): False,
-                                   ('edit', 'travel', 'start_date'): False,
-                                   ('edit', 'travel', 'status'): False,
-                                   ('edit', 'travel', 'supervisor'): False,
-                                   ('edit', 'travel', 'ta_required'): False,
-                                   ('edit', 'travel', 'traveler'): False,
-                                   ('view', 'action_points', 'action_point_number'): True,
-                                   ('view', 'action_points', 'actions_taken'): True,
-                                   ('view', 'action_points', 'comments'): True,
-                                   ('view', 'action_points', 'completed_at'): True,
-                                   ('view', 'action_points', 'created_at'): True,
-                                   ('view', 'action_points', 'description'): True,
-                                   ('view', 'action_points', 'due_date'): True,
-                                   ('view', 'action_points', 'follow_up'): True,
-                                   ('view', 'action_points', 'id'): True,
-                                   ('view', 'action_points', 'person_responsible'): True,
-                                   ('view', 'action_points', 'status'): True,
-                                   ('view', 'action_points', 'trip_reference_number'): True,
-                                   ('view', 'activities', 'date'): True,
-                                   ('view', 'activities', 'id'): True,
-                                   ('view', 'activities', 'locations'): True,
-                                   ('view', 'activities', 'partner'): True,
-                                   ('view', 'activities', 'partnership'): True,
-                                   ('view', 'activities', 'primary_traveler'): True,
-                                   ('view', 'activities', 'result'): True,
-                                   ('view', 'activities', 'travel_type'): True,
-                                   ('view', 'clearances', 'id'): True,
-                                   ('view', 'clearances', 'medical_clearance'): True,
-                                   ('view', 'clearances', 'security_clearance'): True,
-                                   ('view', 'clearances', 'security_course'): True,
-                                   ('view', 'cost_assignments', 'business_area'): True,
-                                   ('view', 'cost_assignments', 'delegate'): True,
-                                   ('view', 'cost_assignments', 'fund'): True,
-                                   ('view', 'cost_assignments', 'grant'): True,
-                                   ('view', 'cost_assignments', 'id'): True,
-                                   ('view', 'cost_assignments', 'share'): True,
-                                   ('view', 'cost_assignments', 'wbs'): True,
-                                   ('view', 'deductions', 'accomodation'): True,
-                                   ('view', 'deductions', 'breakfast'): True,
-                                   ('view', 'deductions', 'date'): True,
-                                   ('view', 'deductions', 'day_of_the_week'): True,
-                                   ('view', 'deductions', 'dinner'): True,
-                                   ('view', 'deductions', 'id'): True,
-                                   ('view', 'deductions', 'lunch'): True,
-                                   ('view', 'deductions', 'no_dsa'): True,
-                                   ('view', 'expenses', 'account_currency'): True,
-                                   ('view', 'expenses', 'amount'): True,
-                                   ('view', 'expenses', 'document_currency'): True,
-                                   ('view', 'expenses', 'id'): True,
-                                   ('view', 'expenses', 'type'): True,
-                                   ('view', 'itinerary', 'airlines'): True,
-                                   ('view', 'itinerary', 'arrival_date'): True,
-                                   ('view', 'itinerary', 'departure_date'): True,
-                                   ('view', 'itinerary', 'destination'): True,
-                                   ('view', 'itinerary', 'dsa_region'): True,
-                                   ('view', 'itinerary', 'id'): True,
-                                   ('view', 'itinerary', 'mode_of_travel'): True,
-                                   ('view', 'itinerary', 'origin'): True,
-                                   ('view', 'itinerary', 'overnight_travel'): True,
-                                   ('view', 'travel', 'action_points'): True,
-                                   ('view', 'travel', 'activities'): True,
-                                   ('view', 'travel', 'clearances'): True,
-                                   ('view', 'travel', 'cost_assignments'): True,
-                                   ('view', 'travel', 'cost_summary'): True,
-                                   ('view', 'travel', 'currency'): True,
-                                   ('view', 'travel', 'deductions'): True,
-                                   ('view', 'travel', 'end_date'): True,
-                                   ('view', 'travel', 'expenses'): True,
-                                   ('view', 'travel', 'id'): True,
-                                   ('view', 'travel', 'international_travel'): True,
-                                   ('view', 'travel', 'itinerary'): True,
-                                   ('view', 'travel', 'office'): True,
-                                   ('view', 'travel', 'purpose'): True,
-                                   ('view', 'travel', 'reference_number'): True,
-                                   ('view', 'travel', 'report'): True,
-                                   ('view', 'travel', 'section'): True,
-                                   ('view', 'travel', 'start_date'): True,
-                                   ('view', 'travel', 'status'): True,
-                                   ('view', 'travel', 'supervisor'): True,
-                                   ('view', 'travel', 'ta_required'): True,
-                                   ('view', 'travel', 'traveler'): True},
-                                  'submitted':
-                                  {('edit', 'action_points', 'action_point_number'): False,
-                                   ('edit', 'action_points', 'actions_taken'): False,
-                                   ('edit', 'action_points', 'comments'): False,
-                                   ('edit', 'action_points', 'completed_at'): False,
-                                   ('edit', 'action_points', 'created_at'): False,
-                                   ('edit', 'action_points', 'description'): False,
-                                   ('edit', 'action_points', 'due_date'): False,
-                                   ('edit', 'action_points', 'follow_up'): False,
-                                   ('edit', 'action_points', 'id'): False,
-                                   ('edit', 'action_points', 'person_responsible'): False,
-                                   ('edit', 'action_points', 'status'): False,
-                                   ('edit', 'action_points', 'trip_reference_number'): False,
-                                   ('edit', 'activities', 'date'): False,
-                                   ('edit', 'activities', 'id'): False,
-                                   ('edit', 'activities', 'locations'): False,
-                                   ('edit', 'activities', 'partner'): False,
-                                   ('edit', 'activities', 'partnership'): False,
-                                   ('edit', 'activities', 'primary_traveler'): False,
-                                   ('edit', 'activities', 'result'): False,
-                                   ('edit', 'activities', 'travel_type'): False,
-                                   ('edit', 'clearances', 'id'): False,
-                                   ('edit', 'clearances', 'medical_clearance'): False,
-                                   ('edit', 'clearances', 'security_clearance'): False,
-                                   ('edit', 'clearances', 'security_course'): False,
-                                   ('edit', 'cost_assignments', 'business_area'): False,
-                                   ('edit', 'cost_assignments', 'delegate'): False,
-                                   ('edit', 'cost_assignments', 'fund'): False,
-                                   ('edit', 'cost_assignments', 'grant'): False,
-                                   ('edit', 'cost_assignments', 'id'): False,
-                                   ('edit', 'cost_assignments', 'share'): False,
-                                   ('edit', 'cost_assignments', 'wbs'): False,
-                                   ('edit', 'deductions', 'accomodation'): False,
-                                   ('edit', 'deductions', 'breakfast'): False,
-                                   ('edit', 'deductions', 'date'): False,
-                                   ('edit', 'deductions', 'day_of_the_week'): False,
-                                   ('edit', 'deductions', 'dinner'): False,
-                                   ('edit', 'deductions', 'id'): False,
-                                   ('edit', 'deductions', 'lunch'): False,
-                                   ('edit', 'deductions', 'no_dsa'): False,
-                                   ('edit', 'expenses', 'account_currency'): False,
-                                   ('edit', 'expenses', 'amount'): False,
-                                   ('edit', 'expenses', 'document_currency'): False,
-                                   ('edit', 'expenses', 'id'): False,
-                                   ('edit', 'expenses', 'type'): False,
-                                   ('edit', 'itinerary', 'airlines'): False,
-                                   ('edit', 'itinerary', 'arrival_date'): False,
-                                   ('edit', 'itinerary', 'departure_date'): False,
-                                   ('edit', 'itinerary', 'destination'): False,
-                                   ('edit', 'itinerary', 'dsa_region'): False,
-                                   ('edit', 'itinerary', 'id'): False,
-                                   ('edit', 'itinerary', 'mode_of_travel'): False,
-                                   ('edit', 'itinerary', 'origin'): False,
-                                   ('edit', 'itinerary', 'overnight_travel'): False,
-                                   ('edit', 'travel', 'action_points'): False,
-                                   ('edit', 'travel', 'activities'): False,
-                                   ('edit', 'travel', 'clearances'): False,
-                                   ('edit', 'travel', 'cost_assignments'): False,
-                                   ('edit', 'travel', 'cost_summary'): False,
-                                   ('edit', 'travel', 'currency'): False,
-                                   ('edit', 'travel', 'deductions'): False,
-                                   ('edit', 'travel', 'end_date'): False,
-                                   ('edit', 'travel', 'expenses'): False,
-                                   ('edit', 'travel', 'id'): False,
-                                   ('edit', 'travel', 'international_travel'): False,
-                                   ('edit', 'travel', 'itinerary'): False,
-                                   ('edit', 'travel', 'office'): False,
-                                   ('edit', 'travel', 'purpose'): False,
-                                   ('edit', 'travel', 'reference_number'): False,
-                                   ('edit', 'travel', 'report'): False,
-                                   ('edit', 'travel', 'section'): False,
-                                   ('edit', 'travel', 'start_date'): False,
-                                   ('edit', 'travel', 'status'): False,
-                                   ('edit', 'travel', 'supervisor'): False,
-                                   ('edit', 'travel', 'ta_required'): False,
-                                   ('edit', 'travel', 'traveler'): False,
-                                   ('view', 'action_points', 'action_point_number'): True,
-                                   ('view', 'action_points', 'actions_taken'): True,
-                                   ('view', 'action_points', 'comments'): True,
-                                   ('view', 'action_points', 'completed_at'): True,
-                                   ('view', 'action_points', 'created_at'): True,
-                                   ('view', 'action_points', 'description'): True,
-                                   ('view', 'action_points', 'due_date'): True,
-                                   ('view', 'action_points', 'follow_up'): True,
-                                   ('view', 'action_points', 'id'): True,
-                                   ('view', 'action_points', 'person_responsible'): True,
-                                   ('view', 'action_points', 'status'): True,
-                                   ('view', 'action_points', 'trip_reference_number'): True,
-                                   ('view', 'activities', 'date'): True,
-                                   ('view', 'activities', 'id'): True,
-                                   ('view', 'activities', 'locations'): True,
-                                   ('view', 'activities', 'partner'): True,
-                                   ('view', 'activities', 'partnership'): True,
-                                   ('view', 'activities', 'primary_traveler'): True,
-                                   ('view', 'activities', 'result'): True,
-                                   ('view', 'activities', 'travel_type'): True,
-                                   ('view', 'clearances', 'id'): True,
-                                   ('view', 'clearances', 'medical_clearance'): True,
-                                   ('view', 'clearances', 'security_clearance'): True,
-                                   ('view', 'clearances', 'security_course'): True,
-                                   ('view', 'cost_assignments', 'business_area'): True,
-                                   ('view', 'cost_assignments', 'delegate'): True,
-                                   ('view', 'cost_assignments', 'fund'): True,
-                                   ('view', 'cost_assignments', 'grant'): True,
-                                   ('view', 'cost_assignments', 'id'): True,
-                                   ('view', 'cost_assignments', 'share'): True,
-                                   ('view', 'cost_assignments', 'wbs'): True,
-                                   ('view', 'deductions', 'accomodation'): True,
-                                   ('view', 'deductions', 'breakfast'): True,
-                                   ('view', 'deductions', 'date'): True,
-                                   ('view', 'deductions', 'day_of_the_week'): True,
-                                   ('view', 'deductions', 'dinner'): True,
-                                   ('view', 'deductions', 'id'): True,
-                                   ('view', 'deductions', 'lunch'): True,
-                                   ('view', 'deductions', 'no_dsa'): True,
-                                   ('view', 'expenses', 'account_currency'): True,
-                                   ('view', 'expenses', 'amount'): True,
-                                   ('view', 'expenses', 'document_currency'): True,
-                                   ('view', 'expenses', 'id'): True,
-                                   ('view', 'expenses', 'type'): True,
-                                   ('view', 'itinerary', 'airlines'): True,
-                                   ('view', 'itinerary', 'arrival_date'): True,
-                                   ('view', 'itinerary', 'departure_date'): True,
-                                   ('view', 'itinerary', 'destination'): True,
-                                   ('view', 'itinerary', 'dsa_region'): True,
-                                   ('view', 'itinerary', 'id'): True,
-                                   ('view', 'itinerary', 'mode_of_travel'): True,
-                                   ('view', 'itinerary', 'origin'): True,
-                                   ('view', 'itinerary', 'overnight_travel'): True,
-                                   ('view', 'travel', 'action_points'): True,
-                                   ('view', 'travel', 'activities'): True,
-                                   ('view', 'travel', 'clearances'): True,
-                                   ('view', 'travel', 'cost_assignments'): True,
-                                   ('view', 'travel', 'cost_summary'): True,
-                                   ('view', 'travel', 'currency'): True,
-                                   ('view', 'travel', 'deductions'): True,
-                                   ('view', 'travel', 'end_date'): True,
-                                   ('view', 'travel', 'expenses'): True,
-                                   ('view', 'travel', 'id'): True,
-                                   ('view', 'travel', 'international_travel'): True,
-                                   ('view', 'travel', 'itinerary'): True,
-                                   ('view', 'travel', 'office'): True,
-                                   ('view', 'travel', 'purpose'): True,
-                                   ('view', 'travel', 'reference_number'): True,
-                                   ('view', 'travel', 'report'): True,
-                                   ('view', 'travel', 'section'): True,
-                                   ('view', 'travel', 'start_date'): True,
-                                   ('view', 'travel', 'status'): True,
-                                   ('view', 'travel', 'supervisor'): True,
-                                   ('view', 'travel', 'ta_required'): True,
-                                   ('view', 'travel', 'traveler'): True}},
-               'Supervisor': {'approved':
-                              {('edit', 'action_points', 'action_point_number'): True,
-                               ('edit', 'action_points', 'actions_taken'): True,
-                               ('edit', 'action_points', 'comments'): True,
-                               ('edit', 'action_points', 'completed_at'): True,
-                               ('edit', 'action_points', 'created_at'): True,
-                               ('edit', 'action_points', 'description'): True,
-                               ('edit', 'action_points', 'due_date'): True,
-                               ('edit', 'action_points', 'follow_up'): True,
-                               ('edit', 'action_points', 'id'): True,
-                               ('edit', 'action_points', 'person_responsible'): True,
-                               ('edit', 'action_points', 'status'): True,
-                               ('edit', 'action_points', 'trip_reference_number'): True,
-                               ('edit', 'activities', 'date'): False,
-                               ('edit', 'activities', 'id'): False,
-                               ('edit', 'activities', 'locations'): False,
-                               ('edit', 'activities', 'partner'): False,
-                               ('edit', 'activities', 'partnership'): False,
-                               ('edit', 'activities', 'primary_traveler'): False,
-                               ('edit', 'activities', 'result'): False,
-                               ('edit', 'activities', 'travel_type'): False,
-                               ('edit', 'clearances', 'id'): False,
-                               ('edit', 'clearances', 'medical_clearance'): False,
-                               ('edit', 'clearances', 'security_clearance'): False,
-                               ('edit', 'clearances', 'security_course'): False,
-                               ('edit', 'cost_assignments', 'business_area'): False,
-                               ('edit', 'cost_assignments', 'delegate'): False,
-                               ('edit', 'cost_assignments', 'fund'): False,
-                               ('edit', 'cost_assignments', 'grant'): False,
-                               ('edit', 'cost_assignments', 'id'): False,
-                               ('edit', 'cost_assignments', 'share'): False,
-                               ('edit', 'cost_assignments', 'wbs'): False,
-                               ('edit', 'deductions', 'accomodation'): False,
-                               ('edit', 'deductions', 'breakfast'): False,
-                               ('edit', 'deductions', 'date'): False,
-                               ('edit', 'deductions', 'day_of_the_week'): False,
-                               ('edit', 'deductions', 'dinner'): False,
-                               ('edit', 'deductions', 'id'): False,
-                               ('edit', 'deductions', 'lunch'): False,
-                               ('edit', 'deductions', 'no_dsa'): False,
-                               ('edit', 'expenses', 'account_currency'): False,
-                               ('edit', 'expenses', 'amount'): False,
-                               ('edit', 'expenses', 'document_currency'): False,
-                               ('edit', 'expenses', 'id'): False,
-                               ('edit', 'expenses', 'type'): False,
-                               ('edit', 'itinerary', 'airlines'): False,
-                               ('edit', 'itinerary', 'arrival_date'): False,
-                               ('edit', 'itinerary', 'departure_date'): False,
-                               ('edit', 'itinerary', 'destination'): False,
-                               ('edit', 'itinerary', 'dsa_region'): False,
-                               ('edit', 'itinerary', 'id'): False,
-                               ('edit', 'itinerary', 'mode_of_travel'): False,
-                               ('edit', 'itinerary', 'origin'): False,
-                               ('edit', 'itinerary', 'overnight_travel'): False,
-                               ('edit', 'travel', 'action_points'): True,
-                               ('edit', 'travel', 'activities'): False,
-                               ('edit', 'travel', 'clearances'): False,
-                               ('edit', 'travel', 'cost_assignments'): False,
-                               ('edit', 'travel', 'cost_summary'): False,
-                               ('edit', 'travel', 'currency'): False,
-                               ('edit', 'travel', 'deductions'): False,
-                               ('edit', 'travel', 'end_date'): False,
-                               ('edit', 'travel', 'expenses'): False,
-                               ('edit', 'travel', 'id'): False,
-                               ('edit', 'travel', 'international_travel'): False,
-                               ('edit', 'travel', 'itinerary'): False,
-                               ('edit', 'travel', 'office'): False,
-                               ('edit', 'travel', 'purpose'): False,
-                               ('edit', 'travel', 'reference_number'): False,
-                               ('edit', 'travel', 'report'): False,
-                               ('edit', 'travel', 'section'): False,
-                               ('edit', 'travel', 'start_date'): False,
-                               ('edit', 'travel', 'status'): False,
-                               ('edit', 'travel', 'supervisor'): False,
-                               ('edit', 'travel', 'ta_required'): False,
-                               ('edit', 'travel', 'traveler'): False,
-                               ('view', 'action_points', 'action_point_number'): True,
-                               ('view', 'action_points', 'actions_taken'): True,
-                               ('view', 'action_points', 'comments'): True,
-                               ('view', 'action_points', 'completed_at'): True,
-                               ('view', 'action_points', 'created_at'): True,
-                               ('view', 'action_points', 'description'): True,
-                               ('view', 'action_points', 'due_date'): True,
-                               ('view', 'action_points', 'follow_up'): True,
-                               ('view', 'action_points', 'id'): True,
-                               ('view', 'action_points', 'person_responsible'): True,
-                               ('view', 'action_points', 'status'): True,
-                               ('view', 'action_points', 'trip_reference_number'): True,
-                               ('view', 'activities', 'date'): True,
-                               ('view', 'activities', 'id'): True,
-                               ('view', 'activities', 'locations'): True,
-                               ('view', 'activities', 'partner'): True,
-                               ('view', 'activities', 'partnership'): True,
-                               ('view', 'activities', 'primary_traveler'): True,
-                               ('view', 'activities', 'result'): True,
-                               ('view', 'activities', 'travel_type'): True,
-                               ('view', 'clearances', 'id'): True,
-                               ('view', 'clearances', 'medical_clearance'): True,
-                               ('view', 'clearances', 'security_clearance'): True,
-                               ('view', 'clearances', 'security_course'): True,
-                               ('view', 'cost_assignments', 'business_area'): True,
-                               ('view', 'cost_assignments', 'delegate'): True,
-                               ('view', 'cost_assignments', 'fund'): True,
-                               ('view', 'cost_assignments', 'grant'): True,
-                               ('view', 'cost_assignments', 'id'): True,
-                               ('view', 'cost_assignments', 'share'): True,
-                               ('view', 'cost_assignments', 'wbs'): True,
-                               ('view', 'deductions', 'accomodation'): True,
-                               ('view', 'deductions', 'breakfast'): True,
-                               ('view', 'deductions', 'date'): True,
-                               ('view', 'deductions', 'day_of_the_week'): True,
-                               ('view', 'deductions', 'dinner'): True,
-                               ('view', 'deductions', 'id'): True,
-                               ('view', 'deductions', 'lunch'): True,
-                               ('view', 'deductions', 'no_dsa'): True,
-                               ('view', 'expenses', 'account_currency'): True,
-                               ('view', 'expenses', 'amount'): True,
-                               ('view', 'expenses', 'document_currency'): True,
-                               ('view', 'expenses', 'id'): True,
-                               ('view', 'expenses', 'type'): True,
-                               ('view', 'itinerary', 'airlines'): True,
-                               ('view', 'itinerary', 'arrival_date'): True,
-                               ('view', 'itinerary', 'departure_date'): True,
-                               ('view', 'itinerary', 'destination'): True,
-                               ('view', 'itinerary', 'dsa_region'): True,
-                               ('view', 'itinerary', 'id'): True,
-                               ('view', 'itinerary', 'mode_of_travel'): True,
-                               ('view', 'itinerary', 'origin'): True,
-                               ('view', 'itinerary', 'overnight_travel'): True,
-                               ('view', 'travel', 'action_points'): True,
-                               ('view', 'travel', 'activities'): True,
-                               ('view', 'travel', 'clearances'): True,
-                               ('view', 'travel', 'cost_assignments'): True,
-                               ('view', 'travel', 'cost_summary'): True,
-                               ('view', 'travel', 'currency'): True,
-                               ('view', 'travel', 'deductions'): True,
-                               ('view', 'travel', 'end_date'): True,
-                               ('view', 'travel', 'expenses'): True,
-                               ('view', 'travel', 'id'): True,
-                               ('view', 'travel', 'international_travel'): True,
-                               ('view', 'travel', 'itinerary'): True,
-                               ('view', 'travel', 'office'): True,
-                               ('view', 'travel', 'purpose'): True,
-                               ('view', 'travel', 'reference_number'): True,
-                               ('view', 'travel', 'report'): True,
-                               ('view', 'travel', 'section'): True,
-                               ('view', 'travel', 'start_date'): True,
-                               ('view', 'travel', 'status'): True,
-                               ('view', 'travel', 'supervisor'): True,
-                               ('view', 'travel', 'ta_required'): True,
-                               ('view', 'travel', 'traveler'): True},
-                              'cancelled':
-                              {('edit', 'action_points', 'action_point_number'): True,
-                               ('edit', 'action_points', 'actions_taken'): True,
-                               ('edit', 'action_points', 'comments'): True,
-                               ('edit', 'action_points', 'completed_at'): True,
-                               ('edit', 'action_points', 'created_at'): True,
-                               ('edit', 'action_points', 'description'): True,
-                               ('edit', 'action_points', 'due_date'): True,
-                               ('edit', 'action_points', 'follow_up'): True,
-                               ('edit', 'action_points', 'id'): True,
-                               ('edit', 'action_points', 'person_responsible'): True,
-                               ('edit', 'action_points', 'status'): True,
-                               ('edit', 'action_points', 'trip_reference_number'): True,
-                               ('edit', 'activities', 'date'): False,
-                               ('edit', 'activities', 'id'): False,
-                               ('edit', 'activities', 'locations'): False,
-                               ('edit', 'activities', 'partner'): False,
-                               ('edit', 'activities', 'partnership'): False,
-                               ('edit', 'activities', 'primary_traveler'): False,
-                               ('edit', 'activities', 'result'): False,
-                               ('edit', 'activities', 'travel_type'): False,
-                               ('edit', 'clearances', 'id'): False,
-                               ('edit', 'clearances', 'medical_clearance'): False,
-                               ('edit', 'clearances', 'security_clearance'): False,
-                               ('edit', 'clearances', 'security_course'): False,
-                               ('edit', 'cost_assignments', 'business_area'): False,
-                               ('edit', 'cost_assignments', 'delegate'): False,
-                               ('edit', 'cost_assignments', 'fund'): False,
-                               ('edit', 'cost_assignments', 'grant'): False,
-                               ('edit', 'cost_assignments', 'id'): False,
-                               ('edit', 'cost_assignments', 'share'): False,
-                               ('edit', 'cost_assignments', 'wbs'): False,
-                               ('edit', 'deductions', 'accomodation'): False,
-                               ('edit', 'deductions', 'breakfast'): False,
-                               ('edit', 'deductions', 'date'): False,
-                               ('edit', 'deductions', 'day_of_the_week'): False,
-                               ('edit', 'deductions', 'dinner'): False,
-                               ('edit', 'deductions', 'id'): False,
-                               ('edit', 'deductions', 'lunch'): False,
-                               ('edit', 'deductions', 'no_dsa'): False,
-                               ('edit', 'expenses', 'account_currency'): False,
-                               ('edit', 'expenses', 'amount'): False,
-                               ('edit', 'expenses', 'document_currency'): False,
-                               ('edit', 'expenses', 'id'): False,
-                               ('edit', 'expenses', 'type'): False,
-                               ('edit', 'itinerary', 'airlines'): False,
-                               ('edit', 'itinerary', 'arrival_date'): False,
-                               ('edit', 'itinerary', 'departure_date'): False,
-                               ('edit', 'itinerary', 'destination'): False,
-                               ('edit', 'itinerary', 'dsa_region'): False,
-                               ('edit', 'itinerary', 'id'): False,
-                               ('edit', 'itinerary', 'mode_of_travel'): False,
-                               ('edit', 'itinerary', 'origin'): False,
-                               ('edit', 'itinerary', 'overnight_travel'): False,
-                               ('edit', 'travel', 'action_points'): True,
-                               ('edit', 'travel', 'activities'): False,
-                               ('edit', 'travel', 'clearances'): False,
-                               ('edit', 'travel', 'cost_assignments'): False,
-                               ('edit', 'travel', 'cost_summary'): False,
-                               ('edit', 'travel', 'currency'): False,
-                               ('edit', 'travel', 'deductions'): False,
-                               ('edit', 'travel', 'end_date'): False,
-                               ('edit', 'travel', 'expenses'): False,
-                               ('edit', 'travel', 'id'): False,
-                               ('edit', 'travel', 'international_travel'): False,
-                               ('edit', 'travel', 'itinerary'): False,
-                               ('edit', 'travel', 'office'): False,
-                               ('edit', 'travel', 'purpose'): False,
-                               ('edit', 'travel', 'reference_number'): False,
-                               ('edit', 'travel', 'report'): False,
-                               ('edit', 'travel', 'section'): False,
-                               ('edit', 'travel', 'start_date'): False,
-                               ('edit', 'travel', 'status'): False,
-                               ('edit', 'travel', 'supervisor'): False,
-                               ('edit', 'travel', 'ta_required'): False,
-                               ('edit', 'travel', 'traveler'): False,
-                               ('view', 'action_points', 'action_point_number'): True,
-                               ('view', 'action_points', 'actions_taken'): True,
-                               ('view', 'action_points', 'comments'): True,
-                               ('view', 'action_points', 'completed_at'): True,
-                               ('view', 'action_points', 'created_at'): True,
-                               ('view', 'action_points', 'description'): True,
-                               ('view', 'action_points', 'due_date'): True,
-                               ('view', 'action_points', 'follow_up'): True,
-                               ('view', 'action_points', 'id'): True,
-                               ('view', 'action_points', 'person_responsible'): True,
-                               ('view', 'action_points', 'status'): True,
-                               ('view', 'action_points', 'trip_reference_number'): True,
-                               ('view', 'activities', 'date'): True,
-                               ('view', 'activities', 'id'): True,
-                               ('view', 'activities', 'locations'): True,
-                               ('view', 'activities', 'partner'): True,
-                               ('view', 'activities', 'partnership'): True,
-                               ('view', 'activities', 'primary_traveler'): True,
-                               ('view', 'activities', 'result'): True,
-                               ('view', 'activities', 'travel_type'): True,
-                               ('view', 'clearances', 'id'): True,
-                               ('view', 'clearances', 'medical_clearance'): True,
-                               ('view', 'clearances', 'security_clearance'): True,
-                               ('view', 'clearances', 'security_course'): True,
-                               ('view', 'cost_assignments', 'business_area'): True,
-                               ('view', 'cost_assignments', 'delegate'): True,
-                               ('view', 'cost_assignments', 'fund'): True,
-                               ('view', 'cost_assignments', 'grant'): True,
-                               ('view', 'cost_assignments', 'id'): True,
-                               ('view', 'cost_assignments', 'share'): True,
-                               ('view', 'cost_assignments', 'wbs'): True,
-                               ('view', 'deductions', 'accomodation'): True,
-                               ('view', 'deductions', 'breakfast'): True,
-                               ('view', 'deductions', 'date'): True,
-                               ('view', 'deductions', 'day_of_the_week'): True,
-                               ('view', 'deductions', 'dinner'): True,
-                               ('view', 'deductions', 'id'): True,
-                               ('view', 'deductions', 'lunch'): True,
-                               ('view', 'deductions', 'no_dsa'): True,
-                               ('view', 'expenses', 'account_currency'): True,
-                               ('view', 'expenses', 'amount'): True,
-                               ('view', 'expenses', 'document_currency'): True,
-                               ('view', 'expenses', 'id'): True,
-                               ('view', 'expenses', 'type'): True,
-                               ('view', 'itinerary', 'airlines'): True,
-                               ('view', 'itinerary', 'arrival_date'): True,
-                               ('view', 'itinerary', 'departure_date'): True,
-                               ('view', 'itinerary', 'destination'): True,
-                               ('view', 'itinerary', 'dsa_region'): True,
-                               ('view', 'itinerary', 'id'): True,
-                               ('view', 'itinerary', 'mode_of_travel'): True,
-                               ('view', 'itinerary', 'origin'): True,
-                               ('view', 'itinerary', 'overnight_travel'): True,
-                               ('view', 'travel', 'action_points'): True,
-                               ('view', 'travel', 'activities'): True,
-                               ('view', 'travel', 'clearances'): True,
-                               ('view', 'travel', 'cost_assignments'): True,
-                               ('view', 'travel', 'cost_summary'): True,
-                               ('view', 'travel', 'currency'): True,
-                               ('view', 'travel', 'deductions'): True,
-                               ('view', 'travel', 'end_date'): True,
-                               ('view', 'travel', 'expenses'): True,
-                               ('view', 'travel', 'id'): True,
-                               ('view', 'travel', 'international_travel'): True,
-                               ('view', 'travel', 'itinerary'): True,
-                               ('view', 'travel', 'office'): True,
-                               ('view', 'travel', 'purpose'): True,
-                               ('view', 'travel', 'reference_number'): True,
-                               ('view', 'travel', 'report'): True,
-                               ('view', 'travel', 'section'): True,
-                               ('view', 'travel', 'start_date'): True,
-                               ('view', 'travel', 'status'): True,
-                               ('view', 'travel', 'supervisor'): True,
-                               ('view', 'travel', 'ta_required'): True,
-                               ('view', 'travel', 'traveler'): True},
-                              'completed':
-                              {('edit', 'action_points', 'action_point_number'): True,
-                               ('edit', 'action_points', 'actions_taken'): True,
-                               ('edit', 'action_points', 'comments'): True,
-                               ('edit', 'action_points', 'completed_at'): True,
-                               ('edit', 'action_points', 'created_at'): True,
-                               ('edit', 'action_points', 'description'): True,
-                               ('edit', 'action_points', 'due_date'): True,
-                               ('edit', 'action_points', 'follow_up'): True,
-                               ('edit', 'action_points', 'id'): True,
-                               ('edit', 'action_points', 'person_responsible'): True,
-                               ('edit', 'action_points', 'status'): True,
-                               ('edit', 'action_points', 'trip_reference_number'): True,
-                               ('edit', 'activities', 'date'): False,
-                               ('edit', 'activities', 'id'): False,
-                               ('edit', 'activities', 'locations'): False,
-                               ('edit', 'activities', 'partner'): False,
-                               ('edit', 'activities', 'partnership'): False,
-                               ('edit', 'activities', 'primary_traveler'): False,
-                               ('edit', 'activities', 'result'): False,
-                               ('edit', 'activities', 'travel_type'): False,
-                               ('edit', 'clearances', 'id'): False,
-                               ('edit', 'clearances', 'medical_clearance'): False,
-                               ('edit', 'clearances', 'security_clearance'): False,
-                               ('edit', 'clearances', 'security_course'): False,
-                               ('edit', 'cost_assignments', 'business_area'): False,
-                               ('edit', 'cost_assignments', 'delegate'): False,
-                               ('edit', 'cost_assignments', 'fund'): False,
-                               ('edit', 'cost_assignments', 'grant'): False,
-                               ('edit', 'cost_assignments', 'id'): False,
-                               ('edit', 'cost_assignments', 'share'): False,
-                               ('edit', 'cost_assignments', 'wbs'): False,
-                               ('edit', 'deductions', 'accomodation'): False,
-                               ('edit', 'deductions', 'breakfast'): False,
-                               ('edit', 'deductions', 'date'): False,
-                               ('edit', 'deductions', 'day_of_the_week'): False,
-                               ('edit', 'deductions', 'dinner'): False,
-                               ('edit', 'deductions', 'id'): False,
-                               ('edit', 'deductions', 'lunch'): False,
-                               ('edit', 'deductions', 'no_dsa'): False,
-                               ('edit', 'expenses', 'account_currency'): False,
-                               ('edit', 'expenses', 'amount'): False,
-                               ('edit', 'expenses', 'document_currency'): False,
-                               ('edit', 'expenses', 'id'): False,
-                               ('edit', 'expenses', 'type'): False,
-                               ('edit', 'itinerary', 'airlines'): False,
-                               ('edit', 'itinerary', 'arrival_date'): False,
-                               ('edit', 'itinerary', 'departure_date'): False,
-                               ('edit', 'itinerary', 'destination'): False,
-                               ('edit', 'itinerary', 'dsa_region'): False,
-                               ('edit', 'itinerary', 'id'): False,
-                               ('edit', 'itinerary', 'mode_of_travel'): False,
-                               ('edit', 'itinerary', 'origin'): False,
-                               ('edit', 'itinerary', 'overnight_travel'): False,
-                               ('edit', 'travel', 'action_points'): True,
-                               ('edit', 'travel', 'activities'): False,
-                               ('edit', 'travel', 'clearances'): False,
-                               ('edit', 'travel', 'cost_assignments'): False,
-                               ('edit', 'travel', 'cost_summary'): False,
-                               ('edit', 'travel', 'currency'): False,
-                               ('edit', 'travel', 'deductions'): False,
-                               ('edit', 'travel', 'end_date'): False,
-                               ('edit', 'travel', 'expenses'): False,
-                               ('edit', 'travel', 'id'): False,
-                               ('edit', 'travel', 'international_travel'): False,
-                               ('edit', 'travel', 'itinerary'): False,
-                               ('edit', 'travel', 'office'): False,
-                               ('edit', 'travel', 'purpose'): False,
-                               ('edit', 'travel', 'reference_number'): False,
-                               ('edit', 'travel', 'report'): False,
-                               ('edit', 'travel', 'section'): False,
-                               ('edit', 'travel', 'start_date'): False,
-                               ('edit', 'travel', 'status'): False,
-                               ('edit', 'travel', 'supervisor'): False,
-                               ('edit', 'travel', 'ta_required'): False,
-                               ('edit', 'travel', 'traveler'): False,
-                               ('view', 'action_points', 'action_point_number'): True,
-                               ('view', 'action_points', 'actions_taken'): True,
-                               ('view', 'action_points', 'comments'): True,
-                               ('view', 'action_points', 'completed_at'): True,
-                               ('view', 'action_points', 'created_at'): True,
-                               ('view', 'action_points', 'description'): True,
-                               ('view', 'action_points', 'due_date'): True,
-                               ('view', 'action_points', 'follow_up'): True,
-                               ('view', 'action_points', 'id'): True,
-                               ('view', 'action_points', 'person_responsible'): True,
-                               ('view', 'action_points', 'status'): True,
-                               ('view', 'action_points', 'trip_reference_number'): True,
-                               ('view', 'activities', 'date'): True,
-                               ('view', 'activities', 'id'): True,
-                               ('view', 'activities', 'locations'): True,
-                               ('view', 'activities', 'partner'): True,
-                               ('view', 'activities', 'partnership'): True,
-                               ('view', 'activities', 'primary_traveler'): True,
-                               ('view', 'activities', 'result'): True,
-                               ('view', 'activities', 'travel_type'): True,
-                               ('view', 'clearances', 'id'): True,
-                               ('view', 'clearances', 'medical_clearance'): True,
-                               ('view', 'clearances', 'security_clearance'): True,
-                               ('view', 'clearances', 'security_course'): True,
-                               ('view', 'cost_assignments', 'business_area'): True,
-                               ('view', 'cost_assignments', 'delegate'): True,
-                               ('view', 'cost_assignments', 'fund'): True,
-                               ('view', 'cost_assignments', 'grant'): True,
-                               ('view', 'cost_assignments', 'id'): True,
-                               ('view', 'cost_assignments', 'share'): True,
-                               ('view', 'cost_assignments', 'wbs'): True,
-                               ('view', 'deductions', 'accomodation'): True,
-                               ('view', 'deductions', 'breakfast'): True,
-                               ('view', 'deductions', 'date'): True,
-                               ('view', 'deductions', 'day_of_the_week'): True,
-                               ('view', 'deductions', 'dinner'): True,
-                               ('view', 'deductions', 'id'): True,
-                               ('view', 'deductions', 'lunch'): True,
-                               ('view', 'deductions', 'no_dsa'): True,
-                               ('view', 'expenses', 'account_currency'): True,
-                               ('view', 'expenses', 'amount'): True,
-                               ('view', 'expenses', 'document_currency'): True,
-                               ('view', 'expenses', 'id'): True,
-                               ('view', 'expenses', 'type'): True,
-                               ('view', 'itinerary', 'airlines'): True,
-                               ('view', 'itinerary', 'arrival_date'): True,
-                               ('view', 'itinerary', 'departure_date'): True,
-                               ('view', 'itinerary', 'destination'): True,
-                               ('view', 'itinerary', 'dsa_region'): True,
-                               ('view', 'itinerary', 'id'): True,
-                               ('view', 'itinerary', 'mode_of_travel'): True,
-                               ('view', 'itinerary', 'origin'): True,
-                               ('view', 'itinerary', 'overnight_travel'): True,
-                               ('view', 'travel', 'action_points'): True,
-                               ('view', 'travel', 'activities'): True,
-                               ('view', 'travel', 'clearances'): True,
-                               ('view', 'travel', 'cost_assignments'): True,
-                               ('view', 'travel', 'cost_summary'): True,
-                               ('view', 'travel', 'currency'): True,
-                               ('view', 'travel', 'deductions'): True,
-                               ('view', 'travel', 'end_date'): True,
-                               ('view', 'travel', 'expenses'): True,
-                               ('view', 'travel', 'id'): True,
-                               ('view', 'travel', 'international_travel'): True,
-                               ('view', 'travel', 'itinerary'): True,
-                               ('view', 'travel', 'office'): True,
-                               ('view', 'travel', 'purpose'): True,
-                               ('view', 'travel', 'reference_number'): True,
-                               ('view', 'travel', 'report'): True,
-                               ('view', 'travel', 'section'): True,
-                               ('view', 'travel', 'start_date'): True,
-                               ('view', 'travel', 'status'): True,
-                               ('view', 'travel', 'supervisor'): True,
-                               ('view', 'travel', 'ta_required'): True,
-                               ('view', 'travel', 'traveler'): True},
-                              'planned':
-                              {('edit', 'action_points', 'action_point_number'): True,
-                               ('edit', 'action_points', 'actions_taken'): True,
-                               ('edit', 'action_points', 'comments'): True,
-                               ('edit', 'action_points', 'completed_at'): True,
-                               ('edit', 'action_points', 'created_at'): True,
-                               ('edit', 'action_points', 'description'): True,
-                               ('edit', 'action_points', 'due_date'): True,
-                               ('edit', 'action_points', 'follow_up'): True,
-                               ('edit', 'action_points', 'id'): True,
-                               ('edit', 'action_points', 'person_responsible'): True,
-                               ('edit', 'action_points', 'status'): True,
-                               ('edit', 'action_points', 'trip_reference_number'): True,
-                               ('edit', 'activities', 'date'): False,
-                               ('edit', 'activities', 'id'): False,
-                               ('edit', 'activities', 'locations'): False,
-                               ('edit', 'activities', 'partner'): False,
-                               ('edit', 'activities', 'partnership'): False,
-                               ('edit', 'activities', 'primary_traveler'): False,
-                               ('edit', 'activities', 'result'): False,
-                               ('edit', 'activities', 'travel_type'): False,
-                               ('edit', 'clearances', 'id'): False,
-                               ('edit', 'clearances', 'medical_clearance'): False,
-                               ('edit', 'clearances', 'security_clearance'): False,
-                               ('edit', 'clearances', 'security_course'): False,
-                               ('edit', 'cost_assignments', 'business_area'): False,
-                               ('edit', 'cost_assignments', 'delegate'): False,
-                               ('edit', 'cost_assignments', 'fund'): False,
-                               ('edit', 'cost_assignments', 'grant'): False,
-                               ('edit', 'cost_assignments', 'id'): False,
-                               ('edit', 'cost_assignments', 'share'): False,
-                               ('edit', 'cost_assignments', 'wbs'): False,
-                               ('edit', 'deductions', 'accomodation'): False,
-                               ('edit', 'deductions', 'breakfast'): False,
-                               ('edit', 'deductions', 'date'): False,
-                               ('edit', 'deductions', 'day_of_the_week'): False,
-                               ('edit', 'deductions', 'dinner'): False,
-                               ('edit', 'deductions', 'id'): False,
-                               ('edit', 'deductions', 'lunch'): False,
-                               ('edit', 'deductions', 'no_dsa'): False,
-                               ('edit', 'expenses', 'account_currency'): False,
-                               ('edit', 'expenses', 'amount'): False,
-                               ('edit', 'expenses', 'document_currency'): False,
-                               ('edit', 'expenses', 'id'): False,
-                               ('edit', 'expenses', 'type'): False,
-                               ('edit', 'itinerary', 'airlines'): False,
-                               ('edit', 'itinerary', 'arrival_date'): False,
-                               ('edit', 'itinerary', 'departure_date'): False,
-                               ('edit', 'itinerary', 'destination'): False,
-                               ('edit', 'itinerary', 'dsa_region'): False,
-                               ('edit', 'itinerary', 'id'): False,
-                               ('edit', 'itinerary', 'mode_of_travel'): False,
-                               ('edit', 'itinerary', 'origin'): False,
-                               ('edit', 'itinerary', 'overnight_travel'): False,
-                               ('edit', 'travel', 'action_points'): True,
-                               ('edit', 'travel', 'activities'): False,
-                               ('edit', 'travel', 'clearances'): False,
-                               ('edit', 'travel', 'cost_assignments'): False,
-                               ('edit', 'travel', 'cost_summary'): False,
-                               ('edit', 'travel', 'currency'): False,
-                               ('edit', 'travel', 'deductions'): False,
-                               ('edit', 'travel', 'end_date'): False,
-                               ('edit', 'travel', 'expenses'): False,
-                               ('edit', 'travel', 'id'): False,
-                               ('edit', 'travel', 'international_travel'): False,
-                               ('edit', 'travel', 'itinerary'): False,
-                               ('edit', 'travel', 'office'): False,
-                               ('edit', 'travel', 'purpose'): False,
-                               ('edit', 'travel', 'reference_number'): False,
-                               ('edit', 'travel', 'report'): False,
-                               ('edit', 'travel', 'section'): False,
-                               ('edit', 'travel', 'start_date'): False,
-                               ('edit', 'travel', 'status'): False,
-                               ('edit', 'travel', 'supervisor'): False,
-                               ('edit', 'travel', 'ta_required'): False,
-                               ('edit', 'travel', 'traveler'): False,
-                               ('view', 'action_points', 'action_point_number'): True,
-                               ('view', 'action_points', 'actions_taken'): True,
-                               ('view', 'action_points', 'comments'): True,
-                               ('view', 'action_points', 'completed_at'): True,
-                               ('view', 'action_points', 'created_at'): True,
-                               ('view', 'action_points', 'description'): True,
-                               ('view', 'action_points', 'due_date'): True,
-                               ('view', 'action_points', 'follow_up'): True,
-                               ('view', 'action_points', 'id'): True,
-                               ('view', 'action_points', 'person_responsible'): True,
-                               ('view', 'action_points', 'status'): True,
-                               ('view', 'action_points', 'trip_reference_number'): True,
-                               ('view', 'activities', 'date'): True,
-                               ('view', 'activities', 'id'): True,
-                               ('view', 'activities', 'locations'): True,
-                               ('view', 'activities', 'partner'): True,
-                               ('view', 'activities', 'partnership'): True,
-                               ('view', 'activities', 'primary_traveler'): True,
-                               ('view', 'activities', 'result'): True,
-                               ('view', 'activities', 'travel_type'): True,
-                               ('view', 'clearances', 'id'): True,
-                               ('view', 'clearances', 'medical_clearance'): True,
-                               ('view', 'clearances', 'security_clearance'): True,
-                               ('view', 'clearances', 'security_course'): True,
-                               ('view', 'cost_assignments', 'business_area'): True,
-                               ('view', 'cost_assignments', 'delegate'): True,
-                               ('view', 'cost_assignments', 'fund'): True,
-                               ('view', 'cost_assignments', 'grant'): True,
-                               ('view', 'cost_assignments', 'id'): True,
-                               ('view', 'cost_assignments', 'share'): True,
-                               ('view', 'cost_assignments', 'wbs'): True,
-                               ('view', 'deductions', 'accomodation'): True,
-                               ('view', 'deductions', 'breakfast'): True,
-                               ('view', 'deductions', 'date'): True,
-                               ('view', 'deductions', 'day_of_the_week'): True,
-                               ('view', 'deductions', 'dinner'): True,
-                               ('view', 'deductions', 'id'): True,
-                               ('view', 'deductions', 'lunch'): True,
-                               ('view', 'deductions', 'no_dsa'): True,
-                               ('view', 'expenses', 'account_currency'): True,
-                               ('view', 'expenses', 'amount'): True,
-                               ('view', 'expenses', 'document_currency'): True,
-                               ('view', 'expenses', 'id'): True,
-                               ('view', 'expenses', 'type'): True,
-                               ('view', 'itinerary', 'airlines'): True,
-                               ('view', 'itinerary', 'arrival_date'): True,
-                               ('view', 'itinerary', 'departure_date'): True,
-                               ('view', 'itinerary', 'destination'): True,
-                               ('view', 'itinerary', 'dsa_region'): True,
-                               ('view', 'itinerary', 'id'): True,
-                               ('view', 'itinerary', 'mode_of_travel'): True,
-                               ('view', 'itinerary', 'origin'): True,
-                               ('view', 'itinerary', 'overnight_travel'): True,
-                               ('view', 'travel', 'action_points'): True,
-                               ('view', 'travel', 'activities'): True,
-                               ('view', 'travel', 'clearances'): True,
-                               ('view', 'travel', 'cost_assignments'): True,
-                               ('view', 'travel', 'cost_summary'): True,
-                               ('view', 'travel', 'currency'): True,
-                               ('view', 'travel', 'deductions'): True,
-                               ('view', 'travel', 'end_date'): True,
-                               ('view', 'travel', 'expenses'): True,
-                               ('view', 'travel', 'id'): True,
-                               ('view', 'travel', 'international_travel'): True,
-                               ('view', 'travel', 'itinerary'): True,
-                               ('view', 'travel', 'office'): True,
-                               ('view', 'travel', 'purpose'): True,
-                               ('view', 'travel', 'reference_number'): True,
-                               ('view', 'travel', 'report'): True,
-                               ('view', 'travel', 'section'): True,
-                               ('view', 'travel', 'start_date'): True,
-                               ('view', 'travel', 'status'): True,
-                               ('view', 'travel', 'supervisor'): True,
-                               ('view', 'travel', 'ta_required'): True,
-                               ('view', 'travel', 'traveler'): True},
-                              'rejected':
-                              {('edit', 'action_points', 'action_point_number'): True,
-                               ('edit', 'action_points', 'actions_taken'): True,
-                               ('edit', 'action_points', 'comments'): True,
-                               ('edit', 'action_points', 'completed_at'): True,
-                               ('edit', 'action_points', 'created_at'): True,
-                               ('edit', 'action_points', 'description'): True,
-                               ('edit', 'action_points', 'due_date'): True,
-                               ('edit', 'action_points', 'follow_up'): True,
-                               ('edit', 'action_points', 'id'): True,
-                               ('edit', 'action_points', 'person_responsible'): True,
-                               ('edit', 'action_points', 'status'): True,
-                               ('edit', 'action_points', 'trip_reference_number'): True,
-                               ('edit', 'activities', 'date'): False,
-                               ('edit', 'activities', 'id'): False,
-                               ('edit', 'activities', 'locations'): False,
-                               ('edit', 'activities', 'partner'): False,
-                               ('edit', 'activities', 'partnership'): False,
-                               ('edit', 'activities', 'primary_traveler'): False,
-                               ('edit', 'activities', 'result'): False,
-                               ('edit', 'activities', 'travel_type'): False,
-                               ('edit', 'clearances', 'id'): False,
-                               ('edit', 'clearances', 'medical_clearance'): False,
-                               ('edit', 'clearances', 'security_clearance'): False,
-                               ('edit', 'clearances', 'security_course'): False,
-                               ('edit', 'cost_assignments', 'business_area'): False,
-                               ('edit', 'cost_assignments', 'delegate'): False,
-                               ('edit', 'cost_assignments', 'fund'): False,
-                               ('edit', 'cost_assignments', 'grant'): False,
-                               ('edit', 'cost_assignments', 'id'): False,
-                               ('edit', 'cost_assignments', 'share'): False,
-                               ('edit', 'cost_assignments', 'wbs'): False,
-                               ('edit', 'deductions', 'accomodation'): False,
-                               ('edit', 'deductions', 'breakfast'): False,
-                               ('edit', 'deductions', 'date'): False,
-                               ('edit', 'deductions', 'day_of_the_week'): False,
-                               ('edit', 'deductions', 'dinner'): False,
-                               ('edit', 'deductions', 'id'): False,
-                               ('edit', 'deductions', 'lunch'): False,
-                               ('edit', 'deductions', 'no_dsa'): False,
-                               ('edit', 'expenses', 'account_currency'): False,
-                               ('edit', 'expenses', 'amount'): False,
-                               ('edit', 'expenses', 'document_currency'): False,
-                               ('edit', 'expenses', 'id'): False,
-                               ('edit', 'expenses', 'type'): False,
-                               ('edit', 'itinerary', 'airlines'): False,
-                               ('edit', 'itinerary', 'arrival_date'): False,
-                               ('edit', 'itinerary', 'departure_date'): False,
-                               ('edit', 'itinerary', 'destination'): False,
-                               ('edit', 'itinerary', 'dsa_region'): False,
-                               ('edit', 'itinerary', 'id'): False,
-                               ('edit', 'itinerary', 'mode_of_travel'): False,
-                               ('edit', 'itinerary', 'origin'): False,
-                               ('edit', 'itinerary', 'overnight_travel'): False,
-                               ('edit', 'travel', 'action_points'): True,
-                               ('edit', 'travel', 'activities'): False,
-                               ('edit', 'travel', 'clearances'): False,
-                               ('edit', 'travel', 'cost_assignments'): False,
-                               ('edit', 'travel', 'cost_summary'): False,
-                               ('edit', 'travel', 'currency'): False,
-                               ('edit', 'travel', 'deductions'): False,
-                               ('edit', 'travel', 'end_date'): False,
-                               ('edit', 'travel', 'expenses'): False,
-                               ('edit', 'travel', 'id'): False,
-                               ('edit', 'travel', 'international_travel'): False,
-                               ('edit', 'travel', 'itinerary'): False,
-                               ('edit', 'travel', 'office'): False,
-                               ('edit', 'travel', 'purpose'): False,
-                               ('edit', 'travel', 'reference_number'): False,
-                               ('edit', 'travel', 'report'): False,
-                               ('edit', 'travel', 'section'): False,
-                               ('edit', 'travel', 'start_date'): False,
-                               ('edit', 'travel', 'status'): False,
-                               ('edit', 'travel', 'supervisor'): False,
-                               ('edit', 'travel', 'ta_required'): False,
-                               ('edit', 'travel', 'traveler'): False,
-                               ('view', 'action_points', 'action_point_number'): True,
-                               ('view', 'action_points', 'actions_taken'): True,
-                               ('view', 'action_points', 'comments'): True,
-                               ('view', 'action_points', 'completed_at'): True,
-                               ('view', 'action_points', 'created_at'): True,
-                               ('view', 'action_points', 'description'): True,
-                               ('view', 'action_points', 'due_date'): True,
-                               ('view', 'action_points', 'follow_up'): True,
-                               ('view', 'action_points', 'id'): True,
-                               ('view', 'action_points', 'person_responsible'): True,
-                               ('view', 'action_points', 'status'): True,
-                               ('view', 'action_points', 'trip_reference_number'): True,
-                               ('view', 'activities', 'date'): True,
-                               ('view', 'activities', 'id'): True,
-                               ('view', 'activities', 'locations'): True,
-                               ('view', 'activities', 'partner'): True,
-                               ('view', 'activities', 'partnership'): True,
-                               ('view', 'activities', 'primary_traveler'): True,
-                               ('view', 'activities', 'result'): True,
-                               ('view', 'activities', 'travel_type'): True,
-                               ('view', 'clearances', 'id'): True,
-                               ('view', 'clearances', 'medical_clearance'): True,
-                               ('view', 'clearances', 'security_clearance'): True,
-                               ('view', 'clearances', 'security_course'): True,
-                               ('view', 'cost_assignments', 'business_area'): True,
-                               ('view', 'cost_assignments', 'delegate'): True,
-                               ('view', 'cost_assignments', 'fund'): True,
-                               ('view', 'cost_assignments', 'grant'): True,
-                               ('view', 'cost_assignments', 'id'): True,
-                               ('view', 'cost_assignments', 'share'): True,
-                               ('view', 'cost_assignments', 'wbs'): True,
-                               ('view', 'deductions', 'accomodation'): True,
-                               ('view', 'deductions', 'breakfast'): True,
-                               ('view', 'deductions', 'date'): True,
-                               ('view', 'deductions', 'day_of_the_week'): True,
-                               ('view', 'deductions', 'dinner'): True,
-                               ('view', 'deductions', 'id'): True,
-                               ('view', 'deductions', 'lunch'): True,
-                               ('view', 'deductions', 'no_dsa'): True,
-                               ('view', 'expenses', 'account_currency'): True,
-                               ('view', 'expenses', 'amount'): True,
-                               ('view', 'expenses', 'document_currency'): True,
-                               ('view', 'expenses', 'id'): True,
-                               ('view', 'expenses', 'type'): True,
-                               ('view', 'itinerary', 'airlines'): True,
-                               ('view', 'itinerary', 'arrival_date'): True,
-                               ('view', 'itinerary', 'departure_date'): True,
-                               ('view', 'itinerary', 'destination'): True,
-                               ('view', 'itinerary', 'dsa_region'): True,
-                               ('view', 'itinerary', 'id'): True,
-                               ('view', 'itinerary', 'mode_of_travel'): True,
-                               ('view', 'itinerary', 'origin'): True,
-                               ('view', 'itinerary', 'overnight_travel'): True,
-                               ('view', 'travel', 'action_points'): True,
-                               ('view', 'travel', 'activities'): True,
-                               ('view', 'travel', 'clearances'): True,
-                               ('view', 'travel', 'cost_assignments'): True,
-                               ('view', 'travel', 'cost_summary'): True,
-                               ('view', 'travel', 'currency'): True,
-                               ('view', 'travel', 'deductions'): True,
-                               ('view', 'travel', 'end_date'): True,
-                               ('view', 'travel', 'expenses'): True,
-                               ('view', 'travel', 'id'): True,
-                               ('view', 'travel', 'international_travel'): True,
-                               ('view', 'travel', 'itinerary'): True,
-                               ('view', 'travel', 'office'): True,
-                               ('view', 'travel', 'purpose'): True,
-                               ('view', 'travel', 'reference_number'): True,
-                               ('view', 'travel', 'report'): True,
-                               ('view', 'travel', 'section'): True,
-                               ('view', 'travel', 'start_date'): True,
-                               ('view', 'travel', 'status'): True,
-                               ('view', 'travel', 'supervisor'): True,
-                               ('view', 'travel', 'ta_required'): True,
-                               ('view', 'travel', 'traveler'): True},
-                              'submitted':
-                              {('edit', 'action_points', 'action_point_number'): True,
-                               ('edit', 'action_points', 'actions_taken'): True,
-                               ('edit', 'action_points', 'comments'): True,
-                               ('edit', 'action_points', 'completed_at'): True,
-                               ('edit', 'action_points', 'created_at'): True,
-                               ('edit', 'action_points', 'description'): True,
-                               ('edit', 'action_points', 'due_date'): True,
-                               ('edit', 'action_points', 'follow_up'): True,
-                               ('edit', 'action_points', 'id'): True,
-                               ('edit', 'action_points', 'person_responsible'): True,
-                               ('edit', 'action_points', 'status'): True,
-                               ('edit', 'action_points', 'trip_reference_number'): True,
-                               ('edit', 'activities', 'date'): False,
-                               ('edit', 'activities', 'id'): False,
-                               ('edit', 'activities', 'locations'): False,
-                               ('edit', 'activities', 'partner'): False,
-                               ('edit', 'activities', 'partnership'): False,
-                               ('edit', 'activities', 'primary_traveler'): False,
-                               ('edit', 'activities', 'result'): False,
-                               ('edit', 'activities', 'travel_type'): False,
-                               ('edit', 'clearances', 'id'): False,
-                               ('edit', 'clearances', 'medical_clearance'): False,
-                               ('edit', 'clearances', 'security_clearance'): False,
-                               ('edit', 'clearances', 'security_course'): False,
-                               ('edit', 'cost_assignments', 'business_area'): False,
-                               ('edit', 'cost_assignments', 'delegate'): False,
-                               ('edit', 'cost_assignments', 'fund'): False,
-                               ('edit', 'cost_assignments', 'grant'): False,
-                               ('edit', 'cost_assignments', 'id'): False,
-                               ('edit', 'cost_assignments', 'share'): False,
-                               ('edit', 'cost_assignments', 'wbs'): False,
-                               ('edit', 'deductions', 'accomodation'): False,
-                               ('edit', 'deductions', 'breakfast'): False,
-                               ('edit', 'deductions', 'date'): False,
-                               ('edit', 'deductions', 'day_of_the_week'): False,
-                               ('edit', 'deductions', 'dinner'): False,
-                               ('edit', 'deductions', 'id'): False,
-                               ('edit', 'deductions', 'lunch'): False,
-                               ('edit', 'deductions', 'no_dsa'): False,
-                               ('edit', 'expenses', 'account_currency'): False,
-                               ('edit', 'expenses', 'amount'): False,
-                               ('edit', 'expenses', 'document_currency'): False,
-                               ('edit', 'expenses', 'id'): False,
-                               ('edit', 'expenses', 'type'): False,
-                               ('edit', 'itinerary', 'airlines'): False,
-                               ('edit', 'itinerary', 'arrival_date'): False,
-                               ('edit', 'itinerary', 'departure_date'): False,
-                               ('edit', 'itinerary', 'destination'): False,
-                               ('edit', 'itinerary', 'dsa_region'): False,
-                               ('edit', 'itinerary', 'id'): False,
-                               ('edit', 'itinerary', 'mode_of_travel'): False,
-                               ('edit', 'itinerary', 'origin'): False,
-                               ('edit', 'itinerary', 'overnight_travel'): False,
-                               ('edit', 'travel', 'action_points'): True,
-                               ('edit', 'travel', 'activities'): False,
-                               ('edit', 'travel', 'clearances'): False,
-                               ('edit', 'travel', 'cost_assignments'): False,
-                               ('edit', 'travel', 'cost_summary'): False,
-                               ('edit', 'travel', 'currency'): False,
-                               ('edit', 'travel', 'deductions'): False,
-                               ('edit', 'travel', 'end_date'): False,
-                               ('edit', 'travel', 'expenses'): False,
-                               ('edit', 'travel', 'id'): False,
-                               ('edit', 'travel', 'international_travel'): False,
-                               ('edit', 'travel', 'itinerary'): False,
-                               ('edit', 'travel', 'office'): False,
-                               ('edit', 'travel', 'purpose'): False,
-                               ('edit', 'travel', 'reference_number'): False,
-                               ('edit', 'travel', 'report'): False,
-                               ('edit', 'travel', 'section'): False,
-                               ('edit', 'travel', 'start_date'): False,
-                               ('edit', 'travel', 'status'): False,
-                               ('edit', 'travel', 'supervisor'): False,
-                               ('edit', 'travel', 'ta_required'): False,
-                               ('edit', 'travel', 'traveler'): False,
-                               ('view', 'action_points', 'action_point_number'): True,
-                               ('view', 'action_points', 'actions_taken'): True,
-                               ('view', 'action_points', 'comments'): True,
-                               ('view', 'action_points', 'completed_at'): True,
-                               ('view', 'action_points', 'created_at'): True,
-                               ('view', 'action_points', 'description'): True,
-                               ('view', 'action_points', 'due_date'): True,
-                               ('view', 'action_points', 'follow_up'): True,
-                               ('view', 'action_points', 'id'): True,
-                               ('view', 'action_points', 'person_responsible'): True,
-                               ('view', 'action_points', 'status'): True,
-                               ('view', 'action_points', 'trip_reference_number'): True,
-                               ('view', 'activities', 'date'): True,
-                               ('view', 'activities', 'id'): True,
-                               ('view', 'activities', 'locations'): True,
-                               ('view', 'activities', 'partner'): True,
-                               ('view', 'activities', 'partnership'): True,
-                               ('view', 'activities', 'primary_traveler'): True,
-                               ('view', 'activities', 'result'): True,
-                               ('view', 'activities', 'travel_type'): True,
-                               ('view', 'clearances', 'id'): True,
-                               ('view', 'clearances', 'medical_clearance'): True,
-                               ('view', 'clearances', 'security_clearance'): True,
-                               ('view', 'clearances', 'security_course'): True,
-                               ('view', 'cost_assignments', 'business_area'): True,
-                               ('view', 'cost_assignments', 'delegate'): True,
-                               ('view', 'cost_assignments', 'fund'): True,
-                               ('view', 'cost_assignments', 'grant'): True,
-                               ('view', 'cost_assignments', 'id'): True,
-                               ('view', 'cost_assignments', 'share'): True,
-                               ('view', 'cost_assignments', 'wbs'): True,
-                               ('view', 'deductions', 'accomodation'): True,
-                               ('view', 'deductions', 'breakfast'): True,
-                               ('view', 'deductions', 'date'): True,
-                               ('view', 'deductions', 'day_of_the_week'): True,
-                               ('view', 'deductions', 'dinner'): True,
-                               ('view', 'deductions', 'id'): True,
-                               ('view', 'deductions', 'lunch'): True,
-                               ('view', 'deductions', 'no_dsa'): True,
-                               ('view', 'expenses', 'account_currency'): True,
-                               ('view', 'expenses', 'amount'): True,
-                               ('view', 'expenses', 'document_currency'): True,
-                               ('view', 'expenses', 'id'): True,
-                               ('view', 'expenses', 'type'): True,
-                               ('view', 'itinerary', 'airlines'): True,
-                               ('view', 'itinerary', 'arrival_date'): True,
-                               ('view', 'itinerary', 'departure_date'): True,
-                               ('view', 'itinerary', 'destination'): True,
-                               ('view', 'itinerary', 'dsa_region'): True,
-                               ('view', 'itinerary', 'id'): True,
-                               ('view', 'itinerary', 'mode_of_travel'): True,
-                               ('view', 'itinerary', 'origin'): True,
-                               ('view', 'itinerary', 'overnight_travel'): True,
-                               ('view', 'travel', 'action_points'): True,
-                               ('view', 'travel', 'activities'): True,
-                               ('view', 'travel', 'clearances'): True,
-                               ('view', 'travel', 'cost_assignments'): True,
-                               ('view', 'travel', 'cost_summary'): True,
-                               ('view', 'travel', 'currency'): True,
-                               ('view', 'travel', 'deductions'): True,
-                               ('view', 'travel', 'end_date'): True,
-                               ('view', 'travel', 'expenses'): True,
-                               ('view', 'travel', 'id'): True,
-                               ('view', 'travel', 'international_travel'): True,
-                               ('view', 'travel', 'itinerary'): True,
-                               ('view', 'travel', 'office'): True,
-                               ('view', 'travel', 'purpose'): True,
-                               ('view', 'travel', 'reference_number'): True,
-                               ('view', 'travel', 'report'): True,
-                               ('view', 'travel', 'section'): True,
-                               ('view', 'travel', 'start_date'): True,
-                               ('view', 'travel', 'status'): True,
-                               ('view', 'travel', 'supervisor'): True,
-                               ('view', 'travel', 'ta_required'): True,
-                               ('view', 'travel', 'traveler'): True}},
-               'Travel Administrator': {'approved':
-                                        {('edit', 'action_points', 'action_point_number'): True,
-                                         ('edit', 'action_points', 'actions_taken'): True,
-                                         ('edit', 'action_points', 'comments'): True,
-                                         ('edit', 'action_points', 'completed_at'): True,
-                                         ('edit', 'action_points', 'created_at'): True,
-                                         ('edit', 'action_points', 'description'): True,
-                                         ('edit', 'action_points', 'due_date'): True,
-                                         ('edit', 'action_points', 'follow_up'): True,
-                                         ('edit', 'action_points', 'id'): True,
-                                         ('edit', 'action_points', 'person_responsible'): True,
-                                         ('edit', 'action_points', 'status'): True,
-                                         ('edit', 'action_points', 'trip_reference_number'): True,
-                                         ('edit', 'activities', 'date'): True,
-                                         ('edit', 'activities', 'id'): True,
-                                         ('edit', 'activities', 'locations'): True,
-                                         ('edit', 'activities', 'partner'): True,
-                                         ('edit', 'activities', 'partnership'): True,
-                                         ('edit', 'activities', 'primary_traveler'): True,
-                                         ('edit', 'activities', 'result'): True,
-                                         ('edit', 'activities', 'travel_type'): True,
-                                         ('edit', 'clearances', 'id'): False,
-                                         ('edit', 'clearances', 'medical_clearance'): False,
-                                         ('edit', 'clearances', 'security_clearance'): False,
-                                         ('edit', 'clearances', 'security_course'): False,
-                                         ('edit', 'cost_assignments', 'business_area'): False,
-                                         ('edit', 'cost_assignments', 'delegate'): False,
-                                         ('edit', 'cost_assignments', 'fund'): False,
-                                         ('edit', 'cost_assignments', 'grant'): False,
-                                         ('edit', 'cost_assignments', 'id'): False,
-                                         ('edit', 'cost_assignments', 'share'): False,
-                                         ('edit', 'cost_assignments', 'wbs'): False,
-                                         ('edit', 'deductions', 'accomodation'): False,
-                                         ('edit', 'deductions', 'breakfast'): False,
-                                         ('edit', 'deductions', 'date'): False,
-                                         ('edit', 'deductions', 'day_of_the_week'): False,
-                                         ('edit', 'deductions', 'dinner'): False,
-                                         ('edit', 'deductions', 'id'): False,
-                                         ('edit', 'deductions', 'lunch'): False,
-                                         ('edit', 'deductions', 'no_dsa'): False,
-                                         ('edit', 'expenses', 'account_currency'): False,
-                                         ('edit', 'expenses', 'amount'): False,
-                                         ('edit', 'expenses', 'document_currency'): False,
-                                         ('edit', 'expenses', 'id'): False,
-                                         ('edit', 'expenses', 'type'): False,
-                                         ('edit', 'itinerary', 'airlines'): False,
-                                         ('edit', 'itinerary', 'arrival_date'): False,
-                                         ('edit', 'itinerary', 'departure_date'): False,
-                                         ('edit', 'itinerary', 'destination'): False,
-                                         ('edit', 'itinerary', 'dsa_region'): False,
-                                         ('edit', 'itinerary', 'id'): False,
-                                         ('edit', 'itinerary', 'mode_of_travel'): False,
-                                         ('edit', 'itinerary', 'origin'): False,
-                                         ('edit', 'itinerary', 'overnight_travel'): False,
-                                         ('edit', 'travel', 'action_points'): True,
-                                         ('edit', 'travel', 'activities'): True,
-                                         ('edit', 'travel', 'clearances'): False,
-                                         ('edit', 'travel', 'cost_assignments'): False,
-                                         ('edit', 'travel', 'cost_summary'): False,
-                                         ('edit', 'travel', 'currency'): False,
-                                         ('edit', 'travel', 'deductions'): False,
-                                         ('edit', 'travel', 'end_date'): False,
-                                         ('edit', 'travel', 'expenses'): False,
-                                         ('edit', 'travel', 'id'): False,
-                                         ('edit', 'travel', 'international_travel'): False,
-                                         ('edit', 'travel', 'itinerary'): False,
-                                         ('edit', 'travel', 'office'): False,
-                                         ('edit', 'travel', 'purpose'): False,
-                                         ('edit', 'travel', 'reference_number'): False,
-                                         ('edit', 'travel', 'report'): False,
-                                         ('edit', 'travel', 'section'): False,
-                                         ('edit', 'travel', 'start_date'): False,
-                                         ('edit', 'travel', 'status'): False,
-                                         ('edit', 'travel', 'supervisor'): False,
-                                         ('edit', 'travel', 'ta_required'): False,
-                                         ('edit', 'travel', 'traveler'): False,
-                                         ('view', 'action_points', 'action_point_number'): True,
-                                         ('view', 'action_points', 'actions_taken'): True,
-                                         ('view', 'action_points', 'comments'): True,
-                                         ('view', 'action_points', 'completed_at'): True,
-                                         ('view', 'action_points', 'created_at'): True,
-                                         ('view', 'action_points', 'description'): True,
-                                         ('view', 'action_points', 'due_date'): True,
-                                         ('view', 'action_points', 'follow_up'): True,
-                                         ('view', 'action_points', 'id'): True,
-                                         ('view', 'action_points', 'person_responsible'): True,
-                                         ('view', 'action_points', 'status'): True,
-                                         ('view', 'action_points', 'trip_reference_number'): True,
-                                         ('view', 'activities', 'date'): True,
-                                         ('view', 'activities', 'id'): True,
-                                         ('view', 'activities', 'locations'): True,
-                                         ('view', 'activities', 'partner'): True,
-                                         ('view', 'activities', 'partnership'): True,
-                                         ('view', 'activities', 'primary_traveler'): True,
-                                         ('view', 'activities', 'result'): True,
-                                         ('view', 'activities', 'travel_type'): True,
-                                         ('view', 'clearances', 'id'): True,
-                                         ('view', 'clearances', 'medical_clearance'): True,
-                                         ('view', 'clearances', 'security_clearance'): True,
-                                         ('view', 'clearances', 'security_course'): True,
-                                         ('view', 'cost_assignments', 'business_area'): True,
-                                         ('view', 'cost_assignments', 'delegate'): True,
-                                         ('view', 'cost_assignments', 'fund'): True,
-                                         ('view', 'cost_assignments', 'grant'): True,
-                                         ('view', 'cost_assignments', 'id'): True,
-                                         ('view', 'cost_assignments', 'share'): True,
-                                         ('view', 'cost_assignments', 'wbs'): True,
-                                         ('view', 'deductions', 'accomodation'): True,
-                                         ('view', 'deductions', 'breakfast'): True,
-                                         ('view', 'deductions', 'date'): True,
-                                         ('view', 'deductions', 'day_of_the_week'): True,
-                                         ('view', 'deductions', 'dinner'): True,
-                                         ('view', 'deductions', 'id'): True,
-                                         ('view', 'deductions', 'lunch'): True,
-                                         ('view', 'deductions', 'no_dsa'): True,
-                                         ('view', 'expenses', 'account_currency'): True,
-                                         ('view', 'expenses', 'amount'): True,
-                                         ('view', 'expenses', 'document_currency'): True,
-                                         ('view', 'expenses', 'id'): True,
-                                         ('view', 'expenses', 'type'): True,
-                                         ('view', 'itinerary', 'airlines'): True,
-                                         ('view', 'itinerary', 'arrival_date'): True,
-                                         ('view', 'itinerary', 'departure_date'): True,
-                                         ('view', 'itinerary', 'destination'): True,
-                                         ('view', 'itinerary', 'dsa_region'): True,
-                                         ('view', 'itinerary', 'id'): True,
-                                         ('view', 'itinerary', 'mode_of_travel'): True,
-                                         ('view', 'itinerary', 'origin'): True,
-                                         ('view', 'itinerary', 'overnight_travel'): True,
-                                         ('view', 'travel', 'action_points'): True,
-                                         ('view', 'travel', 'activities'): True,
-                                         ('view', 'travel', 'clearances'): True,
-                                         ('view', 'travel', 'cost_assignments'): True,
-                                         ('view', 'travel', 'cost_summary'): True,
-                                         ('view', 'travel', 'currency'): True,
-                                         ('view', 'travel', 'deductions'): True,
-                                         ('view', 'travel', 'end_date'): True,
-                                         ('view', 'travel', 'expenses'): True,
-                                         ('view', 'travel', 'id'): True,
-                                         ('view', 'travel', 'international_travel'): True,
-                                         ('view', 'travel', 'itinerary'): True,
-                                         ('view', 'travel', 'office'): True,
-                                         ('view', 'travel', 'purpose'): True,
-                                         ('view', 'travel', 'reference_number'): True,
-                                         ('view', 'travel', 'report'): True,
-                                         ('view', 'travel', 'section'): True,
-                                         ('view', 'travel', 'start_date'): True,
-                                         ('view', 'travel', 'status'): True,
-                                         ('view', 'travel', 'supervisor'): True,
-                                         ('view', 'travel', 'ta_required'): True,
-                                         ('view', 'travel', 'traveler'): True},
-                                        'cancelled':
-                                        {('edit', 'action_points', 'action_point_number'): True,
-                                         ('edit', 'action_points', 'actions_taken'): True,
-                                         ('edit', 'action_points', 'comments'): True,
-                                         ('edit', 'action_points', 'completed_at'): True,
-                                         ('edit', 'action_points', 'created_at'): True,
-                                         ('edit', 'action_points', 'description'): True,
-                                         ('edit', 'action_points', 'due_date'): True,
-                                         ('edit', 'action_points', 'follow_up'): True,
-                                         ('edit', 'action_points', 'id'): True,
-                                         ('edit', 'action_points', 'person_responsible'): True,
-                                         ('edit', 'action_points', 'status'): True,
-                                         ('edit', 'action_points', 'trip_reference_number'): True,
-                                         ('edit', 'activities', 'date'): True,
-                                         ('edit', 'activities', 'id'): True,
-                                         ('edit', 'activities', 'locations'): True,
-                                         ('edit', 'activities', 'partner'): True,
-                                         ('edit', 'activities', 'partnership'): True,
-                                         ('edit', 'activities', 'primary_traveler'): True,
-                                         ('edit', 'activities', 'result'): True,
-                                         ('edit', 'activities', 'travel_type'): True,
-                                         ('edit', 'clearances', 'id'): True,
-                                         ('edit', 'clearances', 'medical_clearance'): True,
-                                         ('edit', 'clearances', 'security_clearance'): True,
-                                         ('edit', 'clearances', 'security_course'): True,
-                                         ('edit', 'cost_assignments', 'business_area'): True,
-                                         ('edit', 'cost_assignments', 'delegate'): True,
-                                         ('edit', 'cost_assignments', 'fund'): True,
-                                         ('edit', 'cost_assignments', 'grant'): True,
-                                         ('edit', 'cost_assignments', 'id'): True,
-                                         ('edit', 'cost_assignments', 'share'): True,
-                                         ('edit', 'cost_assignments', 'wbs'): True,
-                                         ('edit', 'deductions', 'accomodation'): True,
-                                         ('edit', 'deductions', 'breakfast'): True,
-                                         ('edit', 'deductions', 'date'): True,
-                                         ('edit', 'deductions', 'day_of_the_week'): True,
-                                         ('edit', 'deductions', 'dinner'): True,
-                                         ('edit', 'deductions', 'id'): True,
-                                         ('edit', 'deductions', 'lunch'): True,
-                                         ('edit', 'deductions', 'no_dsa'): True,
-                                         ('edit', 'expenses', 'account_currency'): True,
-                                         ('edit', 'expenses', 'amount'): True,
-                                         ('edit', 'expenses', 'document_currency'): True,
-                                         ('edit', 'expenses', 'id'): True,
-                                         ('edit', 'expenses', 'type'): True,
-                                         ('edit', 'itinerary', 'airlines'): True,
-                                         ('edit', 'itinerary', 'arrival_date'): True,
-                                         ('edit', 'itinerary', 'departure_date'): True,
-                                         ('edit', 'itinerary', 'destination'): True,
-                                         ('edit', 'itinerary', 'dsa_region'): True,
-                                         ('edit', 'itinerary', 'id'): True,
-                                         ('edit', 'itinerary', 'mode_of_travel'): True,
-                                         ('edit', 'itinerary', 'origin'): True,
-                                         ('edit', 'itinerary', 'overnight_travel'): True,
-                                         ('edit', 'travel', 'action_points'): True,
-                                         ('edit', 'travel', 'activities'): True,
-                                         ('edit', 'travel', 'clearances'): True,
-                                         ('edit', 'travel', 'cost_assignments'): True,
-                                         ('edit', 'travel', 'cost_summary'): True,
-                                         ('edit', 'travel', 'currency'): True,
-                                         ('edit', 'travel', 'deductions'): True,
-                                         ('edit', 'travel', 'end_date'): True,
-                                         ('edit', 'travel', 'expenses'): True,
-                                         ('edit', 'travel', 'id'): True,
-                                         ('edit', 'travel', 'international_travel'): True,
-                                         ('edit', 'travel', 'itinerary'): True,
-                                         ('edit', 'travel', 'office'): True,
-                                         ('edit', 'travel', 'purpose'): True,
-                                         ('edit', 'travel', 'reference_number'): True,
-                                         ('edit', 'travel', 'report'): True,
-                                         ('edit', 'travel', 'section'): True,
-                                         ('edit', 'travel', 'start_date'): True,
-                                         ('edit', 'travel', 'status'): True,
-                                         ('edit', 'travel', 'supervisor'): True,
-                                         ('edit', 'travel', 'ta_required'): True,
-                                         ('edit', 'travel', 'traveler'): True,
-                                         ('view', 'action_points', 'action_point_number'): True,
-                                         ('view', 'action_points', 'actions_taken'): True,
-                                         ('view', 'action_points', 'comments'): True,
-                                         ('view', 'action_points', 'completed_at'): True,
-                                         ('view', 'action_points', 'created_at'): True,
-                                         ('view', 'action_points', 'description'): True,
-                                         ('view', 'action_points', 'due_date'): True,
-                                         ('view', 'action_points', 'follow_up'): True,
-                                         ('view', 'action_points', 'id'): True,
-                                         ('view', 'action_points', 'person_responsible'): True,
-                                         ('view', 'action_points', 'status'): True,
-                                         ('view', 'action_points', 'trip_reference_number'): True,
-                                         ('view', 'activities', 'date'): True,
-                                         ('view', 'activities', 'id'): True,
-                                         ('view', 'activities', 'locations'): True,
-                                         ('view', 'activities', 'partner'): True,
-                                         ('view', 'activities', 'partnership'): True,
-                                         ('view', 'activities', 'primary_traveler'): True,
-                                         ('view', 'activities', 'result'): True,
-                                         ('view', 'activities', 'travel_type'): True,
-                                         ('view', 'clearances', 'id'): True,
-                                         ('view', 'clearances', 'medical_clearance'): True,
-                                         ('view', 'clearances', 'security_clearance'): True,
-                                         ('view', 'clearances', 'security_course'): True,
-                                         ('view', 'cost_assignments', 'business_area'): True,
-                                         ('view', 'cost_assignments', 'delegate'): True,
-                                         ('view', 'cost_assignments', 'fund'): True,
-                                         ('view', 'cost_assignments', 'grant'): True,
-                                         ('view', 'cost_assignments', 'id'): True,
-                                         ('view', 'cost_assignments', 'share'): True,
-                                         ('view', 'cost_assignments', 'wbs'): True,
-                                         ('view', 'deductions', 'accomodation'): True,
-                                         ('view', 'deductions', 'breakfast'): True,
-                                         ('view', 'deductions', 'date'): True,
-                                         ('view', 'deductions', 'day_of_the_week'): True,
-                                         ('view', 'deductions', 'dinner'): True,
-                                         ('view', 'deductions', 'id'): True,
-                                         ('view', 'deductions', 'lunch'): True,
-                                         ('view', 'deductions', 'no_dsa'): True,
-                                         ('view', 'expenses', 'account_currency'): True,
-                                         ('view', 'expenses', 'amount'): True,
-                                         ('view', 'expenses', 'document_currency'): True,
-                                         ('view', 'expenses', 'id'): True,
-                                         ('view', 'expenses', 'type'): True,
-                                         ('view', 'itinerary', 'airlines'): True,
-                                         ('view', 'itinerary', 'arrival_date'): True,
-                                         ('view', 'itinerary', 'departure_date'): True,
-                                         ('view', 'itinerary', 'destination'): True,
-                                         ('view', 'itinerary', 'dsa_region'): True,
-                                         ('view', 'itinerary', 'id'): True,
-                                         ('view', 'itinerary', 'mode_of_travel'): True,
-                                         ('view', 'itinerary', 'origin'): True,
-                                         ('view', 'itinerary', 'overnight_travel'): True,
-                                         ('view', 'travel', 'action_points'): True,
-                                         ('view', 'travel', 'activities'): True,
-                                         ('view', 'travel', 'clearances'): True,
-                                         ('view', 'travel', 'cost_assignments'): True,
-                                         ('view', 'travel', 'cost_summary'): True,
-                                         ('view', 'travel', 'currency'): True,
-                                         ('view', 'travel', 'deductions'): True,
-                                         ('view', 'travel', 'end_date'): True,
-                                         ('view', 'travel', 'expenses'): True,
-                                         ('view', 'travel', 'id'): True,
-                                         ('view', 'travel', 'international_travel'): True,
-                                         ('view', 'travel', 'itinerary'): True,
-                                         ('view', 'travel', 'office'): True,
-                                         ('view', 'travel', 'purpose'): True,
-                                         ('view', 'travel', 'reference_number'): True,
-                                         ('view', 'travel', 'report'): True,
-                                         ('view', 'travel', 'section'): True,
-                                         ('view', 'travel', 'start_date'): True,
-                                         ('view', 'travel', 'status'): True,
-                                         ('view', 'travel', 'supervisor'): True,
-                                         ('view', 'travel', 'ta_required'): True,
-                                         ('view', 'travel', 'traveler'): True},
-                                        'completed':
-                                        {('edit', 'action_points', 'action_point_number'): True,
-                                         ('edit', 'action_points', 'actions_taken'): True,
-                                         ('edit', 'action_points', 'comments'): True,
-                                         ('edit', 'action_points', 'completed_at'): True,
-                                         ('edit', 'action_points', 'created_at'): True,
-                                         ('edit', 'action_points', 'description'): True,
-                                         ('edit', 'action_points', 'due_date'): True,
-                                         ('edit', 'action_points', 'follow_up'): True,
-                                         ('edit', 'action_points', 'id'): True,
-                                         ('edit', 'action_points', 'person_responsible'): True,
-                                         ('edit', 'action_points', 'status'): True,
-                                         ('edit', 'action_points', 'trip_reference_number'): True,
-                                         ('edit', 'activities', 'date'): False,
-                                         ('edit', 'activities', 'id'): False,
-                                         ('edit', 'activities', 'locations'): False,
-                                         ('edit', 'activities', 'partner'): False,
-                                         ('edit', 'activities', 'partnership'): False,
-                                         ('edit', 'activities', 'primary_traveler'): False,
-                                         ('edit', 'activities', 'result'): False,
-                                         ('edit', 'activities', 'travel_type'): False,
-                                         ('edit', 'clearances', 'id'): False,
-                                         ('edit', 'clearances', 'medical_clearance'): False,
-                                         ('edit', 'clearances', 'security_clearance'): False,
-                                         ('edit', 'clearances', 'security_course'): False,
-                                         ('edit', 'cost_assignments', 'business_area'): False,
-                                         ('edit', 'cost_assignments', 'delegate'): False,
-                                         ('edit', 'cost_assignments', 'fund'): False,
-                                         ('edit', 'cost_assignments', 'grant'): False,
-                                         ('edit', 'cost_assignments', 'id'): False,
-                                         ('edit', 'cost_assignments', 'share'): False,
-                                         ('edit', 'cost_assignments', 'wbs'): False,
-                                         ('edit', 'deductions', 'accomodation'): False,
-                                         ('edit', 'deductions', 'breakfast'): False,
-                                         ('edit', 'deductions', 'date'): False,
-                                         ('edit', 'deductions', 'day_of_the_week'): False,
-                                         ('edit', 'deductions', 'dinner'): False,
-                                         ('edit', 'deductions', 'id'): False,
-                                         ('edit', 'deductions', 'lunch'): False,
-                                         ('edit', 'deductions', 'no_dsa'): False,
-                                         ('edit', 'expenses', 'account_currency'): False,
-                                         ('edit', 'expenses', 'amount'): False,
-                                         ('edit', 'expenses', 'document_currency'): False,
-                                         ('edit', 'expenses', 'id'): False,
-                                         ('edit', 'expenses', 'type'): False,
-                                         ('edit', 'itinerary', 'airlines'): False,
-                                         ('edit', 'itinerary', 'arrival_date'): False,
-                                         ('edit', 'itinerary', 'departure_date'): False,
-                                         ('edit', 'itinerary', 'destination'): False,
-                                         ('edit', 'itinerary', 'dsa_region'): False,
-                                         ('edit', 'itinerary', 'id'): False,
-                                         ('edit', 'itinerary', 'mode_of_travel'): False,
-                                         ('edit', 'itinerary', 'origin'): False,
-                                         ('edit', 'itinerary', 'overnight_travel'): False,
-                                         ('edit', 'travel', 'action_points'): True,
-                                         ('edit', 'travel', 'activities'): False,
-                                         ('edit', 'travel', 'clearances'): False,
-                                         ('edit', 'travel', 'cost_assignments'): False,
-                                         ('edit', 'travel', 'cost_summary'): False,
-                                         ('edit', 'travel', 'currency'): False,
-                                         ('edit', 'travel', 'deductions'): False,
-                                         ('edit', 'travel', 'end_date'): False,
-                                         ('edit', 'travel', 'expenses'): False,
-                                         ('edit', 'travel', 'id'): False,
-                                         ('edit', 'travel', 'international_travel'): False,
-                                         ('edit', 'travel', 'itinerary'): False,
-                                         ('edit', 'travel', 'office'): False,
-                                         ('edit', 'travel', 'purpose'): False,
-                                         ('edit', 'travel', 'reference_number'): False,
-                                         ('edit', 'travel', 'report'): False,
-                                         ('edit', 'travel', 'section'): False,
-                                         ('edit', 'travel', 'start_date'): False,
-                                         ('edit', 'travel', 'status'): False,
-                                         ('edit', 'travel', 'supervisor'): False,
-                                         ('edit', 'travel', 'ta_required'): False,
-                                         ('edit', 'travel', 'traveler'): False,
-                                         ('view', 'action_points', 'action_point_number'): True,
-                                         ('view', 'action_points', 'actions_taken'): True,
-                                         ('view', 'action_points', 'comments'): True,
-                                         ('view', 'action_points', 'completed_at'): True,
-                                         ('view', 'action_points', 'created_at'): True,
-                                         ('view', 'action_points', 'description'): True,
-                                         ('view', 'action_points', 'due_date'): True,
-                                         ('view', 'action_points', 'follow_up'): True,
-                                         ('view', 'action_points', 'id'): True,
-                                         ('view', 'action_points', 'person_responsible'): True,
-                                         ('view', 'action_points', 'status'): True,
-                                         ('view', 'action_points', 'trip_reference_number'): True,
-                                         ('view', 'activities', 'date'): True,
-                                         ('view', 'activities', 'id'): True,
-                                         ('view', 'activities', 'locations'): True,
-                                         ('view', 'activities', 'partner'): True,
-                                         ('view', 'activities', 'partnership'): True,
-                                         ('view', 'activities', 'primary_traveler'): True,
-                                         ('view', 'activities', 'result'): True,
-                                         ('view', 'activities', 'travel_type'): True,
-                                         ('view', 'clearances', 'id'): True,
-                                         ('view', 'clearances', 'medical_clearance'): True,
-                                         ('view', 'clearances', 'security_clearance'): True,
-                                         ('view', 'clearances', 'security_course'): True,
-                                         ('view', 'cost_assignments', 'business_area'): True,
-                                         ('view', 'cost_assignments', 'delegate'): True,
-                                         ('view', 'cost_assignments', 'fund'): True,
-                                         ('view', 'cost_assignments', 'grant'): True,
-                                         ('view', 'cost_assignments', 'id'): True,
-                                         ('view', 'cost_assignments', 'share'): True,
-                                         ('view', 'cost_assignments', 'wbs'): True,
-                                         ('view', 'deductions', 'accomodation'): True,
-                                         ('view', 'deductions', 'breakfast'): True,
-                                         ('view', 'deductions', 'date'): True,
-                                         ('view', 'deductions', 'day_of_the_week'): True,
-                                         ('view', 'deductions', 'dinner'): True,
-                                         ('view', 'deductions', 'id'): True,
-                                         ('view', 'deductions', 'lunch'): True,
-                                         ('view', 'deductions', 'no_dsa'): True,
-                                         ('view', 'expenses', 'account_currency'): True,
-                                         ('view', 'expenses', 'amount'): True,
-                                         ('view', 'expenses', 'document_currency'): True,
-                                         ('view', 'expenses', 'id'): True,
-                                         ('view', 'expenses', 'type'): True,
-                                         ('view', 'itinerary', 'airlines'): True,
-                                         ('view', 'itinerary', 'arrival_date'): True,
-                                         ('view', 'itinerary', 'departure_date'): True,
-                                         ('view', 'itinerary', 'destination'): True,
-                                         ('view', 'itinerary', 'dsa_region'): True,
-                                         ('view', 'itinerary', 'id'): True,
-                                         ('view', 'itinerary', 'mode_of_travel'): True,
-                                         ('view', 'itinerary', 'origin'): True,
-                                         ('view', 'itinerary', 'overnight_travel'): True,
-                                         ('view', 'travel', 'action_points'): True,
-                                         ('view', 'travel', 'activities'): True,
-                                         ('view', 'travel', 'clearances'): True,
-                                         ('view', 'travel', 'cost_assignments'): True,
-                                         ('view', 'travel', 'cost_summary'): True,
-                                         ('view', 'travel', 'currency'): True,
-                                         ('view', 'travel', 'deductions'): True,
-                                         ('view', 'travel', 'end_date'): True,
-                                         ('view', 'travel', 'expenses'): True,
-                                         ('view', 'travel', 'id'): True,
-                                         ('view', 'travel', 'international_travel'): True,
-                                         ('view', 'travel', 'itinerary'): True,
-                                         ('view', 'travel', 'office'): True,
-                                         ('view', 'travel', 'purpose'): True,
-                                         ('view', 'travel', 'reference_number'): True,
-                                         ('view', 'travel', 'report'): True,
-                                         ('view', 'travel', 'section'): True,
-                                         ('view', 'travel', 'start_date'): True,
-                                         ('view', 'travel', 'status'): True,
-                                         ('view', 'travel', 'supervisor'): True,
-                                         ('view', 'travel', 'ta_required'): True,
-                                         ('view', 'travel', 'traveler'): True},
-                                        'planned':
-                                        {('edit', 'action_points', 'action_point_number'): True,
-                                         ('edit', 'action_points', 'actions_taken'): True,
-                                         ('edit', 'action_points', 'comments'): True,
-                                         ('edit', 'action_points', 'completed_at'): True,
-                                         ('edit', 'action_points', 'created_at'): True,
-                                         ('edit', 'action_points', 'description'): True,
-                                         ('edit', 'action_points', 'due_date'): True,
-                                         ('edit', 'action_points', 'follow_up'): True,
-                                         ('edit', 'action_points', 'id'): True,
-                                         ('edit', 'action_points', 'person_responsible'): True,
-                                         ('edit', 'action_points', 'status'): True,
-                                         ('edit', 'action_points', 'trip_reference_number'): True,
-                                         ('edit', 'activities', 'date'): True,
-                                         ('edit', 'activities', 'id'): True,
-                                         ('edit', 'activities', 'locations'): True,
-                                         ('edit', 'activities', 'partner'): True,
-                                         ('edit', 'activities', 'partnership'): True,
-                                         ('edit', 'activities', 'primary_traveler'): True,
-                                         ('edit', 'activities', 'result'): True,
-                                         ('edit', 'activities', 'travel_type'): True,
-                                         ('edit', 'clearances', 'id'): True,
-                                         ('edit', 'clearances', 'medical_clearance'): True,
-                                         ('edit', 'clearances', 'security_clearance'): True,
-                                         ('edit', 'clearances', 'security_course'): True,
-                                         ('edit', 'cost_assignments', 'business_area'): True,
-                                         ('edit', 'cost_assignments', 'delegate'): True,
-                                         ('edit', 'cost_assignments', 'fund'): True,
-                                         ('edit', 'cost_assignments', 'grant'): True,
-                                         ('edit', 'cost_assignments', 'id'): True,
-                                         ('edit', 'cost_assignments', 'share'): True,
-                                         ('edit', 'cost_assignments', 'wbs'): True,
-                                         ('edit', 'deductions', 'accomodation'): True,
-                                         ('edit', 'deductions', 'breakfast'): True,
-                                         ('edit', 'deductions', 'date'): True,
-                                         ('edit', 'deductions', 'day_of_the_week'): True,
-                                         ('edit', 'deductions', 'dinner'): True,
-                                         ('edit', 'deductions', 'id'): True,
-                                         ('edit', 'deductions', 'lunch'): True,
-                                         ('edit', 'deductions', 'no_dsa'): True,
-                                         ('edit', 'expenses', 'account_currency'): True,
-                                         ('edit', 'expenses', 'amount'): True,
-                                         ('edit', 'expenses', 'document_currency'): True,
-                                         ('edit', 'expenses', 'id'): True,
-                                         ('edit', 'expenses', 'type'): True,
-                                         ('edit', 'itinerary', 'airlines'): True,
-                                         ('edit', 'itinerary', 'arrival_date'): True,
-                                         ('edit', 'itinerary', 'departure_date'): True,
-                                         ('edit', 'itinerary', 'destination'): True,
-                                         ('edit', 'itinerary', 'dsa_region'): True,
-                                         ('edit', 'itinerary', 'id'): True,
-                                         ('edit', 'itinerary', 'mode_of_travel'): True,
-                                         ('edit', 'itinerary', 'origin'): True,
-                                         ('edit', 'itinerary', 'overnight_travel'): True,
-                                         ('edit', 'travel', 'action_points'): True,
-                                         ('edit', 'travel', 'activities'): True,
-                                         ('edit', 'travel', 'clearances'): True,
-                                         ('edit', 'travel', 'cost_assignments'): True,
-                                         ('edit', 'travel', 'cost_summary'): True,
-                                         ('edit', 'travel', 'currency'): True,
-                                         ('edit', 'travel', 'deductions'): True,
-                                         ('edit', 'travel', 'end_date'): True,
-                                         ('edit', 'travel', 'expenses'): True,
-                                         ('edit', 'travel', 'id'): True,
-                                         ('edit', 'travel', 'international_travel'): True,
-                                         ('edit', 'travel', 'itinerary'): True,
-                                         ('edit', 'travel', 'office'): True,
-                                         ('edit', 'travel', 'purpose'): True,
-                                         ('edit', 'travel', 'reference_number'): True,
-                                         ('edit', 'travel', 'report'): True,
-                                         ('edit', 'travel', 'section'): True,
-                                         ('edit', 'travel', 'start_date'): True,
-                                         ('edit', 'travel', 'status'): True,
-                                         ('edit', 'travel', 'supervisor'): True,
-                                         ('edit', 'travel', 'ta_required'): True,
-                                         ('edit', 'travel', 'traveler'): True,
-                                         ('view', 'action_points', 'action_point_number'): True,
-                                         ('view', 'action_points', 'actions_taken'): True,
-                                         ('view', 'action_points', 'comments'): True,
-                                         ('view', 'action_points', 'completed_at'): True,
-                                         ('view', 'action_points', 'created_at'): True,
-                                         ('view', 'action_points', 'description'): True,
-                                         ('view', 'action_points', 'due_date'): True,
-                                         ('view', 'action_points', 'follow_up'): True,
-                                         ('view', 'action_points', 'id'): True,
-                                         ('view', 'action_points', 'person_responsible'): True,
-                                         ('view', 'action_points', 'status'): True,
-                                         ('view', 'action_points', 'trip_reference_number'): True,
-                                         ('view', 'activities', 'date'): True,
-                                         ('view', 'activities', 'id'): True,
-                                         ('view', 'activities', 'locations'): True,
-                                         ('view', 'activities', 'partner'): True,
-                                         ('view', 'activities', 'partnership'): True,
-                                         ('view', 'activities', 'primary_traveler'): True,
-                                         ('view', 'activities', 'result'): True,
-                                         ('view', 'activities', 'travel_type'): True,
-                                         ('view', 'clearances', 'id'): True,
-                                         ('view', 'clearances', 'medical_clearance'): True,
-                                         ('view', 'clearances', 'security_clearance'): True,
-                                         ('view', 'clearances', 'security_course'): True,
-                                         ('view', 'cost_assignments', 'business_area'): True,
-                                         ('view', 'cost_assignments', 'delegate'): True,
-                                         ('view', 'cost_assignments', 'fund'): True,
-                                         ('view', 'cost_assignments', 'grant'): True,
-                                         ('view', 'cost_assignments', 'id'): True,
-                                         ('view', 'cost_assignments', 'share'): True,
-                                         ('view', 'cost_assignments', 'wbs'): True,
-                                         ('view', 'deductions', 'accomodation'): True,
-                                         ('view', 'deductions', 'breakfast'): True,
-                                         ('view', 'deductions', 'date'): True,
-                                         ('view', 'deductions', 'day_of_the_week'): True,
-                                         ('view', 'deductions', 'dinner'): True,
-                                         ('view', 'deductions', 'id'): True,
-                                         ('view', 'deductions', 'lunch'): True,
-                                         ('view', 'deductions', 'no_dsa'): True,
-                                         ('view', 'expenses', 'account_currency'): True,
-                                         ('view', 'expenses', 'amount'): True,
-                                         ('view', 'expenses', 'document_currency'): True,
-                                         ('view', 'expenses', 'id'): True,
-                                         ('view', 'expenses', 'type'): True,
-                                         ('view', 'itinerary', 'airlines'): True,
-                                         ('view', 'itinerary', 'arrival_date'): True,
-                                         ('view', 'itinerary', 'departure_date'): True,
-                                         ('view', 'itinerary', 'destination'): True,
-                                         ('view', 'itinerary', 'dsa_region'): True,
-                                         ('view', 'itinerary', 'id'): True,
-                                         ('view', 'itinerary', 'mode_of_travel'): True,
-                                         ('view', 'itinerary', 'origin'): True,
-                                         ('view', 'itinerary', 'overnight_travel'): True,
-                                         ('view', 'travel', 'action_points'): True,
-                                         ('view', 'travel', 'activities'): True,
-                                         ('view', 'travel', 'clearances'): True,
-                                         ('view', 'travel', 'cost_assignments'): True,
-                                         ('view', 'travel', 'cost_summary'): True,
-                                         ('view', 'travel', 'currency'): True,
-                                         ('view', 'travel', 'deductions'): True,
-                                         ('view', 'travel', 'end_date'): True,
-                                         ('view', 'travel', 'expenses'): True,
-                                         ('view', 'travel', 'id'): True,
-                                         ('view', 'travel', 'international_travel'): True,
-                                         ('view', 'travel', 'itinerary'): True,
-                                         ('view', 'travel', 'office'): True,
-                                         ('view', 'travel', 'purpose'): True,
-                                         ('view', 'travel', 'reference_number'): True,
-                                         ('view', 'travel', 'report'): True,
-                                         ('view', 'travel', 'section'): True,
-                                         ('view', 'travel', 'start_date'): True,
-                                         ('view', 'travel', 'status'): True,
-                                         ('view', 'travel', 'supervisor'): True,
-                                         ('view', 'travel', 'ta_required'): True,
-                                         ('view', 'travel', 'traveler'): True},
-                                        'rejected':
-                                        {('edit', 'action_points', 'action_point_number'): True,
-                                         ('edit', 'action_points', 'actions_taken'): True,
-                                         ('edit', 'action_points', 'comments'): True,
-                                         ('edit', 'action_points', 'completed_at'): True,
-                                         ('edit', 'action_points', 'created_at'): True,
-                                         ('edit', 'action_points', 'description'): True,
-                                         ('edit', 'action_points', 'due_date'): True,
-                                         ('edit', 'action_points', 'follow_up'): True,
-                                         ('edit', 'action_points', 'id'): True,
-                                         ('edit', 'action_points', 'person_responsible'): True,
-                                         ('edit', 'action_points', 'status'): True,
-                                         ('edit', 'action_points', 'trip_reference_number'): True,
-                                         ('edit', 'activities', 'date'): True,
-                                         ('edit', 'activities', 'id'): True,
-                                         ('edit', 'activities', 'locations'): True,
-                                         ('edit', 'activities', 'partner'): True,
-                                         ('edit', 'activities', 'partnership'): True,
-                                         ('edit', 'activities', 'primary_traveler'): True,
-                                         ('edit', 'activities', 'result'): True,
-                                         ('edit', 'activities', 'travel_type'): True,
-                                         ('edit', 'clearances', 'id'): True,
-                                         ('edit', 'clearances', 'medical_clearance'): True,
-                                         ('edit', 'clearances', 'security_clearance'): True,
-                                         ('edit', 'clearances', 'security_course'): True,
-                                         ('edit', 'cost_assignments', 'business_area'): True,
-                                         ('edit', 'cost_assignments', 'delegate'): True,
-                                         ('edit', 'cost_assignments', 'fund'): True,
-                                         ('edit', 'cost_assignments', 'grant'): True,
-                                         ('edit', 'cost_assignments', 'id'): True,
-                                         ('edit', 'cost_assignments', 'share'): True,
-                                         ('edit', 'cost_assignments', 'wbs'): True,
-                                         ('edit', 'deductions', 'accomodation'): True,
-                                         ('edit', 'deductions', 'breakfast'): True,
-                                         ('edit', 'deductions', 'date'): True,
-                                         ('edit', 'deductions', 'day_of_the_week'): True,
-                                         ('edit', 'deductions', 'dinner'): True,
-                                         ('edit', 'deductions', 'id'): True,
-                                         ('edit', 'deductions', 'lunch'): True,
-                                         ('edit', 'deductions', 'no_dsa'): True,
-                                         ('edit', 'expenses', 'account_currency'): True,
-                                         ('edit', 'expenses', 'amount'): True,
-                                         ('edit', 'expenses', 'document_currency'): True,
-                                         ('edit', 'expenses', 'id'): True,
-                                         ('edit', 'expenses', 'type'): True,
-                                         ('edit', 'itinerary', 'airlines'): True,
-                                         ('edit', 'itinerary', 'arrival_date'): True,
-                                         ('edit', 'itinerary', 'departure_date'): True,
-                                         ('edit', 'itinerary', 'destination'): True,
-                                         ('edit', 'itinerary', 'dsa_region'): True,
-                                         ('edit', 'itinerary', 'id'): True,
-                                         ('edit', 'itinerary', 'mode_of_travel'): True,
-                                         ('edit', 'itinerary', 'origin'): True,
-                                         ('edit', 'itinerary', 'overnight_travel'): True,
-                                         ('edit', 'travel', 'action_points'): True,
-                                         ('edit', 'travel', 'activities'): True,
-                                         ('edit', 'travel', 'clearances'): True,
-                                         ('edit', 'travel', 'cost_assignments'): True,
-                                         ('edit', 'travel', 'cost_summary'): True,
-                                         ('edit', 'travel', 'currency'): True,
-                                         ('edit', 'travel', 'deductions'): True,
-                                         ('edit', 'travel', 'end_date'): True,
-                                         ('edit', 'travel', 'expenses'): True,
-                                         ('edit', 'travel', 'id'): True,
-                                         ('edit', 'travel', 'international_travel'): True,
-                                         ('edit', 'travel', 'itinerary'): True,
-                                         ('edit', 'travel', 'office'): True,
-                                         ('edit', 'travel', 'purpose'): True,
-                                         ('edit', 'travel', 'reference_number'): True,
-                                         ('edit', 'travel', 'report'): True,
-                                         ('edit', 'travel', 'section'): True,
-                                         ('edit', 'travel', 'start_date'): True,
-                                         ('edit', 'travel', 'status'): True,
-                                         ('edit', 'travel', 'supervisor'): True,
-                                         ('edit', 'travel', 'ta_required'): True,
-                                         ('edit', 'travel', 'traveler'): True,
-                                         ('view', 'action_points', 'action_point_number'): True,
-                                         ('view', 'action_points', 'actions_taken'): True,
-                                         ('view', 'action_points', 'comments'): True,
-                                         ('view', 'action_points', 'completed_at'): True,
-                                         ('view', 'action_points', 'created_at'): True,
-                                         ('view', 'action_points', 'description'): True,
-                                         ('view', 'action_points', 'due_date'): True,
-                                         ('view', 'action_points', 'follow_up'): True,
-                                         ('view', 'action_points', 'id'): True,
-                                         ('view', 'action_points', 'person_responsible'): True,
-                                         ('view', 'action_points', 'status'): True,
-                                         ('view', 'action_points', 'trip_reference_number'): True,
-                                         ('view', 'activities', 'date'): True,
-                                         ('view', 'activities', 'id'): True,
-                                         ('view', 'activities', 'locations'): True,
-                                         ('view', 'activities', 'partner'): True,
-                                         ('view', 'activities', 'partnership'): True,
-                                         ('view', 'activities', 'primary_traveler'): True,
-                                         ('view', 'activities', 'result'): True,
-                                         ('view', 'activities', 'travel_type'): True,
-                                         ('view', 'clearances', 'id'): True,
-                                         ('view', 'clearances', 'medical_clearance'): True,
-                                         ('view', 'clearances', 'security_clearance'): True,
-                                         ('view', 'clearances', 'security_course'): True,
-                                         ('view', 'cost_assignments', 'business_area'): True,
-                                         ('view', 'cost_assignments', 'delegate'): True,
-                                         ('view', 'cost_assignments', 'fund'): True,
-                                         ('view', 'cost_assignments', 'grant'): True,
-                                         ('view', 'cost_assignments', 'id'): True,
-                                         ('view', 'cost_assignments', 'share'): True,
-                                         ('view', 'cost_assignments', 'wbs'): True,
-                                         ('view', 'deductions', 'accomodation'): True,
-                                         ('view', 'deductions', 'breakfast'): True,
-                                         ('view', 'deductions', 'date'): True,
-                                         ('view', 'deductions', 'day_of_the_week'): True,
-                                         ('view', 'deductions', 'dinner'): True,
-                                         ('view', 'deductions', 'id'): True,
-                                         ('view', 'deductions', 'lunch'): True,
-                                         ('view', 'deductions', 'no_dsa'): True,
-                                         ('view', 'expenses', 'account_currency'): True,
-                                         ('view', 'expenses', 'amount'): True,
-                                         ('view', 'expenses', 'document_currency'): True,
-                                         ('view', 'expenses', 'id'): True,
-                                         ('view', 'expenses', 'type'): True,
-                                         ('view', 'itinerary', 'airlines'): True,
-                                         ('view', 'itinerary', 'arrival_date'): True,
-                                         ('view', 'itinerary', 'departure_date'): True,
-                                         ('view', 'itinerary', 'destination'): True,
-                                         ('view', 'itinerary', 'dsa_region'): True,
-                                         ('view', 'itinerary', 'id'): True,
-                                         ('view', 'itinerary', 'mode_of_travel'): True,
-                                         ('view', 'itinerary', 'origin'): True,
-                                         ('view', 'itinerary', 'overnight_travel'): True,
-                                         ('view', 'travel', 'action_points'): True,
-                                         ('view', 'travel', 'activities'): True,
-                                         ('view', 'travel', 'clearances'): True,
-                                         ('view', 'travel', 'cost_assignments'): True,
-                                         ('view', 'travel', 'cost_summary'): True,
-                                         ('view', 'travel', 'currency'): True,
-                                         ('view', 'travel', 'deductions'): True,
-                                         ('view', 'travel', 'end_date'): True,
-                                         ('view', 'travel', 'expenses'): True,
-                                         ('view', 'travel', 'id'): True,
-                                         ('view', 'travel', 'international_travel'): True,
-                                         ('view', 'travel', 'itinerary'): True,
-                                         ('view', 'travel', 'office'): True,
-                                         ('view', 'travel', 'purpose'): True,
-                                         ('view', 'travel', 'reference_number'): True,
-                                         ('view', 'travel', 'report'): True,
-                                         ('view', 'travel', 'section'): True,
-                                         ('view', 'travel', 'start_date'): True,
-                                         ('view', 'travel', 'status'): True,
-                                         ('view', 'travel', 'supervisor'): True,
-                                         ('view', 'travel', 'ta_required'): True,
-                                         ('view', 'travel', 'traveler'): True},
-                                        'submitted':
-                                        {('edit', 'action_points', 'action_point_number'): True,
-                                         ('edit', 'action_points', 'actions_taken'): True,
-                                         ('edit', 'action_points', 'comments'): True,
-                                         ('edit', 'action_points', 'completed_at'): True,
-                                         ('edit', 'action_points', 'created_at'): True,
-                                         ('edit', 'action_points', 'description'): True,
-                                         ('edit', 'action_points', 'due_date'): True,
-                                         ('edit', 'action_points', 'follow_up'): True,
-                                         ('edit', 'action_points', 'id'): True,
-                                         ('edit', 'action_points', 'person_responsible'): True,
-                                         ('edit', 'action_points', 'status'): True,
-                                         ('edit', 'action_points', 'trip_reference_number'): True,
-                                         ('edit', 'activities', 'date'): True,
-                                         ('edit', 'activities', 'id'): True,
-                                         ('edit', 'activities', 'locations'): True,
-                                         ('edit', 'activities', 'partner'): True,
-                                         ('edit', 'activities', 'partnership'): True,
-                                         ('edit', 'activities', 'primary_traveler'): True,
-                                         ('edit', 'activities', 'result'): True,
-                                         ('edit', 'activities', 'travel_type'): True,
-                                         ('edit', 'clearances', 'id'): True,
-                                         ('edit', 'clearances', 'medical_clearance'): True,
-                                         ('edit', 'clearances', 'security_clearance'): True,
-                                         ('edit', 'clearances', 'security_course'): True,
-                                         ('edit', 'cost_assignments', 'business_area'): True,
-                                         ('edit', 'cost_assignments', 'delegate'): True,
-                                         ('edit', 'cost_assignments', 'fund'): True,
-                                         ('edit', 'cost_assignments', 'grant'): True,
-                                         ('edit', 'cost_assignments', 'id'): True,
-                                         ('edit', 'cost_assignments', 'share'): True,
-                                         ('edit', 'cost_assignments', 'wbs'): True,
-                                         ('edit', 'deductions', 'accomodation'): True,
-                                         ('edit', 'deductions', 'breakfast'): True,
-                                         ('edit', 'deductions', 'date'): True,
-                                         ('edit', 'deductions', 'day_of_the_week'): True,
-                                         ('edit', 'deductions', 'dinner'): True,
-                                         ('edit', 'deductions', 'id'): True,
-                                         ('edit', 'deductions', 'lunch'): True,
-                                         ('edit', 'deductions', 'no_dsa'): True,
-                                         ('edit', 'expenses', 'account_currency'): True,
-                                         ('edit', 'expenses', 'amount'): True,
-                                         ('edit', 'expenses', 'document_currency'): True,
-                                         ('edit', 'expenses', 'id'): True,
-                                         ('edit', 'expenses', 'type'): True,
-                                         ('edit', 'itinerary', 'airlines'): True,
-                                         ('edit', 'itinerary', 'arrival_date'): True,
-                                         ('edit', 'itinerary', 'departure_date'): True,
-                                         ('edit', 'itinerary', 'destination'): True,
-                                         ('edit', 'itinerary', 'dsa_region'): True,
-                                         ('edit', 'itinerary', 'id'): True,
-                                         ('edit', 'itinerary', 'mode_of_travel'): True,
-                                         ('edit', 'itinerary', 'origin'): True,
-                                         ('edit', 'itinerary', 'overnight_travel'): True,
-                                         ('edit', 'travel', 'action_points'): True,
-                                         ('edit', 'travel', 'activities'): True,
-                                         ('edit', 'travel', 'clearances'): True,
-                                         ('edit', 'travel', 'cost_assignments'): True,
-                                         ('edit', 'travel', 'cost_summary'): True,
-                                         ('edit', 'travel', 'currency'): True,
-                                         ('edit', 'travel', 'deductions'): True,
-                                         ('edit', 'travel', 'end_date'): True,
-                                         ('edit', 'travel', 'expenses'): True,
-                                         ('edit', 'travel', 'id'): True,
-                                         ('edit', 'travel', 'international_travel'): True,
-                                         ('edit', 'travel', 'itinerary'): True,
-                                         ('edit', 'travel', 'office'): True,
-                                         ('edit', 'travel', 'purpose'): True,
-                                         ('edit', 'travel', 'reference_number'): True,
-                                         ('edit', 'travel', 'report'): True,
-                                         ('edit', 'travel', 'section'): True,
-                                         ('edit', 'travel', 'start_date'): True,
-                                         ('edit', 'travel', 'status'): True,
-                                         ('edit', 'travel', 'supervisor'): True,
-                                         ('edit', 'travel', 'ta_required'): True,
-                                         ('edit', 'travel', 'traveler'): True,
-                                         ('view', 'action_points', 'action_point_number'): True,
-                                         ('view', 'action_points', 'actions_taken'): True,
-                                         ('view', 'action_points', 'comments'): True,
-                                         ('view', 'action_points', 'completed_at'): True,
-                                         ('view', 'action_points', 'created_at'): True,
-                                         ('view', 'action_points', 'description'): True,
-                                         ('view', 'action_points', 'due_date'): True,
-                                         ('view', 'action_points', 'follow_up'): True,
-                                         ('view', 'action_points', 'id'): True,
-                                         ('view', 'action_points', 'person_responsible'): True,
-                                         ('view', 'action_points', 'status'): True,
-                                         ('view', 'action_points', 'trip_reference_number'): True,
-                                         ('view', 'activities', 'date'): True,
-                                         ('view', 'activities', 'id'): True,
-                                         ('view', 'activities', 'locations'): True,
-                                         ('view', 'activities', 'partner'): True,
-                                         ('view', 'activities', 'partnership'): True,
-                                         ('view', 'activities', 'primary_traveler'): True,
-                                         ('view', 'activities', 'result'): True,
-                                         ('view', 'activities', 'travel_type'): True,
-                                         ('view', 'clearances', 'id'): True,
-                                         ('view', 'clearances', 'medical_clearance'): True,
-                                         ('view', 'clearances', 'security_clearance'): True,
-                                         ('view', 'clearances', 'security_course'): True,
-                                         ('view', 'cost_assignments', 'business_area'): True,
-                                         ('view', 'cost_assignments', 'delegate'): True,
-                                         ('view', 'cost_assignments', 'fund'): True,
-                                         ('view', 'cost_assignments', 'grant'): True,
-                                         ('view', 'cost_assignments', 'id'): True,
-                                         ('view', 'cost_assignments', 'share'): True,
-                                         ('view', 'cost_assignments', 'wbs'): True,
-                                         ('view', 'deductions', 'accomodation'): True,
-                                         ('view', 'deductions', 'breakfast'): True,
-                                         ('view', 'deductions', 'date'): True,
-                                         ('view', 'deductions', 'day_of_the_week'): True,
-                                         ('view', 'deductions', 'dinner'): True,
-                                         ('view', 'deductions', 'id'): True,
-                                         ('view', 'deductions', 'lunch'): True,
-                                         ('view', 'deductions', 'no_dsa'): True,
-                                         ('view', 'expenses', 'account_currency'): True,
-                                         ('view', 'expenses', 'amount'): True,
-                                         ('view', 'expenses', 'document_currency'): True,
-                                         ('view', 'expenses', 'id'): True,
-                                         ('view', 'expenses', 'type'): True,
-                                         ('view', 'itinerary', 'airlines'): True,
-                                         ('view', 'itinerary', 'arrival_date'): True,
-                                         ('view', 'itinerary', 'departure_date'): True,
-                                         ('view', 'itinerary', 'destination'): True,
-                                         ('view', 'itinerary', 'dsa_region'): True,
-                                         ('view', 'itinerary', 'id'): True,
-                                         ('view', 'itinerary', 'mode_of_travel'): True,
-                                         ('view', 'itinerary', 'origin'): True,
-                                         ('view', 'itinerary', 'overnight_travel'): True,
-                                         ('view', 'travel', 'action_points'): True,
-                                         ('view', 'travel', 'activities'): True,
-                                         ('view', 'travel', 'clearances'): True,
-                                         ('view', 'travel', 'cost_assignments'): True,
-                                         ('view', 'travel', 'cost_summary'): True,
-                                         ('view', 'travel', 'currency'): True,
-                                         ('view', 'travel', 'deductions'): True,
-                                         ('view', 'travel', 'end_date'): True,
-                                         ('view', 'travel', 'expenses'): True,
-                                         ('view', 'travel', 'id'): True,
-                                         ('view', 'travel', 'international_travel'): True,
-                                         ('view', 'travel', 'itinerary'): True,
-                                         ('view', 'travel', 'office'): True,
-                                         ('view', 'travel', 'purpose'): True,
-                                         ('view', 'travel', 'reference_number'): True,
-                                         ('view', 'travel', 'report'): True,
-                                         ('view', 'travel', 'section'): True,
-                                         ('view', 'travel', 'start_date'): True,
-                                         ('view', 'travel', 'status'): True,
-                                         ('view', 'travel', 'supervisor'): True,
-                                         ('view', 'travel', 'ta_required'): True,
-                                         ('view', 'travel', 'traveler'): True}},
-               'Travel Focal Point': {'approved':
-                                      {('edit', 'action_points', 'action_point_number'): True,
-                                       ('edit', 'action_points', 'actions_taken'): True,
-                                       ('edit', 'action_points', 'comments'): True,
-                                       ('edit', 'action_points', 'completed_at'): True,
-                                       ('edit', 'action_points', 'created_at'): True,
-                                       ('edit', 'action_points', 'description'): True,
-                                       ('edit', 'action_points', 'due_date'): True,
-                                       ('edit', 'action_points', 'follow_up'): True,
-                                       ('edit', 'action_points', 'id'): True,
-                                       ('edit', 'action_points', 'person_responsible'): True,
-                                       ('edit', 'action_points', 'status'): True,
-                                       ('edit', 'action_points', 'trip_reference_number'): True,
-                                       ('edit', 'activities', 'date'): False,
-                                       ('edit', 'activities', 'id'): False,
-                                       ('edit', 'activities', 'locations'): False,
-                                       ('edit', 'activities', 'partner'): False,
-                                       ('edit', 'activities', 'partnership'): False,
-                                       ('edit', 'activities', 'primary_traveler'): False,
-                                       ('edit', 'activities', 'result'): False,
-                                       ('edit', 'activities', 'travel_type'): False,
-                                       ('edit', 'clearances', 'id'): False,
-                                       ('edit', 'clearances', 'medical_clearance'): False,
-                                       ('edit', 'clearances', 'security_clearance'): False,
-                                       ('edit', 'clearances', 'security_course'): False,
-                                       ('edit', 'cost_assignments', 'business_area'): False,
-                                       ('edit', 'cost_assignments', 'delegate'): False,
-                                       ('edit', 'cost_assignments', 'fund'): False,
-                                       ('edit', 'cost_assignments', 'grant'): False,
-                                       ('edit', 'cost_assignments', 'id'): False,
-                                       ('edit', 'cost_assignments', 'share'): False,
-                                       ('edit', 'cost_assignments', 'wbs'): False,
-                                       ('edit', 'deductions', 'accomodation'): False,
-                                       ('edit', 'deductions', 'breakfast'): False,
-                                       ('edit', 'deductions', 'date'): False,
-                                       ('edit', 'deductions', 'day_of_the_week'): False,
-                                       ('edit', 'deductions', 'dinner'): False,
-                                       ('edit', 'deductions', 'id'): False,
-                                       ('edit', 'deductions', 'lunch'): False,
-                                       ('edit', 'deductions', 'no_dsa'): False,
-                                       ('edit', 'expenses', 'account_currency'): False,
-                                       ('edit', 'expenses', 'amount'): False,
-                                       ('edit', 'expenses', 'document_currency'): False,
-                                       ('edit', 'expenses', 'id'): False,
-                                       ('edit', 'expenses', 'type'): False,
-                                       ('edit', 'itinerary', 'airlines'): True,
-                                       ('edit', 'itinerary', 'arrival_date'): True,
-                                       ('edit', 'itinerary', 'departure_date'): True,
-                                       ('edit', 'itinerary', 'destination'): True,
-                                       ('edit', 'itinerary', 'dsa_region'): True,
-                                       ('edit', 'itinerary', 'id'): True,
-                                       ('edit', 'itinerary', 'mode_of_travel'): True,
-                                       ('edit', 'itinerary', 'origin'): True,
-                                       ('edit', 'itinerary', 'overnight_travel'): True,
-                                       ('edit', 'travel', 'action_points'): True,
-                                       ('edit', 'travel', 'activities'): False,
-                                       ('edit', 'travel', 'clearances'): False,
-                                       ('edit', 'travel', 'cost_assignments'): False,
-                                       ('edit', 'travel', 'cost_summary'): False,
-                                       ('edit', 'travel', 'currency'): True,
-                                       ('edit', 'travel', 'deductions'): False,
-                                       ('edit', 'travel', 'end_date'): True,
-                                       ('edit', 'travel', 'expenses'): False,
-                                       ('edit', 'travel', 'id'): False,
-                                       ('edit', 'travel', 'international_travel'): False,
-                                       ('edit', 'travel', 'itinerary'): True,
-                                       ('edit', 'travel', 'office'): False,
-                                       ('edit', 'travel', 'purpose'): False,
-                                       ('edit', 'travel', 'reference_number'): False,
-                                       ('edit', 'travel', 'report'): False,
-                                       ('edit', 'travel', 'section'): False,
-                                       ('edit', 'travel', 'start_date'): True,
-                                       ('edit', 'travel', 'status'): False,
-                                       ('edit', 'travel', 'supervisor'): False,
-                                       ('edit', 'travel', 'ta_required'): False,
-                                       ('edit', 'travel', 'traveler'): False,
-                                       ('view', 'action_points', 'action_point_number'): True,
-                                       ('view', 'action_points', 'actions_taken'): True,
-                                       ('view', 'action_points', 'comments'): True,
-                                       ('view', 'action_points', 'completed_at'): True,
-                                       ('view', 'action_points', 'created_at'): True,
-                                       ('view', 'action_points', 'description'): True,
-                                       ('view', 'action_points', 'due_date'): True,
-                                       ('view', 'action_points', 'follow_up'): True,
-                                       ('view', 'action_points', 'id'): True,
-                                       ('view', 'action_points', 'person_responsible'): True,
-                                       ('view', 'action_points', 'status'): True,
-                                       ('view', 'action_points', 'trip_reference_number'): True,
-                                       ('view', 'activities', 'date'): True,
-                                       ('view', 'activities', 'id'): True,
-                                       ('view', 'activities', 'locations'): True,
-                                       ('view', 'activities', 'partner'): True,
-                                       ('view', 'activities', 'partnership'): True,
-                                       ('view', 'activities', 'primary_traveler'): True,
-                                       ('view', 'activities', 'result'): True,
-                                       ('view', 'activities', 'travel_type'): True,
-                                       ('view', 'clearances', 'id'): True,
-                                       ('view', 'clearances', 'medical_clearance'): True,
-                                       ('view', 'clearances', 'security_clearance'): True,
-                                       ('view', 'clearances', 'security_course'): True,
-                                       ('view', 'cost_assignments', 'business_area'): True,
-                                       ('view', 'cost_assignments', 'delegate'): True,
-                                       ('view', 'cost_assignments', 'fund'): True,
-                                       ('view', 'cost_assignments', 'grant'): True,
-                                       ('view', 'cost_assignments', 'id'): True,
-                                       ('view', 'cost_assignments', 'share'): True,
-                                       ('view', 'cost_assignments', 'wbs'): True,
-                                       ('view', 'deductions', 'accomodation'): True,
-                                       ('view', 'deductions', 'breakfast'): True,
-                                       ('view', 'deductions', 'date'): True,
-                                       ('view', 'deductions', 'day_of_the_week'): True,
-                                       ('view', 'deductions', 'dinner'): True,
-                                       ('view', 'deductions', 'id'): True,
-                                       ('view', 'deductions', 'lunch'): True,
-                                       ('view', 'deductions', 'no_dsa'): True,
-                                       ('view', 'expenses', 'account_currency'): True,
-                                       ('view', 'expenses', 'amount'): True,
-                                       ('view', 'expenses', 'document_currency'): True,
-                                       ('view', 'expenses', 'id'): True,
-                                       ('view', 'expenses', 'type'): True,
-                                       ('view', 'itinerary', 'airlines'): True,
-                                       ('view', 'itinerary', 'arrival_date'): True,
-                                       ('view', 'itinerary', 'departure_date'): True,
-                                       ('view', 'itinerary', 'destination'): True,
-                                       ('view', 'itinerary', 'dsa_region'): True,
-                                       ('view', 'itinerary', 'id'): True,
-                                       ('view', 'itinerary', 'mode_of_travel'): True,
-                                       ('view', 'itinerary', 'origin'): True,
-                                       ('view', 'itinerary', 'overnight_travel'): True,
-                                       ('view', 'travel', 'action_points'): True,
-                                       ('view', 'travel', 'activities'): True,
-                                       ('view', 'travel', 'clearances'): True,
-                                       ('view', 'travel', 'cost_assignments'): True,
-                                       ('view', 'travel', 'cost_summary'): True,
-                                       ('view', 'travel', 'currency'): True,
-                                       ('view', 'travel', 'deductions'): True,
-                                       ('view', 'travel', 'end_date'): True,
-                                       ('view', 'travel', 'expenses'): True,
-                                       ('view', 'travel', 'id'): True,
-                                       ('view', 'travel', 'international_travel'): True,
-                                       ('view', 'travel', 'itinerary'): True,
-                                       ('view', 'travel', 'office'): True,
-                                       ('view', 'travel', 'purpose'): True,
-                                       ('view', 'travel', 'reference_number'): True,
-                                       ('view', 'travel', 'report'): True,
-                                       ('view', 'travel', 'section'): True,
-                                       ('view', 'travel', 'start_date'): True,
-                                       ('view', 'travel', 'status'): True,
-                                       ('view', 'travel', 'supervisor'): True,
-                                       ('view', 'travel', 'ta_required'): True,
-                                       ('view', 'travel', 'traveler'): True},
-                                      'cancelled':
-                                      {('edit', 'action_points', 'action_point_number'): True,
-                                       ('edit', 'action_points', 'actions_taken'): True,
-                                       ('edit', 'action_points', 'comments'): True,
-                                       ('edit', 'action_points', 'completed_at'): True,
-                                       ('edit', 'action_points', 'created_at'): True,
-                                       ('edit', 'action_points', 'description'): True,
-                                       ('edit', 'action_points', 'due_date'): True,
-                                       ('edit', 'action_points', 'follow_up'): True,
-                                       ('edit', 'action_points', 'id'): True,
-                                       ('edit', 'action_points', 'person_responsible'): True,
-                                       ('edit', 'action_points', 'status'): True,
-                                       ('edit', 'action_points', 'trip_reference_number'): True,
-                                       ('edit', 'activities', 'date'): False,
-                                       ('edit', 'activities', 'id'): False,
-                                       ('edit', 'activities', 'locations'): False,
-                                       ('edit', 'activities', 'partner'): False,
-                                       ('edit', 'activities', 'partnership'): False,
-                                       ('edit', 'activities', 'primary_traveler'): False,
-                                       ('edit', 'activities', 'result'): False,
-                                       ('edit', 'activities', 'travel_type'): False,
-                                       ('edit', 'clearances', 'id'): False,
-                                       ('edit', 'clearances', 'medical_clearance'): False,
-                                       ('edit', 'clearances', 'security_clearance'): False,
-                                       ('edit', 'clearances', 'security_course'): False,
-                                       ('edit', 'cost_assignments', 'business_area'): False,
-                                       ('edit', 'cost_assignments', 'delegate'): False,
-                                       ('edit', 'cost_assignments', 'fund'): False,
-                                       ('edit', 'cost_assignments', 'grant'): False,
-                                       ('edit', 'cost_assignments', 'id'): False,
-                                       ('edit', 'cost_assignments', 'share'): False,
-                                       ('edit', 'cost_assignments', 'wbs'): False,
-                                       ('edit', 'deductions', 'accomodation'): False,
-                                       ('edit', 'deductions', 'breakfast'): False,
-                                       ('edit', 'deductions', 'date'): False,
-                                       ('edit', 'deductions', 'day_of_the_week'): False,
-                                       ('edit', 'deductions', 'dinner'): False,
-                                       ('edit', 'deductions', 'id'): False,
-                                       ('edit', 'deductions', 'lunch'): False,
-                                       ('edit', 'deductions', 'no_dsa'): False,
-                                       ('edit', 'expenses', 'account_currency'): False,
-                                       ('edit', 'expenses', 'amount'): False,
-                                       ('edit', 'expenses', 'document_currency'): False,
-                                       ('edit', 'expenses', 'id'): False,
-                                       ('edit', 'expenses', 'type'): False,
-                                       ('edit', 'itinerary', 'airlines'): True,
-                                       ('edit', 'itinerary', 'arrival_date'): True,
-                                       ('edit', 'itinerary', 'departure_date'): True,
-                                       ('edit', 'itinerary', 'destination'): True,
-                                       ('edit', 'itinerary', 'dsa_region'): True,
-                                       ('edit', 'itinerary', 'id'): True,
-                                       ('edit', 'itinerary', 'mode_of_travel'): True,
-                                       ('edit', 'itinerary', 'origin'): True,
-                                       ('edit', 'itinerary', 'overnight_travel'): True,
-                                       ('edit', 'travel', 'action_points'): True,
-                                       ('edit', 'travel', 'activities'): False,
-                                       ('edit', 'travel', 'clearances'): False,
-                                       ('edit', 'travel', 'cost_assignments'): False,
-                                       ('edit', 'travel', 'cost_summary'): False,
-                                       ('edit', 'travel', 'currency'): True,
-                                       ('edit', 'travel', 'deductions'): False,
-                                       ('edit', 'travel', 'end_date'): True,
-                                       ('edit', 'travel', 'expenses'): False,
-                                       ('edit', 'travel', 'id'): False,
-                                       ('edit', 'travel', 'international_travel'): False,
-                                       ('edit', 'travel', 'itinerary'): True,
-                                       ('edit', 'travel', 'office'): False,
-                                       ('edit', 'travel', 'purpose'): False,
-                                       ('edit', 'travel', 'reference_number'): False,
-                                       ('edit', 'travel', 'report'): False,
-                                       ('edit', 'travel', 'section'): False,
-                                       ('edit', 'travel', 'start_date'): True,
-                                       ('edit', 'travel', 'status'): False,
-                                       ('edit', 'travel', 'supervisor'): False,
-                                       ('edit', 'travel', 'ta_required'): False,
-                                       ('edit', 'travel', 'traveler'): False,
-                                       ('view', 'action_points', 'action_point_number'): True,
-                                       ('view', 'action_points', 'actions_taken'): True,
-                                       ('view', 'action_points', 'comments'): True,
-                                       ('view', 'action_points', 'completed_at'): True,
-                                       ('view', 'action_points', 'created_at'): True,
-                                       ('view', 'action_points', 'description'): True,
-                                       ('view', 'action_points', 'due_date'): True,
-                                       ('view', 'action_points', 'follow_up'): True,
-                                       ('view', 'action_points', 'id'): True,
-                                       ('view', 'action_points', 'person_responsible'): True,
-                                       ('view', 'action_points', 'status'): True,
-                                       ('view', 'action_points', 'trip_reference_number'): True,
-                                       ('view', 'activities', 'date'): True,
-                                       ('view', 'activities', 'id'): True,
-                                       ('view', 'activities', 'locations'): True,
-                                       ('view', 'activities', 'partner'): True,
-                                       ('view', 'activities', 'partnership'): True,
-                                       ('view', 'activities', 'primary_traveler'): True,
-                                       ('view', 'activities', 'result'): True,
-                                       ('view', 'activities', 'travel_type'): True,
-                                       ('view', 'clearances', 'id'): True,
-                                       ('view', 'clearances', 'medical_clearance'): True,
-                                       ('view', 'clearances', 'security_clearance'): True,
-                                       ('view', 'clearances', 'security_course'): True,
-                                       ('view', 'cost_assignments', 'business_area'): True,
-                                       ('view', 'cost_assignments', 'delegate'): True,
-                                       ('view', 'cost_assignments', 'fund'): True,
-                                       ('view', 'cost_assignments', 'grant'): True,
-                                       ('view', 'cost_assignments', 'id'): True,
-                                       ('view', 'cost_assignments', 'share'): True,
-                                       ('view', 'cost_assignments', 'wbs'): True,
-                                       ('view', 'deductions', 'accomodation'): True,
-                                       ('view', 'deductions', 'breakfast'): True,
-                                       ('view', 'deductions', 'date'): True,
-                                       ('view', 'deductions', 'day_of_the_week'): True,
-                                       ('view', 'deductions', 'dinner'): True,
-                                       ('view', 'deductions', 'id'): True,
-                                       ('view', 'deductions', 'lunch'): True,
-                                       ('view', 'deductions', 'no_dsa'): True,
-                                       ('view', 'expenses', 'account_currency'): True,
-                                       ('view', 'expenses', 'amount'): True,
-                                       ('view', 'expenses', 'document_currency'): True,
-                                       ('view', 'expenses', 'id'): True,
-                                       ('view', 'expenses', 'type'): True,
-                                       ('view', 'itinerary', 'airlines'): True,
-                                       ('view', 'itinerary', 'arrival_date'): True,
-                                       ('view', 'itinerary', 'departure_date'): True,
-                                       ('view', 'itinerary', 'destination'): True,
-                                       ('view', 'itinerary', 'dsa_region'): True,
-                                       ('view', 'itinerary', 'id'): True,
-                                       ('view', 'itinerary', 'mode_of_travel'): True,
-                                       ('view', 'itinerary', 'origin'): True,
-                                       ('view', 'itinerary', 'overnight_travel'): True,
-                                       ('view', 'travel', 'action_points'): True,
-                                       ('view', 'travel', 'activities'): True,
-                                       ('view', 'travel', 'clearances'): True,
-                                       ('view', 'travel', 'cost_assignments'): True,
-                                       ('view', 'travel', 'cost_summary'): True,
-                                       ('view', 'travel', 'currency'): True,
-                                       ('view', 'travel', 'deductions'): True,
-                                       ('view', 'travel', 'end_date'): True,
-                                       ('view', 'travel', 'expenses'): True,
-                                       ('view', 'travel', 'id'): True,
-                                       ('view', 'travel', 'international_travel'): True,
-                                       ('view', 'travel', 'itinerary'): True,
-                                       ('view', 'travel', 'office'): True,
-                                       ('view', 'travel', 'purpose'): True,
-                                       ('view', 'travel', 'reference_number'): True,
-                                       ('view', 'travel', 'report'): True,
-                                       ('view', 'travel', 'section'): True,
-                                       ('view', 'travel', 'start_date'): True,
-                                       ('view', 'travel', 'status'): True,
-                                       ('view', 'travel', 'supervisor'): True,
-                                       ('view', 'travel', 'ta_required'): True,
-                                       ('view', 'travel', 'traveler'): True},
-                                      'completed':
-                                      {('edit', 'action_points', 'action_point_number'): True,
-                                       ('edit', 'action_points', 'actions_taken'): True,
-                                       ('edit', 'action_points', 'comments'): True,
-                                       ('edit', 'action_points', 'completed_at'): True,
-                                       ('edit', 'action_points', 'created_at'): True,
-                                       ('edit', 'action_points', 'description'): True,
-                                       ('edit', 'action_points', 'due_date'): True,
-                                       ('edit', 'action_points', 'follow_up'): True,
-                                       ('edit', 'action_points', 'id'): True,
-                                       ('edit', 'action_points', 'person_responsible'): True,
-                                       ('edit', 'action_points', 'status'): True,
-                                       ('edit', 'action_points', 'trip_reference_number'): True,
-                                       ('edit', 'activities', 'date'): False,
-                                       ('edit', 'activities', 'id'): False,
-                                       ('edit', 'activities', 'locations'): False,
-                                       ('edit', 'activities', 'partner'): False,
-                                       ('edit', 'activities', 'partnership'): False,
-                                       ('edit', 'activities', 'primary_traveler'): False,
-                                       ('edit', 'activities', 'result'): False,
-                                       ('edit', 'activities', 'travel_type'): False,
-                                       ('edit', 'clearances', 'id'): False,
-                                       ('edit', 'clearances', 'medical_clearance'): False,
-                                       ('edit', 'clearances', 'security_clearance'): False,
-                                       ('edit', 'clearances', 'security_course'): False,
-                                       ('edit', 'cost_assignments', 'business_area'): False,
-                                       ('edit', 'cost_assignments', 'delegate'): False,
-                                       ('edit', 'cost_assignments', 'fund'): False,
-                                       ('edit', 'cost_assignments', 'grant'): False,
-                                       ('edit', 'cost_assignments', 'id'): False,
-                                       ('edit', 'cost_assignments', 'share'): False,
-                                       ('edit', 'cost_assignments', 'wbs'): False,
-                                       ('edit', 'deductions', 'accomodation'): False,
-                                       ('edit', 'deductions', 'breakfast'): False,
-                                       ('edit', 'deductions', 'date'): False,
-                                       ('edit', 'deductions', 'day_of_the_week'): False,
-                                       ('edit', 'deductions', 'dinner'): False,
-                                       ('edit', 'deductions', 'id'): False,
-                                       ('edit', 'deductions', 'lunch'): False,
-                                       ('edit', 'deductions', 'no_dsa'): False,
-                                       ('edit', 'expenses', 'account_currency'): False,
-                                       ('edit', 'expenses', 'amount'): False,
-                                       ('edit', 'expenses', 'document_currency'): False,
-                                       ('edit', 'expenses', 'id'): False,
-                                       ('edit', 'expenses', 'type'): False,
-                                       ('edit', 'itinerary', 'airlines'): False,
-                                       ('edit', 'itinerary', 'arrival_date'): False,
-                                       ('edit', 'itinerary', 'departure_date'): False,
-                                       ('edit', 'itinerary', 'destination'): False,
-                                       ('edit', 'itinerary', 'dsa_region'): False,
-                                       ('edit', 'itinerary', 'id'): False,
-                                       ('edit', 'itinerary', 'mode_of_travel'): False,
-                                       ('edit', 'itinerary', 'origin'): False,
-                                       ('edit', 'itinerary', 'overnight_travel'): False,
-                                       ('edit', 'travel', 'action_points'): True,
-                                       ('edit', 'travel', 'activities'): False,
-                                       ('edit', 'travel', 'clearances'): False,
-                                       ('edit', 'travel', 'cost_assignments'): False,
-                                       ('edit', 'travel', 'cost_summary'): False,
-                                       ('edit', 'travel', 'currency'): False,
-                                       ('edit', 'travel', 'deductions'): False,
-                                       ('edit', 'travel', 'end_date'): False,
-                                       ('edit', 'travel', 'expenses'): False,
-                                       ('edit', 'travel', 'id'): False,
-                                       ('edit', 'travel', 'international_travel'): False,
-                                       ('edit', 'travel', 'itinerary'): False,
-                                       ('edit', 'travel', 'office'): False,
-                                       ('edit', 'travel', 'purpose'): False,
-                                       ('edit', 'travel', 'reference_number'): False,
-                                       ('edit', 'travel', 'report'): False,
-                                       ('edit', 'travel', 'section'): False,
-                                       ('edit', 'travel', 'start_date'): False,
-                                       ('edit', 'travel', 'status'): False,
-                                       ('edit', 'travel', 'supervisor'): False,
-                                       ('edit', 'travel', 'ta_required'): False,
-                                       ('edit', 'travel', 'traveler'): False,
-                                       ('view', 'action_points', 'action_point_number'): True,
-                                       ('view', 'action_points', 'actions_taken'): True,
-                                       ('view', 'action_points', 'comments'): True,
-                                       ('view', 'action_points', 'completed_at'): True,
-                                       ('view', 'action_points', 'created_at'): True,
-                                       ('view', 'action_points', 'description'): True,
-                                       ('view', 'action_points', 'due_date'): True,
-                                       ('view', 'action_points', 'follow_up'): True,
-                                       ('view', 'action_points', 'id'): True,
-                                       ('view', 'action_points', 'person_responsible'): True,
-                                       ('view', 'action_points', 'status'): True,
-                                       ('view', 'action_points', 'trip_reference_number'): True,
-                                       ('view', 'activities', 'date'): True,
-                                       ('view', 'activities', 'id'): True,
-                                       ('view', 'activities', 'locations'): True,
-                                       ('view', 'activities', 'partner'): True,
-                                       ('view', 'activities', 'partnership'): True,
-                                       ('view', 'activities', 'primary_traveler'): True,
-                                       ('view', 'activities', 'result'): True,
-                                       ('view', 'activities', 'travel_type'): True,
-                                       ('view', 'clearances', 'id'): True,
-                                       ('view', 'clearances', 'medical_clearance'): True,
-                                       ('view', 'clearances', 'security_clearance'): True,
-                                       ('view', 'clearances', 'security_course'): True,
-                                       ('view', 'cost_assignments', 'business_area'): True,
-                                       ('view', 'cost_assignments', 'delegate'): True,
-                                       ('view', 'cost_assignments', 'fund'): True,
-                                       ('view', 'cost_assignments', 'grant'): True,
-                                       ('view', 'cost_assignments', 'id'): True,
-                                       ('view', 'cost_assignments', 'share'): True,
-                                       ('view', 'cost_assignments', 'wbs'): True,
-                                       ('view', 'deductions', 'accomodation'): True,
-                                       ('view', 'deductions', 'breakfast'): True,
-                                       ('view', 'deductions', 'date'): True,
-                                       ('view', 'deductions', 'day_of_the_week'): True,
-                                       ('view', 'deductions', 'dinner'): True,
-                                       ('view', 'deductions', 'id'): True,
-                                       ('view', 'deductions', 'lunch'): True,
-                                       ('view', 'deductions', 'no_dsa'): True,
-                                       ('view', 'expenses', 'account_currency'): True,
-                                       ('view', 'expenses', 'amount'): True,
-                                       ('view', 'expenses', 'document_currency'): True,
-                                       ('view', 'expenses', 'id'): True,
-                                       ('view', 'expenses', 'type'): True,
-                                       ('view', 'itinerary', 'airlines'): True,
-                                       ('view', 'itinerary', 'arrival_date'): True,
-                                       ('view', 'itinerary', 'departure_date'): True,
-                                       ('view', 'itinerary', 'destination'): True,
-                                       ('view', 'itinerary', 'dsa_region'): True,
-                                       ('view', 'itinerary', 'id'): True,
-                                       ('view', 'itinerary', 'mode_of_travel'): True,
-                                       ('view', 'itinerary', 'origin'): True,
-                                       ('view', 'itinerary', 'overnight_travel'): True,
-                                       ('view', 'travel', 'action_points'): True,
-                                       ('view', 'travel', 'activities'): True,
-                                       ('view', 'travel', 'clearances'): True,
-                                       ('view', 'travel', 'cost_assignments'): True,
-                                       ('view', 'travel', 'cost_summary'): True,
-                                       ('view', 'travel', 'currency'): True,
-                                       ('view', 'travel', 'deductions'): True,
-                                       ('view', 'travel', 'end_date'): True,
-                                       ('view', 'travel', 'expenses'): True,
-                                       ('view', 'travel', 'id'): True,
-                                       ('view', 'travel', 'international_travel'): True,
-                                       ('view', 'travel', 'itinerary'): True,
-                                       ('view', 'travel', 'office'): True,
-                                       ('view', 'travel', 'purpose'): True,
-                                       ('view', 'travel', 'reference_number'): True,
-                                       ('view', 'travel', 'report'): True,
-                                       ('view', 'travel', 'section'): True,
-                                       ('view', 'travel', 'start_date'): True,
-                                       ('view', 'travel', 'status'): True,
-                                       ('view', 'travel', 'supervisor'): True,
-                                       ('view', 'travel', 'ta_required'): True,
-                                       ('view', 'travel', 'traveler'): True},
-                                      'planned':
-                                      {('edit', 'action_points', 'action_point_number'): True,
-                                       ('edit', 'action_points', 'actions_taken'): True,
-                                       ('edit', 'action_points', 'comments'): True,
-                                       ('edit', 'action_points', 'completed_at'): True,
-                                       ('edit', 'action_points', 'created_at'): True,
-                                       ('edit', 'action_points', 'description'): True,
-                                       ('edit', 'action_points', 'due_date'): True,
-                                       ('edit', 'action_points', 'follow_up'): True,
-                                       ('edit', 'action_points', 'id'): True,
-                                       ('edit', 'action_points', 'person_responsible'): True,
-                                       ('edit', 'action_points', 'status'): True,
-                                       ('edit', 'action_points', 'trip_reference_number'): True,
-                                       ('edit', 'activities', 'date'): False,
-                                       ('edit', 'activities', 'id'): False,
-                                       ('edit', 'activities', 'locations'): False,
-                                       ('edit', 'activities', 'partner'): False,
-                                       ('edit', 'activities', 'partnership'): False,
-                                       ('edit', 'activities', 'primary_traveler'): False,
-                                       ('edit', 'activities', 'result'): False,
-                                       ('edit', 'activities', 'travel_type'): False,
-                                       ('edit', 'clearances', 'id'): False,
-                                       ('edit', 'clearances', 'medical_clearance'): False,
-                                       ('edit', 'clearances', 'security_clearance'): False,
-                                       ('edit', 'clearances', 'security_course'): False,
-                                       ('edit', 'cost_assignments', 'business_area'): False,
-                                       ('edit', 'cost_assignments', 'delegate'): False,
-                                       ('edit', 'cost_assignments', 'fund'): False,
-                                       ('edit', 'cost_assignments', 'grant'): False,
-                                       ('edit', 'cost_assignments', 'id'): False,
-                                       ('edit', 'cost_assignments', 'share'): False,
-                                       ('edit', 'cost_assignments', 'wbs'): False,
-                                       ('edit', 'deductions', 'accomodation'): False,
-                                       ('edit', 'deductions', 'breakfast'): False,
-                                       ('edit', 'deductions', 'date'): False,
-                                       ('edit', 'deductions', 'day_of_the_week'): False,
-                                       ('edit', 'deductions', 'dinner'): False,
-                                       ('edit', 'deductions', 'id'): False,
-                                       ('edit', 'deductions', 'lunch'): False,
-                                       ('edit', 'deductions', 'no_dsa'): False,
-                                       ('edit', 'expenses', 'account_currency'): False,
-                                       ('edit', 'expenses', 'amount'): False,
-                                       ('edit', 'expenses', 'document_currency'): False,
-                                       ('edit', 'expenses', 'id'): False,
-                                       ('edit', 'expenses', 'type'): False,
-                                       ('edit', 'itinerary', 'airlines'): True,
-                                       ('edit', 'itinerary', 'arrival_date'): True,
-                                       ('edit', 'itinerary', 'departure_date'): True,
-                                       ('edit', 'itinerary', 'destination'): True,
-                                       ('edit', 'itinerary', 'dsa_region'): True,
-                                       ('edit', 'itinerary', 'id'): True,
-                                       ('edit', 'itinerary', 'mode_of_travel'): True,
-                                       ('edit', 'itinerary', 'origin'): True,
-                                       ('edit', 'itinerary', 'overnight_travel'): True,
-                                       ('edit', 'travel', 'action_points'): True,
-                                       ('edit', 'travel', 'activities'): False,
-                                       ('edit', 'travel', 'clearances'): False,
-                                       ('edit', 'travel', 'cost_assignments'): False,
-                                       ('edit', 'travel', 'cost_summary'): False,
-                                       ('edit', 'travel', 'currency'): True,
-                                       ('edit', 'travel', 'deductions'): False,
-                                       ('edit', 'travel', 'end_date'): True,
-                                       ('edit', 'travel', 'expenses'): False,
-                                       ('edit', 'travel', 'id'): False,
-                                       ('edit', 'travel', 'international_travel'): False,
-                                       ('edit', 'travel', 'itinerary'): True,
-                                       ('edit', 'travel', 'office'): False,
-                                       ('edit', 'travel', 'purpose'): False,
-                                       ('edit', 'travel', 'reference_number'): False,
-                                       ('edit', 'travel', 'report'): False,
-                                       ('edit', 'travel', 'section'): False,
-                                       ('edit', 'travel', 'start_date'): True,
-                                       ('edit', 'travel', 'status'): False,
-                                       ('edit', 'travel', 'supervisor'): False,
-                                       ('edit', 'travel', 'ta_required'): False,
-                                       ('edit', 'travel', 'traveler'): False,
-                                       ('view', 'action_points', 'action_point_number'): True,
-                                       ('view', 'action_points', 'actions_taken'): True,
-                                       ('view', 'action_points', 'comments'): True,
-                                       ('view', 'action_points', 'completed_at'): True,
-                                       ('view', 'action_points', 'created_at'): True,
-                                       ('view', 'action_points', 'description'): True,
-                                       ('view', 'action_points', 'due_date'): True,
-                                       ('view', 'action_points', 'follow_up'): True,
-                                       ('view', 'action_points', 'id'): True,
-                                       ('view', 'action_points', 'person_responsible'): True,
-                                       ('view', 'action_points', 'status'): True,
-                                       ('view', 'action_points', 'trip_reference_number'): True,
-                                       ('view', 'activities', 'date'): True,
-                                       ('view', 'activities', 'id'): True,
-                                       ('view', 'activities', 'locations'): True,
-                                       ('view', 'activities', 'partner'): True,
-                                       ('view', 'activities', 'partnership'): True,
-                                       ('view', 'activities', 'primary_traveler'): True,
-                                       ('view', 'activities', 'result'): True,
-                                       ('view', 'activities', 'travel_type'): True,
-                                       ('view', 'clearances', 'id'): True,
-                                       ('view', 'clearances', 'medical_clearance'): True,
-                                       ('view', 'clearances', 'security_clearance'): True,
-                                       ('view', 'clearances', 'security_course'): True,
-                                       ('view', 'cost_assignments', 'business_area'): True,
-                                       ('view', 'cost_assignments', 'delegate'): True,
-                                       ('view', 'cost_assignments', 'fund'): True,
-                                       ('view', 'cost_assignments', 'grant'): True,
-                                       ('view', 'cost_assignments', 'id'): True,
-                                       ('view', 'cost_assignments', 'share'): True,
-                                       ('view', 'cost_assignments', 'wbs'): True,
-                                       ('view', 'deductions', 'accomodation'): True,
-                                       ('view', 'deductions', 'breakfast'): True,
-                                       ('view', 'deductions', 'date'): True,
-                                       ('view', 'deductions', 'day_of_the_week'): True,
-                                       ('view', 'deductions', 'dinner'): True,
-                                       ('view', 'deductions', 'id'): True,
-                                       ('view', 'deductions', 'lunch'): True,
-                                       ('view', 'deductions', 'no_dsa'): True,
-                                       ('view', 'expenses', 'account_currency'): True,
-                                       ('view', 'expenses', 'amount'): True,
-                                       ('view', 'expenses', 'document_currency'): True,
-                                       ('view', 'expenses', 'id'): True,
-                                       ('view', 'expenses', 'type'): True,
-                                       ('view', 'itinerary', 'airlines'): True,
-                                       ('view', 'itinerary', 'arrival_date'): True,
-                                       ('view', 'itinerary', 'departure_date'): True,
-                                       ('view', 'itinerary', 'destination'): True,
-                                       ('view', 'itinerary', 'dsa_region'): True,
-                                       ('view', 'itinerary', 'id'): True,
-                                       ('view', 'itinerary', 'mode_of_travel'): True,
-                                       ('view', 'itinerary', 'origin'): True,
-                                       ('view', 'itinerary', 'overnight_travel'): True,
-                                       ('view', 'travel', 'action_points'): True,
-                                       ('view', 'travel', 'activities'): True,
-                                       ('view', 'travel', 'clearances'): True,
-                                       ('view', 'travel', 'cost_assignments'): True,
-                                       ('view', 'travel', 'cost_summary'): True,
-                                       ('view', 'travel', 'currency'): True,
-                                       ('view', 'travel', 'deductions'): True,
-                                       ('view', 'travel', 'end_date'): True,
-                                       ('view', 'travel', 'expenses'): True,
-                                       ('view', 'travel', 'id'): True,
-                                       ('view', 'travel', 'international_travel'): True,
-                                       ('view', 'travel', 'itinerary'): True,
-                                       ('view', 'travel', 'office'): True,
-                                       ('view', 'travel', 'purpose'): True,
-                                       ('view', 'travel', 'reference_number'): True,
-                                       ('view', 'travel', 'report'): True,
-                                       ('view', 'travel', 'section'): True,
-                                       ('view', 'travel', 'start_date'): True,
-                                       ('view', 'travel', 'status'): True,
-                                       ('view', 'travel', 'supervisor'): True,
-                                       ('view', 'travel', 'ta_required'): True,
-                                       ('view', 'travel', 'traveler'): True},
-                                      'rejected':
-                                      {('edit', 'action_points', 'action_point_number'): True,
-                                       ('edit', 'action_points', 'actions_taken'): True,
-                                       ('edit', 'action_points', 'comments'): True,
-                                       ('edit', 'action_points', 'completed_at'): True,
-                                       ('edit', 'action_points', 'created_at'): True,
-                                       ('edit', 'action_points', 'description'): True,
-                                       ('edit', 'action_points', 'due_date'): True,
-                                       ('edit', 'action_points', 'follow_up'): True,
-                                       ('edit', 'action_points', 'id'): True,
-                                       ('edit', 'action_points', 'person_responsible'): True,
-                                       ('edit', 'action_points', 'status'): True,
-                                       ('edit', 'action_points', 'trip_reference_number'): True,
-                                       ('edit', 'activities', 'date'): False,
-                                       ('edit', 'activities', 'id'): False,
-                                       ('edit', 'activities', 'locations'): False,
-                                       ('edit', 'activities', 'partner'): False,
-                                       ('edit', 'activities', 'partnership'): False,
-                                       ('edit', 'activities', 'primary_traveler'): False,
-                                       ('edit', 'activities', 'result'): False,
-                                       ('edit', 'activities', 'travel_type'): False,
-                                       ('edit', 'clearances', 'id'): False,
-                                       ('edit', 'clearances', 'medical_clearance'): False,
-                                       ('edit', 'clearances', 'security_clearance'): False,
-                                       ('edit', 'clearances', 'security_course'): False,
-                                       ('edit', 'cost_assignments', 'business_area'): False,
-                                       ('edit', 'cost_assignments', 'delegate'): False,
-                                       ('edit', 'cost_assignments', 'fund'): False,
-                                       ('edit', 'cost_assignments', 'grant'): False,
-                                       ('edit', 'cost_assignments', 'id'): False,
-                                       ('edit', 'cost_assignments', 'share'): False,
-                                       ('edit', 'cost_assignments', 'wbs'): False,
-                                       ('edit', 'deductions', 'accomodation'): False,
-                                       ('edit', 'deductions', 'breakfast'): False,
-                                       ('edit', 'deductions', 'date'): False,
-                                       ('edit', 'deductions', 'day_of_the_week'): False,
-                                       ('edit', 'deductions', 'dinner'): False,
-                                       ('edit', 'deductions', 'id'): False,
-                                       ('edit', 'deductions', 'lunch'): False,
-                                       ('edit', 'deductions', 'no_dsa'): False,
-                                       ('edit', 'expenses', 'account_currency'): False,
-                                       ('edit', 'expenses', 'amount'): False,
-                                       ('edit', 'expenses', 'document_currency'): False,
-                                       ('edit', 'expenses', 'id'): False,
-                                       ('edit', 'expenses', 'type'): False,
-                                       ('edit', 'itinerary', 'airlines'): True,
-                                       ('edit', 'itinerary', 'arrival_date'): True,
-                                       ('edit', 'itinerary', 'departure_date'): True,
-                                       ('edit', 'itinerary', 'destination'): True,
-                                       ('edit', 'itinerary', 'dsa_region'): True,
-                                       ('edit', 'itinerary', 'id'): True,
-                                       ('edit', 'itinerary', 'mode_of_travel'): True,
-                                       ('edit', 'itinerary', 'origin'): True,
-                                       ('edit', 'itinerary', 'overnight_travel'): True,
-                                       ('edit', 'travel', 'action_points'): True,
-                                       ('edit', 'travel', 'activities'): False,
-                                       ('edit', 'travel', 'clearances'): False,
-                                       ('edit', 'travel', 'cost_assignments'): False,
-                                       ('edit', 'travel', 'cost_summary'): False,
-                                       ('edit', 'travel', 'currency'): True,
-                                       ('edit', 'travel', 'deductions'): False,
-                                       ('edit', 'travel', 'end_date'): True,
-                                       ('edit', 'travel', 'expenses'): False,
-                                       ('edit', 'travel', 'id'): False,
-                                       ('edit', 'travel', 'international_travel'): False,
-                                       ('edit', 'travel', 'itinerary'): True,
-                                       ('edit', 'travel', 'office'): False,
-                                       ('edit', 'travel', 'purpose'): False,
-                                       ('edit', 'travel', 'reference_number'): False,
-                                       ('edit', 'travel', 'report'): False,
-                                       ('edit', 'travel', 'section'): False,
-                                       ('edit', 'travel', 'start_date'): True,
-                                       ('edit', 'travel', 'status'): False,
-                                       ('edit', 'travel', 'supervisor'): False,
-                                       ('edit', 'travel', 'ta_required'): False,
-                                       ('edit', 'travel', 'traveler'): False,
-                                       ('view', 'action_points', 'action_point_number'): True,
-                                       ('view', 'action_points', 'actions_taken'): True,
-                                       ('view', 'action_points', 'comments'): True,
-                                       ('view', 'action_points', 'completed_at'): True,
-                                       ('view', 'action_points', 'created_at'): True,
-                                       ('view', 'action_points', 'description'): True,
-                                       ('view', 'action_points', 'due_date'): True,
-                                       ('view', 'action_points', 'follow_up'): True,
-                                       ('view', 'action_points', 'id'): True,
-                                       ('view', 'action_points', 'person_responsible'): True,
-                                       ('view', 'action_points', 'status'): True,
-                                       ('view', 'action_points', 'trip_reference_number'): True,
-                                       ('view', 'activities', 'date'): True,
-                                       ('view', 'activities', 'id'): True,
-                                       ('view', 'activities', 'locations'): True,
-                                       ('view', 'activities', 'partner'): True,
-                                       ('view', 'activities', 'partnership'): True,
-                                       ('view', 'activities', 'primary_traveler'): True,
-                                       ('view', 'activities', 'result'): True,
-                                       ('view', 'activities', 'travel_type'): True,
-                                       ('view', 'clearances', 'id'): True,
-                                       ('view', 'clearances', 'medical_clearance'): True,
-                                       ('view', 'clearances', 'security_clearance'): True,
-                                       ('view', 'clearances', 'security_course'): True,
-                                       ('view', 'cost_assignments', 'business_area'): True,
-                                       ('view', 'cost_assignments', 'delegate'): True,
-                                       ('view', 'cost_assignments', 'fund'): True,
-                                       ('view', 'cost_assignments', 'grant'): True,
-                                       ('view', 'cost_assignments', 'id'): True,
-                                       ('view', 'cost_assignments', 'share'): True,
-                                       ('view', 'cost_assignments', 'wbs'): True,
-                                       ('view', 'deductions', 'accomodation'): True,
-                                       ('view', 'deductions', 'breakfast'): True,
-                                       ('view', 'deductions', 'date'): True,
-                                       ('view', 'deductions', 'day_of_the_week'): True,
-                                       ('view', 'deductions', 'dinner'): True,
-                                       ('view', 'deductions', 'id'): True,
-                                       ('view', 'deductions', 'lunch'): True,
-                                       ('view', 'deductions', 'no_dsa'): True,
-                                       ('view', 'expenses', 'account_currency'): True,
-                                       ('view', 'expenses', 'amount'): True,
-                                       ('view', 'expenses', 'document_currency'): True,
-                                       ('view', 'expenses', 'id'): True,
-                                       ('view', 'expenses', 'type'): True,
-                                       ('view', 'itinerary', 'airlines'): True,
-                                       ('view', 'itinerary', 'arrival_date'): True,
-                                       ('view', 'itinerary', 'departure_date'): True,
-                                       ('view', 'itinerary', 'destination'): True,
-                                       ('view', 'itinerary', 'dsa_region'): True,
-                                       ('view', 'itinerary', 'id'): True,
-                                       ('view', 'itinerary', 'mode_of_travel'): True,
-                                       ('view', 'itinerary', 'origin'): True,
-                                       ('view', 'itinerary', 'overnight_travel'): True,
-                                       ('view', 'travel', 'action_points'): True,
-                                       ('view', 'travel', 'activities'): True,
-                                       ('view', 'travel', 'clearances'): True,
-                                       ('view', 'travel', 'cost_assignments'): True,
-                                       ('view', 'travel', 'cost_summary'): True,
-                                       ('view', 'travel', 'currency'): True,
-                                       ('view', 'travel', 'deductions'): True,
-                                       ('view', 'travel', 'end_date'): True,
-                                       ('view', 'travel', 'expenses'): True,
-                                       ('view', 'travel', 'id'): True,
-                                       ('view', 'travel', 'international_travel'): True,
-                                       ('view', 'travel', 'itinerary'): True,
-                                       ('view', 'travel', 'office'): True,
-                                       ('view', 'travel', 'purpose'): True,
-                                       ('view', 'travel', 'reference_number'): True,
-                                       ('view', 'travel', 'report'): True,
-                                       ('view', 'travel', 'section'): True,
-                                       ('view', 'travel', 'start_date'): True,
-                                       ('view', 'travel', 'status'): True,
-                                       ('view', 'travel', 'supervisor'): True,
-                                       ('view', 'travel', 'ta_required'): True,
-                                       ('view', 'travel', 'traveler'): True},
-                                      'submitted':
-                                      {('edit', 'action_points', 'action_point_number'): True,
-                                       ('edit', 'action_points', 'actions_taken'): True,
-                                       ('edit', 'action_points', 'comments'): True,
-                                       ('edit', 'action_points', 'completed_at'): True,
-                                       ('edit', 'action_points', 'created_at'): True,
-                                       ('edit', 'action_points', 'description'): True,
-                                       ('edit', 'action_points', 'due_date'): True,
-                                       ('edit', 'action_points', 'follow_up'): True,
-                                       ('edit', 'action_points', 'id'): True,
-                                       ('edit', 'action_points', 'person_responsible'): True,
-                                       ('edit', 'action_points', 'status'): True,
-                                       ('edit', 'action_points', 'trip_reference_number'): True,
-                                       ('edit', 'activities', 'date'): False,
-                                       ('edit', 'activities', 'id'): False,
-                                       ('edit', 'activities', 'locations'): False,
-                                       ('edit', 'activities', 'partner'): False,
-                                       ('edit', 'activities', 'partnership'): False,
-                                       ('edit', 'activities', 'primary_traveler'): False,
-                                       ('edit', 'activities', 'result'): False,
-                                       ('edit', 'activities', 'travel_type'): False,
-                                       ('edit', 'clearances', 'id'): False,
-                                       ('edit', 'clearances', 'medical_clearance'): False,
-                                       ('edit', 'clearances', 'security_clearance'): False,
-                                       ('edit', 'clearances', 'security_course'): False,
-                                       ('edit', 'cost_assignments', 'business_area'): False,
-                                       ('edit', 'cost_assignments', 'delegate'): False,
-                                       ('edit', 'cost_assignments', 'fund'): False,
-                                       ('edit', 'cost_assignments', 'grant'): False,
-                                       ('edit', 'cost_assignments', 'id'): False,
-                                       ('edit', 'cost_assignments', 'share'): False,
-                                       ('edit', 'cost_assignments', 'wbs'): False,
-                                       ('edit', 'deductions', 'accomodation'): False,
-                                       ('edit', 'deductions', 'breakfast'): False,
-                                       ('edit', 'deductions', 'date'): False,
-                                       ('edit', 'deductions', 'day_of_the_week'): False,
-                                       ('edit', 'deductions', 'dinner'): False,
-                                       ('edit', 'deductions', 'id'): False,
-                                       ('edit', 'deductions', 'lunch'): False,
-                                       ('edit', 'deductions', 'no_dsa'): False,
-                                       ('edit', 'expenses', 'account_currency'): False,
-                                       ('edit', 'expenses', 'amount'): False,
-                                       ('edit', 'expenses', 'document_currency'): False,
-                                       ('edit', 'expenses', 'id'): False,
-                                       ('edit', 'expenses', 'type'): False,
-                                       ('edit', 'itinerary', 'airlines'): True,
-                                       ('edit', 'itinerary', 'arrival_date'): True,
-                                       ('edit', 'itinerary', 'departure_date'): True,
-                                       ('edit', 'itinerary', 'destination'): True,
-                                       ('edit', 'itinerary', 'dsa_region'): True,
-                                       ('edit', 'itinerary', 'id'): True,
-                                       ('edit', 'itinerary', 'mode_of_travel'): True,
-                                       ('edit', 'itinerary', 'origin'): True,
-                                       ('edit', 'itinerary', 'overnight_travel'): True,
-                                       ('edit', 'travel', 'action_points'): True,
-                                       ('edit', 'travel', 'activities'): False,
-                                       ('edit', 'travel', 'clearances'): False,
-                                       ('edit', 'travel', 'cost_assignments'): False,
-                                       ('edit', 'travel', 'cost_summary'): False,
-                                       ('edit', 'travel', 'currency'): True,
-                                       ('edit', 'travel', 'deductions'): False,
-                                       ('edit', 'travel', 'end_date'): True,
-                                       ('edit', 'travel', 'expenses'): False,
-                                       ('edit', 'travel', 'id'): False,
-                                       ('edit', 'travel', 'international_travel'): False,
-                                       ('edit', 'travel', 'itinerary'): True,
-                                       ('edit', 'travel', 'office'): False,
-                                       ('edit', 'travel', 'purpose'): False,
-                                       ('edit', 'travel', 'reference_number'): False,
-                                       ('edit', 'travel', 'report'): False,
-                                       ('edit', 'travel', 'section'): False,
-                                       ('edit', 'travel', 'start_date'): True,
-                                       ('edit', 'travel', 'status'): False,
-                                       ('edit', 'travel', 'supervisor'): False,
-                                       ('edit', 'travel', 'ta_required'): False,
-                                       ('edit', 'travel', 'traveler'): False,
-                                       ('view', 'action_points', 'action_point_number'): True,
-                                       ('view', 'action_points', 'actions_taken'): True,
-                                       ('view', 'action_points', 'comments'): True,
-                                       ('view', 'action_points', 'completed_at'): True,
-                                       ('view', 'action_points', 'created_at'): True,
-                                       ('view', 'action_points', 'description'): True,
-                                       ('view', 'action_points', 'due_date'): True,
-                                       ('view', 'action_points', 'follow_up'): True,
-                                       ('view', 'action_points', 'id'): True,
-                                       ('view', 'action_points', 'person_responsible'): True,
-                                       ('view', 'action_points', 'status'): True,
-                                       ('view', 'action_points', 'trip_reference_number'): True,
-                                       ('view', 'activities', 'date'): True,
-                                       ('view', 'activities', 'id'): True,
-                                       ('view', 'activities', 'locations'): True,
-                                       ('view', 'activities', 'partner'): True,
-                                       ('view', 'activities', 'partnership'): True,
-                                       ('view', 'activities', 'primary_traveler'): True,
-                                       ('view', 'activities', 'result'): True,
-                                       ('view', 'activities', 'travel_type'): True,
-                                       ('view', 'clearances', 'id'): True,
-                                       ('view', 'clearances', 'medical_clearance'): True,
-                                       ('view', 'clearances', 'security_clearance'): True,
-                                       ('view', 'clearances', 'security_course'): True,
-                                       ('view', 'cost_assignments', 'business_area'): True,
-                                       ('view', 'cost_assignments', 'delegate'): True,
-                                       ('view', 'cost_assignments', 'fund'): True,
-                                       ('view', 'cost_assignments', 'grant'): True,
-                                       ('view', 'cost_assignments', 'id'): True,
-                                       ('view', 'cost_assignments', 'share'): True,
-                                       ('view', 'cost_assignments', 'wbs'): True,
-                                       ('view', 'deductions', 'accomodation'): True,
-                                       ('view', 'deductions', 'breakfast'): True,
-                                       ('view', 'deductions', 'date'): True,
-                                       ('view', 'deductions', 'day_of_the_week'): True,
-                                       ('view', 'deductions', 'dinner'): True,
-                                       ('view', 'deductions', 'id'): True,
-                                       ('view', 'deductions', 'lunch'): True,
-                                       ('view', 'deductions', 'no_dsa'): True,
-                                       ('view', 'expenses', 'account_currency'): True,
-                                       ('view', 'expenses', 'amount'): True,
-                                       ('view', 'expenses', 'document_currency'): True,
-                                       ('view', 'expenses', 'id'): True,
-                                       ('view', 'expenses', 'type'): True,
-                                       ('view', 'itinerary', 'airlines'): True,
-                                       ('view', 'itinerary', 'arrival_date'): True,
-                                       ('view', 'itinerary', 'departure_date'): True,
-                                       ('view', 'itinerary', 'destination'): True,
-                                       ('view', 'itinerary', 'dsa_region'): True,
-                                       ('view', 'itinerary', 'id'): True,
-                                       ('view', 'itinerary', 'mode_of_travel'): True,
-                                       ('view', 'itinerary', 'origin'): True,
-                                       ('view', 'itinerary', 'overnight_travel'): True,
-                                       ('view', 'travel', 'action_points'): True,
-                                       ('view', 'travel', 'activities'): True,
-                                       ('view', 'travel', 'clearances'): True,
-                                       ('view', 'travel', 'cost_assignments'): True,
-                                       ('view', 'travel', 'cost_summary'): True,
-                                       ('view', 'travel', 'currency'): True,
-                                       ('view', 'travel', 'deductions'): True,
-                                       ('view', 'travel', 'end_date'): True,
-                                       ('view', 'travel', 'expenses'): True,
-                                       ('view', 'travel', 'id'): True,
-                                       ('view', 'travel', 'international_travel'): True,
-                                       ('view', 'travel', 'itinerary'): True,
-                                       ('view', 'travel', 'office'): True,
-                                       ('view', 'travel', 'purpose'): True,
-                                       ('view', 'travel', 'reference_number'): True,
-                                       ('view', 'travel', 'report'): True,
-                                       ('view', 'travel', 'section'): True,
-                                       ('view', 'travel', 'start_date'): True,
-                                       ('view', 'travel', 'status'): True,
-                                       ('view', 'travel', 'supervisor'): True,
-                                       ('view', 'travel', 'ta_required'): True,
-                                       ('view', 'travel', 'traveler'): True}},
-               'Traveler': {'approved':
-                            {('edit', 'action_points', 'action_point_number'): True,
-                             ('edit', 'action_points', 'actions_taken'): True,
-                             ('edit', 'action_points', 'comments'): True,
-                             ('edit', 'action_points', 'completed_at'): True,
-                             ('edit', 'action_points', 'created_at'): True,
-                             ('edit', 'action_points', 'description'): True,
-                             ('edit', 'action_points', 'due_date'): True,
-                             ('edit', 'action_points', 'follow_up'): True,
-                             ('edit', 'action_points', 'id'): True,
-                             ('edit', 'action_points', 'person_responsible'): True,
-                             ('edit', 'action_points', 'status'): True,
-                             ('edit', 'action_points', 'trip_reference_number'): True,
-                             ('edit', 'activities', 'date'): False,
-                             ('edit', 'activities', 'id'): False,
-                             ('edit', 'activities', 'locations'): False,
-                             ('edit', 'activities', 'partner'): False,
-                             ('edit', 'activities', 'partnership'): False,
-                             ('edit', 'activities', 'primary_traveler'): False,
-                             ('edit', 'activities', 'result'): False,
-                             ('edit', 'activities', 'travel_type'): False,
-                             ('edit', 'clearances', 'id'): False,
-                             ('edit', 'clearances', 'medical_clearance'): False,
-                             ('edit', 'clearances', 'security_clearance'): False,
-                             ('edit', 'clearances', 'security_course'): False,
-                             ('edit', 'cost_assignments', 'business_area'): False,
-                             ('edit', 'cost_assignments', 'delegate'): False,
-                             ('edit', 'cost_assignments', 'fund'): False,
-                             ('edit', 'cost_assignments', 'grant'): False,
-                             ('edit', 'cost_assignments', 'id'): False,
-                             ('edit', 'cost_assignments', 'share'): False,
-                             ('edit', 'cost_assignments', 'wbs'): False,
-                             ('edit', 'deductions', 'accomodation'): False,
-                             ('edit', 'deductions', 'breakfast'): False,
-                             ('edit', 'deductions', 'date'): False,
-                             ('edit', 'deductions', 'day_of_the_week'): False,
-                             ('edit', 'deductions', 'dinner'): False,
-                             ('edit', 'deductions', 'id'): False,
-                             ('edit', 'deductions', 'lunch'): False,
-                             ('edit', 'deductions', 'no_dsa'): False,
-                             ('edit', 'expenses', 'account_currency'): False,
-                             ('edit', 'expenses', 'amount'): False,
-                             ('edit', 'expenses', 'document_currency'): False,
-                             ('edit', 'expenses', 'id'): False,
-                             ('edit', 'expenses', 'type'): False,
-                             ('edit', 'itinerary', 'airlines'): False,
-                             ('edit', 'itinerary', 'arrival_date'): False,
-                             ('edit', 'itinerary', 'departure_date'): False,
-                             ('edit', 'itinerary', 'destination'): False,
-                             ('edit', 'itinerary', 'dsa_region'): False,
-                             ('edit', 'itinerary', 'id'): False,
-                             ('edit', 'itinerary', 'mode_of_travel'): False,
-                             ('edit', 'itinerary', 'origin'): False,
-                             ('edit', 'itinerary', 'overnight_travel'): False,
-                             ('edit', 'travel', 'action_points'): True,
-                             ('edit', 'travel', 'activities'): False,
-                             ('edit', 'travel', 'clearances'): False,
-                             ('edit', 'travel', 'cost_assignments'): False,
-                             ('edit', 'travel', 'cost_summary'): False,
-                             ('edit', 'travel', 'currency'): False,
-                             ('edit', 'travel', 'deductions'): False,
-                             ('edit', 'travel', 'end_date'): False,
-                             ('edit', 'travel', 'expenses'): False,
-                             ('edit', 'travel', 'id'): False,
-                             ('edit', 'travel', 'international_travel'): False,
-                             ('edit', 'travel', 'itinerary'): False,
-                             ('edit', 'travel', 'office'): False,
-                             ('edit', 'travel', 'purpose'): False,
-                             ('edit', 'travel', 'reference_number'): False,
-                             ('edit', 'travel', 'report'): True,
-                             ('edit', 'travel', 'section'): False,
-                             ('edit', 'travel', 'start_date'): False,
-                             ('edit', 'travel', 'status'): False,
-                             ('edit', 'travel', 'supervisor'): False,
-                             ('edit', 'travel', 'ta_required'): False,
-                             ('edit', 'travel', 'traveler'): False,
-                             ('view', 'action_points', 'action_point_number'): True,
-                             ('view', 'action_points', 'actions_taken'): True,
-                             ('view', 'action_points', 'comments'): True,
-                             ('view', 'action_points', 'completed_at'): True,
-                             ('view', 'action_points', 'created_at'): True,
-                             ('view', 'action_points', 'description'): True,
-                             ('view', 'action_points', 'due_date'): True,
-                             ('view', 'action_points', 'follow_up'): True,
-                             ('view', 'action_points', 'id'): True,
-                             ('view', 'action_points', 'person_responsible'): True,
-                             ('view', 'action_points', 'status'): True,
-                             ('view', 'action_points', 'trip_reference_number'): True,
-                             ('view', 'activities', 'date'): True,
-                             ('view', 'activities', 'id'): True,
-                             ('view', 'activities', 'locations'): True,
-                             ('view', 'activities', 'partner'): True,
-                             ('view', 'activities', 'partnership'): True,
-                             ('view', 'activities', 'primary_traveler'): True,
-                             ('view', 'activities', 'result'): True,
-                             ('view', 'activities', 'travel_type'): True,
-                             ('view', 'clearances', 'id'): True,
-                             ('view', 'clearances', 'medical_clearance'): True,
-                             ('view', 'clearances', 'security_clearance'): True,
-                             ('view', 'clearances', 'security_course'): True,
-                             ('view', 'cost_assignments', 'business_area'): True,
-                             ('view', 'cost_assignments', 'delegate'): True,
-                             ('view', 'cost_assignments', 'fund'): True,
-                             ('view', 'cost_assignments', 'grant'): True,
-                             ('view', 'cost_assignments', 'id'): True,
-                             ('view', 'cost_assignments', 'share'): True,
-                             ('view', 'cost_assignments', 'wbs'): True,
-                             ('view', 'deductions', 'accomodation'): True,
-                             ('view', 'deductions', 'breakfast'): True,
-                             ('view', 'deductions', 'date'): True,
-                             ('view', 'deductions', 'day_of_the_week'): True,
-                             ('view', 'deductions', 'dinner'): True,
-                             ('view', 'deductions', 'id'): True,
-                             ('view', 'deductions', 'lunch'): True,
-                             ('view', 'deductions', 'no_dsa'): True,
-                             ('view', 'expenses', 'account_currency'): True,
-                             ('view', 'expenses', 'amount'): True,
-                             ('view', 'expenses', 'document_currency'): True,
-                             ('view', 'expenses', 'id'): True,
-                             ('view', 'expenses', 'type'): True,
-                             ('view', 'itinerary', 'airlines'): True,
-                             ('view', 'itinerary', 'arrival_date'): True,
-                             ('view', 'itinerary', 'departure_date'): True,
-                             ('view', 'itinerary', 'destination'): True,
-                             ('view', 'itinerary', 'dsa_region'): True,
-                             ('view', 'itinerary', 'id'): True,
-                             ('view', 'itinerary', 'mode_of_travel'): True,
-                             ('view', 'itinerary', 'origin'): True,
-                             ('view', 'itinerary', 'overnight_travel'): True,
-                             ('view', 'travel', 'action_points'): True,
-                             ('view', 'travel', 'activities'): True,
-                             ('view', 'travel', 'clearances'): True,
-                             ('view', 'travel', 'cost_assignments'): True,
-                             ('view', 'travel', 'cost_summary'): True,
-                             ('view', 'travel', 'currency'): True,
-                             ('view', 'travel', 'deductions'): True,
-                             ('view', 'travel', 'end_date'): True,
-                             ('view', 'travel', 'expenses'): True,
-                             ('view', 'travel', 'id'): True,
-                             ('view', 'travel', 'international_travel'): True,
-                             ('view', 'travel', 'itinerary'): True,
-                             ('view', 'travel', 'office'): True,
-                             ('view', 'travel', 'purpose'): True,
-                             ('view', 'travel', 'reference_number'): True,
-                             ('view', 'travel', 'report'): True,
-                             ('view', 'travel', 'section'): True,
-                             ('view', 'travel', 'start_date'): True,
-                             ('view', 'travel', 'status'): True,
-                             ('view', 'travel', 'supervisor'): True,
-                             ('view', 'travel', 'ta_required'): True,
-                             ('view', 'travel', 'traveler'): True},
-                            'cancelled':
-                            {('edit', 'action_points', 'action_point_number'): True,
-                             ('edit', 'action_points', 'actions_taken'): True,
-                             ('edit', 'action_points', 'comments'): True,
-                             ('edit', 'action_points', 'completed_at'): True,
-                             ('edit', 'action_points', 'created_at'): True,
-                             ('edit', 'action_points', 'description'): True,
-                             ('edit', 'action_points', 'due_date'): True,
-                             ('edit', 'action_points', 'follow_up'): True,
-                             ('edit', 'action_points', 'id'): True,
-                             ('edit', 'action_points', 'person_responsible'): True,
-                             ('edit', 'action_points', 'status'): True,
-                             ('edit', 'action_points', 'trip_reference_number'): True,
-                             ('edit', 'activities', 'date'): False,
-                             ('edit', 'activities', 'id'): False,
-                             ('edit', 'activities', 'locations'): False,
-                             ('edit', 'activities', 'partner'): False,
-                             ('edit', 'activities', 'partnership'): False,
-                             ('edit', 'activities', 'primary_traveler'): False,
-                             ('edit', 'activities', 'result'): False,
-                             ('edit', 'activities', 'travel_type'): False,
-                             ('edit', 'clearances', 'id'): False,
-                             ('edit', 'clearances', 'medical_clearance'): False,
-                             ('edit', 'clearances', 'security_clearance'): False,
-                             ('edit', 'clearances', 'security_course'): False,
-                             ('edit', 'cost_assignments', 'business_area'): False,
-                             ('edit', 'cost_assignments', 'delegate'): False,
-                             ('edit', 'cost_assignments', 'fund'): False,
-                             ('edit', 'cost_assignments', 'grant'): False,
-                             ('edit', 'cost_assignments', 'id'): False,
-                             ('edit', 'cost_assignments', 'share'): False,
-                             ('edit', 'cost_assignments', 'wbs'): False,
-                             ('edit', 'deductions', 'accomodation'): False,
-                             ('edit', 'deductions', 'breakfast'): False,
-                             ('edit', 'deductions', 'date'): False,
-                             ('edit', 'deductions', 'day_of_the_week'): False,
-                             ('edit', 'deductions', 'dinner'): False,
-                             ('edit', 'deductions', 'id'): False,
-                             ('edit', 'deductions', 'lunch'): False,
-                             ('edit', 'deductions', 'no_dsa'): False,
-                             ('edit', 'expenses', 'account_currency'): False,
-                             ('edit', 'expenses', 'amount'): False,
-                             ('edit', 'expenses', 'document_currency'): False,
-                             ('edit', 'expenses', 'id'): False,
-                             ('edit', 'expenses', 'type'): False,
-                             ('edit', 'itinerary', 'airlines'): False,
-                             ('edit', 'itinerary', 'arrival_date'): False,
-                             ('edit', 'itinerary', 'departure_date'): False,
-                             ('edit', 'itinerary', 'destination'): False,
-                             ('edit', 'itinerary', 'dsa_region'): False,
-                             ('edit', 'itinerary', 'id'): False,
-                             ('edit', 'itinerary', 'mode_of_travel'): False,
-                             ('edit', 'itinerary', 'origin'): False,
-                             ('edit', 'itinerary', 'overnight_travel'): False,
-                             ('edit', 'travel', 'action_points'): False,
-                             ('edit', 'travel', 'activities'): False,
-                             ('edit', 'travel', 'clearances'): False,
-                             ('edit', 'travel', 'cost_assignments'): False,
-                             ('edit', 'travel', 'cost_summary'): False,
-                             ('edit', 'travel', 'currency'): False,
-                             ('edit', 'travel', 'deductions'): False,
-                             ('edit', 'travel', 'end_date'): False,
-                             ('edit', 'travel', 'expenses'): False,
-                             ('edit', 'travel', 'id'): False,
-                             ('edit', 'travel', 'international_travel'): False,
-                             ('edit', 'travel', 'itinerary'): False,
-                             ('edit', 'travel', 'office'): False,
-                             ('edit', 'travel', 'purpose'): False,
-                             ('edit', 'travel', 'reference_number'): False,
-                             ('edit', 'travel', 'report'): True,
-                             ('edit', 'travel', 'section'): False,
-                             ('edit', 'travel', 'start_date'): False,
-                             ('edit', 'travel', 'status'): False,
-                             ('edit', 'travel', 'supervisor'): False,
-                             ('edit', 'travel', 'ta_required'): False,
-                             ('edit', 'travel', 'traveler'): False,
-                             ('view', 'action_points', 'action_point_number'): True,
-                             ('view', 'action_points', 'actions_taken'): True,
-                             ('view', 'action_points', 'comments'): True,
-                             ('view', 'action_points', 'completed_at'): True,
-                             ('view', 'action_points', 'created_at'): True,
-                             ('view', 'action_points', 'description'): True,
-                             ('view', 'action_points', 'due_date'): True,
-                             ('view', 'action_points', 'follow_up'): True,
-                             ('view', 'action_points', 'id'): True,
-                             ('view', 'action_points', 'person_responsible'): True,
-                             ('view', 'action_points', 'status'): True,
-                             ('view', 'action_points', 'trip_reference_number'): True,
-                             ('view', 'activities', 'date'): True,
-                             ('view', 'activities', 'id'): True,
-                             ('view', 'activities', 'locations'): True,
-                             ('view', 'activities', 'partner'): True,
-                             ('view', 'activities', 'partnership'): True,
-                             ('view', 'activities', 'primary_traveler'): True,
-                             ('view', 'activities', 'result'): True,
-                             ('view', 'activities', 'travel_type'): True,
-                             ('view', 'clearances', 'id'): True,
-                             ('view', 'clearances', 'medical_clearance'): True,
-                             ('view', 'clearances', 'security_clearance'): True,
-                             ('view', 'clearances', 'security_course'): True,
-                             ('view', 'cost_assignments', 'business_area'): True,
-                             ('view', 'cost_assignments', 'delegate'): True,
-                             ('view', 'cost_assignments', 'fund'): True,
-                             ('view', 'cost_assignments', 'grant'): True,
-                             ('view', 'cost_assignments', 'id'): True,
-                             ('view', 'cost_assignments', 'share'): True,
-                             ('view', 'cost_assignments', 'wbs'): True,
-                             ('view', 'deductions', 'accomodation'): True,
-                             ('view', 'deductions', 'breakfast'): True,
-                             ('view', 'deductions', 'date'): True,
-                             ('view', 'deductions', 'day_of_the_week'): True,
-                             ('view', 'deductions', 'dinner'): True,
-                             ('view', 'deductions', 'id'): True,
-                             ('view', 'deductions', 'lunch'): True,
-                             ('view', 'deductions', 'no_dsa'): True,
-                             ('view', 'expenses', 'account_currency'): True,
-                             ('view', 'expenses', 'amount'): True,
-                             ('view', 'expenses', 'document_currency'): True,
-                             ('view', 'expenses', 'id'): True,
-                             ('view', 'expenses', 'type'): True,
-                             ('view', 'itinerary', 'airlines'): True,
-                             ('view', 'itinerary', 'arrival_date'): True,
-                             ('view', 'itinerary', 'departure_date'): True,
-                             ('view', 'itinerary', 'destination'): True,
-                             ('view', 'itinerary', 'dsa_region'): True,
-                             ('view', 'itinerary', 'id'): True,
-                             ('view', 'itinerary', 'mode_of_travel'): True,
-                             ('view', 'itinerary', 'origin'): True,
-                             ('view', 'itinerary', 'overnight_travel'): True,
-                             ('view', 'travel', 'action_points'): True,
-                             ('view', 'travel', 'activities'): True,
-                             ('view', 'travel', 'clearances'): True,
-                             ('view', 'travel', 'cost_assignments'): True,
-                             ('view', 'travel', 'cost_summary'): True,
-                             ('view', 'travel', 'currency'): True,
-                             ('view', 'travel', 'deductions'): True,
-                             ('view', 'travel', 'end_date'): True,
-                             ('view', 'travel', 'expenses'): True,
-                             ('view', 'travel', 'id'): True,
-                             ('view', 'travel', 'international_travel'): True,
-                             ('view', 'travel', 'itinerary'): True,
-                             ('view', 'travel', 'office'): True,
-                             ('view', 'travel', 'purpose'): True,
-                             ('view', 'travel', 'reference_number'): True,
-                             ('view', 'travel', 'report'): True,
-                             ('view', 'travel', 'section'): True,
-                             ('view', 'travel', 'start_date'): True,
-                             ('view', 'travel', 'status'): True,
-                             ('view', 'travel', 'supervisor'): True,
-                             ('view', 'travel', 'ta_required'): True,
-                             ('view', 'travel', 'traveler'): True},
-                            'completed':
-                            {('edit', 'action_points', 'action_point_number'): True,
-                             ('edit', 'action_points', 'actions_taken'): True,
-                             ('edit', 'action_points', 'comments'): True,
-                             ('edit', 'action_points', 'completed_at'): True,
-                             ('edit', 'action_points', 'created_at'): True,
-                             ('edit', 'action_points', 'description'): True,
-                             ('edit', 'action_points', 'due_date'): True,
-                             ('edit', 'action_points', 'follow_up'): True,
-                             ('edit', 'action_points', 'id'): True,
-                             ('edit', 'action_points', 'person_responsible'): True,
-                             ('edit', 'action_points', 'status'): True,
-                             ('edit', 'action_points', 'trip_reference_number'): True,
-                             ('edit', 'activities', 'date'): False,
-                             ('edit', 'activities', 'id'): False,
-                             ('edit', 'activities', 'locations'): False,
-                             ('edit', 'activities', 'partner'): False,
-                             ('edit', 'activities', 'partnership'): False,
-                             ('edit', 'activities', 'primary_traveler'): False,
-                             ('edit', 'activities', 'result'): False,
-                             ('edit', 'activities', 'travel_type'): False,
-                             ('edit', 'clearances', 'id'): False,
-                             ('edit', 'clearances', 'medical_clearance'): False,
-                             ('edit', 'clearances', 'security_clearance'): False,
-                             ('edit', 'clearances', 'security_course'): False,
-                             ('edit', 'cost_assignments', 'business_area'): False,
-                             ('edit', 'cost_assignments', 'delegate'): False,
-                             ('edit', 'cost_assignments', 'fund'): False,
-                             ('edit', 'cost_assignments', 'grant'): False,
-                             ('edit', 'cost_assignments', 'id'): False,
-                             ('edit', 'cost_assignments', 'share'): False,
-                             ('edit', 'cost_assignments', 'wbs'): False,
-                             ('edit', 'deductions', 'accomodation'): False,
-                             ('edit', 'deductions', 'breakfast'): False,
-                             ('edit', 'deductions', 'date'): False,
-                             ('edit', 'deductions', 'day_of_the_week'): False,
-                             ('edit', 'deductions', 'dinner'): False,
-                             ('edit', 'deductions', 'id'): False,
-                             ('edit', 'deductions', 'lunch'): False,
-                             ('edit', 'deductions', 'no_dsa'): False,
-                             ('edit', 'expenses', 'account_currency'): False,
-                             ('edit', 'expenses', 'amount'): False,
-                             ('edit', 'expenses', 'document_currency'): False,
-                             ('edit', 'expenses', 'id'): False,
-                             ('edit', 'expenses', 'type'): False,
-                             ('edit', 'itinerary', 'airlines'): False,
-                             ('edit', 'itinerary', 'arrival_date'): False,
-                             ('edit', 'itinerary', 'departure_date'): False,
-                             ('edit', 'itinerary', 'destination'): False,
-                             ('edit', 'itinerary', 'dsa_region'): False,
-                             ('edit', 'itinerary', 'id'): False,
-                             ('edit', 'itinerary', 'mode_of_travel'): False,
-                             ('edit', 'itinerary', 'origin'): False,
-                             ('edit', 'itinerary', 'overnight_travel'): False,
-                             ('edit', 'travel', 'action_points'): True,
-                             ('edit', 'travel', 'activities'): False,
-                             ('edit', 'travel', 'clearances'): False,
-                             ('edit', 'travel', 'cost_assignments'): False,
-                             ('edit', 'travel', 'cost_summary'): False,
-                             ('edit', 'travel', 'currency'): False,
-                             ('edit', 'travel', 'deductions'): False,
-                             ('edit', 'travel', 'end_date'): False,
-                             ('edit', 'travel', 'expenses'): False,
-                             ('edit', 'travel', 'id'): False,
-                             ('edit', 'travel', 'international_travel'): False,
-                             ('edit', 'travel', 'itinerary'): False,
-                             ('edit', 'travel', 'office'): False,
-                             ('edit', 'travel', 'purpose'): False,
-                             ('edit', 'travel', 'reference_number'): False,
-                             ('edit', 'travel', 'report'): True,
-                             ('edit', 'travel', 'section'): False,
-                             ('edit', 'travel', 'start_date'): False,
-                             ('edit', 'travel', 'status'): False,
-                             ('edit', 'travel', 'supervisor'): False,
-                             ('edit', 'travel', 'ta_required'): False,
-                             ('edit', 'travel', 'traveler'): False,
-                             ('view', 'action_points', 'action_point_number'): True,
-                             ('view', 'action_points', 'actions_taken'): True,
-                             ('view', 'action_points', 'comments'): True,
-                             ('view', 'action_points', 'completed_at'): True,
-                             ('view', 'action_points', 'created_at'): True,
-                             ('view', 'action_points', 'description'): True,
-                             ('view', 'action_points', 'due_date'): True,
-                             ('view', 'action_points', 'follow_up'): True,
-                             ('view', 'action_points', 'id'): True,
-                             ('view', 'action_points', 'person_responsible'): True,
-                             ('view', 'action_points', 'status'): True,
-                             ('view', 'action_points', 'trip_reference_number'): True,
-                             ('view', 'activities', 'date'): True,
-                             ('view', 'activities', 'id'): True,
-                             ('view', 'activities', 'locations'): True,
-                             ('view', 'activities', 'partner'): True,
-                             ('view', 'activities', 'partnership'): True,
-                             ('view', 'activities', 'primary_traveler'): True,
-                             ('view', 'activities', 'result'): True,
-                             ('view', 'activities', 'travel_type'): True,
-                             ('view', 'clearances', 'id'): True,
-                             ('view', 'clearances', 'medical_clearance'): True,
-                             ('view', 'clearances', 'security_clearance'): True,
-                             ('view', 'clearances', 'security_course'): True,
-                             ('view', 'cost_assignments', 'business_area'): True,
-                             ('view', 'cost_assignments', 'delegate'): True,
-                             ('view', 'cost_assignments', 'fund'): True,
-                             ('view', 'cost_assignments', 'grant'): True,
-                             ('view', 'cost_assignments', 'id'): True,
-                             ('view', 'cost_assignments', 'share'): True,
-                             ('view', 'cost_assignments', 'wbs'): True,
-                             ('view', 'deductions', 'accomodation'): True,
-                             ('view', 'deductions', 'breakfast'): True,
-                             ('view', 'deductions', 'date'): True,
-                             ('view', 'deductions', 'day_of_the_week'): True,
-                             ('view', 'deductions', 'dinner'): True,
-                             ('view', 'deductions', 'id'): True,
-                             ('view', 'deductions', 'lunch'): True,
-                             ('view', 'deductions', 'no_dsa'): True,
-                             ('view', 'expenses', 'account_currency'): True,
-                             ('view', 'expenses', 'amount'): True,
-                             ('view', 'expenses', 'document_currency'): True,
-                             ('view', 'expenses', 'id'): True,
-                             ('view', 'expenses', 'type'): True,
-                             ('view', 'itinerary', 'airlines'): True,
-                             ('view', 'itinerary', 'arrival_date'): True,
-                             ('view', 'itinerary', 'departure_date'): True,
-                             ('view', 'itinerary', 'destination'): True,
-                             ('view', 'itinerary', 'dsa_region'): True,
-                             ('view', 'itinerary', 'id'): True,
-                             ('view', 'itinerary', 'mode_of_travel'): True,
-                             ('view', 'itinerary', 'origin'): True,
-                             ('view', 'itinerary', 'overnight_travel'): True,
-                             ('view', 'travel', 'action_points'): True,
-                             ('view', 'travel', 'activities'): True,
-                             ('view', 'travel', 'clearances'): True,
-                             ('view', 'travel', 'cost_assignments'): True,
-                             ('view', 'travel', 'cost_summary'): True,
-                             ('view', 'travel', 'currency'): True,
-                             ('view', 'travel', 'deductions'): True,
-                             ('view', 'travel', 'end_date'): True,
-                             ('view', 'travel', 'expenses'): True,
-                             ('view', 'travel', 'id'): True,
-                             ('view', 'travel', 'international_travel'): True,
-                             ('view', 'travel', 'itinerary'): True,
-                             ('view', 'travel', 'office'): True,
-                             ('view', 'travel', 'purpose'): True,
-                             ('view', 'travel', 'reference_number'): True,
-                             ('view', 'travel', 'report'): True,
-                             ('view', 'travel', 'section'): True,
-                             ('view', 'travel', 'start_date'): True,
-                             ('view', 'travel', 'status'): True,
-                             ('view', 'travel', 'supervisor'): True,
-                             ('view', 'travel', 'ta_required'): True,
-                             ('view', 'travel', 'traveler'): True},
-                            'planned':
-                            {('edit', 'action_points', 'action_point_number'): True,
-                             ('edit', 'action_points', 'actions_taken'): True,
-                             ('edit', 'action_points', 'comments'): True,
-                             ('edit', 'action_points', 'completed_at'): True,
-                             ('edit', 'action_points', 'created_at'): True,
-                             ('edit', 'action_points', 'description'): True,
-                             ('edit', 'action_points', 'due_date'): True,
-                             ('edit', 'action_points', 'follow_up'): True,
-                             ('edit', 'action_points', 'id'): True,
-                             ('edit', 'action_points', 'person_responsible'): True,
-                             ('edit', 'action_points', 'status'): True,
-                             ('edit', 'action_points', 'trip_reference_number'): True,
-                             ('edit', 'activities', 'date'): True,
-                             ('edit', 'activities', 'id'): True,
-                             ('edit', 'activities', 'locations'): True,
-                             ('edit', 'activities', 'partner'): True,
-                             ('edit', 'activities', 'partnership'): True,
-                             ('edit', 'activities', 'primary_traveler'): True,
-                             ('edit', 'activities', 'result'): True,
-                             ('edit', 'activities', 'travel_type'): True,
-                             ('edit', 'clearances', 'id'): True,
-                             ('edit', 'clearances', 'medical_clearance'): True,
-                             ('edit', 'clearances', 'security_clearance'): True,
-                             ('edit', 'clearances', 'security_course'): True,
-                             ('edit', 'cost_assignments', 'business_area'): True,
-                             ('edit', 'cost_assignments', 'delegate'): True,
-                             ('edit', 'cost_assignments', 'fund'): True,
-                             ('edit', 'cost_assignments', 'grant'): True,
-                             ('edit', 'cost_assignments', 'id'): True,
-                             ('edit', 'cost_assignments', 'share'): True,
-                             ('edit', 'cost_assignments', 'wbs'): True,
-                             ('edit', 'deductions', 'accomodation'): True,
-                             ('edit', 'deductions', 'breakfast'): True,
-                             ('edit', 'deductions', 'date'): True,
-                             ('edit', 'deductions', 'day_of_the_week'): True,
-                             ('edit', 'deductions', 'dinner'): True,
-                             ('edit', 'deductions', 'id'): True,
-                             ('edit', 'deductions', 'lunch'): True,
-                             ('edit', 'deductions', 'no_dsa'): True,
-                             ('edit', 'expenses', 'account_currency'): False,
-                             ('edit', 'expenses', 'amount'): True,
-                             ('edit', 'expenses', 'document_currency'): True,
-                             ('edit', 'expenses', 'id'): True,
-                             ('edit', 'expenses', 'type'): True,
-                             ('edit', 'itinerary', 'airlines'): True,
-                             ('edit', 'itinerary', 'arrival_date'): True,
-                             ('edit', 'itinerary', 'departure_date'): True,
-                             ('edit', 'itinerary', 'destination'): True,
-                             ('edit', 'itinerary', 'dsa_region'): True,
-                             ('edit', 'itinerary', 'id'): True,
-                             ('edit', 'itinerary', 'mode_of_travel'): True,
-                             ('edit', 'itinerary', 'origin'): True,
-                             ('edit', 'itinerary', 'overnight_travel'): True,
-                             ('edit', 'travel', 'action_points'): True,
-                             ('edit', 'travel', 'activities'): True,
-                             ('edit', 'travel', 'clearances'): True,
-                             ('edit', 'travel', 'cost_assignments'): True,
-                             ('edit', 'travel', 'cost_summary'): True,
-                             ('edit', 'travel', 'currency'): False,
-                             ('edit', 'travel', 'deductions'): True,
-                             ('edit', 'travel', 'end_date'): True,
-                             ('edit', 'travel', 'expenses'): True,
-                             ('edit', 'travel', 'id'): True,
-                             ('edit', 'travel', 'international_travel'): True,
-                             ('edit', 'travel', 'itinerary'): True,
-                             ('edit', 'travel', 'office'): True,
-                             ('edit', 'travel', 'purpose'): True,
-                             ('edit', 'travel', 'reference_number'): True,
-                             ('edit', 'travel', 'report'): True,
-                             ('edit', 'travel', 'section'): True,
-                             ('edit', 'travel', 'start_date'): True,
-                             ('edit', 'travel', 'status'): True,
-                             ('edit', 'travel', 'supervisor'): True,
-                             ('edit', 'travel', 'ta_required'): True,
-                             ('edit', 'travel', 'traveler'): False,
-                             ('view', 'action_points', 'action_point_number'): True,
-                             ('view', 'action_points', 'actions_taken'): True,
-                             ('view', 'action_points', 'comments'): True,
-                             ('view', 'action_points', 'completed_at'): True,
-                             ('view', 'action_points', 'created_at'): True,
-                             ('view', 'action_points', 'description'): True,
-                             ('view', 'action_points', 'due_date'): True,
-                             ('view', 'action_points', 'follow_up'): True,
-                             ('view', 'action_points', 'id'): True,
-                             ('view', 'action_points', 'person_responsible'): True,
-                             ('view', 'action_points', 'status'): True,
-                             ('view', 'action_points', 'trip_reference_number'): True,
-                             ('view', 'activities', 'date'): True,
-                             ('view', 'activities', 'id'): True,
-                             ('view', 'activities', 'locations'): True,
-                             ('view', 'activities', 'partner'): True,
-                             ('view', 'activities', 'partnership'): True,
-                             ('view', 'activities', 'primary_traveler'): True,
-                             ('view', 'activities', 'result'): True,
-                             ('view', 'activities', 'travel_type'): True,
-                             ('view', 'clearances', 'id'): True,
-                             ('view', 'clearances', 'medical_clearance'): True,
-                             ('view', 'clearances', 'security_clearance'): True,
-                             ('view', 'clearances', 'security_course'): True,
-                             ('view', 'cost_assignments', 'business_area'): True,
-                             ('view', 'cost_assignments', 'delegate'): True,
-                             ('view', 'cost_assignments', 'fund'): True,
-                             ('view', 'cost_assignments', 'grant'): True,
-                             ('view', 'cost_assignments', 'id'): True,
-                             ('view', 'cost_assignments', 'share'): True,
-                             ('view', 'cost_assignments', 'wbs'): True,
-                             ('view', 'deductions', 'accomodation'): True,
-                             ('view', 'deductions', 'breakfast'): True,
-                             ('view', 'deductions', 'date'): True,
-                             ('view', 'deductions', 'day_of_the_week'): True,
-                             ('view', 'deductions', 'dinner'): True,
-                             ('view', 'deductions', 'id'): True,
-                             ('view', 'deductions', 'lunch'): True,
-                             ('view', 'deductions', 'no_dsa'): True,
-                             ('view', 'expenses', 'account_currency'): False,
-                             ('view', 'expenses', 'amount'): True,
-                             ('view', 'expenses', 'document_currency'): True,
-                             ('view', 'expenses', 'id'): True,
-                             ('view', 'expenses', 'type'): True,
-                             ('view', 'itinerary', 'airlines'): True,
-                             ('view', 'itinerary', 'arrival_date'): True,
-                             ('view', 'itinerary', 'departure_date'): True,
-                             ('view', 'itinerary', 'destination'): True,
-                             ('view', 'itinerary', 'dsa_region'): True,
-                             ('view', 'itinerary', 'id'): True,
-                             ('view', 'itinerary', 'mode_of_travel'): True,
-                             ('view', 'itinerary', 'origin'): True,
-                             ('view', 'itinerary', 'overnight_travel'): True,
-                             ('view', 'travel', 'action_points'): True,
-                             ('view', 'travel', 'activities'): True,
-                             ('view', 'travel', 'clearances'): True,
-                             ('view', 'travel', 'cost_assignments'): True,
-                             ('view', 'travel', 'cost_summary'): True,
-                             ('view', 'travel', 'currency'): True,
-                             ('view', 'travel', 'deductions'): True,
-                             ('view', 'travel', 'end_date'): True,
-                             ('view', 'travel', 'expenses'): True,
-                             ('view', 'travel', 'id'): True,
-                             ('view', 'travel', 'international_travel'): True,
-                             ('view', 'travel', 'itinerary'): True,
-                             ('view', 'travel', 'office'): True,
-                             ('view', 'travel', 'purpose'): True,
-                             ('view', 'travel', 'reference_number'): True,
-                             ('view', 'travel', 'report'): True,
-                             ('view', 'travel', 'section'): True,
-                             ('view', 'travel', 'start_date'): True,
-                             ('view', 'travel', 'status'): True,
-                             ('view', 'travel', 'supervisor'): True,
-                             ('view', 'travel', 'ta_required'): True,
-                             ('view', 'travel', 'traveler'): True},
-                            'rejected':
-                            {('edit', 'action_points', 'action_point_number'): True,
-                             ('edit', 'action_points', 'actions_taken'): True,
-                             ('edit', 'action_points', 'comments'): True,
-                             ('edit', 'action_points', 'completed_at'): True,
-                             ('edit', 'action_points', 'created_at'): True,
-                             ('edit', 'action_points', 'description'): True,
-                             ('edit', 'action_points', 'due_date'): True,
-                             ('edit', 'action_points', 'follow_up'): True,
-                             ('edit', 'action_points', 'id'): True,
-                             ('edit', 'action_points', 'person_responsible'): True,
-                             ('edit', 'action_points', 'status'): True,
-                             ('edit', 'action_points', 'trip_reference_number'): True,
-                             ('edit', 'activities', 'date'): True,
-                             ('edit', 'activities', 'id'): True,
-                             ('edit', 'activities', 'locations'): True,
-                             ('edit', 'activities', 'partner'): True,
-                             ('edit', 'activities', 'partnership'): True,
-                             ('edit', 'activities', 'primary_traveler'): True,
-                             ('edit', 'activities', 'result'): True,
-                             ('edit', 'activities', 'travel_type'): True,
-                             ('edit', 'clearances', 'id'): True,
-                             ('edit', 'clearances', 'medical_clearance'): True,
-                             ('edit', 'clearances', 'security_clearance'): True,
-                             ('edit', 'clearances', 'security_course'): True,
-                             ('edit', 'cost_assignments', 'business_area'): True,
-                             ('edit', 'cost_assignments', 'delegate'): True,
-                             ('edit', 'cost_assignments', 'fund'): True,
-                             ('edit', 'cost_assignments', 'grant'): True,
-                             ('edit', 'cost_assignments', 'id'): True,
-                             ('edit', 'cost_assignments', 'share'): True,
-                             ('edit', 'cost_assignments', 'wbs'): True,
-                             ('edit', 'deductions', 'accomodation'): True,
-                             ('edit', 'deductions', 'breakfast'): True,
-                             ('edit', 'deductions', 'date'): True,
-                             ('edit', 'deductions', 'day_of_the_week'): True,
-                             ('edit', 'deductions', 'dinner'): True,
-                             ('edit', 'deductions', 'id'): True,
-                             ('edit', 'deductions', 'lunch'): True,
-                             ('edit', 'deductions', 'no_dsa'): True,
-                             ('edit', 'expenses', 'account_currency'): False,
-                             ('edit', 'expenses', 'amount'): True,
-                             ('edit', 'expenses', 'document_currency'): False,
-                             ('edit', 'expenses', 'id'): True,
-                             ('edit', 'expenses', 'type'): True,
-                             ('edit', 'itinerary', 'airlines'): True,
-                             ('edit', 'itinerary', 'arrival_date'): True,
-                             ('edit', 'itinerary', 'departure_date'): True,
-                             ('edit', 'itinerary', 'destination'): True,
-                             ('edit', 'itinerary', 'dsa_region'): True,
-                             ('edit', 'itinerary', 'id'): True,
-                             ('edit', 'itinerary', 'mode_of_travel'): True,
-                             ('edit', 'itinerary', 'origin'): True,
-                             ('edit', 'itinerary', 'overnight_travel'): True,
-                             ('edit', 'travel', 'action_points'): True,
-                             ('edit', 'travel', 'activities'): True,
-                             ('edit', 'travel', 'clearances'): True,
-                             ('edit', 'travel', 'cost_assignments'): True,
-                             ('edit', 'travel', 'cost_summary'): True,
-                             ('edit', 'travel', 'currency'): False,
-                             ('edit', 'travel', 'deductions'): True,
-                             ('edit', 'travel', 'end_date'): True,
-                             ('edit', 'travel', 'expenses'): True,
-                             ('edit', 'travel', 'id'): True,
-                             ('edit', 'travel', 'international_travel'): True,
-                             ('edit', 'travel', 'itinerary'): True,
-                             ('edit', 'travel', 'office'): True,
-                             ('edit', 'travel', 'purpose'): True,
-                             ('edit', 'travel', 'reference_number'): True,
-                             ('edit', 'travel', 'report'): True,
-                             ('edit', 'travel', 'section'): True,
-                             ('edit', 'travel', 'start_date'): True,
-                             ('edit', 'travel', 'status'): True,
-                             ('edit', 'travel', 'supervisor'): True,
-                             ('edit', 'travel', 'ta_required'): True,
-                             ('edit', 'travel', 'traveler'): False,
-                             ('view', 'action_points', 'action_point_number'): True,
-                             ('view', 'action_points', 'actions_taken'): True,
-                             ('view', 'action_points', 'comments'): True,
-                             ('view', 'action_points', 'completed_at'): True,
-                             ('view', 'action_points', 'created_at'): True,
-                             ('view', 'action_points', 'description'): True,
-                             ('view', 'action_points', 'due_date'): True,
-                             ('view', 'action_points', 'follow_up'): True,
-                             ('view', 'action_points', 'id'): True,
-                             ('view', 'action_points', 'person_responsible'): True,
-                             ('view', 'action_points', 'status'): True,
-                             ('view', 'action_points', 'trip_reference_number'): True,
-                             ('view', 'activities', 'date'): True,
-                             ('view', 'activities', 'id'): True,
-                             ('view', 'activities', 'locations'): True,
-                             ('view', 'activities', 'partner'): True,
-                             ('view', 'activities', 'partnership'): True,
-                             ('view', 'activities', 'primary_traveler'): True,
-                             ('view', 'activities', 'result'): True,
-                             ('view', 'activities', 'travel_type'): True,
-                             ('view', 'clearances', 'id'): True,
-                             ('view', 'clearances', 'medical_clearance'): True,
-                             ('view', 'clearances', 'security_clearance'): True,
-                             ('view', 'clearances', 'security_course'): True,
-                             ('view', 'cost_assignments', 'business_area'): True,
-                             ('view', 'cost_assignments', 'delegate'): True,
-                             ('view', 'cost_assignments', 'fund'): True,
-                             ('view', 'cost_assignments', 'grant'): True,
-                             ('view', 'cost_assignments', 'id'): True,
-                             ('view', 'cost_assignments', 'share'): True,
-                             ('view', 'cost_assignments', 'wbs'): True,
-                             ('view', 'deductions', 'accomodation'): True,
-                             ('view', 'deductions', 'breakfast'): True,
-                             ('view', 'deductions', 'date'): True,
-                             ('view', 'deductions', 'day_of_the_week'): True,
-                             ('view', 'deductions', 'dinner'): True,
-                             ('view', 'deductions', 'id'): True,
-                             ('view', 'deductions', 'lunch'): True,
-                             ('view', 'deductions', 'no_dsa'): True,
-                             ('view', 'expenses', 'account_currency'): True,
-                             ('view', 'expenses', 'amount'): True,
-                             ('view', 'expenses', 'document_currency'): True,
-                             ('view', 'expenses', 'id'): True,
-                             ('view', 'expenses', 'type'): True,
-                             ('view', 'itinerary', 'airlines'): True,
-                             ('view', 'itinerary', 'arrival_date'): True,
-                             ('view', 'itinerary', 'departure_date'): True,
-                             ('view', 'itinerary', 'destination'): True,
-                             ('view', 'itinerary', 'dsa_region'): True,
-                             ('view', 'itinerary', 'id'): True,
-                             ('view', 'itinerary', 'mode_of_travel'): True,
-                             ('view', 'itinerary', 'origin'): True,
-                             ('view', 'itinerary', 'overnight_travel'): True,
-                             ('view', 'travel', 'action_points'): True,
-                             ('view', 'travel', 'activities'): True,
-                             ('view', 'travel', 'clearances'): True,
-                             ('view', 'travel', 'cost_assignments'): True,
-                             ('view', 'travel', 'cost_summary'): True,
-                             ('view', 'travel', 'currency'): True,
-                             ('view', 'travel', 'deductions'): True,
-                             ('view', 'travel', 'end_date'): True,
-                             ('view', 'travel', 'expenses'): True,
-                             ('view', 'travel', 'id'): True,
-                             ('view', 'travel', 'international_travel'): True,
-                             ('view', 'travel', 'itinerary'): True,
-                             ('view', 'travel', 'office'): True,
-                             ('view', 'travel', 'purpose'): True,
-                             ('view', 'travel', 'reference_number'): True,
-                             ('view', 'travel', 'report'): True,
-                             ('view', 'travel', 'section'): True,
-                             ('view', 'travel', 'start_date'): True,
-                             ('view', 'travel', 'status'): True,
-                             ('view', 'travel', 'supervisor'): True,
-                             ('view', 'travel', 'ta_required'): True,
-                             ('view', 'travel', 'traveler'): True},
-                            'submitted':
-                            {('edit', 'action_points', 'action_point_number'): True,
-                             ('edit', 'action_points', 'actions_taken'): True,
-                             ('edit', 'action_points', 'comments'): True,
-                             ('edit', 'action_points', 'completed_at'): True,
-                             ('edit', 'action_points', 'created_at'): True,
-                             ('edit', 'action_points', 'description'): True,
-                             ('edit', 'action_points', 'due_date'): True,
-                             ('edit', 'action_points', 'follow_up'): True,
-                             ('edit', 'action_points', 'id'): True,
-                             ('edit', 'action_points', 'person_responsible'): True,
-                             ('edit', 'action_points', 'status'): True,
-                             ('edit', 'action_points', 'trip_reference_number'): True,
-                             ('edit', 'activities', 'date'): True,
-                             ('edit', 'activities', 'id'): True,
-                             ('edit', 'activities', 'locations'): True,
-                             ('edit', 'activities', 'partner'): True,
-                             ('edit', 'activities', 'partnership'): True,
-                             ('edit', 'activities', 'primary_traveler'): True,
-                             ('edit', 'activities', 'result'): True,
-                             ('edit', 'activities', 'travel_type'): True,
-                             ('edit', 'clearances', 'id'): True,
-                             ('edit', 'clearances', 'medical_clearance'): True,
-                             ('edit', 'clearances', 'security_clearance'): True,
-                             ('edit', 'clearances', 'security_course'): True,
-                             ('edit', 'cost_assignments', 'business_area'): True,
-                             ('edit', 'cost_assignments', 'delegate'): True,
-                             ('edit', 'cost_assignments', 'fund'): True,
-                             ('edit', 'cost_assignments', 'grant'): True,
-                             ('edit', 'cost_assignments', 'id'): True,
-                             ('edit', 'cost_assignments', 'share'): True,
-                             ('edit', 'cost_assignments', 'wbs'): True,
-                             ('edit', 'deductions', 'accomodation'): True,
-                             ('edit', 'deductions', 'breakfast'): True,
-                             ('edit', 'deductions', 'date'): True,
-                             ('edit', 'deductions', 'day_of_the_week'): True,
-                             ('edit', 'deductions', 'dinner'): True,
-                             ('edit', 'deductions', 'id'): True,
-                             ('edit', 'deductions', 'lunch'): True,
-                             ('edit', 'deductions', 'no_dsa'): True,
-                             ('edit', 'expenses', 'account_currency'): True,
-                             ('edit', 'expenses', 'amount'): True,
-                             ('edit', 'expenses', 'document_currency'): False,
-                             ('edit', 'expenses', 'id'): True,
-                             ('edit', 'expenses', 'type'): True,
-                             ('edit', 'itinerary', 'airlines'): True,
-                             ('edit', 'itinerary', 'arrival_date'): True,
-                             ('edit', 'itinerary', 'departure_date'): True,
-                             ('edit', 'itinerary', 'destination'): True,
-                             ('edit', 'itinerary', 'dsa_region'): True,
-                             ('edit', 'itinerary', 'id'): True,
-                             ('edit', 'itinerary', 'mode_of_travel'): True,
-                             ('edit', 'itinerary', 'origin'): True,
-                             ('edit', 'itinerary', 'overnight_travel'): True,
-                             ('edit', 'travel', 'action_points'): True,
-                             ('edit', 'travel', 'activities'): True,
-                             ('edit', 'travel', 'clearances'): True,
-                             ('edit', 'travel', 'cost_assignments'): True,
-                             ('edit', 'travel', 'cost_summary'): True,
-                             ('edit', 'travel', 'currency'): False,
-                             ('edit', 'travel', 'deductions'): True,
-                             ('edit', 'travel', 'end_date'): True,
-                             ('edit', 'travel', 'expenses'): True,
-                             ('edit', 'travel', 'id'): True,
-                             ('edit', 'travel', 'international_travel'): True,
-                             ('edit', 'travel', 'itinerary'): True,
-                             ('edit', 'travel', 'office'): True,
-                             ('edit', 'travel', 'purpose'): True,
-                             ('edit', 'travel', 'reference_number'): True,
-                             ('edit', 'travel', 'report'): True,
-                             ('edit', 'travel', 'section'): True,
-                             ('edit', 'travel', 'start_date'): True,
-                             ('edit', 'travel', 'status'): True,
-                             ('edit', 'travel', 'supervisor'): True,
-                             ('edit', 'travel', 'ta_required'): True,
-                             ('edit', 'travel', 'traveler'): False,
-                             ('view', 'action_points', 'action_point_number'): True,
-                             ('view', 'action_points', 'actions_taken'): True,
-                             ('view', 'action_points', 'comments'): True,
-                             ('view', 'action_points', 'completed_at'): True,
-                             ('view', 'action_points', 'created_at'): True,
-                             ('view', 'action_points', 'description'): True,
-                             ('view', 'action_points', 'due_date'): True,
-                             ('view', 'action_points', 'follow_up'): True,
-                             ('view', 'action_points', 'id'): True,
-                             ('view', 'action_points', 'person_responsible'): True,
-                             ('view', 'action_points', 'status'): True,
-                             ('view', 'action_points', 'trip_reference_number'): True,
-                             ('view', 'activities', 'date'): True,
-                             ('view', 'activities', 'id'): True,
-                             ('view', 'activities', 'locations'): True,
-                             ('view', 'activities', 'partner'): True,
-                             ('view', 'activities', 'partnership'): True,
-                             ('view', 'activities', 'primary_traveler'): True,
-                             ('view', 'activities', 'result'): True,
-                             ('view', 'activities', 'travel_type'): True,
-                             ('view', 'clearances', 'id'): True,
-                             ('view', 'clearances', 'medical_clearance'): True,
-                             ('view', 'clearances', 'security_clearance'): True,
-                             ('view', 'clearances', 'security_course'): True,
-                             ('view', 'cost_assignments', 'business_area'): True,
-                             ('view', 'cost_assignments', 'delegate'): True,
-                             ('view', 'cost_assignments', 'fund'): True,
-                             ('view', 'cost_assignments', 'grant'): True,
-                             ('view', 'cost_assignments', 'id'): True,
-                             ('view', 'cost_assignments', 'share'): True,
-                             ('view', 'cost_assignments', 'wbs'): True,
-                             ('view', 'deductions', 'accomodation'): True,
-                             ('view', 'deductions', 'breakfast'): True,
-                             ('view', 'deductions', 'date'): True,
-                             ('view', 'deductions', 'day_of_the_week'): True,
-                             ('view', 'deductions', 'dinner'): True,
-                             ('view', 'deductions', 'id'): True,
-                             ('view', 'deductions', 'lunch'): True,
-                             ('view', 'deductions', 'no_dsa'): True,
-                             ('view', 'expenses', 'account_currency'): True,
-                             ('view', 'expenses', 'amount'): True,
-                             ('view', 'expenses', 'document_currency'): True,
-                             ('view', 'expenses', 'id'): True,
-                             ('view', 'expenses', 'type'): True,
-                             ('view', 'itinerary', 'airlines'): True,
-                             ('view', 'itinerary', 'arrival_date'): True,
-                             ('view', 'itinerary', 'departure_date'): True,
-                             ('view', 'itinerary', 'destination'): True,
-                             ('view', 'itinerary', 'dsa_region'): True,
-                             ('view', 'itinerary', 'id'): True,
-                             ('view', 'itinerary', 'mode_of_travel'): True,
-                             ('view', 'itinerary', 'origin'): True,
-                             ('view', 'itinerary', 'overnight_travel'): True,
-                             ('view', 'travel', 'action_points'): True,
-                             ('view', 'travel', 'activities'): True,
-                             ('view', 'travel', 'clearances'): True,
-                             ('view', 'travel', 'cost_assignments'): True,
-                             ('view', 'travel', 'cost_summary'): True,
-                             ('view', 'travel', 'currency'): True,
-                             ('view', 'travel', 'deductions'): True,
-                             ('view', 'travel', 'end_date'): True,
-                             ('view', 'travel', 'expenses'): True,
-                             ('view', 'travel', 'id'): True,
-                             ('view', 'travel', 'international_travel'): True,
-                             ('view', 'travel', 'itinerary'): True,
-                             ('view', 'travel', 'office'): True,
-                             ('view', 'travel', 'purpose'): True,
-                             ('view', 'travel', 'reference_number'): True,
-                             ('view', 'travel', 'report'): True,
-                             ('view', 'travel', 'section'): True,
-                             ('view', 'travel', 'start_date'): True,
-                             ('view', 'travel', 'status'): True,
-                             ('view', 'travel', 'supervisor'): True,
-                             ('view', 'travel', 'ta_required'): True,
-                             ('view', 'travel', 'traveler'): True}}}
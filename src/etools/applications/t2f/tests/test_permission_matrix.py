@@ -7,7 +7,13 @@ from unicef_locations.tests.factories import LocationFactory
 
 from etools.applications.core.tests.cases import BaseTenantTestCase
 from etools.applications.publics.tests.factories import PublicsCurrencyFactory, PublicsDSARegionFactory
-from etools.applications.t2f.helpers.permission_matrix import FakePermissionMatrix, get_user_role_list, UserTypes
+from etools.applications.t2f.helpers.permission_matrix import (
+    FakePermissionMatrix,
+    get_travel_permissions,
+    get_user_role_list,
+    PermissionMatrix,
+    UserTypes,
+)
 from etools.applications.t2f.models import ModeOfTravel, Travel, TravelType
 from etools.applications.t2f.tests.factories import TravelFactory
 from etools.applications.users.tests.factories import UserFactory
@@ -96,6 +102,35 @@ class TestPermissionMatrix(BaseTenantTestCase):
                                  UserTypes.TRAVEL_ADMINISTRATOR,
                                  UserTypes.REPRESENTATIVE])
 
+    def test_user_type_lookup_queries(self):
+        travel = TravelFactory(traveler=self.traveler, supervisor=self.unicef_staff)
+        tfp = UserFactory(groups__data=['UNICEF User', 'Travel Focal Point'])
+
+        # group membership is loaded once for the user
+        with self.assertNumQueries(1):
+            self.assertEqual(get_user_role_list(tfp, travel), [UserTypes.ANYONE, UserTypes.TRAVEL_FOCAL_POINT])
+            self.assertEqual(get_user_role_list(tfp, travel), [UserTypes.ANYONE, UserTypes.TRAVEL_FOCAL_POINT])
+
+        tfp.groups.add(Group.objects.create(name='Travel Administrator'))
+        self.assertIn(UserTypes.TRAVEL_ADMINISTRATOR, get_user_role_list(tfp, travel))
+
+    def test_travel_permissions(self):
+        travel_permissions = get_travel_permissions()
+        self.assertEqual(len(travel_permissions), 48)
+        self.assertFalse(travel_permissions[(UserTypes.ANYONE, Travel.PLANNED)][('edit', 'travel', 'purpose')])
+        self.assertTrue(travel_permissions[(UserTypes.TRAVELER, Travel.PLANNED)][('edit', 'travel', 'purpose')])
+
+    def test_permission_dict(self):
+        travel = TravelFactory(traveler=self.traveler, supervisor=self.unicef_staff)
+
+        matrix = PermissionMatrix(travel, self.traveler)
+        self.assertTrue(matrix.has_permission(PermissionMatrix.EDIT, 'travel', 'purpose'))
+        self.assertTrue(matrix.has_permission(PermissionMatrix.EDIT, 'travel', 'unknown'))
+
+        matrix = PermissionMatrix(travel, UserFactory())
+        self.assertFalse(matrix.has_permission(PermissionMatrix.EDIT, 'travel', 'purpose'))
+        self.assertTrue(matrix.has_permission(PermissionMatrix.VIEW, 'travel', 'purpose'))
+
     def test_travel_creation(self):
         dsa_region = PublicsDSARegionFactory()
         currency = PublicsCurrencyFactory()
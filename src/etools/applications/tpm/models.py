@@ -17,6 +17,7 @@ from etools.applications.action_points.models import ActionPoint
 from etools.applications.activities.models import Activity
 from etools.applications.core.urlresolvers import build_frontend_url
 from etools.applications.environment.notifications import send_notification_with_template
+from etools.applications.hact.tracker import mark_partners_dirty
 from etools.applications.tpm.tpmpartners.models import TPMPartner, TPMPartnerStaffMember
 from etools.applications.tpm.transitions.conditions import (
     TPMVisitAssignRequiredFieldsCheck,
@@ -330,6 +331,7 @@ class TPMVisit(SoftDeleteMixin, TimeStampedModel, models.Model):
         mark_as_programmatic_visit = mark_as_programmatic_visit or []
 
         self.tpm_activities.filter(id__in=mark_as_programmatic_visit).update(is_pv=True)
+        mark_partners_dirty(self.tpm_activities.values_list('partner_id', flat=True))
 
         self.date_of_unicef_approved = timezone.now()
         if notify_focal_point:
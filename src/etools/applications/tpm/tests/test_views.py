@@ -19,6 +19,8 @@ from etools.applications.core.tests.cases import BaseTenantTestCase
 from etools.applications.partners.models import PartnerType
 from etools.applications.partners.tests.factories import InterventionAttachmentFactory
 from etools.applications.reports.tests.factories import OfficeFactory, SectionFactory
+from etools.applications.tpm.export.renderers import TPMVisitCSVRenderer
+from etools.applications.tpm.export.serializers import TPMVisitExportSerializer
 from etools.applications.tpm.models import ThirdPartyMonitor, TPMVisit
 from etools.applications.tpm.tests.base import TPMTestCaseMixin
 from etools.applications.tpm.tests.factories import (
@@ -321,7 +323,14 @@ class TestTPMVisitViewSet(TestExportMixin, TPMTestCaseMixin, BaseTenantTestCase)
         self._test_partner()
 
     def test_visits_csv(self):
-        self._test_export(self.pme_user, 'tpm:visits-visits-export')
+        TPMVisitFactory(tpm_activities__count=2)
+        TPMVisitFactory(status='unicef_approved', tpm_activities__count=1)
+
+        response = self._test_export(self.pme_user, 'tpm:visits-visits-export')
+        # as the serialized list was rendered before the export was streamed
+        self.assertCSVExport(response.export_content, TPMVisitCSVRenderer().render(
+            TPMVisitExportSerializer(TPMVisit.objects.order_by('id'), many=True).data,
+        ))
 
     def test_activities_csv(self):
         self._test_export(self.pme_user, 'tpm:visits-activities-export')
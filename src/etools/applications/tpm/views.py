@@ -21,6 +21,7 @@ from etools.applications.action_points.conditions import (
     ActionPointAssigneeCondition,
     ActionPointAuthorCondition,
 )
+from etools.applications.core.mixins import StreamingExportMixin
 from etools.applications.partners.models import PartnerOrganization
 from etools.applications.partners.serializers.partner_organization_v2 import MinimalPartnerOrganizationListSerializer
 from etools.applications.permissions2.conditions import ObjectStatusCondition
@@ -85,6 +86,7 @@ class BaseTPMViewSet(
     SafeTenantViewSetMixin,
     MultiSerializerViewSetMixin,
     PermittedSerializerMixin,
+    StreamingExportMixin,
 ):
     metadata_class = BaseMetadata
     pagination_class = DynamicPageNumberPagination
@@ -125,12 +127,12 @@ class TPMPartnerViewSet(
         if getattr(self, 'action', None) == 'list':
             queryset = queryset.country_partners()
 
-        user_groups = self.request.user.groups.all()
+        user_groups = self.request.user.group_names
 
-        if UNICEFUser.as_group() in user_groups or PME.as_group() in user_groups:
+        if UNICEFUser.name in user_groups or PME.name in user_groups:
             # no need to filter queryset
             pass
-        elif ThirdPartyMonitor.as_group() in user_groups:
+        elif ThirdPartyMonitor.name in user_groups:
             queryset = queryset.filter(staff_members__user=self.request.user)
         else:
             queryset = queryset.none()
@@ -140,7 +142,7 @@ class TPMPartnerViewSet(
     def get_permission_context(self):
         context = super().get_permission_context()
 
-        if ThirdPartyMonitor.as_group() in self.request.user.groups.all() and \
+        if ThirdPartyMonitor.name in self.request.user.group_names and \
            hasattr(self.request.user, 'tpmpartners_tpmpartnerstaffmember'):
             context += [
                 TPMStaffMemberCondition(
@@ -191,8 +193,7 @@ class TPMPartnerViewSet(
         tpm_partners = self.filter_queryset(
             TPMPartner.objects.filter(countries__id__contains=request.user.profile.country.id).order_by('vendor_number')
         )
-        serializer = TPMPartnerExportSerializer(tpm_partners, many=True)
-        return Response(serializer.data, headers={
+        return self.stream_export(tpm_partners, TPMPartnerExportSerializer(), headers={
             'Content-Disposition': 'attachment;filename=tpm_vendors_{}.csv'.format(timezone.now().date())
         })
 
@@ -230,8 +231,7 @@ class TPMStaffMembersViewSet(
     def export(self, request, *args, **kwargs):
         partner = self.get_parent_object()
         queryset = self.filter_queryset(self.get_queryset())
-        serializer = TPMPartnerContactsSerializer(queryset, many=True)
-        return Response(serializer.data, headers={
+        return self.stream_export(queryset, TPMPartnerContactsSerializer(), headers={
             'Content-Disposition': 'attachment;filename=tpm_#{}_contacts_{}.csv'.format(
                 partner.vendor_number, timezone.now().date()
             ),
@@ -329,12 +329,12 @@ class TPMVisitViewSet(
     def get_queryset(self):
         queryset = super().get_queryset().distinct()
 
-        user_groups = self.request.user.groups.all()
+        user_groups = self.request.user.group_names
 
-        if UNICEFUser.as_group() in user_groups or PME.as_group() in user_groups:
+        if UNICEFUser.name in user_groups or PME.name in user_groups:
             # no need to filter queryset
             pass
-        elif ThirdPartyMonitor.as_group() in user_groups and \
+        elif ThirdPartyMonitor.name in user_groups and \
                 hasattr(self.request.user, 'tpmpartners_tpmpartnerstaffmember'):
             queryset = queryset.filter(
                 tpm_partner=self.request.user.tpmpartners_tpmpartnerstaffmember.tpm_partner
@@ -376,15 +376,14 @@ class TPMVisitViewSet(
             'tpm_activities__intervention', 'tpm_activities__locations', 'tpm_activities__unicef_focal_points',
             'tpm_partner_focal_points'
         ).order_by('id'))
-        serializer = TPMVisitExportSerializer(tpm_visits, many=True)
-        return Response(serializer.data, headers={
+        return self.stream_export(tpm_visits, TPMVisitExportSerializer(), headers={
             'Content-Disposition': 'attachment;filename=tpm_visits_{}.csv'.format(timezone.now().date())
         })
 
     def get_permission_context(self):
         context = super().get_permission_context()
 
-        if ThirdPartyMonitor.as_group() in self.request.user.groups.all() and \
+        if ThirdPartyMonitor.name in self.request.user.group_names and \
            hasattr(self.request.user, 'tpmpartners_tpmpartnerstaffmember'):
             context += [
                 TPMStaffMemberCondition(
@@ -412,8 +411,7 @@ class TPMVisitViewSet(
         ).prefetch_related(
             'tpm_visit', 'section', 'locations', 'cp_output'
         ).order_by('tpm_visit', 'id')
-        serializer = TPMActivityExportSerializer(tpm_activities, many=True)
-        return Response(serializer.data, headers={
+        return self.stream_export(tpm_activities, TPMActivityExportSerializer(), headers={
             'Content-Disposition': 'attachment;filename=tpm_tasks_{}.csv'.format(timezone.now().date())
         })
 
@@ -425,8 +423,7 @@ class TPMVisitViewSet(
             'activity', 'location', 'activity__tpmactivity__tpm_visit', 'activity__tpmactivity__section',
             'activity__cp_output'
         ).order_by('activity__tpmactivity__tpm_visit', 'activity', 'id')
-        serializer = TPMLocationExportSerializer(tpm_locations, many=True)
-        return Response(serializer.data, headers={
+        return self.stream_export(tpm_locations, TPMLocationExportSerializer(), headers={
             'Content-Disposition': 'attachment;filename=tpm_locations_{}.csv'.format(timezone.now().date())
         })
 
@@ -434,8 +431,7 @@ class TPMVisitViewSet(
     def action_points_export(self, request, *args, **kwargs):
         action_points = TPMActionPoint.objects.filter(tpm_activity__tpm_visit__in=self.get_queryset()).order_by('id')
 
-        serializer = TPMActionPointFullExportSerializer(action_points, many=True)
-        return Response(serializer.data, headers={
+        return self.stream_export(action_points, TPMActionPointFullExportSerializer(), headers={
             'Content-Disposition': 'attachment;filename=tpm_action_points_{}.csv'.format(timezone.now().date())
         })
 
@@ -490,8 +486,8 @@ class TPMActionPointViewSet(BaseTPMViewSet,
 
     @action(detail=False, methods=['get'], url_path='export', renderer_classes=(TPMActionPointCSVRenderer,))
     def csv_export(self, request, *args, **kwargs):
-        serializer = TPMActionPointExportSerializer(self.filter_queryset(self.get_queryset()), many=True)
-        return Response(serializer.data, headers={
+        action_points = self.filter_queryset(self.get_queryset())
+        return self.stream_export(action_points, TPMActionPointExportSerializer(), headers={
             'Content-Disposition': 'attachment;filename={}_action_points_{}.csv'.format(
                 self.get_root_object().reference_number, timezone.now().date()
             )
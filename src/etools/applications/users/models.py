@@ -8,7 +8,7 @@ from django.core.exceptions import ValidationError
 from django.core.mail import send_mail
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import connection, models
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
@@ -16,6 +16,8 @@ from django_tenants.models import TenantMixin
 from django_tenants.utils import get_public_schema_name, tenant_context
 from model_utils.models import TimeStampedModel
 
+from etools.libraries.tenant_support.utils import clear_country_cache, clear_user_country_cache
+
 if TYPE_CHECKING:
     from etools.applications.partners.models import PartnerStaffMember
 
@@ -79,6 +81,29 @@ class User(TimeStampedModel, AbstractBaseUser, PermissionsMixin):
     def full_name(self):
         return self.get_full_name()
 
+    @cached_property
+    def group_map(self):
+        """Names of the groups of the user by id, loaded with a single query once per instance, so once per request"""
+        return dict(self.groups.values_list('pk', 'name'))
+
+    @cached_property
+    def group_names(self):
+        return set(self.group_map.values())
+
+    @cached_property
+    def group_ids(self):
+        return set(self.group_map.keys())
+
+    def clear_group_names(self):
+        for name in ['group_map', 'group_names', 'group_ids']:
+            self.__dict__.pop(name, None)
+
+    @staticmethod
+    def groups_changed(sender, instance, action, reverse, **kwargs):
+        # user.groups.add() and the like, the users of group.user_set.add() aren't at hand
+        if action.startswith('post_') and not reverse:
+            instance.clear_group_names()
+
     @cached_property
     def partner(self):
         staff_member = self.get_partner_staff_member()
@@ -105,6 +130,9 @@ class User(TimeStampedModel, AbstractBaseUser, PermissionsMixin):
         super().save(*args, **kwargs)
 
 
+m2m_changed.connect(User.groups_changed, sender=User.groups.through)
+
+
 def custom_dashboards_default():
     return dict(bi_url='')
 
@@ -204,6 +232,7 @@ class WorkspaceCounter(models.Model):
 
 
 post_save.connect(WorkspaceCounter.create_counter_model, sender=Country)
+post_save.connect(clear_country_cache, sender=Country)
 
 
 class CountryOfficeManager(models.Manager):
@@ -343,7 +372,7 @@ class UserProfile(models.Model):
             except Group.DoesNotExist:
                 logger.exception('Cannot find main group UNICEF User')
             else:
-                g.user_set.add(sender)
+                sender.groups.add(g)
 
             sender.is_staff = True
             sender.save()
@@ -383,3 +412,5 @@ class UserProfile(models.Model):
 
 
 post_save.connect(UserProfile.create_user_profile, sender=settings.AUTH_USER_MODEL)
+post_save.connect(clear_user_country_cache, sender=UserProfile)
+post_delete.connect(clear_user_country_cache, sender=UserProfile)
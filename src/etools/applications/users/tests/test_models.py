@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
 from django.core.exceptions import ValidationError
 from django.test import SimpleTestCase
 
@@ -123,6 +124,18 @@ class TestUserModel(BaseTenantTestCase):
         user.email = "NotNormal@example.com"
         self.assertRaises(ValidationError, user.save)
 
+    def test_group_names(self):
+        user = UserFactory(groups__data=['UNICEF User', 'PME'])
+        group_ids = set(Group.objects.filter(name__in=['UNICEF User', 'PME']).values_list('pk', flat=True))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(user.group_names, {'UNICEF User', 'PME'})
+            self.assertEqual(user.group_names, {'UNICEF User', 'PME'})
+            self.assertEqual(user.group_ids, group_ids)
+
+        user.groups.remove(Group.objects.get(name='PME'))
+        self.assertEqual(user.group_names, {'UNICEF User'})
+
 
 class TestStrUnicode(SimpleTestCase):
     """Ensure calling str() on model instances returns the right text."""
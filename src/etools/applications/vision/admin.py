@@ -1,4 +1,8 @@
+import json
+
 from django.contrib import admin
+from django.utils.html import format_html
+from django.utils.translation import gettext_lazy as _
 
 from unicef_vision.admin import VisionLoggerAdmin
 
@@ -11,5 +15,18 @@ class VisionSyncLogAdmin(VisionLoggerAdmin):
     change_form_template = 'admin/vision/vision_log/change_form.html'
 
     list_filter = VisionLoggerAdmin.list_filter + ('country',)
-    list_display = VisionLoggerAdmin.list_display + ('country',)
-    readonly_fields = VisionLoggerAdmin.readonly_fields + ('country',)
+    list_display = VisionLoggerAdmin.list_display + ('total_changed', 'sync_seconds', 'sync_queries', 'country',)
+    readonly_fields = VisionLoggerAdmin.readonly_fields + ('total_changed', 'country', 'sync_metrics')
+    exclude = ('metrics', )
+
+    def sync_seconds(self, obj):
+        return obj.metrics.get('seconds')
+    sync_seconds.short_description = _('Seconds')
+
+    def sync_queries(self, obj):
+        return obj.metrics.get('queries')
+    sync_queries.short_description = _('Queries')
+
+    def sync_metrics(self, obj):
+        return format_html('<pre>{}</pre>', json.dumps(obj.metrics, indent=2, sort_keys=True))
+    sync_metrics.short_description = _('Metrics')
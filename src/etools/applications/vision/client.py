@@ -0,0 +1,124 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+
+import requests
+from requests.adapters import HTTPAdapter
+from unicef_vision.exceptions import VisionException
+from unicef_vision.utils import base_headers
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class InsightClient:
+    """
+    Client shared by everything talking to Insight in a process.
+    Connections are pooled and kept alive between requests, responses are gzipped, failed requests are retried
+    with an exponential backoff, and latency and payload size of the requests are recorded per endpoint.
+    """
+
+    def __init__(self, retries=None, backoff_factor=None, pool_size=None):
+        self.session = requests.Session()
+        self.session.headers.update(base_headers)
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate'
+
+        retry = Retry(
+            total=settings.INSIGHT_REQUESTS_RETRIES if retries is None else retries,
+            backoff_factor=settings.INSIGHT_REQUESTS_BACKOFF if backoff_factor is None else backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=('GET', ),
+            raise_on_status=False,
+        )
+        pool_size = pool_size or settings.INSIGHT_REQUESTS_POOL_SIZE
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self.stats = defaultdict(lambda: {'requests': 0, 'errors': 0, 'seconds': 0.0, 'bytes': 0})
+        self.lock = threading.Lock()
+
+    def get_timeout(self, endpoint):
+        return float(settings.INSIGHT_ENDPOINT_TIMEOUTS.get(endpoint, settings.INSIGHT_REQUESTS_TIMEOUT))
+
+    def record(self, endpoint, seconds, size, error=False):
+        with self.lock:
+            stats = self.stats[endpoint]
+            stats['requests'] += 1
+            stats['errors'] += int(error)
+            stats['seconds'] += seconds
+            stats['bytes'] += size
+        logger.info('Insight {}: {:.3f}s, {} bytes{}'.format(endpoint, seconds, size, ', failed' if error else ''))
+
+    def get(self, url, endpoint, headers=None, check_status=True):
+        """Return the response for url, raise VisionException if the request fails"""
+        start = time.monotonic()
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.get_timeout(endpoint))
+        except requests.RequestException as e:
+            self.record(endpoint, time.monotonic() - start, 0, error=True)
+            raise VisionException('Load data failed! {}'.format(e))
+
+        self.record(endpoint, time.monotonic() - start, len(response.content), error=response.status_code != 200)
+        if check_status and response.status_code != 200:
+            raise VisionException('Load data failed! Http code: {}'.format(response.status_code))
+        return response
+
+    def stream(self, url, endpoint, chunk_size, headers=None):
+        """Yield the content of url in chunks, as it is downloaded"""
+        start = time.monotonic()
+        size = 0
+        error = True
+        try:
+            with self.session.get(url, headers=headers, timeout=self.get_timeout(endpoint), stream=True) as response:
+                if response.status_code != 200:
+                    raise VisionException('Load data failed! Http code: {}'.format(response.status_code))
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    size += len(chunk)
+                    yield chunk
+            error = False
+        except requests.RequestException as e:
+            raise VisionException('Load data failed! {}'.format(e))
+        finally:
+            self.record(endpoint, time.monotonic() - start, size, error=error)
+
+    def reset_stats(self):
+        with self.lock:
+            self.stats.clear()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_insight_client():
+    """Return the client of the process, created on first use so that each forked worker has its own pool"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = InsightClient()
+    return _client
+
+
+def get_data_from_insight(endpoint, data=None):
+    """Same as unicef_vision.utils.get_data_from_insight, through the shared client"""
+    separator = '' if settings.INSIGHT_URL.endswith('/') else '/'
+    url = '{}{}{}'.format(settings.INSIGHT_URL, separator, endpoint).format(**(data or {}))
+
+    try:
+        response = get_insight_client().get(url, endpoint.split('/')[0], check_status=False)
+    except VisionException as e:
+        return False, 'Loading data from Vision Failed, {}'.format(e)
+    if response.status_code != 200:
+        return False, 'Loading data from Vision Failed, status {}'.format(response.status_code)
+    try:
+        result = response.json()
+    except ValueError:
+        return False, 'Loading data from Vision Failed, no valid response returned for data: {}'.format(data)
+    return True, result
@@ -0,0 +1,150 @@
+import codecs
+import json
+from functools import partial
+
+from unicef_vision.exceptions import VisionException
+from unicef_vision.loaders import FileDataLoader, INSIGHT_NO_DATA_MESSAGE, VisionDataLoader as BaseVisionDataLoader
+
+from etools.applications.vision.client import get_insight_client
+
+CHUNK_SIZE = 64 * 1024
+
+# Insight wraps the rows in {"ROWSET": {"ROW": [...]}}
+ENVELOPE_KEYS = ('ROWSET', 'ROW')
+
+WHITESPACE = ' \t\n\r'
+
+
+class JSONStream:
+    """Cursor over a JSON document delivered as an iterable of bytes (or str) chunks"""
+
+    decoder = json.JSONDecoder()
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.utf8 = codecs.getincrementaldecoder('utf-8')()
+        self.text = ''
+        self.pos = 0
+
+    def fill(self):
+        """Read the next chunk, dropping the part of the buffer already consumed"""
+        try:
+            chunk = next(self.chunks)
+        except StopIteration:
+            return False
+        if isinstance(chunk, bytes):
+            chunk = self.utf8.decode(chunk)
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non whitespace character without consuming it, None at the end of the document"""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return None
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise VisionException('Invalid JSON: expected {!r}, found {!r}'.format(char, found))
+        self.pos += 1
+
+    def delimited(self, end):
+        return end < len(self.text) and self.text[end] in WHITESPACE + ',]}'
+
+    def decode(self):
+        """Decode the next complete JSON value, reading more chunks until it is available"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # a number is only complete once its delimiter has been read, it may continue in the next chunk
+            if not isinstance(value, (dict, list, str)) and not self.delimited(end) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def iter_array(self):
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.decode()
+            if self.peek() != ',':
+                break
+            self.pos += 1
+        self.expect(']')
+
+
+def iter_json_records(chunks):
+    """
+    Yield the records of an Insight JSON payload one at a time, without loading the whole payload in memory.
+    Handles a plain list of records, the ROWSET/ROW envelope (with a list or a single row) and a single record.
+    Anything else, like the 'No Data Available' message, yields nothing.
+    """
+    yield from _iter_records(JSONStream(chunks))
+
+
+def _iter_records(stream):
+    char = stream.peek()
+    if char == '[':
+        yield from stream.iter_array()
+    elif char == '{':
+        stream.expect('{')
+        if stream.peek() == '}':
+            return
+        key = stream.decode()
+        stream.expect(':')
+        if key in ENVELOPE_KEYS:
+            yield from _iter_records(stream)
+            return
+        # not an envelope, so this is a single record: decode the rest of it
+        record = {key: stream.decode()}
+        while stream.peek() == ',':
+            stream.pos += 1
+            key = stream.decode()
+            stream.expect(':')
+            record[key] = stream.decode()
+        stream.expect('}')
+        yield record
+
+
+class VisionDataLoader(BaseVisionDataLoader):
+    """Loader going through the shared Insight client, which pools connections and retries failed requests"""
+
+    def __init__(self, endpoint, detail=None, **kwargs):
+        self.endpoint = endpoint
+        super().__init__(endpoint, detail, **kwargs)
+
+    def get(self):
+        json_response = get_insight_client().get(self.url, self.endpoint, headers=self.headers).json()
+        if json_response == INSIGHT_NO_DATA_MESSAGE:
+            return []
+        return json_response
+
+
+class VisionDataStreamLoader(VisionDataLoader):
+    """Loader that parses the Insight response incrementally while it is downloaded"""
+
+    def stream(self):
+        yield from iter_json_records(
+            get_insight_client().stream(self.url, self.endpoint, CHUNK_SIZE, headers=self.headers)
+        )
+
+
+class FileDataStreamLoader(FileDataLoader):
+    """Loader that parses a json file incrementally instead of json.load-ing it"""
+
+    def stream(self):
+        with open(self.filename, 'rb') as f:
+            yield from iter_json_records(iter(partial(f.read, CHUNK_SIZE), b''))
@@ -0,0 +1,117 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from django.db import connection
+
+from etools.applications.vision.client import get_insight_client
+
+WRITE_STATEMENTS = ('INSERT', 'UPDATE', 'DELETE')
+
+# synchronizer methods timed as a phase of the sync, the time of nested phases is not counted twice
+PHASE_METHODS = (
+    ('convert', '_convert_records'),
+    ('convert', '_convert_batch'),
+    ('filter', '_filter_records'),
+    ('hash', '_changed_records'),
+    ('hash', '_store_record_hashes'),
+    ('save', '_save_records'),
+    ('save', '_save_batches'),
+)
+
+
+class SyncMetrics:
+    """
+    Performance figures of a synchronizer run, stored in VisionSyncLog.metrics:
+    wall time per phase, rows read and written, database queries, Insight requests and peak memory allocated
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.stack = []
+        self.queries = 0
+        self.rows_written = 0
+        self.seconds = 0
+        self.insight = {}
+        self.peak_allocated_kb = 0
+
+    @contextmanager
+    def phase(self, name):
+        """Time a phase, excluding the time spent in phases started within it"""
+        self.stack.append(0)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - start
+            nested = self.stack.pop()
+            self.phases[name] = self.phases.get(name, 0) + elapsed - nested
+            if self.stack:
+                self.stack[-1] += elapsed
+
+    def timed(self, name, func):
+        def wrapper(*args, **kwargs):
+            with self.phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    def timed_iter(self, name, iterable):
+        """Yield from iterable, timing the time spent producing the items"""
+        iterator = iter(iterable)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        self.queries += 1
+        result = execute(sql, params, many, context)
+        if sql.lstrip()[:6].upper() in WRITE_STATEMENTS:
+            self.rows_written += max(context['cursor'].rowcount, 0)
+        return result
+
+    @contextmanager
+    def collect(self, synchronizer):
+        """Collect the metrics of synchronizer while the block runs"""
+        for name, method in PHASE_METHODS:
+            if hasattr(synchronizer, method):
+                setattr(synchronizer, method, self.timed(name, getattr(synchronizer, method)))
+        endpoint = getattr(synchronizer, 'ENDPOINT', None)
+        client = get_insight_client()
+        insight_before = dict(client.stats.get(endpoint, {}))
+
+        # the allocations of the run only, the memory of a long lived worker is not relevant
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
+        allocated_before = tracemalloc.get_traced_memory()[0]
+
+        start = time.monotonic()
+        try:
+            with connection.execute_wrapper(self.execute_wrapper):
+                yield self
+        finally:
+            self.seconds = time.monotonic() - start
+            for _, method in PHASE_METHODS:
+                synchronizer.__dict__.pop(method, None)
+            insight_after = client.stats.get(endpoint, {})
+            self.insight = {key: round(value - insight_before.get(key, 0), 3) for key, value in insight_after.items()}
+            self.peak_allocated_kb = max(tracemalloc.get_traced_memory()[1] - allocated_before, 0) // 1024
+            if not tracing:
+                tracemalloc.stop()
+
+    def as_dict(self, rows_read=0):
+        return {
+            'seconds': round(self.seconds, 3),
+            'phases': {name: round(seconds, 3) for name, seconds in self.phases.items()},
+            'rows_read': rows_read,
+            'rows_written': self.rows_written,
+            'queries': self.queries,
+            'insight': self.insight,
+            'peak_allocated_kb': self.peak_allocated_kb,
+        }
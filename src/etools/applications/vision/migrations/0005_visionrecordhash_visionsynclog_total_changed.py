@@ -0,0 +1,32 @@
+# Generated by Django 3.2.6 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vision', '0004_visionsynclog_business_area_code'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VisionRecordHash',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('handler_name', models.CharField(max_length=50, verbose_name='Handler Name')),
+                ('business_area_code', models.CharField(blank=True, default='', max_length=10, verbose_name='Business Area Code')),
+                ('key', models.CharField(max_length=255, verbose_name='Record Key')),
+                ('hash', models.CharField(max_length=32, verbose_name='Hash')),
+                ('modified', models.DateTimeField(auto_now=True, verbose_name='Modified')),
+            ],
+            options={
+                'unique_together': {('handler_name', 'business_area_code', 'key')},
+            },
+        ),
+        migrations.AddField(
+            model_name='visionsynclog',
+            name='total_changed',
+            field=models.IntegerField(default=0, verbose_name='Total Changed'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.6 on 2026-10-18 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vision', '0005_visionrecordhash_visionsynclog_total_changed'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='visionsynclog',
+            name='metrics',
+            field=models.JSONField(blank=True, default=dict, verbose_name='Metrics'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.6 on 2026-10-18 16:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vision', '0006_visionsynclog_metrics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='visionsynclog',
+            name='run_id',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=32, verbose_name='Run ID'),
+        ),
+    ]
@@ -8,6 +8,30 @@ from etools.applications.users.models import Country
 
 class VisionSyncLog(AbstractVisionLog):
     country = models.ForeignKey(Country, verbose_name=_('Country'), on_delete=models.CASCADE)
+    total_changed = models.IntegerField(default=0, verbose_name=_('Total Changed'))
+    # timing and volumes of the run, see vision.metrics.SyncMetrics
+    metrics = models.JSONField(blank=True, default=dict, verbose_name=_('Metrics'))
+    # sync run the log belongs to, see vision.tasks.run_sync_plan
+    run_id = models.CharField(max_length=32, blank=True, default='', db_index=True, verbose_name=_('Run ID'))
 
     def __str__(self):
         return '{0.country} {0.date_processed}:{0.successful} {0.total_processed}'.format(self)
+
+
+class VisionRecordHash(models.Model):
+    """
+    Content hash of the last synced version of a Vision record,
+    used by the synchronizers to skip records that did not change since the previous run
+    """
+
+    handler_name = models.CharField(max_length=50, verbose_name=_('Handler Name'))
+    business_area_code = models.CharField(max_length=10, verbose_name=_('Business Area Code'), blank=True, default='')
+    key = models.CharField(max_length=255, verbose_name=_('Record Key'))
+    hash = models.CharField(max_length=32, verbose_name=_('Hash'))
+    modified = models.DateTimeField(auto_now=True, verbose_name=_('Modified'))
+
+    class Meta:
+        unique_together = ('handler_name', 'business_area_code', 'key')
+
+    def __str__(self):
+        return '{0.handler_name} {0.business_area_code} {0.key}'.format(self)
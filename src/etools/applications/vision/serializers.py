@@ -0,0 +1,22 @@
+from rest_framework import serializers
+
+from etools.applications.vision.models import VisionSyncLog
+
+
+class VisionSyncLogMetricsSerializer(serializers.ModelSerializer):
+    country = serializers.CharField(source='country.name', read_only=True)
+
+    class Meta:
+        model = VisionSyncLog
+        fields = (
+            'id',
+            'country',
+            'business_area_code',
+            'handler_name',
+            'date_processed',
+            'successful',
+            'total_records',
+            'total_processed',
+            'total_changed',
+            'metrics',
+        )
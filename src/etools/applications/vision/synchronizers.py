@@ -1,19 +1,43 @@
+import hashlib
+import json
 import logging
+import sys
+from itertools import islice
 
-from django.db import connection
+from django.db import connection, transaction
+from django.utils.encoding import force_str
 
 from django_tenants.utils import get_public_schema_name, get_tenant_model
-from unicef_vision.synchronizers import VisionDataSynchronizer
+from unicef_vision.exceptions import VisionException
+from unicef_vision.synchronizers import FileDataSynchronizer as BaseFileDataSynchronizer, VisionDataSynchronizer
+from unicef_vision.utils import get_vision_logger_domain_model
 
-from etools.applications.vision.models import VisionSyncLog
+from etools.applications.vision.loaders import FileDataStreamLoader, VisionDataLoader, VisionDataStreamLoader
+from etools.applications.vision.metrics import SyncMetrics
+from etools.applications.vision.models import VisionRecordHash, VisionSyncLog
 
 logger = logging.getLogger(__name__)
 
 
 class VisionDataTenantSynchronizer(VisionDataSynchronizer):
     LOGGER_CLASS = VisionSyncLog
+    LOADER_CLASS = VisionDataLoader
+
+    # streaming mode: records are parsed incrementally and saved in batches of STREAM_BATCH_SIZE,
+    # so the whole payload is never held in memory
+    STREAMING = False
+    STREAM_LOADER_CLASS = VisionDataStreamLoader
+    STREAM_BATCH_SIZE = 1000
+
+    # record key used to skip the records whose content did not change since the last sync, None disables it
+    HASH_KEY = None
 
     def __init__(self, detail=None, business_area_code=None, *args, **kwargs):
+        # full: repair run, records are processed even if they did not change since the last sync
+        self.full = kwargs.pop('full', False)
+        # run_id: sync run the log belongs to
+        self.run_id = kwargs.pop('run_id', '')
+        self.record_hashes = {}
         super().__init__(detail, business_area_code, *args, **kwargs)
         if business_area_code:
             self.country = get_tenant_model().objects.get(business_area_code=self.business_area_code)
@@ -24,4 +48,124 @@ class VisionDataTenantSynchronizer(VisionDataSynchronizer):
     def logger_parameters(self):
         kwargs = super().logger_parameters()
         kwargs['country'] = self.country
+        kwargs['run_id'] = self.run_id
         return kwargs
+
+    def get_record_key(self, record):
+        return str(record[self.HASH_KEY])
+
+    @staticmethod
+    def get_record_hash(record):
+        return hashlib.md5(json.dumps(record, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def _changed_records(self, records):
+        """
+        Drop the records with the same content as in the last sync.
+        The hashes of the remaining ones are kept until _store_record_hashes is called, once they are saved
+        """
+        if not self.HASH_KEY:
+            return records
+
+        hashed = [(self.get_record_key(record), self.get_record_hash(record), record) for record in records]
+        stored = dict(VisionRecordHash.objects.filter(
+            handler_name=self.__class__.__name__,
+            business_area_code=self.business_area_code or '',
+            key__in={key for key, _, _ in hashed},
+        ).values_list('key', 'hash'))
+
+        changed = []
+        for key, record_hash, record in hashed:
+            if self.full or stored.get(key) != record_hash:
+                changed.append(record)
+                self.record_hashes[key] = record_hash
+
+        logger.info('{} of {} records changed since the last sync'.format(len(changed), len(records)))
+        if hasattr(self, 'log'):
+            self.log.total_changed += len(changed)
+        return changed
+
+    @transaction.atomic
+    def _store_record_hashes(self):
+        if not self.record_hashes:
+            return
+        qs = VisionRecordHash.objects.filter(
+            handler_name=self.__class__.__name__,
+            business_area_code=self.business_area_code or '',
+        )
+        qs.filter(key__in=self.record_hashes.keys()).delete()
+        VisionRecordHash.objects.bulk_create([
+            VisionRecordHash(
+                handler_name=self.__class__.__name__,
+                business_area_code=self.business_area_code or '',
+                key=key,
+                hash=record_hash,
+            ) for key, record_hash in self.record_hashes.items()
+        ], batch_size=self.STREAM_BATCH_SIZE)
+        self.record_hashes = {}
+
+    def _convert_batch(self, records):
+        return self._convert_records(records)
+
+    def _iter_batches(self, records):
+        records = iter(records)
+        while True:
+            batch = list(islice(records, self.STREAM_BATCH_SIZE))
+            if not batch:
+                return
+            self.log.total_records += len(batch)
+            logger.info('{} records read from stream'.format(self.log.total_records))
+            yield self._convert_batch(batch)
+
+    def _save_batches(self, batches):
+        """
+        Save the converted batches one at a time.
+        Synchronizers that need to see every record before saving anything override this.
+        """
+        processed = 0
+        for batch in batches:
+            processed += self._save_records(batch)
+        return processed
+
+    def _sync(self):
+        """Load, convert and save the records, returning the totals"""
+        if self.STREAMING:
+            data_getter = self.STREAM_LOADER_CLASS(**self.kwargs)
+            return self._save_batches(self._iter_batches(self.metrics.timed_iter('fetch', data_getter.stream())))
+
+        data_getter = self.LOADER_CLASS(**self.kwargs)
+        original_records = self.metrics.timed('fetch', data_getter.get)()
+        logger.info('{} records returned from get'.format(len(original_records)))
+
+        converted_records = self._convert_records(original_records)
+        self.log.total_records = len(converted_records)
+        logger.info('{} records returned from conversion'.format(len(converted_records)))
+
+        return self._save_records(converted_records)
+
+    def sync(self):
+        self.log = get_vision_logger_domain_model()(**self.logger_parameters())
+        self.metrics = SyncMetrics()
+
+        try:
+            with self.metrics.collect(self):
+                totals = self._sync()
+        except Exception as e:
+            logger.info('sync', exc_info=True)
+            self.log.exception_message = force_str(e)
+            traceback = sys.exc_info()[2]
+            raise VisionException(force_str(e)).with_traceback(traceback)
+        else:
+            if isinstance(totals, dict):
+                self.log.total_processed = totals.get('processed', 0)
+                self.log.details = totals.get('details', '')
+                self.log.total_records = totals.get('total_records', self.log.total_records)
+            else:
+                self.log.total_processed = totals
+            self.log.successful = True
+        finally:
+            self.log.metrics = self.metrics.as_dict(rows_read=self.log.total_records)
+            self.log.save()
+
+
+class FileDataSynchronizer(BaseFileDataSynchronizer):
+    STREAM_LOADER_CLASS = FileDataStreamLoader
@@ -1,13 +1,21 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
 from django.db import connection
+from django.db.models import Sum
 from django.utils import timezone
 
+from celery import chain
 from celery.utils.log import get_task_logger
+from django_tenants.utils import get_public_schema_name
 from unicef_vision.exceptions import VisionException
 
 from etools.applications.funds.synchronizers import FundReservationsSynchronizer
 from etools.applications.partners.synchronizers import DirectCashTransferSynchronizer, PartnerSynchronizer
 from etools.applications.reports.synchronizers import ProgrammeSynchronizer, RAMSynchronizer
 from etools.applications.users.models import Country
+from etools.applications.vision.models import VisionSyncLog
 from etools.config.celery import app, send_to_slack
 
 PUBLIC_SYNC_HANDLERS = {}
@@ -22,10 +30,29 @@ SYNC_HANDLERS = {
     'dct': DirectCashTransferSynchronizer,
 }
 
+# order in which the handlers of a tenant run: each handler only starts once the previous one is done
+SYNC_ORDER = (
+    'programme',
+    'ram',
+    'partner',
+    'fund_reservation',
+    'dct',
+)
+
+SYNC_RUN_HANDLER_NAME = 'VisionSyncRun'
+# seconds a step waits before trying again to get a free slot on its Insight endpoint
+ENDPOINT_SLOT_RETRY_COUNTDOWN = 30
+# the slots counter expires, so that slots of workers that died are eventually released
+ENDPOINT_SLOT_TIMEOUT = 4 * 60 * 60
+
 
 logger = get_task_logger(__name__)
 
 
+def get_sync_order(handlers):
+    return sorted(handlers, key=lambda handler: SYNC_ORDER.index(handler) if handler in SYNC_ORDER else len(SYNC_ORDER))
+
+
 @app.task
 def vision_sync_task(business_area_code=None, synchronizers=SYNC_HANDLERS.keys()):
     """
@@ -37,7 +64,9 @@ def vision_sync_task(business_area_code=None, synchronizers=SYNC_HANDLERS.keys()
     # by other means, so it's really a Celery task.
 
     global_synchronizers = [handler for handler in synchronizers if SYNC_HANDLERS[handler].GLOBAL_CALL]
-    tenant_synchronizers = [handler for handler in synchronizers if not SYNC_HANDLERS[handler].GLOBAL_CALL]
+    tenant_synchronizers = get_sync_order(
+        [handler for handler in synchronizers if not SYNC_HANDLERS[handler].GLOBAL_CALL]
+    )
 
     country_filter_dict = {
         'vision_sync_enabled': True
@@ -46,16 +75,18 @@ def vision_sync_task(business_area_code=None, synchronizers=SYNC_HANDLERS.keys()
         country_filter_dict['business_area_code'] = business_area_code
     countries = Country.objects.filter(**country_filter_dict)
 
-    if not business_area_code or business_area_code == '0':  # public schema
-        for handler in global_synchronizers:
-            sync_handler.delay(business_area_code, handler)
+    plan = []
+    if (not business_area_code or business_area_code == '0') and global_synchronizers:  # public schema
+        plan.append((business_area_code, get_sync_order(global_synchronizers)))
     for country in countries:
         connection.set_tenant(country)
-        for handler in tenant_synchronizers:
-            sync_handler.delay(country.business_area_code, handler)
+        if tenant_synchronizers:
+            plan.append((country.business_area_code, tenant_synchronizers))
         country.vision_last_synced = timezone.now()
         country.save()
 
+    run_sync_plan(plan)
+
     text = 'Created tasks for the following countries: {} and synchronizers: {}'.format(
         ',\n '.join([country.name for country in countries]),
         ',\n '.join([synchronizer for synchronizer in synchronizers])
@@ -64,12 +95,66 @@ def vision_sync_task(business_area_code=None, synchronizers=SYNC_HANDLERS.keys()
     logger.info(text)
 
 
-@app.task(bind=True, autoretry_for=(VisionException,), retry_kwargs={'max_retries': 1})
-def sync_handler(self, business_area_code, handler):
+def run_sync_plan(plan):
     """
-    Run .sync() on one handler for one country.
+    Schedule the sync of plan, a list of (business_area_code, [handlers]).
+    The handlers of a tenant run one after the other, in the given order. Tenants are spread over
+    VISION_SYNC_MAX_TENANTS lanes running in parallel, and when the last lane is done the run is summarized
+    in a single VisionSyncLog.
+    """
+    if not plan:
+        return None
+
+    run_id = uuid.uuid4().hex
+    lanes = [[] for __ in range(min(settings.VISION_SYNC_MAX_TENANTS, len(plan)))]
+    for i, (business_area_code, handlers) in enumerate(plan):
+        lanes[i % len(lanes)].extend(sync_step.si(business_area_code, handler, run_id) for handler in handlers)
+
+    cache.set(_run_key(run_id), len(lanes), timeout=ENDPOINT_SLOT_TIMEOUT)
+    business_area_codes = [business_area_code for business_area_code, __ in plan]
+    steps = sum(len(handlers) for __, handlers in plan)
+    for lane in lanes:
+        chain(*lane, sync_lane_done.si(run_id, business_area_codes, steps)).apply_async()
+    return run_id
+
+
+def _run_key(run_id):
+    return 'vision-sync-run-{}'.format(run_id)
+
+
+def _endpoint_key(endpoint):
+    return 'vision-sync-endpoint-{}'.format(endpoint)
+
+
+def get_endpoint_limit(endpoint):
+    return settings.VISION_SYNC_ENDPOINT_LIMITS.get(endpoint, settings.VISION_SYNC_MAX_PER_ENDPOINT)
+
+
+def acquire_endpoint_slot(endpoint):
+    limit = get_endpoint_limit(endpoint)
+    if not limit:
+        return True
+    key = _endpoint_key(endpoint)
+    cache.add(key, 0, timeout=ENDPOINT_SLOT_TIMEOUT)
+    if cache.incr(key) > limit:
+        cache.decr(key)
+        return False
+    return True
+
+
+def release_endpoint_slot(endpoint):
+    if get_endpoint_limit(endpoint):
+        try:
+            cache.decr(_endpoint_key(endpoint))
+        except ValueError:
+            # counter expired while the sync was running
+            pass
+
+
+def run_sync_handler(business_area_code, handler, run_id=''):
+    """
+    Run .sync() on one handler for one country, its log is tagged with run_id
     """
-    # Scheduled from vision_sync_task() (above).
     logger.info('Starting vision sync handler {} for country {}'.format(handler, business_area_code))
     try:
         country = Country.objects.get(business_area_code=business_area_code)
@@ -81,9 +166,11 @@ def sync_handler(self, business_area_code, handler):
     else:
         try:
             if handler == "programme":
-                SYNC_HANDLERS[handler](business_area_code=country.business_area_code, cycle="all").sync()
+                SYNC_HANDLERS[handler](
+                    business_area_code=country.business_area_code, cycle="all", run_id=run_id,
+                ).sync()
             else:
-                SYNC_HANDLERS[handler](business_area_code=country.business_area_code).sync()
+                SYNC_HANDLERS[handler](business_area_code=country.business_area_code, run_id=run_id).sync()
             logger.info("{} sync successfully for {} [{}]".format(handler, country.name, business_area_code))
 
         except VisionException:
@@ -91,6 +178,75 @@ def sync_handler(self, business_area_code, handler):
             logger.exception("{} sync failed, Country: {}".format(
                 handler, business_area_code
             ))
-            # The 'autoretry_for' in the task decorator tells Celery to
-            # retry this a few times on VisionExceptions, so just re-raise it
             raise
+
+
+@app.task
+def sync_handler(business_area_code, handler):
+    """
+    Run .sync() on one handler for one country.
+    """
+    # failed Insight requests are retried by the Insight client, re-running the whole sync would not help
+    run_sync_handler(business_area_code, handler)
+
+
+@app.task(bind=True, max_retries=None)
+def sync_step(self, business_area_code, handler, run_id=''):
+    """
+    Step of a sync run, scheduled by run_sync_plan().
+    Waits for a free slot on the Insight endpoint of the handler, and never fails,
+    so the following handlers of the lane still run.
+    """
+    endpoint = SYNC_HANDLERS[handler].ENDPOINT
+    if not acquire_endpoint_slot(endpoint):
+        raise self.retry(countdown=ENDPOINT_SLOT_RETRY_COUNTDOWN)
+    try:
+        run_sync_handler(business_area_code, handler, run_id)
+    except Exception:
+        logger.exception('{} sync step failed, Country: {}'.format(handler, business_area_code))
+    finally:
+        release_endpoint_slot(endpoint)
+
+
+@app.task
+def sync_lane_done(run_id, business_area_codes, steps):
+    """Last task of every lane of a sync run: the last lane to finish records the run summary"""
+    try:
+        remaining = cache.decr(_run_key(run_id))
+    except ValueError:
+        remaining = 0
+    if remaining <= 0:
+        cache.delete(_run_key(run_id))
+        log_sync_run(run_id, business_area_codes, steps)
+
+
+def log_sync_run(run_id, business_area_codes, steps):
+    """Summarize in one VisionSyncLog the logs written by the handlers of a sync run"""
+    logs = VisionSyncLog.objects.filter(run_id=run_id).exclude(handler_name=SYNC_RUN_HANDLER_NAME)
+    totals = logs.aggregate(
+        total_records=Sum('total_records'),
+        total_processed=Sum('total_processed'),
+        total_changed=Sum('total_changed'),
+    )
+    failed = logs.filter(successful=False)
+    # steps that did not write a log at all (country not found, unexpected errors) are failures too
+    missing = steps - logs.count()
+
+    details = 'Tenants: {}, Handlers: {}, Failed: {}, Not logged: {}'.format(
+        len(business_area_codes), steps, failed.count(), missing,
+    )
+    failures = ', '.join('{} {}'.format(business_area_code, handler_name) for business_area_code, handler_name in
+                         failed.values_list('business_area_code', 'handler_name'))
+    if failures:
+        details = '{}\n{}'.format(details, failures)
+
+    return VisionSyncLog.objects.create(
+        country=Country.objects.get(schema_name=get_public_schema_name()),
+        handler_name=SYNC_RUN_HANDLER_NAME,
+        run_id=run_id,
+        total_records=totals['total_records'] or 0,
+        total_processed=totals['total_processed'] or 0,
+        total_changed=totals['total_changed'] or 0,
+        successful=not failures and missing <= 0,
+        details=details[:2048],
+    )
@@ -0,0 +1,61 @@
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from rest_framework import status
+
+from etools.applications.core.tests.cases import BaseTenantTestCase
+from etools.applications.core.tests.mixins import URLAssertionMixin
+from etools.applications.users.tests.factories import UserFactory
+from etools.applications.vision.models import VisionSyncLog
+
+
+class UrlsTestCase(URLAssertionMixin, SimpleTestCase):
+    """Simple test case to verify URL reversal"""
+
+    def test_urls(self):
+        """Verify URL pattern names generate the URLs we expect them to."""
+        names_and_paths = (
+            ('sync-metrics', 'sync-metrics/', {}),
+        )
+        self.assertReversal(names_and_paths, 'vision:', '/api/v2/vision/')
+
+
+class TestVisionSyncLogMetricsView(BaseTenantTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.unicef_staff = UserFactory(is_staff=True)
+        cls.metrics = {'seconds': 1.5, 'phases': {'fetch': 1.0, 'save': 0.5}, 'queries': 12}
+        cls.partner_log = VisionSyncLog.objects.create(
+            country=cls.tenant,
+            business_area_code='ZZZ',
+            handler_name='PartnerSynchronizer',
+            successful=True,
+            metrics=cls.metrics,
+        )
+        cls.programme_log = VisionSyncLog.objects.create(
+            country=cls.tenant,
+            business_area_code='ZZZ',
+            handler_name='ProgrammeSynchronizer',
+            successful=False,
+        )
+
+    def test_list(self):
+        response = self.forced_auth_req('get', reverse('vision:sync-metrics'), user=self.unicef_staff)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+    def test_filter(self):
+        response = self.forced_auth_req(
+            'get',
+            reverse('vision:sync-metrics'),
+            user=self.unicef_staff,
+            data={'handler_name': 'PartnerSynchronizer', 'successful': 'true'},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['id'], self.partner_log.pk)
+        self.assertEqual(response.data[0]['metrics'], self.metrics)
+
+    def test_permission(self):
+        response = self.forced_auth_req('get', reverse('vision:sync-metrics'), user=UserFactory())
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,108 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test import SimpleTestCase
+from django.test.utils import override_settings
+
+import mock
+from unicef_vision.exceptions import VisionException
+
+from etools.applications.vision.client import InsightClient
+from etools.applications.vision.loaders import VisionDataStreamLoader
+
+RECORDS = [{'VENDOR_CODE': 'V{}'.format(i), 'VENDOR_NAME': 'Partner {}'.format(i)} for i in range(50)]
+
+
+class StubInsightHandler(BaseHTTPRequestHandler):
+    """Serves RECORDS gzipped, after failing with the statuses queued in server.failures"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.requests.append((self.path, self.headers.get('Accept-Encoding')))
+        if self.server.failures:
+            self.send_response(self.server.failures.pop(0))
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = gzip.compress(json.dumps({'ROWSET': {'ROW': RECORDS}}).encode('utf-8'))
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestInsightClient(SimpleTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubInsightHandler)
+        cls.server.daemon_threads = True
+        cls.url = 'http://127.0.0.1:{}/'.format(cls.server.server_address[1])
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.server.requests = []
+        self.server.failures = []
+        self.client = InsightClient(retries=2, backoff_factor=0, pool_size=1)
+
+    def test_get(self):
+        response = self.client.get(self.url + 'partners', 'partners')
+        self.assertEqual(response.json()['ROWSET']['ROW'], RECORDS)
+        self.assertEqual(self.server.requests, [('/partners', 'gzip, deflate')])
+        stats = self.client.stats['partners']
+        self.assertEqual(stats['requests'], 1)
+        self.assertEqual(stats['errors'], 0)
+        self.assertGreater(stats['bytes'], 0)
+        self.assertGreater(stats['seconds'], 0)
+
+    def test_get_retry(self):
+        self.server.failures = [503, 502]
+        response = self.client.get(self.url + 'partners', 'partners')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_get_retries_exhausted(self):
+        self.server.failures = [503, 503, 503]
+        with self.assertRaisesRegex(VisionException, 'Http code: 503'):
+            self.client.get(self.url + 'partners', 'partners')
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(self.client.stats['partners']['errors'], 1)
+
+    def test_get_not_retried(self):
+        self.server.failures = [404]
+        with self.assertRaises(VisionException):
+            self.client.get(self.url + 'partners', 'partners')
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_stream(self):
+        self.server.failures = [500]
+        data = b''.join(self.client.stream(self.url + 'dcts', 'dcts', 16))
+        self.assertEqual(json.loads(data)['ROWSET']['ROW'], RECORDS)
+        self.assertEqual(self.client.stats['dcts']['bytes'], len(data))
+
+    def test_keep_alive(self):
+        for __ in range(3):
+            self.client.get(self.url + 'partners', 'partners')
+        pool = self.client.session.get_adapter(self.url).poolmanager.connection_from_url(self.url)
+        self.assertEqual(pool.num_connections, 1)
+
+    def test_stream_loader(self):
+        with override_settings(INSIGHT_URL=self.url):
+            loader = VisionDataStreamLoader('partners', businessarea='ZZZ')
+        with mock.patch('etools.applications.vision.loaders.get_insight_client', return_value=self.client):
+            self.assertEqual(list(loader.stream()), RECORDS)
+        self.assertEqual(self.server.requests[0][0], '/partners/?businessarea=ZZZ')
@@ -0,0 +1,54 @@
+import json
+import os
+import tempfile
+
+from django.test import SimpleTestCase
+
+from etools.applications.vision.loaders import FileDataStreamLoader, iter_json_records
+
+
+def _chunks(data, size):
+    data = json.dumps(data, ensure_ascii=False).encode('utf-8')
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestIterJsonRecords(SimpleTestCase):
+    records = [
+        {'VENDOR_CODE': 'V{}'.format(i), 'VENDOR_NAME': 'Parténaire ]}', 'AMOUNT': 12345.67, 'FLAG': None}
+        for i in range(20)
+    ]
+
+    def assertRecords(self, data, expected):
+        # small chunk sizes split values, numbers and multi byte characters across chunks
+        for size in (1, 7, 64, 100000):
+            self.assertEqual(list(iter_json_records(_chunks(data, size))), expected)
+
+    def test_list(self):
+        self.assertRecords(self.records, self.records)
+
+    def test_rowset(self):
+        self.assertRecords({'ROWSET': {'ROW': self.records}}, self.records)
+
+    def test_rowset_single_row(self):
+        self.assertRecords({'ROWSET': {'ROW': self.records[0]}}, self.records[:1])
+
+    def test_single_record(self):
+        self.assertRecords(self.records[0], self.records[:1])
+
+    def test_no_data(self):
+        self.assertRecords('No Data Available', [])
+        self.assertRecords([], [])
+        self.assertRecords({}, [])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_records([b'[{"VENDOR_CODE": "V1"}, {"VENDOR']))
+
+
+class TestFileDataStreamLoader(SimpleTestCase):
+    def test_stream(self):
+        records = [{'VENDOR_CODE': 'V{}'.format(i)} for i in range(10)]
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            json.dump({'ROWSET': {'ROW': records}}, f)
+        self.addCleanup(os.remove, f.name)
+        self.assertEqual(list(FileDataStreamLoader(f.name).stream()), records)
@@ -0,0 +1,58 @@
+from django.test import SimpleTestCase
+
+import mock
+
+from etools.applications.core.tests.cases import BaseTenantTestCase
+from etools.applications.vision.metrics import SyncMetrics
+from etools.applications.vision.models import VisionSyncLog
+from etools.applications.vision.synchronizers import VisionDataTenantSynchronizer
+
+
+class TestSyncMetrics(SimpleTestCase):
+
+    @mock.patch('etools.applications.vision.metrics.time.monotonic')
+    def test_phase_nested(self, mock_monotonic):
+        # save: 0 -> 10, fetch within it: 2 -> 5
+        mock_monotonic.side_effect = [0, 2, 5, 10]
+        metrics = SyncMetrics()
+        with metrics.phase('save'):
+            with metrics.phase('fetch'):
+                pass
+        self.assertEqual(metrics.phases, {'save': 7, 'fetch': 3})
+
+    @mock.patch('etools.applications.vision.metrics.time.monotonic')
+    def test_timed_iter(self, mock_monotonic):
+        mock_monotonic.side_effect = [0, 1, 1, 3, 3, 4]
+        metrics = SyncMetrics()
+        self.assertEqual(list(metrics.timed_iter('fetch', [1, 2])), [1, 2])
+        self.assertEqual(metrics.phases, {'fetch': 4})
+
+
+class MetricsSynchronizer(VisionDataTenantSynchronizer):
+    ENDPOINT = 'test'
+
+    def _convert_records(self, records):
+        return records
+
+    def _save_records(self, records):
+        VisionSyncLog.objects.filter(pk=-1).update(total_records=0)
+        return len(records)
+
+
+class TestSynchronizerMetrics(BaseTenantTestCase):
+
+    def test_sync(self):
+        synchronizer = MetricsSynchronizer(business_area_code=self.tenant.business_area_code, run_id='run')
+        with mock.patch.object(synchronizer.LOADER_CLASS, 'get', return_value=[{'a': 1}, {'a': 2}]):
+            synchronizer.sync()
+
+        log = VisionSyncLog.objects.get(handler_name='MetricsSynchronizer')
+        self.assertTrue(log.successful)
+        self.assertEqual(log.run_id, 'run')
+        self.assertEqual(set(log.metrics['phases']), {'fetch', 'convert', 'save'})
+        self.assertEqual(log.metrics['rows_read'], 2)
+        self.assertEqual(log.metrics['queries'], 1)
+        self.assertEqual(log.metrics['rows_written'], 0)
+        self.assertGreaterEqual(log.metrics['peak_allocated_kb'], 0)
+        # the timed methods are only wrapped during the sync
+        self.assertNotIn('_save_records', synchronizer.__dict__)
@@ -12,6 +12,7 @@ from unicef_vision.exceptions import VisionException
 import etools.applications.vision.tasks
 from etools.applications.core.tests.cases import BaseTenantTestCase
 from etools.applications.users.tests.factories import CountryFactory
+from etools.applications.vision.models import VisionSyncLog
 
 
 def _build_country(name):
@@ -34,7 +35,7 @@ def _build_country(name):
 
 @mock.patch('etools.applications.vision.tasks.Country')
 @mock.patch('etools.applications.vision.tasks.send_to_slack')
-@mock.patch('etools.applications.vision.tasks.sync_handler')
+@mock.patch('etools.applications.vision.tasks.run_sync_plan')
 @mock.patch('etools.applications.vision.tasks.connection', spec=['set_tenant'])
 @mock.patch('etools.applications.vision.tasks.logger.info')
 class TestVisionSyncTask(SimpleTestCase):
@@ -110,13 +111,20 @@ class TestVisionSyncTask(SimpleTestCase):
             self.assertEqual(call_args[0], (country, ))
             self.assertEqual(call_args[1], {})
 
+    def _planned_tasks(self, mock_run_sync_plan):
+        """Return the (business_area_code, handler) pairs of the plan passed to run_sync_plan()"""
+        self.assertEqual(mock_run_sync_plan.call_count, 1)
+        plan = mock_run_sync_plan.call_args[0][0]
+        return [(business_area_code, handler) for business_area_code, handlers in plan for handler in handlers]
+
     def _assertGlobalHandlersSynced(self, mock_handler, all_sync_task=15, public_task=0):
         """Verify that public handler tasks were called
         all_sync_task is the number of tasks called.
         sync_t0 is the number of tasks called for public schema
         """
-        self.assertEqual(mock_handler.delay.call_count, all_sync_task)
-        countries = [arguments[0][0] for arguments in mock_handler.delay.call_args_list]
+        tasks = self._planned_tasks(mock_handler)
+        self.assertEqual(len(tasks), all_sync_task)
+        countries = [business_area_code for business_area_code, __ in tasks]
         self.assertEqual(countries.count('Global'), public_task)
 
     def _assertTenantHandlersSynced(self, mock_handler, all_sync_task=15, sync_t0=5, sync_t1=5, sync_t2=5):
@@ -126,8 +134,9 @@ class TestVisionSyncTask(SimpleTestCase):
         sync_t1 is the number of tasks called for ZZZ Test 1
         sync_t2 is the number of tasks called for ZZZ Test 2
         """
-        self.assertEqual(mock_handler.delay.call_count, all_sync_task)
-        countries = [arguments[0][0] for arguments in mock_handler.delay.call_args_list]
+        tasks = self._planned_tasks(mock_handler)
+        self.assertEqual(len(tasks), all_sync_task)
+        countries = [business_area_code for business_area_code, __ in tasks]
         self.assertEqual(countries.count('ZZZ Test0'), sync_t0)
         self.assertEqual(countries.count('ZZZ Test1'), sync_t1)
         self.assertEqual(countries.count('ZZZ Test2'), sync_t2)
@@ -165,6 +174,10 @@ class TestVisionSyncTask(SimpleTestCase):
         self._assertCountryMockCalls(countryMock)
         self._assertGlobalHandlersSynced(mock_handler)
         self._assertTenantHandlersSynced(mock_handler)
+        # handlers of a tenant are planned in dependency order
+        plan = mock_handler.call_args[0][0]
+        for __, handlers in plan:
+            self.assertEqual(list(handlers), list(etools.applications.vision.tasks.SYNC_ORDER))
         self._assertConnectionTenantSet(mock_django_db_connection)
         self._assertVisionLastSynced()
         self._assertSlackNotified(mock_send_to_slack)
@@ -236,6 +249,137 @@ class TestVisionSyncTask(SimpleTestCase):
         self._assertLoggerMessages(mock_logger, selected_countries, selected_synchronizers)
 
 
+@mock.patch('etools.applications.vision.tasks.chain')
+@mock.patch('etools.applications.vision.tasks.cache')
+class TestRunSyncPlan(SimpleTestCase):
+    """Exercises run_sync_plan(), which spreads the tenants over parallel lanes"""
+
+    plan = [
+        ('ZZZ Test0', ['programme', 'partner']),
+        ('ZZZ Test1', ['programme', 'partner']),
+        ('ZZZ Test2', ['programme', 'partner']),
+    ]
+
+    def _lanes(self, mock_chain):
+        return [[(task.args, task.task) for task in call[0]] for call in mock_chain.call_args_list]
+
+    @override_settings(VISION_SYNC_MAX_TENANTS=2)
+    def test_lanes(self, mock_cache, mock_chain):
+        run_id = etools.applications.vision.tasks.run_sync_plan(self.plan)
+
+        lanes = self._lanes(mock_chain)
+        self.assertEqual(len(lanes), 2)
+        self.assertEqual(mock_chain.return_value.apply_async.call_count, 2)
+        mock_cache.set.assert_called_once_with('vision-sync-run-{}'.format(run_id), 2, timeout=mock.ANY)
+        sync_step = etools.applications.vision.tasks.sync_step.name
+        self.assertEqual(lanes[0][:4], [
+            (('ZZZ Test0', 'programme', run_id), sync_step),
+            (('ZZZ Test0', 'partner', run_id), sync_step),
+            (('ZZZ Test2', 'programme', run_id), sync_step),
+            (('ZZZ Test2', 'partner', run_id), sync_step),
+        ])
+        self.assertEqual(lanes[1][:2], [
+            (('ZZZ Test1', 'programme', run_id), sync_step),
+            (('ZZZ Test1', 'partner', run_id), sync_step),
+        ])
+        # every lane ends with the same summary step
+        for lane in lanes:
+            args, task = lane[-1]
+            self.assertEqual(task, etools.applications.vision.tasks.sync_lane_done.name)
+            self.assertEqual(args[0], run_id)
+            self.assertEqual(args[1:], (['ZZZ Test0', 'ZZZ Test1', 'ZZZ Test2'], 6))
+
+    @override_settings(VISION_SYNC_MAX_TENANTS=10)
+    def test_lanes_less_tenants(self, mock_cache, mock_chain):
+        etools.applications.vision.tasks.run_sync_plan(self.plan)
+        self.assertEqual(len(self._lanes(mock_chain)), 3)
+
+    def test_empty_plan(self, mock_cache, mock_chain):
+        self.assertIsNone(etools.applications.vision.tasks.run_sync_plan([]))
+        self.assertEqual(mock_chain.call_count, 0)
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    VISION_SYNC_MAX_PER_ENDPOINT=2,
+    VISION_SYNC_ENDPOINT_LIMITS={'partners': 1, 'dcts': 0},
+)
+class TestEndpointSlots(SimpleTestCase):
+    """Exercises the concurrency limit per Insight endpoint"""
+
+    def test_default_limit(self):
+        acquire = etools.applications.vision.tasks.acquire_endpoint_slot
+        self.assertTrue(acquire('wbsstructures'))
+        self.assertTrue(acquire('wbsstructures'))
+        self.assertFalse(acquire('wbsstructures'))
+        etools.applications.vision.tasks.release_endpoint_slot('wbsstructures')
+        self.assertTrue(acquire('wbsstructures'))
+
+    def test_endpoint_limit(self):
+        acquire = etools.applications.vision.tasks.acquire_endpoint_slot
+        self.assertTrue(acquire('partners'))
+        self.assertFalse(acquire('partners'))
+
+    def test_no_limit(self):
+        acquire = etools.applications.vision.tasks.acquire_endpoint_slot
+        for __ in range(5):
+            self.assertTrue(acquire('dcts'))
+
+
+class TestLogSyncRun(BaseTenantTestCase):
+    """Exercises log_sync_run(), which summarizes a sync run"""
+
+    run_id = 'run'
+
+    def _log(self, business_area_code, handler_name, successful=True, run_id=run_id, **kwargs):
+        return VisionSyncLog.objects.create(
+            country=self.tenant,
+            run_id=run_id,
+            business_area_code=business_area_code,
+            handler_name=handler_name,
+            successful=successful,
+            **kwargs
+        )
+
+    def setUp(self):
+        super().setUp()
+        # the summary belongs to the public tenant, which the test database does not have
+        patcher = mock.patch('etools.applications.vision.tasks.Country')
+        patcher.start().objects.get.return_value = self.tenant
+        self.addCleanup(patcher.stop)
+
+    def test_log_sync_run(self):
+        self._log('ZZZ', 'ProgrammeSynchronizer', total_records=10, total_processed=8, total_changed=3)
+        self._log('ZZZ', 'PartnerSynchronizer', successful=False, total_records=5, total_processed=1)
+        # a sync running at the same time
+        self._log('ZZZ', 'PartnerSynchronizer', run_id='other', total_records=100, total_processed=100)
+
+        log = etools.applications.vision.tasks.log_sync_run(self.run_id, ['ZZZ'], 3)
+        self.assertEqual(log.run_id, self.run_id)
+        self.assertEqual(log.handler_name, etools.applications.vision.tasks.SYNC_RUN_HANDLER_NAME)
+        self.assertEqual(log.total_records, 15)
+        self.assertEqual(log.total_processed, 9)
+        self.assertEqual(log.total_changed, 3)
+        self.assertFalse(log.successful)
+        self.assertIn('Failed: 1, Not logged: 1', log.details)
+        self.assertIn('ZZZ PartnerSynchronizer', log.details)
+
+    def test_log_sync_run_successful(self):
+        self._log('ZZZ', 'ProgrammeSynchronizer', total_records=10, total_processed=10)
+
+        log = etools.applications.vision.tasks.log_sync_run(self.run_id, ['ZZZ'], 1)
+        self.assertTrue(log.successful)
+        self.assertEqual(log.total_processed, 10)
+
+    def test_log_sync_run_global(self):
+        """The global handlers log under the code of the public tenant, not the code of their step"""
+        self._log(self.tenant.business_area_code, 'ProgrammeSynchronizer', total_records=10, total_processed=10)
+
+        log = etools.applications.vision.tasks.log_sync_run(self.run_id, [None], 1)
+        self.assertTrue(log.successful)
+        self.assertIn('Not logged: 0', log.details)
+
+
 class TestSyncHandlerTask(BaseTenantTestCase):
     """Exercises the sync_handler()"""
 
@@ -268,7 +412,7 @@ class TestSyncHandlerTask(BaseTenantTestCase):
         Country.objects.get = mock.Mock(return_value=self.country)
 
         etools.applications.vision.tasks.sync_handler.delay(self.country.business_area_code, 'programme')
-        # Check that it got retried once
+        # Not retried by the task, failed requests are retried by the Insight client
         self.assertEqual(mock_logger_info.call_count, 1)
         self.assertEqual(mock_logger_error.call_count, 0)
         expected_msg = 'Starting vision sync handler {} for country {}'.format(
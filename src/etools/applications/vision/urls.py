@@ -0,0 +1,10 @@
+from django.conf.urls import url
+
+from etools.applications.vision.views import VisionSyncLogMetricsListAPIView
+
+app_name = 'vision'
+urlpatterns = (
+    url(r'^sync-metrics/$',
+        view=VisionSyncLogMetricsListAPIView.as_view(http_method_names=['get']),
+        name='sync-metrics'),
+)
@@ -0,0 +1,31 @@
+from rest_framework import permissions
+from rest_framework.generics import ListAPIView
+from unicef_restlib.views import QueryStringFilterMixin
+
+from etools.applications.vision.models import VisionSyncLog
+from etools.applications.vision.serializers import VisionSyncLogMetricsSerializer
+
+
+class VisionSyncLogMetricsListAPIView(QueryStringFilterMixin, ListAPIView):
+    """
+    Returns the sync logs with their metrics, most recent first, to trend sync performance per tenant and handler.
+    """
+    serializer_class = VisionSyncLogMetricsSerializer
+    permission_classes = (permissions.IsAdminUser,)
+    queryset = VisionSyncLog.objects.select_related('country').order_by('-date_processed')
+    filters = (
+        ('business_area_code', 'business_area_code__in'),
+        ('handler_name', 'handler_name__in'),
+        ('date_from', 'date_processed__date__gte'),
+        ('date_to', 'date_processed__date__lte'),
+    )
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        successful = self.request.query_params.get('successful')
+        if successful is not None:
+            queryset = queryset.filter(successful=successful.lower() in ('true', '1'))
+        # without a date range only the latest logs are returned
+        if not {'date_from', 'date_to'} & set(self.request.query_params.keys()):
+            queryset = queryset[:1000]
+        return queryset
@@ -130,6 +130,10 @@ MIDDLEWARE = (
 )
 WSGI_APPLICATION = 'etools.config.wsgi.application'
 
+# query budget of the views which don't declare one, checked by core.middleware.QueryBudgetMiddleware
+QUERY_BUDGET_MAX_QUERIES = int(get_from_secrets_or_env('QUERY_BUDGET_MAX_QUERIES', 50))
+QUERY_BUDGET_MAX_DUPLICATES = int(get_from_secrets_or_env('QUERY_BUDGET_MAX_DUPLICATES', 5))
+
 # DJANGO: LOGGING
 LOGGING = {
     'version': 1,
@@ -354,7 +358,10 @@ CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 CELERY_EMAIL_BACKEND = get_from_secrets_or_env('EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
 CELERY_TASK_ROUTES = {
     'etools.applications.vision.tasks.sync_handler': {'queue': 'vision_queue'},
+    'etools.applications.vision.tasks.sync_step': {'queue': 'vision_queue'},
+    'etools.applications.vision.tasks.sync_lane_done': {'queue': 'vision_queue'},
     'etools.applications.hact.tasks.update_hact_for_country': {'queue': 'vision_queue'},
+    'etools.applications.hact.tasks.update_dirty_partners': {'queue': 'vision_queue'},
     'etools.libraries.azure_graph_api.tasks.sync_delta_users': {'queue': 'vision_queue'},
     'etools.libraries.azure_graph_api.tasks.sync_all_users': {'queue': 'vision_queue'}
 }
@@ -478,6 +485,24 @@ INSIGHT_SUB_KEY = get_from_secrets_or_env('INSIGHT_SUB_KEY', 'invalid_key')
 INSIGHT_URL = get_from_secrets_or_env('INSIGHT_URL', 'http://invalid_vision_url')
 INSIGHT_BANK_KEY = get_from_secrets_or_env('INSIGHT_BANK_KEY', None)
 
+# vision sync: number of tenants synced in parallel, and of concurrent requests per Insight endpoint (0: no limit)
+VISION_SYNC_MAX_TENANTS = int(get_from_secrets_or_env('VISION_SYNC_MAX_TENANTS', 4))
+VISION_SYNC_MAX_PER_ENDPOINT = int(get_from_secrets_or_env('VISION_SYNC_MAX_PER_ENDPOINT', 2))
+# per endpoint overrides of VISION_SYNC_MAX_PER_ENDPOINT, e.g. "fundsreservations:1,partners:3"
+VISION_SYNC_ENDPOINT_LIMITS = {
+    endpoint: int(limit) for endpoint, limit in (
+        item.split(':') for item in get_from_secrets_or_env('VISION_SYNC_ENDPOINT_LIMITS', '').split(',') if item
+    )
+}
+
+# number of processes of a TenantExecutor in processes mode
+TENANT_EXECUTOR_MAX_WORKERS = int(get_from_secrets_or_env('TENANT_EXECUTOR_MAX_WORKERS', 4))
+
+# seconds between the first change to a partner's hact values and their recompute, see hact.tracker
+HACT_DIRTY_PARTNERS_COUNTDOWN = int(get_from_secrets_or_env('HACT_DIRTY_PARTNERS_COUNTDOWN', 300))
+
+# seconds the hact dashboard and history payloads are cached, they are also cleared when the hact data is saved
+HACT_CACHE_TIMEOUT = int(get_from_secrets_or_env('HACT_CACHE_TIMEOUT', 60 * 60 * 24))
 
 # ALLOW BASIC AUTH FOR DEMO SITE
 ALLOW_BASIC_AUTH = get_from_secrets_or_env('ALLOW_BASIC_AUTH', False)
@@ -541,6 +566,9 @@ SILENCED_SYSTEM_CHECKS = ["django_tenants.W003"]
 # GET parameter that allows override of schema
 SCHEMA_OVERRIDE_PARAM = "schema"
 
+# seconds the country of a user is cached by the tenant middleware, the cache is also cleared on profile changes
+USER_COUNTRY_CACHE_TIMEOUT = int(get_from_secrets_or_env('USER_COUNTRY_CACHE_TIMEOUT', 60 * 60))
+
 # Number of days before PCA required notification
 PCA_REQUIRED_NOTIFICATION_LEAD = 30
 
@@ -566,6 +594,16 @@ PSEA_ASSESSMENT_FINAL_RECIPIENTS = get_from_secrets_or_env(
 ).split(',')
 
 INSIGHT_REQUESTS_TIMEOUT = get_from_secrets_or_env('INSIGHT_REQUESTS_TIMEOUT', 400)  # in seconds
+# per endpoint overrides of INSIGHT_REQUESTS_TIMEOUT, e.g. "partners:600,dcts:120"
+INSIGHT_ENDPOINT_TIMEOUTS = {
+    endpoint: int(timeout) for endpoint, timeout in (
+        item.split(':') for item in get_from_secrets_or_env('INSIGHT_ENDPOINT_TIMEOUTS', '').split(',') if item
+    )
+}
+# failed Insight requests are retried, waiting backoff * 2 ** (attempt - 1) seconds in between
+INSIGHT_REQUESTS_RETRIES = int(get_from_secrets_or_env('INSIGHT_REQUESTS_RETRIES', 3))
+INSIGHT_REQUESTS_BACKOFF = float(get_from_secrets_or_env('INSIGHT_REQUESTS_BACKOFF', 2))
+INSIGHT_REQUESTS_POOL_SIZE = int(get_from_secrets_or_env('INSIGHT_REQUESTS_POOL_SIZE', 10))
 
 # Etools offline collect
 # https://github.com/unicef/etools-offline-collect/blob/develop/client/README.md
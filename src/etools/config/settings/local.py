@@ -96,3 +96,5 @@ DATA_UPLOAD_MAX_NUMBER_FIELDS = 10240
 
 # Optional for debugging db queries
 # MIDDLEWARE += ('etools.applications.core.middleware.QueryCountDebugMiddleware',)
+# Optional for reporting the views exceeding their query budget, see core.query_budget
+# MIDDLEWARE += ('etools.applications.core.middleware.QueryBudgetMiddleware',)
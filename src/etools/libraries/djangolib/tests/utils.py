@@ -1,3 +1,6 @@
+import csv
+import io
+
 from django.urls import reverse
 
 from rest_framework import status
@@ -14,5 +17,18 @@ class TestExportMixin(object):
         self.assertEqual(response.status_code, status_code)
         if status_code == status.HTTP_200_OK:
             self.assertIn('Content-Disposition', response.headers)
+            if response.streaming:
+                # the rows are serialized and rendered only when the response is read
+                response.export_content = b''.join(response.streaming_content)
 
         return response
+
+    def assertCSVExport(self, content, expected_content, ordered=True):
+        """Assert that the exported csv has the header and the rows of expected_content, in the same order if ordered"""
+        header, *rows = csv.reader(io.StringIO(content.decode('utf-8')))
+        expected_header, *expected_rows = csv.reader(io.StringIO(expected_content.decode('utf-8')))
+        self.assertEqual(header, expected_header)
+        if ordered:
+            self.assertEqual(rows, expected_rows)
+        else:
+            self.assertCountEqual(rows, expected_rows)
@@ -13,6 +13,16 @@ def get_current_site():
     return Site.objects.get_current()
 
 
+def get_user_group_names(user):
+    """Names of the groups of the user, loaded once per request and memoized on the user (see User.group_names)"""
+    return getattr(user, 'group_names', set())
+
+
+def get_user_group_ids(user):
+    """Ids of the groups of the user, memoized on the user along with the names (see User.group_ids)"""
+    return getattr(user, 'group_ids', set())
+
+
 def is_user_in_groups(user, group_names):
     """Utility function; returns True if user is in ANY of the groups in the group_names list, False if the user
     is in none of them. Note that group_names should be a tuple or list, not a single string.
@@ -22,7 +32,7 @@ def is_user_in_groups(user, group_names):
     if isinstance(group_names, str):
         # Anticipate common programming oversight.
         raise ValueError('group_names parameter must be a tuple or list, not a string')
-    return user.groups.filter(name__in=group_names).exists()
+    return bool(get_user_group_names(user).intersection(group_names))
 
 
 def get_all_field_names(TheModel):
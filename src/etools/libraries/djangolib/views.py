@@ -22,7 +22,7 @@ class ExternalModuleFilterMixin:
         query_params = self.request.query_params
         module = query_params.get(self.param_name, None)
         user = self.request.user
-        if not user.is_unicef_user() and not user.groups.filter(name="Read-Only API").exists():
+        if not user.is_unicef_user() and "Read-Only API" not in user.group_names:
             if module in self.module2filters:
                 queries = []
                 for user_filter in self.module2filters[module]:
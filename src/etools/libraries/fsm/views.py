@@ -1,3 +1,4 @@
+from etools.applications.permissions2.index import permission_index
 from etools.applications.permissions2.models import Permission
 
 
@@ -9,8 +10,10 @@ def has_action_permission(action):
         target = Permission.get_target(instance, action)
         context = getattr(user, '_permission_context', [])
 
-        permissions = Permission.objects.filter_by_context(context) \
-            .filter_by_targets([target]).filter(permission=Permission.PERMISSIONS.action)
+        permissions = [
+            permission for permission in permission_index.filter([target], context)
+            if permission.permission == Permission.PERMISSIONS.action
+        ]
 
         return bool(
             Permission.apply_permissions(permissions, [target], Permission.PERMISSIONS.action)
@@ -0,0 +1,27 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections
+
+
+class SchemaContentTypeCache(dict):
+    """
+    ContentTypeManager keeps its cache in a dict of {database alias: {model key or id: content type}}.
+    This dict adds the schema of the connection to the alias, so that public and every tenant schema keep
+    their own content types and the cache can be kept across requests instead of being cleared on every one.
+    """
+
+    def get_key(self, using):
+        return using, getattr(connections[using], 'schema_name', None)
+
+    def __getitem__(self, using):
+        return super().__getitem__(self.get_key(using))
+
+    def __contains__(self, using):
+        return super().__contains__(self.get_key(using))
+
+    def setdefault(self, using, default=None):
+        return super().setdefault(self.get_key(using), default)
+
+
+def install_schema_content_type_cache():
+    if not isinstance(ContentType.objects._cache, SchemaContentTypeCache):
+        ContentType.objects._cache = SchemaContentTypeCache()
@@ -0,0 +1,27 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+
+from etools.applications.core.tests.cases import BaseTenantTestCase
+from etools.applications.partners.models import PartnerOrganization
+from etools.libraries.tenant_support.content_types import SchemaContentTypeCache
+
+
+class TestSchemaContentTypeCache(BaseTenantTestCase):
+
+    def test_installed(self):
+        self.assertIsInstance(ContentType.objects._cache, SchemaContentTypeCache)
+
+    def test_cache_per_schema(self):
+        ContentType.objects.clear_cache()
+        content_type = ContentType.objects.get_for_model(PartnerOrganization)
+        with self.assertNumQueries(0):
+            self.assertEqual(ContentType.objects.get_for_model(PartnerOrganization), content_type)
+            self.assertEqual(ContentType.objects.get_for_id(content_type.pk), content_type)
+        self.assertIn(('default', self.tenant.schema_name), dict(ContentType.objects._cache))
+
+        connection.set_schema_to_public()
+        self.assertNotIn('default', ContentType.objects._cache)
+        with self.assertNumQueries(1):
+            ContentType.objects.get_for_model(PartnerOrganization)
+        self.assertIn(('default', 'public'), dict(ContentType.objects._cache))
+        connection.set_tenant(self.tenant)
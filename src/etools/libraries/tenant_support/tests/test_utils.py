@@ -1,9 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from django.conf import settings
+from django.db import connection
 from django.test import RequestFactory
 
 import mock
 
 from etools.applications.core.tests.cases import BaseTenantTestCase
+from etools.applications.partners.models import Agreement, PartnerOrganization
+from etools.applications.partners.tests.factories import AgreementFactory, PartnerFactory
 from etools.applications.users.tests.factories import UserFactory
 from etools.libraries.tenant_support import utils
 
@@ -76,3 +81,106 @@ class TestSetCountry(BaseTenantTestCase):
             utils.set_country(self.user, request)
         self.assertEqual(request.tenant, self.country)
         self.mock_set.assert_called_with(self.country)
+
+
+def get_schema_name(fail_on=None):
+    if connection.schema_name == fail_on:
+        raise ValueError('failed')
+    return connection.schema_name
+
+
+class FakePool(ThreadPoolExecutor):
+    def __init__(self, max_workers, mp_context, initializer):
+        super().__init__(max_workers)
+
+
+class TestTenantExecutor(BaseTenantTestCase):
+
+    def test_serial(self):
+        progress = mock.Mock()
+        results = utils.TenantExecutor(progress=progress).run(get_schema_name)
+        self.assertIn(utils.TenantResult(self.tenant.schema_name, self.tenant.schema_name, None), results)
+        self.assertEqual(progress.call_count, len(results))
+        self.assertEqual(progress.call_args[0][:2], (len(results), len(results)))
+        self.assertEqual(connection.tenant, self.tenant)
+
+    def test_serial_exception(self):
+        results = utils.TenantExecutor().run(get_schema_name, fail_on=self.tenant.schema_name)
+        result = [result for result in results if result.schema_name == self.tenant.schema_name][0]
+        self.assertIsNone(result.result)
+        self.assertIsInstance(result.exception, ValueError)
+        self.assertIn('ValueError', result.traceback)
+
+    def test_serial_missing_schema(self):
+        executor = utils.TenantExecutor()
+        with mock.patch.object(executor, 'get_schema_names', return_value=['missing']):
+            results = executor.run(get_schema_name)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].schema_name, 'missing')
+        self.assertIsNotNone(results[0].exception)
+        self.assertEqual(connection.tenant, self.tenant)
+
+    def test_schema_names(self):
+        self.assertEqual(utils.TenantExecutor(schema_names=[]).run(get_schema_name), [])
+        self.assertEqual(
+            utils.TenantExecutor(schema_names=[self.tenant.schema_name]).run(get_schema_name),
+            [utils.TenantResult(self.tenant.schema_name, self.tenant.schema_name, None)],
+        )
+
+    def test_run_on_all_tenants(self):
+        self.assertIn(self.tenant.schema_name, utils.run_on_all_tenants(get_schema_name))
+        with self.assertRaises(ValueError):
+            utils.run_on_all_tenants(get_schema_name, fail_on=self.tenant.schema_name)
+        self.assertEqual(connection.tenant, self.tenant)
+
+    @mock.patch('etools.libraries.tenant_support.utils.connections')
+    @mock.patch('etools.libraries.tenant_support.utils.ProcessPoolExecutor', FakePool)
+    def test_processes(self, mock_connections):
+        def run_on_tenant(schema_name, function, kwargs):
+            if schema_name == 'broken':
+                raise EOFError()
+            return utils.TenantResult(schema_name, function.__name__, None)
+
+        executor = utils.TenantExecutor(utils.TenantExecutor.PROCESSES, max_workers=2)
+        with mock.patch.object(executor, 'get_schema_names', return_value=['one', 'two', 'broken']), \
+                mock.patch('etools.libraries.tenant_support.utils.run_on_tenant', run_on_tenant):
+            results = executor.run(get_schema_name)
+
+        mock_connections.close_all.assert_called_once_with()
+        self.assertEqual(len(results), 3)
+        self.assertIn(utils.TenantResult('one', 'get_schema_name', None), results)
+        broken = [result for result in results if result.schema_name == 'broken'][0]
+        self.assertIsInstance(broken.exception, EOFError)
+
+
+class TestTenantUnionQuery(BaseTenantTestCase):
+
+    def test_sql(self):
+        queryset = Agreement.objects.filter(signed_by__email='test@example.com')
+        sql, params = utils.TenantUnionQuery(queryset, ['one', 'two']).get_sql('SELECT %%s, * FROM (%s) t', queryset)
+        self.assertIn('FROM "one"."partners_agreement"', sql)
+        self.assertIn('FROM "two"."partners_agreement"', sql)
+        self.assertIn('JOIN "auth_user"', sql)
+        self.assertEqual(sql.count(' UNION ALL '), 1)
+        self.assertEqual(params, ['one', 'test@example.com', 'two', 'test@example.com'])
+
+    def test_counts(self):
+        partner = PartnerFactory()
+        AgreementFactory.create_batch(2, partner=partner)
+        AgreementFactory()
+        schema_name = self.tenant.schema_name
+        with self.assertNumQueries(1):
+            counts = utils.TenantUnionQuery(Agreement.objects.filter(partner=partner), [schema_name]).counts()
+        self.assertEqual(counts, {schema_name: 2})
+        self.assertEqual(utils.TenantUnionQuery(Agreement.objects.all(), []).counts(), {})
+
+    def test_values(self):
+        PartnerFactory(name='First')
+        PartnerFactory(name='Second')
+        schema_name = self.tenant.schema_name
+        rows = utils.TenantUnionQuery(
+            PartnerOrganization.objects.filter(name='First').values('name', 'pk'),
+            [schema_name, schema_name],
+        ).values()
+        partner = PartnerOrganization.objects.get(name='First')
+        self.assertEqual(rows, [{'schema_name': schema_name, 'name': 'First', 'pk': partner.pk}] * 2)
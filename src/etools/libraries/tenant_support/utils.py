@@ -1,13 +1,55 @@
 import logging
+import multiprocessing
+import re
+import traceback
+from collections import namedtuple
+from concurrent.futures import as_completed, ProcessPoolExecutor
 
+from django.apps import apps
 from django.conf import settings
-from django.db import connection
+from django.core.cache import cache
+from django.db import connection, connections
 from django.db.models import Q
 
 from django_tenants.utils import get_tenant_model
 
 logger = logging.getLogger(__name__)
 
+USER_COUNTRY_CACHE_KEY = 'tenant-user-country-{}'
+COUNTRY_CACHE_KEY = 'tenant-country-{}'
+NOT_CACHED = object()
+
+
+def get_country(country_id):
+    """Country by id, cached until the country is saved"""
+    key = COUNTRY_CACHE_KEY.format(country_id)
+    country = cache.get(key)
+    if country is None:
+        country = get_tenant_model().objects.get(pk=country_id)
+        cache.set(key, country, timeout=settings.USER_COUNTRY_CACHE_TIMEOUT)
+    return country
+
+
+def get_user_country(user):
+    """
+    Country of the user's profile without querying the profile and the country on every request,
+    the country id is cached per user until the profile is saved
+    """
+    key = USER_COUNTRY_CACHE_KEY.format(user.pk)
+    country_id = cache.get(key, NOT_CACHED)
+    if country_id is NOT_CACHED:
+        country_id = user.profile.country_id
+        cache.set(key, country_id, timeout=settings.USER_COUNTRY_CACHE_TIMEOUT)
+    return get_country(country_id) if country_id else None
+
+
+def clear_user_country_cache(sender, instance, **kwargs):
+    cache.delete(USER_COUNTRY_CACHE_KEY.format(instance.user_id))
+
+
+def clear_country_cache(sender, instance, **kwargs):
+    cache.delete(COUNTRY_CACHE_KEY.format(instance.pk))
+
 
 def set_country(user, request):
 
@@ -22,7 +64,7 @@ def set_country(user, request):
         except get_tenant_model().DoesNotExist:
             country = None
 
-    request.tenant = country or user.profile.country or user.profile.country_override
+    request.tenant = country or get_user_country(user) or user.profile.country_override
     connection.set_tenant(request.tenant)
 
 
@@ -50,6 +92,170 @@ class every_country:
 
 
 def run_on_all_tenants(function, **kwargs):
-    with every_country() as c:
-        for country in c:
-            function(**kwargs)
+    """
+    Run function on every tenant one after the other and return its results, a failing tenant
+    doesn't stop the others, the first exception is raised once they are all done
+    """
+    results = TenantExecutor(TenantExecutor.SERIAL).run(function, **kwargs)
+    for tenant_result in results:
+        if tenant_result.exception:
+            raise tenant_result.exception
+    return [tenant_result.result for tenant_result in results]
+
+
+# the formatted traceback is kept along with the exception, as the exceptions of the workers lose theirs
+TenantResult = namedtuple('TenantResult', ['schema_name', 'result', 'exception', 'traceback'], defaults=[None])
+
+
+def run_on_tenant(schema_name, function, kwargs):
+    """Run function on the tenant in the current process and return its TenantResult"""
+    try:
+        connection.set_tenant(get_tenant_model().objects.get(schema_name=schema_name))
+        return TenantResult(schema_name, function(**kwargs), None)
+    except Exception as e:
+        logger.exception('Running {} on {} failed'.format(getattr(function, '__name__', function), schema_name))
+        return TenantResult(schema_name, None, e, traceback.format_exc())
+
+
+def init_tenant_worker():
+    # each worker opens its own connections, none is inherited from the parent process
+    connections.close_all()
+
+
+class TenantExecutor:
+    """
+    Run a callable on every tenant and collect a TenantResult for each of them, exceptions included.
+
+    In serial mode the tenants are visited one after the other in the current process, which is what
+    run_on_all_tenants and the tests need. In processes mode they are fanned out to
+    a pool of at most max_workers forked processes, each with its own database connection;
+    function and kwargs are pickled so function has to be a module level function.
+
+    Example usage:
+
+    results = TenantExecutor(TenantExecutor.PROCESSES, max_workers=8).run(function, param=value)
+    failed = [result.schema_name for result in results if result.exception]
+    """
+    SERIAL = 'serial'
+    PROCESSES = 'processes'
+
+    def __init__(self, mode=SERIAL, max_workers=None, progress=None, schema_names=None):
+        self.mode = mode
+        self.max_workers = max_workers or settings.TENANT_EXECUTOR_MAX_WORKERS
+        self.progress = progress or self.log_progress
+        # limit the run to these tenants, all of them by default
+        self.schema_names = schema_names
+
+    def get_schema_names(self):
+        tenants = get_tenant_model().objects.exclude(name='Global')
+        if self.schema_names is not None:
+            tenants = tenants.filter(schema_name__in=self.schema_names)
+        return list(tenants.values_list('schema_name', flat=True))
+
+    @staticmethod
+    def log_progress(done, total, tenant_result):
+        status = 'failed: {}'.format(tenant_result.exception) if tenant_result.exception else 'done'
+        logger.info('{}/{} {} {}'.format(done, total, tenant_result.schema_name, status))
+
+    def run(self, function, **kwargs):
+        schema_names = self.get_schema_names()
+        original_tenant = connection.tenant
+        results = []
+        try:
+            if self.mode == self.PROCESSES:
+                tenant_results = self.run_processes(schema_names, function, kwargs)
+            else:
+                tenant_results = (run_on_tenant(schema_name, function, kwargs) for schema_name in schema_names)
+            for tenant_result in tenant_results:
+                results.append(tenant_result)
+                self.progress(len(results), len(schema_names), tenant_result)
+        finally:
+            connection.set_tenant(original_tenant)
+        return results
+
+    def run_processes(self, schema_names, function, kwargs):
+        if not schema_names:
+            return
+        # the forked workers must not share the sockets of the current connections
+        connections.close_all()
+        with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(schema_names)),
+                mp_context=multiprocessing.get_context('fork'),
+                initializer=init_tenant_worker,
+        ) as pool:
+            futures = {
+                pool.submit(run_on_tenant, schema_name, function, kwargs): schema_name
+                for schema_name in schema_names
+            }
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    # the worker died, or function, kwargs or the result could not be pickled
+                    yield TenantResult(futures[future], None, e, traceback.format_exc())
+
+
+class TenantUnionQuery:
+    """
+    Run the same queryset on many tenant schemas with a single UNION ALL statement instead of switching
+    the tenant and querying each schema in a loop.
+
+    The queryset is compiled once, then every table of a tenant app referenced by a FROM or a JOIN is
+    qualified with the schema of each part; the tables of the shared apps are left to the search path,
+    so they are read from public. Each row is tagged with the schema it comes from.
+
+    Example usage:
+
+    TenantUnionQuery(Agreement.objects.filter(status='active'), ['afghanistan', 'chad']).counts()
+    """
+    SCHEMA_COLUMN = 'schema_name'
+    TABLE_REFERENCE = re.compile(r'\b(FROM|JOIN) "(\w+)"')
+
+    def __init__(self, queryset, schema_names):
+        self.queryset = queryset.order_by()
+        self.schema_names = list(schema_names)
+
+    @staticmethod
+    def get_tenant_tables():
+        tenant_apps = set(settings.TENANT_APPS)
+        return {
+            model._meta.db_table for model in apps.get_models(include_auto_created=True)
+            if model._meta.app_config.name in tenant_apps
+        }
+
+    def get_sql(self, template, queryset):
+        """Return the UNION ALL of template % (sql of queryset) for every schema, with its params"""
+        sql, params = queryset.query.sql_with_params()
+        tenant_tables = self.get_tenant_tables()
+        qn = connection.ops.quote_name
+
+        parts, union_params = [], []
+        for schema_name in self.schema_names:
+            schema_sql = self.TABLE_REFERENCE.sub(
+                lambda match: '{} {}.{}'.format(match.group(1), qn(schema_name), qn(match.group(2)))
+                if match.group(2) in tenant_tables else match.group(0),
+                sql,
+            )
+            parts.append(template % schema_sql)
+            union_params.extend((schema_name, ) + tuple(params))
+        return ' UNION ALL '.join(parts), union_params
+
+    def execute(self, template, queryset):
+        if not self.schema_names:
+            return []
+        sql, params = self.get_sql(template, queryset)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+    def values(self):
+        """Rows of the values() queryset as dicts, with the schema of each row in SCHEMA_COLUMN"""
+        query = self.queryset.query
+        names = [self.SCHEMA_COLUMN, *query.extra_select, *query.values_select, *query.annotation_select]
+        rows = self.execute('SELECT %%s, "tenant_union".* FROM (%s) AS "tenant_union"', self.queryset)
+        return [dict(zip(names, row)) for row in rows]
+
+    def counts(self):
+        """Number of rows of the queryset per schema, as queryset.count() would return on each tenant"""
+        rows = self.execute('SELECT %%s, COUNT(*) FROM (%s) AS "tenant_union"', self.queryset.values('pk'))
+        return dict(rows)